@@ -0,0 +1,200 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmark the compilation of pipelines with a large number of steps.
+
+This script builds synthetic pipelines which invoke the same step thousands of
+times, compiles them and reports the time and peak memory required to register
+the step invocations and to compile the pipeline.
+
+Example:
+    python scripts/benchmark_compilation.py --steps 1000 10000 50000
+    python scripts/benchmark_compilation.py --shape fan_out -o results.json
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Tuple
+
+from zenml import pipeline, step
+from zenml.client import Client
+from zenml.config.compiler import Compiler
+from zenml.config.pipeline_run_configuration import PipelineRunConfiguration
+from zenml.pipelines.pipeline_definition import Pipeline
+
+
+@step
+def benchmark_step(value: int = 0) -> int:
+    """Step which is invoked many times by the benchmark pipelines.
+
+    Args:
+        value: The input value.
+
+    Returns:
+        The input value.
+    """
+    return value
+
+
+def build_pipeline(num_steps: int, shape: str) -> Pipeline:
+    """Builds a synthetic pipeline.
+
+    Args:
+        num_steps: The number of step invocations of the pipeline.
+        shape: The shape of the pipeline DAG. `chain` connects all steps
+            sequentially, `fan_out` makes all steps depend on the first one
+            and `independent` creates steps without any dependencies.
+
+    Returns:
+        The pipeline.
+    """
+
+    @pipeline(enable_cache=False)
+    def benchmark_pipeline() -> None:
+        """Pipeline which invokes the benchmark step many times."""
+        first = benchmark_step()
+        output = first
+        for _ in range(num_steps - 1):
+            if shape == "chain":
+                output = benchmark_step(output)
+            elif shape == "fan_out":
+                benchmark_step(first)
+            else:
+                benchmark_step()
+
+    return benchmark_pipeline
+
+
+def measure(function: Callable[[], Any], memory: bool) -> Tuple[float, int]:
+    """Measures the run time and peak memory of a function.
+
+    Args:
+        function: The function to measure.
+        memory: Whether to measure the peak memory. Tracing the memory
+            allocations slows down the function considerably, which is why
+            the function is run a second time to measure its memory.
+
+    Returns:
+        The run time in seconds and the peak memory in bytes.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    function()
+    duration = time.perf_counter() - start
+
+    peak_memory = 0
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            function()
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return duration, peak_memory
+
+
+def run_benchmark(num_steps: int, shape: str, memory: bool) -> Dict[str, Any]:
+    """Benchmarks the registration and compilation of a pipeline.
+
+    Args:
+        num_steps: The number of step invocations of the pipeline.
+        shape: The shape of the pipeline DAG.
+        memory: Whether to measure the peak memory.
+
+    Returns:
+        The benchmark results.
+    """
+    pipeline_instance = build_pipeline(num_steps=num_steps, shape=shape)
+    stack = Client().active_stack
+    compiler = Compiler()
+
+    def _register() -> None:
+        pipeline_instance.prepare()
+
+    def _compile() -> None:
+        compiler.compile(
+            pipeline=pipeline_instance,
+            stack=stack,
+            run_configuration=PipelineRunConfiguration(),
+        )
+
+    register_time, register_memory = measure(_register, memory=memory)
+    compile_time, compile_memory = measure(_compile, memory=memory)
+    assert len(pipeline_instance.invocations) == num_steps
+
+    return {
+        "steps": num_steps,
+        "shape": shape,
+        "register_time": round(register_time, 3),
+        "register_peak_memory": register_memory,
+        "compile_time": round(compile_time, 3),
+        "compile_peak_memory": compile_memory,
+    }
+
+
+def main() -> None:
+    """Runs the compilation benchmarks and prints the results."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the compilation of large pipelines"
+    )
+    parser.add_argument(
+        "--steps",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 50000],
+        help="Number of step invocations of the benchmark pipelines",
+    )
+    parser.add_argument(
+        "--shape",
+        choices=["chain", "fan_out", "independent"],
+        default="chain",
+        help="Shape of the pipeline DAG",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip measuring the peak memory",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="JSON file to which the results are written",
+    )
+    args = parser.parse_args()
+
+    results = []
+    for num_steps in args.steps:
+        result = run_benchmark(
+            num_steps=num_steps, shape=args.shape, memory=not args.no_memory
+        )
+        results.append(result)
+        print(
+            f"{num_steps:>6} steps: "
+            f"register {result['register_time']:.3f}s "
+            f"({result['register_peak_memory'] / 2**20:.1f} MiB), "
+            f"compile {result['compile_time']:.3f}s "
+            f"({result['compile_peak_memory'] / 2**20:.1f} MiB)"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
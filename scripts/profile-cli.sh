@@ -36,6 +36,8 @@ COMMANDS=(
     "zenml model list"
     "zenml --help"
     "zenml stack --help"
+    # Process startup as it happens in step pods and entrypoints
+    "python3 -c 'from zenml.integrations.registry import integration_registry; integration_registry.activate_integrations()'"
 )
 
 # Parse arguments
@@ -13,13 +13,17 @@
 #  permissions and limitations under the License.
 """The analytics client of ZenML."""
 
+import atexit
 import json
 import logging
+import os
+import threading
+from queue import Full, Queue
 from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
 
+from zenml.analytics.consumer import Consumer, QueueItem
 from zenml.analytics.enums import AnalyticsEvent
-from zenml.analytics.request import post
 from zenml.analytics.utils import AnalyticsEncoder
 from zenml.constants import IS_DEBUG_ENV
 
@@ -29,15 +33,43 @@ logger = logging.getLogger(__name__)
 class Client(object):
     """The client class for ZenML analytics."""
 
-    def __init__(self, send: bool = True, timeout: int = 15) -> None:
+    def __init__(
+        self,
+        send: bool = True,
+        timeout: int = 15,
+        max_queue_size: int = 10000,
+        upload_size: int = 100,
+        upload_interval: float = 0.5,
+    ) -> None:
         """Initialization of the client.
 
+        Messages are not sent by the calling thread. Instead, they are queued
+        and sent in batches by a background consumer thread which is started
+        on demand. Queued messages are drained when the interpreter exits.
+
         Args:
             send: Flag to determine whether to send the message.
             timeout: Timeout in seconds.
+            max_queue_size: Maximum number of messages to buffer. Messages
+                are dropped if the buffer is full.
+            upload_size: Maximum number of messages to send in a single
+                request.
+            upload_interval: Maximum time in seconds to wait for more
+                messages before sending a batch.
         """
         self.send = send
         self.timeout = timeout
+        self.max_queue_size = max_queue_size
+        self.upload_size = upload_size
+        self.upload_interval = upload_interval
+
+        self.queue: "Queue[QueueItem]" = Queue(max_queue_size)
+        self.consumer: Optional[Consumer] = None
+        self._consumer_lock = threading.Lock()
+        self._pid = os.getpid()
+
+        if send:
+            atexit.register(self.join)
 
     def identify(
         self, user_id: UUID, traits: Optional[Dict[Any, Any]]
@@ -133,12 +165,68 @@ class Client(object):
         Returns:
             Tuple (success flag, the original message).
         """
+        from zenml.analytics import source_context
+
         # if send is False, return msg as if it was successfully queued
         if not self.send:
             return True, msg
 
-        post(timeout=self.timeout, batch=[msg])
+        self._ensure_consumer()
+        try:
+            # The source context is a context variable, so we need to capture
+            # it here as it is not available in the consumer thread.
+            self.queue.put((source_context.get(), msg), block=False)
+        except Full:
+            logger.debug("Analytics queue is full, dropping message.")
+            return False, msg
+
         return True, msg
 
+    def _ensure_consumer(self) -> None:
+        """Start the consumer thread if it is not running yet."""
+        if self.consumer is not None and self._pid == os.getpid():
+            return
+
+        with self._consumer_lock:
+            if self._pid != os.getpid():
+                # We're in a forked child process: The queue might contain
+                # messages that the parent process is sending already and
+                # the consumer thread of the parent does not exist here.
+                self.queue = Queue(self.max_queue_size)
+                self.consumer = None
+                self._pid = os.getpid()
+
+            if self.consumer is None:
+                self.consumer = Consumer(
+                    queue=self.queue,
+                    upload_size=self.upload_size,
+                    upload_interval=self.upload_interval,
+                    timeout=self.timeout,
+                )
+                self.consumer.start()
+
+    def flush(self) -> None:
+        """Block until all queued messages are sent."""
+        if self.consumer is None or self._pid != os.getpid():
+            return
+
+        self.queue.join()
+
+    def join(self) -> None:
+        """Send all queued messages and stop the consumer thread.
+
+        The consumer is given at most `timeout` seconds to drain the queue so
+        that an unreachable analytics server does not delay the shutdown of
+        the interpreter.
+        """
+        with self._consumer_lock:
+            consumer = self.consumer
+            if consumer is None or self._pid != os.getpid():
+                return
+            self.consumer = None
+
+        consumer.pause()
+        consumer.join(timeout=self.timeout)
+
 
 default_client = Client()
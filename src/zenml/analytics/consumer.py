@@ -0,0 +1,128 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""The analytics consumer of ZenML.
+
+This module is based on the 'analytics-python' package created by Segment.
+The base functionalities are adapted to work with the ZenML analytics server.
+"""
+
+import logging
+import time
+from queue import Empty, Queue
+from threading import Thread
+from typing import Dict, List, Tuple
+
+from zenml.analytics import request
+from zenml.enums import SourceContextTypes
+
+logger = logging.getLogger(__name__)
+
+QueueItem = Tuple[SourceContextTypes, str]
+
+
+class Consumer(Thread):
+    """Background thread which sends the queued messages in batches."""
+
+    def __init__(
+        self,
+        queue: "Queue[QueueItem]",
+        upload_size: int = 100,
+        upload_interval: float = 0.5,
+        timeout: int = 15,
+    ) -> None:
+        """Initialization of the consumer.
+
+        Args:
+            queue: The queue from which to consume the messages.
+            upload_size: Maximum number of messages to send in a single
+                request.
+            upload_interval: Maximum time in seconds to wait for more
+                messages before sending a batch.
+            timeout: Timeout in seconds for each request.
+        """
+        # The consumer is a daemon thread so it never keeps the interpreter
+        # alive. Draining the queue on shutdown is handled by the client.
+        super().__init__(daemon=True, name="zenml-analytics")
+        self.queue = queue
+        self.upload_size = upload_size
+        self.upload_interval = upload_interval
+        self.timeout = timeout
+        self.running = True
+
+    def run(self) -> None:
+        """Send messages until the consumer is paused and the queue is empty."""
+        logger.debug("Analytics consumer is running.")
+        while self.running or not self.queue.empty():
+            self.upload()
+        logger.debug("Analytics consumer exited.")
+
+    def pause(self) -> None:
+        """Pause the consumer once all queued messages are sent."""
+        self.running = False
+
+    def upload(self) -> bool:
+        """Send the next batch of messages.
+
+        Returns:
+            True if a batch was sent successfully, False otherwise.
+        """
+        batch = self.next()
+        if not batch:
+            return False
+
+        # The source context is sent as a request header, so messages that
+        # were queued from different sources need separate requests.
+        batches: Dict[SourceContextTypes, List[str]] = {}
+        for source, msg in batch:
+            batches.setdefault(source, []).append(msg)
+
+        success = True
+        try:
+            for source, messages in batches.items():
+                try:
+                    request.post(
+                        batch=messages, timeout=self.timeout, source=source
+                    )
+                except Exception as e:
+                    logger.debug(f"Sending telemetry data failed: {e}")
+                    success = False
+        finally:
+            for _ in batch:
+                self.queue.task_done()
+
+        return success
+
+    def next(self) -> List[QueueItem]:
+        """Collect the next batch of messages from the queue.
+
+        Returns:
+            Up to `upload_size` messages which were queued within
+            `upload_interval` seconds.
+        """
+        items: List[QueueItem] = []
+        start_time = time.monotonic()
+
+        while len(items) < self.upload_size:
+            elapsed = time.monotonic() - start_time
+            if elapsed >= self.upload_interval:
+                break
+            try:
+                item = self.queue.get(
+                    block=True, timeout=self.upload_interval - elapsed
+                )
+            except Empty:
+                break
+            items.append(item)
+
+        return items
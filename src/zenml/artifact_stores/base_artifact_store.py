@@ -16,6 +16,8 @@
 import inspect
 import os
 import textwrap
+import threading
+import time
 from abc import abstractmethod
 from pathlib import Path
 from typing import (
@@ -35,7 +37,11 @@ from typing import (
 
 from pydantic import model_validator
 
-from zenml.constants import ENV_ZENML_SERVER
+from zenml.constants import (
+    ARTIFACT_STORE_STAT_CACHE_SIZE,
+    ARTIFACT_STORE_STAT_CACHE_TTL,
+    ENV_ZENML_SERVER,
+)
 from zenml.enums import StackComponentType
 from zenml.exceptions import ArtifactStoreInterfaceError
 from zenml.io import fileio
@@ -48,6 +54,17 @@ logger = get_logger(__name__)
 
 PathType = Union[bytes, str]
 
+# Methods that create, modify or delete the paths passed to them
+_MUTATING_METHODS = {
+    "copyfile",
+    "makedirs",
+    "mkdir",
+    "open",
+    "remove",
+    "rename",
+    "rmtree",
+}
+
 
 class _sanitize_paths:
     """Sanitizes path inputs before calling the original function.
@@ -232,6 +249,233 @@ class BaseArtifactStoreConfig(StackComponentConfig):
         return data
 
 
+def _is_within(path: str, directory: str) -> bool:
+    """Checks whether a path is equal to or inside a directory.
+
+    Args:
+        path: The path to check.
+        directory: The directory.
+
+    Returns:
+        Whether the path is equal to or inside the directory.
+    """
+    return path == directory or path.startswith(
+        (directory + "/", directory + "\\")
+    )
+
+
+class _StatCache:
+    """Short-lived cache of the existence of paths in an artifact store.
+
+    Only paths which exist are cached, as other processes might create files
+    at any time. Complete listings of directories which are not modified
+    anymore, like the directories of stored artifacts, can be added to answer
+    checks for paths which do not exist inside them as well.
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        """Initializes the cache.
+
+        Args:
+            ttl: The number of seconds for which entries are cached.
+            max_entries: The maximum number of cached paths.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._existing: Dict[str, float] = {}
+        self._listings: Dict[str, Tuple[Set[str], float]] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Gets the state of the cache for pickling.
+
+        The cached entries are not pickled, as they might be outdated once
+        the cache is unpickled in another process.
+
+        Returns:
+            The state of the cache.
+        """
+        return {"ttl": self.ttl, "max_entries": self.max_entries}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restores the state of the cache after unpickling.
+
+        Args:
+            state: The state of the cache.
+        """
+        self.__init__(**state)  # type: ignore[misc]
+
+    @staticmethod
+    def _normalize(path: PathType) -> str:
+        """Normalizes a path to use it as a cache key.
+
+        Args:
+            path: The path to normalize.
+
+        Returns:
+            The normalized path.
+        """
+        return fileio.convert_to_str(path).rstrip("/\\")
+
+    def get(self, path: PathType) -> Optional[bool]:
+        """Gets whether a path exists.
+
+        Args:
+            path: The path.
+
+        Returns:
+            Whether the path exists, or None if this is not cached.
+        """
+        path = self._normalize(path)
+        now = time.monotonic()
+        with self._lock:
+            expiry = self._existing.get(path)
+            if expiry is not None:
+                if expiry > now:
+                    return True
+                del self._existing[path]
+
+            for directory, (paths, expiry) in self._listings.items():
+                if expiry > now and _is_within(path, directory):
+                    return path == directory or path in paths
+
+        return None
+
+    def add(self, path: PathType) -> None:
+        """Caches that a path exists.
+
+        Args:
+            path: The path.
+        """
+        with self._lock:
+            if len(self._existing) >= self.max_entries:
+                self._existing.clear()
+            self._existing[self._normalize(path)] = time.monotonic() + self.ttl
+
+    def add_listing(self, directory: PathType, paths: Iterable[str]) -> None:
+        """Caches the complete listing of a directory.
+
+        Args:
+            directory: The directory.
+            paths: The paths of all files and subdirectories in the directory.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._listings = {
+                key: value
+                for key, value in self._listings.items()
+                if value[1] > now
+            }
+            if len(self._listings) >= self.max_entries:
+                self._listings.clear()
+            self._listings[self._normalize(directory)] = (
+                {self._normalize(path) for path in paths},
+                now + self.ttl,
+            )
+
+    def invalidate(self, path: PathType) -> None:
+        """Removes all cache entries which might be affected by a change.
+
+        Args:
+            path: The path that was changed.
+        """
+        path = self._normalize(path)
+        with self._lock:
+            for existing in list(self._existing):
+                if _is_within(existing, path):
+                    del self._existing[existing]
+            for directory in list(self._listings):
+                if _is_within(path, directory) or _is_within(directory, path):
+                    del self._listings[directory]
+
+
+class _cache_exists:
+    """Answers existence checks from the stat cache if possible.
+
+    Args:
+        func: The `exists` method to decorate.
+        stat_cache: The stat cache to use.
+
+    Returns:
+        Function that checks whether a path exists.
+    """
+
+    def __init__(
+        self, func: Callable[..., Any], stat_cache: _StatCache
+    ) -> None:
+        """Initializes the decorator.
+
+        Args:
+            func: The `exists` method to decorate.
+            stat_cache: The stat cache to use.
+        """
+        self.__wrapped__ = func
+        self.stat_cache = stat_cache
+
+    def __call__(self, path: PathType) -> bool:
+        """Checks whether a path exists.
+
+        Args:
+            path: The path to check.
+
+        Returns:
+            Whether the path exists.
+        """
+        cached = self.stat_cache.get(path)
+        if cached is not None:
+            return cached
+
+        result = bool(self.__wrapped__(path))
+        if result:
+            self.stat_cache.add(path)
+        return result
+
+
+class _invalidate_stat_cache:
+    """Invalidates the stat cache before calling a mutating method.
+
+    Args:
+        func: The mutating method to decorate.
+        stat_cache: The stat cache to invalidate.
+
+    Returns:
+        Function that invalidates all paths passed to the original function.
+    """
+
+    def __init__(
+        self, func: Callable[..., Any], stat_cache: _StatCache
+    ) -> None:
+        """Initializes the decorator.
+
+        Args:
+            func: The mutating method to decorate.
+            stat_cache: The stat cache to invalidate.
+        """
+        self.__wrapped__ = func
+        self.stat_cache = stat_cache
+        self.is_open = func.__name__ == "open"
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Invalidates the paths and calls the original function.
+
+        Args:
+            *args: Positional args.
+            **kwargs: Keyword args.
+
+        Returns:
+            Output of the original function.
+        """
+        if self.is_open:
+            mode = args[1] if len(args) > 1 else kwargs.get("mode", "r")
+            if not any(char in mode for char in "wax+"):
+                return self.__wrapped__(*args, **kwargs)
+
+        for key, value in [*enumerate(args), *kwargs.items()]:
+            if key != "mode" and isinstance(value, (str, bytes)):
+                self.stat_cache.invalidate(value)
+        return self.__wrapped__(*args, **kwargs)
+
+
 class BaseArtifactStore(StackComponent):
     """Base class for all ZenML artifact stores."""
 
@@ -435,6 +679,13 @@ class BaseArtifactStore(StackComponent):
             **kwargs: The keyword arguments to pass to the Pydantic object.
         """
         super(BaseArtifactStore, self).__init__(*args, **kwargs)
+        self._stat_cache = _StatCache(
+            ttl=ARTIFACT_STORE_STAT_CACHE_TTL,
+            max_entries=ARTIFACT_STORE_STAT_CACHE_SIZE,
+        )
+        self._filesystem_methods: Optional[Dict[str, Callable[..., Any]]] = (
+            None
+        )
 
         # If running in a ZenML server environment, we don't register
         # the filesystems. We always use the artifact stores directly.
@@ -450,20 +701,30 @@ class BaseArtifactStore(StackComponent):
         overloads: Dict[str, Any] = {
             "SUPPORTED_SCHEMES": self.config.SUPPORTED_SCHEMES,
         }
-        for abc_method in inspect.getmembers(BaseArtifactStore):
-            if getattr(abc_method[1], "__isabstractmethod__", False):
-                sanitized_method = _sanitize_paths(
-                    getattr(self, abc_method[0]), self.path
-                )
-                # prepare overloads for filesystem methods
-                overloads[abc_method[0]] = staticmethod(sanitized_method)
-
-                # decorate artifact store methods
-                setattr(
-                    self,
-                    abc_method[0],
-                    sanitized_method,
-                )
+        # The artifact store methods are only decorated once, even if the
+        # filesystem is registered multiple times.
+        if self._filesystem_methods is None:
+            self._filesystem_methods = {}
+            for abc_method in inspect.getmembers(BaseArtifactStore):
+                if getattr(abc_method[1], "__isabstractmethod__", False):
+                    sanitized_method = _sanitize_paths(
+                        self._with_stat_cache(
+                            abc_method[0], getattr(self, abc_method[0])
+                        ),
+                        self.path,
+                    )
+                    self._filesystem_methods[abc_method[0]] = sanitized_method
+
+                    # decorate artifact store methods
+                    setattr(
+                        self,
+                        abc_method[0],
+                        sanitized_method,
+                    )
+
+        # prepare overloads for filesystem methods
+        for name, method in self._filesystem_methods.items():
+            overloads[name] = staticmethod(method)
 
         # Local filesystem is always registered, no point in doing it again.
         if isinstance(self, LocalFilesystem):
@@ -475,6 +736,38 @@ class BaseArtifactStore(StackComponent):
 
         default_filesystem_registry.register(filesystem_class)
 
+    def _with_stat_cache(
+        self, name: str, method: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        """Decorates a filesystem method to use and update the stat cache.
+
+        Args:
+            name: The name of the method.
+            method: The method to decorate.
+
+        Returns:
+            The decorated method.
+        """
+        if name == "exists":
+            return _cache_exists(method, self._stat_cache)
+        if name in _MUTATING_METHODS:
+            return _invalidate_stat_cache(method, self._stat_cache)
+        return method
+
+    def _cache_listing(
+        self, directory: PathType, paths: Iterable[str]
+    ) -> None:
+        """Caches the complete listing of a directory which is not modified.
+
+        Existence checks for paths inside the directory are answered from
+        this listing until the stat cache entry expires.
+
+        Args:
+            directory: The directory.
+            paths: The paths of all files and subdirectories in the directory.
+        """
+        self._stat_cache.add_listing(directory, paths)
+
     def _remove_previous_file_versions(self, path: PathType) -> None:
         """Remove all file versions but the latest in the given path.
 
@@ -15,6 +15,7 @@
 
 import base64
 import contextlib
+import json
 import os
 import re
 import tempfile
@@ -37,6 +38,7 @@ from zenml.artifacts.preexisting_data_materializer import (
 )
 from zenml.client import Client
 from zenml.constants import (
+    ARTIFACT_MANIFEST_FILENAME,
     ENV_ZENML_SERVER,
     MODEL_METADATA_YAML_FILE_NAME,
 )
@@ -113,6 +115,64 @@ def _save_artifact_visualizations(
     ]
 
 
+def _write_artifact_manifest(
+    artifact_store: "BaseArtifactStore", uri: str
+) -> None:
+    """Writes a manifest of all files and directories of an artifact.
+
+    The manifest is used to answer existence checks of materializers when
+    loading the artifact without sending a request for each of them.
+
+    Args:
+        artifact_store: The artifact store in which the artifact is stored.
+        uri: The artifact URI.
+    """
+    try:
+        paths: List[str] = []
+        for root, dirs, files in artifact_store.walk(uri):
+            root_path = fileio.convert_to_str(root)
+            for name in [*dirs, *files]:
+                path = os.path.join(root_path, fileio.convert_to_str(name))
+                paths.append(os.path.relpath(path, uri).replace("\\", "/"))
+
+        with artifact_store.open(
+            os.path.join(uri, ARTIFACT_MANIFEST_FILENAME), "w"
+        ) as f:
+            f.write(json.dumps({"paths": paths}))
+    except Exception as e:
+        logger.debug("Failed to write manifest for artifact %s: %s", uri, e)
+
+
+def _load_artifact_manifest(
+    artifact_store: "BaseArtifactStore", uri: str
+) -> None:
+    """Loads the manifest of an artifact into the artifact store stat cache.
+
+    Artifacts stored by older ZenML versions do not have a manifest, in which
+    case the materializers check the existence of paths as usual.
+
+    Args:
+        artifact_store: The artifact store in which the artifact is stored.
+        uri: The artifact URI.
+    """
+    try:
+        with artifact_store.open(
+            os.path.join(uri, ARTIFACT_MANIFEST_FILENAME), "r"
+        ) as f:
+            paths = json.loads(f.read())["paths"]
+    except Exception as e:
+        logger.debug("Failed to read manifest of artifact %s: %s", uri, e)
+        return
+
+    artifact_store._cache_listing(
+        uri,
+        [
+            os.path.join(uri, *path.split("/"))
+            for path in [ARTIFACT_MANIFEST_FILENAME, *paths]
+        ],
+    )
+
+
 def _store_artifact_data_and_prepare_request(
     data: Any,
     name: str,
@@ -165,6 +225,7 @@ def _store_artifact_data_and_prepare_request(
         if store_visualizations
         else None
     )
+    _write_artifact_manifest(artifact_store=artifact_store, uri=uri)
 
     combined_metadata: Dict[str, "MetadataType"] = {}
     if store_metadata:
@@ -796,6 +857,9 @@ def _load_artifact_from_uri(
     materializer_object: BaseMaterializer = materializer_class(
         uri, artifact_store
     )
+    _load_artifact_manifest(
+        artifact_store=materializer_object.artifact_store, uri=uri
+    )
     artifact = materializer_object.load(artifact_class)
     logger.debug("Artifact loaded successfully.")
 
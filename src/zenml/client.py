@@ -14,7 +14,6 @@
 """Client implementation."""
 
 import functools
-import json
 import os
 from abc import ABCMeta
 from collections import Counter
@@ -61,6 +60,7 @@ from zenml.enums import (
     ArtifactType,
     ColorVariants,
     LogicalOperators,
+    MetadataResourceTypes,
     ModelStages,
     OAuthDeviceStatus,
     PluginSubType,
@@ -140,6 +140,7 @@ from zenml.models import (
     ProjectRequest,
     ProjectResponse,
     ProjectUpdate,
+    RunMetadataEntry,
     RunMetadataRequest,
     RunMetadataResource,
     RunTemplateFilter,
@@ -200,7 +201,7 @@ from zenml.utils.pagination_utils import depaginate
 from zenml.utils.uuid_utils import is_valid_uuid
 
 if TYPE_CHECKING:
-    from zenml.metadata.metadata_types import MetadataType, MetadataTypeEnum
+    from zenml.metadata.metadata_types import MetadataType
     from zenml.service_connectors.service_connector import ServiceConnector
     from zenml.services.service import ServiceConfig
     from zenml.stack import Stack
@@ -3868,6 +3869,8 @@ class Client(metaclass=ClientMetaClass):
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
         logical_operator: LogicalOperators = LogicalOperators.AND,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
@@ -3907,6 +3910,10 @@ class Client(metaclass=ClientMetaClass):
             page: The page of items
             size: The maximum size of all pages
             logical_operator: Which logical operator to use [and, or]
+            cursor: Cursor returned by the previous page. If set, the items
+                following the cursor are returned instead of the requested
+                page.
+            include_total: Whether to count the total number of items.
             id: The id of the runs to filter by.
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
@@ -3950,6 +3957,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            include_total=include_total,
             id=id,
             created=created,
             updated=updated,
@@ -4032,6 +4041,8 @@ class Client(metaclass=ClientMetaClass):
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
         logical_operator: LogicalOperators = LogicalOperators.AND,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
@@ -4058,6 +4069,10 @@ class Client(metaclass=ClientMetaClass):
             page: The page of items
             size: The maximum size of all pages
             logical_operator: Which logical operator to use [and, or]
+            cursor: Cursor returned by the previous page. If set, the items
+                following the cursor are returned instead of the requested
+                page.
+            include_total: Whether to count the total number of items.
             id: Use the id of runs to filter by.
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
@@ -4086,6 +4101,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            include_total=include_total,
             id=id,
             cache_key=cache_key,
             code_hash=code_hash,
@@ -4342,6 +4359,8 @@ class Client(metaclass=ClientMetaClass):
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
         logical_operator: LogicalOperators = LogicalOperators.AND,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
@@ -4373,6 +4392,10 @@ class Client(metaclass=ClientMetaClass):
             page: The page of items
             size: The maximum size of all pages
             logical_operator: Which logical operator to use [and, or]
+            cursor: Cursor returned by the previous page. If set, the items
+                following the cursor are returned instead of the requested
+                page.
+            include_total: Whether to count the total number of items.
             id: Use the id of artifact version to filter by.
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
@@ -4410,6 +4433,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            cursor=cursor,
+            include_total=include_total,
             id=id,
             created=created,
             updated=updated,
@@ -4596,30 +4621,9 @@ class Client(metaclass=ClientMetaClass):
             publisher_step_id: The ID of the step execution that publishes
                 this metadata automatically.
         """
-        from zenml.metadata.metadata_types import get_metadata_type
-
-        values: Dict[str, "MetadataType"] = {}
-        types: Dict[str, "MetadataTypeEnum"] = {}
-        for key, value in metadata.items():
-            # Skip metadata that is too large to be stored in the database.
-            if len(json.dumps(value)) > TEXT_FIELD_MAX_LENGTH:
-                logger.warning(
-                    f"Metadata value for key '{key}' is too large to be "
-                    "stored in the database. Skipping."
-                )
-                continue
-            # Skip metadata that is not of a supported type.
-            try:
-                metadata_type = get_metadata_type(value)
-            except ValueError as e:
-                logger.warning(
-                    f"Metadata value for key '{key}' is not of a supported "
-                    f"type. Skipping. Full error: {e}"
-                )
-                continue
-            values[key] = value
-            types[key] = metadata_type
+        from zenml.metadata.metadata_types import prepare_run_metadata
 
+        values, types = prepare_run_metadata(metadata)
         run_metadata = RunMetadataRequest(
             project=self.active_project.id,
             resources=resources,
@@ -4630,6 +4634,36 @@ class Client(metaclass=ClientMetaClass):
         )
         self.zen_store.create_run_metadata(run_metadata)
 
+    def get_run_metadata_history(
+        self,
+        resource_id: UUID,
+        resource_type: MetadataResourceTypes,
+        key: Optional[str] = None,
+        page: int = PAGINATION_STARTING_PAGE,
+        size: int = PAGE_SIZE_DEFAULT,
+    ) -> List[RunMetadataEntry]:
+        """Get all run metadata entries of a resource, newest first.
+
+        Run metadata responses only include the latest value of each key.
+        This method can be used to get all values which were logged.
+
+        Args:
+            resource_id: The ID of the resource.
+            resource_type: The type of the resource.
+            key: If given, only get the entries with this key.
+            page: The page of entries to get.
+            size: The number of entries per page.
+
+        Returns:
+            The run metadata entries of the page.
+        """
+        return self.zen_store.get_run_metadata_history(
+            resource=RunMetadataResource(id=resource_id, type=resource_type),
+            key=key,
+            page=page,
+            size=size,
+        )
+
     # -------------------------------- Secrets ---------------------------------
 
     def create_secret(
@@ -6503,6 +6537,8 @@ class Client(metaclass=ClientMetaClass):
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
         logical_operator: LogicalOperators = LogicalOperators.AND,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
         name: Optional[str] = None,
@@ -6526,6 +6562,10 @@ class Client(metaclass=ClientMetaClass):
             page: The page of items
             size: The maximum size of all pages
             logical_operator: Which logical operator to use [and, or]
+            cursor: Cursor returned by the previous page. If set, the items
+                following the cursor are returned instead of the requested
+                page.
+            include_total: Whether to count the total number of items.
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
             name: name or id of the model version.
@@ -6561,6 +6601,8 @@ class Client(metaclass=ClientMetaClass):
             size=size,
             sort_by=sort_by,
             logical_operator=logical_operator,
+            cursor=cursor,
+            include_total=include_total,
             created=created,
             updated=updated,
             name=name,
@@ -6640,6 +6682,8 @@ class Client(metaclass=ClientMetaClass):
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
         logical_operator: LogicalOperators = LogicalOperators.AND,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
         model_version_id: Optional[Union[UUID, str]] = None,
@@ -6659,6 +6703,10 @@ class Client(metaclass=ClientMetaClass):
             page: The page of items
             size: The maximum size of all pages
             logical_operator: Which logical operator to use [and, or]
+            cursor: Cursor returned by the previous page. If set, the items
+                following the cursor are returned instead of the requested
+                page.
+            include_total: Whether to count the total number of items.
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
             model_version_id: Use the model version id for filtering
@@ -6679,6 +6727,8 @@ class Client(metaclass=ClientMetaClass):
             ModelVersionArtifactFilter(
                 sort_by=sort_by,
                 logical_operator=logical_operator,
+                cursor=cursor,
+                include_total=include_total,
                 page=page,
                 size=size,
                 created=created,
@@ -6752,6 +6802,8 @@ class Client(metaclass=ClientMetaClass):
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
         logical_operator: LogicalOperators = LogicalOperators.AND,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
         model_version_id: Optional[Union[UUID, str]] = None,
@@ -6767,6 +6819,10 @@ class Client(metaclass=ClientMetaClass):
             page: The page of items
             size: The maximum size of all pages
             logical_operator: Which logical operator to use [and, or]
+            cursor: Cursor returned by the previous page. If set, the items
+                following the cursor are returned instead of the requested
+                page.
+            include_total: Whether to count the total number of items.
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
             model_version_id: Use the model version id for filtering
@@ -6783,6 +6839,8 @@ class Client(metaclass=ClientMetaClass):
             ModelVersionPipelineRunFilter(
                 sort_by=sort_by,
                 logical_operator=logical_operator,
+                cursor=cursor,
+                include_total=include_total,
                 page=page,
                 size=size,
                 created=created,
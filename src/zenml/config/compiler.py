@@ -41,7 +41,7 @@ from zenml.environment import get_run_environment_dict
 from zenml.exceptions import StackValidationError
 from zenml.models import PipelineDeploymentBase
 from zenml.pipelines.run_utils import get_default_run_name
-from zenml.utils import pydantic_utils, settings_utils
+from zenml.utils import pydantic_utils, settings_utils, source_utils
 
 if TYPE_CHECKING:
     from zenml.pipelines.pipeline_definition import Pipeline
@@ -112,17 +112,18 @@ class Compiler:
         with pipeline.__suppress_configure_warnings__():
             pipeline.configure(settings=pipeline_settings, merge=False)
 
-        steps = {
-            invocation_id: self._compile_step_invocation(
-                invocation=invocation,
-                stack=stack,
-                step_config=run_configuration.steps.get(invocation_id),
-                pipeline_configuration=pipeline.configuration,
-            )
-            for invocation_id, invocation in self._get_sorted_invocations(
-                pipeline=pipeline
-            )
-        }
+        with source_utils.cache_source_resolution():
+            steps = {
+                invocation_id: self._compile_step_invocation(
+                    invocation=invocation,
+                    stack=stack,
+                    step_config=run_configuration.steps.get(invocation_id),
+                    pipeline_configuration=pipeline.configuration,
+                )
+                for invocation_id, invocation in self._get_sorted_invocations(
+                    pipeline=pipeline
+                )
+            }
 
         self._ensure_required_stack_components_exist(stack=stack, steps=steps)
 
@@ -338,13 +339,16 @@ class Compiler:
         Raises:
             RuntimeError: If an upstream step is missing.
         """
-        available_steps = set(pipeline.invocations)
-        invalid_upstream_steps = invocation.upstream_steps - available_steps
+        invalid_upstream_steps = {
+            step
+            for step in invocation.upstream_steps
+            if step not in pipeline.invocations
+        }
 
         if invalid_upstream_steps:
             raise RuntimeError(
                 f"Invalid upstream steps: {invalid_upstream_steps}. Available "
-                f"steps in this pipeline: {available_steps}."
+                f"steps in this pipeline: {set(pipeline.invocations)}."
             )
 
     def _filter_and_validate_settings(
@@ -454,8 +458,15 @@ class Compiler:
             The compiled step.
         """
         # Copy the invocation (including its referenced step) before we apply
-        # the step configuration which is exclusive to this invocation.
-        invocation = copy.deepcopy(invocation)
+        # the step configuration which is exclusive to this invocation. The
+        # parent pipeline is shared instead of copied, as copying it would
+        # copy all other invocations of the pipeline as well. Settings are
+        # never modified in place but replaced when configuring the step, so
+        # the copy can share them with the original invocation.
+        memo: Dict[int, Any] = {id(invocation.pipeline): invocation.pipeline}
+        for settings in invocation.step.configuration.settings.values():
+            memo[id(settings)] = settings
+        invocation = copy.deepcopy(invocation, memo=memo)
 
         step = invocation.step
         if step_config:
@@ -36,10 +36,20 @@ class SecretsStoreConfiguration(BaseModel):
             a subclass of `BaseSecretsStore`. This is optional and only
             required if the store backend is not one of the built-in
             implementations.
+        cache_ttl: The number of seconds for which secret values fetched from
+            the store backend are cached. Set to 0 to disable the cache.
+        cache_max_size: The maximum number of secrets for which values are
+            cached.
+        cache_class_path: The Python class path of the cache implementation.
+            Should point to a subclass of `BaseSecretsCache`. If not set, an
+            in-memory cache is used.
     """
 
     type: SecretsStoreType
     class_path: Optional[str] = None
+    cache_ttl: float = 30
+    cache_max_size: int = 1000
+    cache_class_path: Optional[str] = None
 
     @model_validator(mode="after")
     def validate_custom(self) -> "SecretsStoreConfiguration":
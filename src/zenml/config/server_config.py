@@ -251,8 +251,8 @@ class ServerConfiguration(BaseModel):
         memcache_default_expiry: The default expiry time in seconds for cache
             entries. If not specified, the default value of 30 seconds will be
             used.
-        file_download_size_limit: The maximum size of the file download in
-            bytes. If not specified, the default value of 2GB will be used.
+        file_download_size_limit: Deprecated. Artifact downloads are
+            streamed and therefore no longer limited in size.
         thread_pool_size: The size of the thread pool for handling requests. If
             not specified, the default value of 40 will be used.
         server_request_timeout: The timeout for server requests in seconds. If
@@ -273,7 +273,9 @@ class StepConfiguration(PartialStepConfiguration):
                 exclude_none=True,
             )
 
-            updated_config = self.model_copy(update=pipeline_values, deep=True)
+            # The updated configuration gets serialized and validated again
+            # when applying the original values, so a shallow copy suffices.
+            updated_config = self.model_copy(update=pipeline_values)
             return update_model(updated_config, original_values)
         else:
             return self.model_copy(deep=True)
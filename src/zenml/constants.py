@@ -199,12 +199,26 @@ ENV_ZENML_RUN_SINGLE_STEPS_WITHOUT_STACK = (
 )
 ENV_ZENML_PREVENT_CLIENT_SIDE_CACHING = "ZENML_PREVENT_CLIENT_SIDE_CACHING"
 ENV_ZENML_DISABLE_CREDENTIALS_DISK_CACHING = "DISABLE_CREDENTIALS_DISK_CACHING"
+ENV_ZENML_DISABLE_INTEGRATION_MANIFEST = "ZENML_DISABLE_INTEGRATION_MANIFEST"
+ENV_ZENML_SERVICE_CONNECTOR_REFRESH_FRACTION = (
+    "ZENML_SERVICE_CONNECTOR_REFRESH_FRACTION"
+)
 ENV_ZENML_RUNNER_PARENT_IMAGE = "ZENML_RUNNER_PARENT_IMAGE"
 ENV_ZENML_RUNNER_IMAGE_DISABLE_UV = "ZENML_RUNNER_IMAGE_DISABLE_UV"
 ENV_ZENML_RUNNER_POD_TIMEOUT = "ZENML_RUNNER_POD_TIMEOUT"
 ENV_ZENML_WORKLOAD_TOKEN_EXPIRATION_LEEWAY = (
     "ZENML_WORKLOAD_TOKEN_EXPIRATION_LEEWAY"
 )
+ENV_ZENML_DIRECTORY_TRANSFER_MAX_WORKERS = (
+    "ZENML_DIRECTORY_TRANSFER_MAX_WORKERS"
+)
+ENV_ZENML_DIRECTORY_TRANSFER_CHUNK_SIZE = "ZENML_DIRECTORY_TRANSFER_CHUNK_SIZE"
+ENV_ZENML_NUMPY_SHARD_SIZE = "ZENML_NUMPY_SHARD_SIZE"
+ENV_ZENML_NUMPY_CACHE_DIR = "ZENML_NUMPY_CACHE_DIR"
+ENV_ZENML_NUMPY_CACHE_MAX_SIZE = "ZENML_NUMPY_CACHE_MAX_SIZE"
+ENV_ZENML_HF_DATASETS_CACHE_DIR = "ZENML_HF_DATASETS_CACHE_DIR"
+ENV_ZENML_HF_DATASETS_CACHE_MAX_SIZE = "ZENML_HF_DATASETS_CACHE_MAX_SIZE"
+ENV_ZENML_HF_DATASETS_CACHE_ON_SAVE = "ZENML_HF_DATASETS_CACHE_ON_SAVE"
 # Logging variables
 IS_DEBUG_ENV: bool = handle_bool_env_var(ENV_ZENML_DEBUG, default=False)
 
@@ -282,6 +296,12 @@ DEFAULT_ZENML_SERVER_MAX_DEVICE_AUTH_ATTEMPTS = 3
 DEFAULT_ZENML_SERVER_DEVICE_AUTH_TIMEOUT = 60 * 5  # 5 minutes
 DEFAULT_ZENML_SERVER_DEVICE_AUTH_POLLING = 5  # seconds
 DEFAULT_HTTP_TIMEOUT = 30
+DEFAULT_HTTP_POOL_CONNECTIONS = 10
+DEFAULT_HTTP_POOL_MAXSIZE = 32
+DEFAULT_HTTP_KEEPALIVE_IDLE = 60  # seconds
+DEFAULT_HTTP_COMPRESSION_MIN_SIZE = 1024  # bytes
+REST_RESPONSE_CACHE_SIZE = 128
+REST_RESPONSE_CACHE_MAX_FILES = 1000
 DEFAULT_ZENML_SERVER_REQUEST_TIMEOUT = 20  # seconds
 SERVICE_CONNECTOR_VERIFY_REQUEST_TIMEOUT = 120  # seconds
 ZENML_API_KEY_PREFIX = "ZENKEY_"
@@ -356,6 +376,7 @@ ARTIFACT_VERSIONS = "/artifact_versions"
 ARTIFACT_VISUALIZATIONS = "/artifact_visualizations"
 AUTH = "/auth"
 BATCH = "/batch"
+CACHED = "/cached"
 CODE_REFERENCES = "/code_references"
 CODE_REPOSITORIES = "/code_repositories"
 COMPONENT_TYPES = "/component-types"
@@ -372,6 +393,7 @@ EVENT_FLAVORS = "/event-flavors"
 EVENT_SOURCES = "/event-sources"
 FLAVORS = "/flavors"
 HEALTH = "/health"
+HISTORY = "/history"
 INFO = "/info"
 LOAD_INFO = "/load-info"
 LOGIN = "/login"
@@ -454,6 +476,10 @@ METADATA_ORCHESTRATOR_LOGS_URL = "orchestrator_logs_url"
 METADATA_ORCHESTRATOR_RUN_ID = "orchestrator_run_id"
 METADATA_EXPERIMENT_TRACKER_URL = "experiment_tracker_url"
 METADATA_DEPLOYED_MODEL_URL = "deployed_model_url"
+# Run metadata logged inside a step is buffered and flushed in bulk once the
+# buffer holds this many values or the flush interval has passed
+STEP_METADATA_BUFFER_MAX_SIZE = 1000
+STEP_METADATA_FLUSH_INTERVAL_SECONDS = 10.0
 
 # Model registries constants
 MLFLOW_MODEL_FORMAT = "MLflow"
@@ -465,6 +491,27 @@ KUBERNETES_CLUSTER_RESOURCE_TYPE = "kubernetes-cluster"
 # Stack Recipe constants
 STACK_RECIPES_GITHUB_REPO = "https://github.com/zenml-io/mlops-stacks.git"
 
+# Number of deployments for which the parsed configurations are cached by
+# the SQL zen store
+DEPLOYMENT_CONFIGURATION_CACHE_SIZE = 100
+
+# Artifact store constants
+# Number of seconds for which the existence of paths in artifact stores is
+# cached
+ARTIFACT_STORE_STAT_CACHE_TTL = 30
+ARTIFACT_STORE_STAT_CACHE_SIZE = 10000
+# File in which the paths of all files of an artifact are stored
+ARTIFACT_MANIFEST_FILENAME = ".zenml_manifest.json"
+# Number of files that are copied in parallel when copying directories and
+# size of the chunks in which files are streamed between filesystems
+DIRECTORY_TRANSFER_MAX_WORKERS = 8
+DIRECTORY_TRANSFER_CHUNK_SIZE = 8 * 1024 * 1024
+# Maximum size in bytes of the local caches in which materializers store
+# copies of remote artifacts, and the number of seconds for which recently
+# used files are never removed from such a cache
+MATERIALIZER_CACHE_MAX_SIZE = 10 * 1024**3
+MATERIALIZER_CACHE_MIN_AGE_SECONDS = 60
+
 # Parameters for internal ZenML Models
 TEXT_FIELD_MAX_LENGTH = 65535
 STR_ID_FIELD_MAX_LENGTH = 50
@@ -477,6 +524,9 @@ LATEST_MODEL_VERSION_PLACEHOLDER = "__latest__"
 
 # Service connector constants
 SERVICE_CONNECTOR_SKEW_TOLERANCE_SECONDS = 60 * 5  # 5 minutes
+# Fraction of the credentials lifetime after which connector clients used by
+# stack components are refreshed in the background
+SERVICE_CONNECTOR_REFRESH_FRACTION = 0.75
 
 # Versioned entities
 MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION = (
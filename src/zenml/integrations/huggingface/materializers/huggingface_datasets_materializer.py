@@ -11,9 +11,26 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
-"""Implementation of the Huggingface datasets materializer."""
-
+"""Implementation of the Huggingface datasets materializer.
+
+Environment Variables:
+    ZENML_HF_DATASETS_CACHE_DIR: The local directory in which the files of
+        datasets stored in remote artifact stores are cached, addressed by the
+        hash of their content. Defaults to a directory inside the global ZenML
+        config directory. Steps running on the same machine share the cached
+        files.
+    ZENML_HF_DATASETS_CACHE_MAX_SIZE: The maximum size of the cache in bytes.
+        The least recently used files are removed from the cache once it grows
+        larger. Defaults to 10 GiB.
+    ZENML_HF_DATASETS_CACHE_ON_SAVE: If set to `true`, the files of saved
+        datasets are kept in the cache, so loading them on the same machine
+        doesn't download them again. Otherwise, only loaded datasets are
+        cached.
+"""
+
+import hashlib
 import os
+import shutil
 from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
@@ -25,22 +42,124 @@ from typing import (
     Type,
     Union,
 )
+from uuid import uuid4
 
 from datasets import Dataset, load_from_disk
 from datasets.dataset_dict import DatasetDict
 
+from zenml.constants import (
+    ENV_ZENML_HF_DATASETS_CACHE_DIR,
+    ENV_ZENML_HF_DATASETS_CACHE_MAX_SIZE,
+    ENV_ZENML_HF_DATASETS_CACHE_ON_SAVE,
+    handle_bool_env_var,
+)
 from zenml.enums import ArtifactType, VisualizationType
 from zenml.integrations.pandas.materializers.pandas_materializer import (
     PandasMaterializer,
 )
 from zenml.io import fileio
+from zenml.io.transfer import copy_files
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import io_utils
+from zenml.utils import io_utils, yaml_utils
+from zenml.utils.materializer_utils import (
+    evict_local_cache_files,
+    get_local_cache_directory,
+    touch_local_cache_file,
+)
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
 
 DEFAULT_DATASET_DIR = "hf_datasets"
+SHARDS_FILENAME = "shards.json"
+CACHE_DIRECTORY_NAME = "hf_datasets_cache"
+
+
+def _hash_file(path: str) -> str:
+    """Computes the SHA256 hash of a local file.
+
+    Args:
+        path: The path of the file.
+
+    Returns:
+        The hex digest of the file content.
+    """
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _get_shard_cache_dir() -> str:
+    """Gets the directory of the local shard cache.
+
+    Returns:
+        The directory of the shard cache.
+    """
+    return get_local_cache_directory(
+        name=CACHE_DIRECTORY_NAME, env_var=ENV_ZENML_HF_DATASETS_CACHE_DIR
+    )
+
+
+def _get_shard_cache_path(digest: str) -> str:
+    """Gets the path of a file in the local shard cache.
+
+    Args:
+        digest: The SHA256 hash of the file content.
+
+    Returns:
+        The path of the file in the shard cache.
+    """
+    return os.path.join(_get_shard_cache_dir(), digest[:2], digest)
+
+
+def _evict_shard_cache_files() -> None:
+    """Removes the least recently used files from the local shard cache."""
+    evict_local_cache_files(
+        _get_shard_cache_dir(),
+        max_size_env_var=ENV_ZENML_HF_DATASETS_CACHE_MAX_SIZE,
+    )
+
+
+def _add_to_shard_cache(path: str, digest: str) -> None:
+    """Moves a local file into the shard cache.
+
+    Args:
+        path: The path of the file.
+        digest: The SHA256 hash of the file content.
+    """
+    cache_path = _get_shard_cache_path(digest)
+    if os.path.exists(cache_path):
+        touch_local_cache_file(cache_path)
+        return
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    temp_path = f"{cache_path}.{uuid4().hex}.tmp"
+    shutil.move(path, temp_path)
+    os.replace(temp_path, cache_path)
+
+
+def _link_or_copy(source: str, destination: str) -> None:
+    """Links a file, or copies it if the filesystem doesn't support links.
+
+    Args:
+        source: The path of the file.
+        destination: The path of the link.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+    """
+    try:
+        os.link(source, destination)
+    except FileNotFoundError:
+        # Don't create a dangling symlink
+        raise
+    except OSError:
+        try:
+            os.symlink(source, destination)
+        except OSError:
+            shutil.copyfile(source, destination)
 
 
 def extract_repo_name(checksum_str: str) -> Optional[str]:
@@ -81,32 +200,127 @@ class HFDatasetMaterializer(BaseMaterializer):
     ) -> Union[Dataset, DatasetDict]:
         """Reads Dataset.
 
+        If the artifact store is local or mounted, the dataset is memory-mapped
+        directly from the artifact store. Otherwise, the Arrow files are loaded
+        from a local shard cache that is shared between steps, and only files
+        that are missing in the cache are downloaded.
+
         Args:
             data_type: The type of the dataset to read.
 
         Returns:
             The dataset read from the specified dir.
         """
+        path = os.path.join(self.uri, DEFAULT_DATASET_DIR)
+        if not io_utils.is_remote(path):
+            return load_from_disk(path)
+
+        shards_path = os.path.join(self.uri, SHARDS_FILENAME)
+        if fileio.exists(shards_path):
+            shards = yaml_utils.read_json(shards_path)
+            return load_from_disk(self._load_shards(shards))
+
         with self.get_temporary_directory(delete_at_exit=False) as temp_dir:
-            io_utils.copy_dir(
-                os.path.join(self.uri, DEFAULT_DATASET_DIR),
-                temp_dir,
-            )
+            io_utils.copy_dir(path, temp_dir)
             return load_from_disk(temp_dir)
 
     def save(self, ds: Union[Dataset, DatasetDict]) -> None:
         """Writes a Dataset to the specified dir.
 
+        If the artifact store is local or mounted, the dataset is written
+        directly into the artifact store. Otherwise, the dataset is staged in a
+        temporary directory and uploaded. If caching on save is enabled, the
+        staged files are then moved to the local shard cache, so loading the
+        dataset on the same machine doesn't download it again.
+
         Args:
             ds: The Dataset to write.
         """
-        with self.get_temporary_directory(delete_at_exit=True) as temp_dir:
-            path = os.path.join(temp_dir, DEFAULT_DATASET_DIR)
+        path = os.path.join(self.uri, DEFAULT_DATASET_DIR)
+        if not io_utils.is_remote(path):
             ds.save_to_disk(path)
-            io_utils.copy_dir(
-                path,
-                os.path.join(self.uri, DEFAULT_DATASET_DIR),
-            )
+            return
+
+        cache_on_save = handle_bool_env_var(
+            ENV_ZENML_HF_DATASETS_CACHE_ON_SAVE, default=False
+        )
+        with self.get_temporary_directory(delete_at_exit=True) as temp_dir:
+            staging_path = os.path.join(temp_dir, DEFAULT_DATASET_DIR)
+            ds.save_to_disk(staging_path)
+            io_utils.copy_dir(staging_path, path)
+
+            shards: Dict[str, str] = {}
+            for root, _, files in os.walk(staging_path):
+                for file in files:
+                    file_path = os.path.join(root, file)
+                    digest = _hash_file(file_path)
+                    relative_path = os.path.relpath(file_path, staging_path)
+                    shards[relative_path.replace(os.sep, "/")] = digest
+                    if cache_on_save:
+                        _add_to_shard_cache(file_path, digest)
+
+        yaml_utils.write_json(os.path.join(self.uri, SHARDS_FILENAME), shards)
+        if cache_on_save:
+            _evict_shard_cache_files()
+
+    def _load_shards(self, shards: Dict[str, str]) -> str:
+        """Loads the files of a dataset from the local shard cache.
+
+        Args:
+            shards: Mapping of the relative path of all dataset files to the
+                SHA256 hash of their content.
+
+        Raises:
+            RuntimeError: If the content of a downloaded file doesn't match
+                its hash.
+
+        Returns:
+            Path to a local directory containing the dataset files.
+        """
+        path = os.path.join(self.uri, DEFAULT_DATASET_DIR)
+        downloads: Dict[str, Tuple[str, str]] = {}
+        for relative_path, digest in shards.items():
+            cache_path = _get_shard_cache_path(digest)
+            if digest in downloads:
+                continue
+            elif os.path.exists(cache_path):
+                touch_local_cache_file(cache_path)
+            else:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                # Download to a unique path first to not collide with other
+                # steps that download the same file at the same time
+                downloads[digest] = (
+                    os.path.join(path, relative_path),
+                    f"{cache_path}.{uuid4().hex}.tmp",
+                )
+
+        try:
+            copy_files(list(downloads.values()))
+            for digest, (source, download_path) in downloads.items():
+                if _hash_file(download_path) != digest:
+                    raise RuntimeError(
+                        f"The content of the downloaded file `{source}` does "
+                        "not match the hash that was stored when saving the "
+                        "dataset."
+                    )
+                os.replace(download_path, _get_shard_cache_path(digest))
+        finally:
+            for _, download_path in downloads.values():
+                if os.path.exists(download_path):
+                    os.remove(download_path)
+
+        with self.get_temporary_directory(delete_at_exit=False) as temp_dir:
+            for relative_path, digest in shards.items():
+                link_path = os.path.join(temp_dir, relative_path)
+                os.makedirs(os.path.dirname(link_path), exist_ok=True)
+                _link_or_copy(_get_shard_cache_path(digest), link_path)
+
+        # The cache is only cleaned up once all files of this dataset are
+        # linked, as the eviction might otherwise remove some of them.
+        if downloads:
+            _evict_shard_cache_files()
+
+        return temp_dir
 
     def extract_metadata(
         self, ds: Union[Dataset, DatasetDict]
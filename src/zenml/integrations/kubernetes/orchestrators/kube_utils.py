@@ -33,12 +33,24 @@ Adjusted from https://github.com/tensorflow/tfx/blob/master/tfx/utils/kube_utils
 
 import enum
 import re
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NoReturn,
+    Optional,
+    TypeVar,
+    cast,
+)
 
 from kubernetes import client as k8s_client
 from kubernetes import config as k8s_config
+from kubernetes import watch as k8s_watch
 from kubernetes.client.rest import ApiException
+from urllib3.exceptions import HTTPError
 
 from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
     build_namespace_manifest,
@@ -213,6 +225,300 @@ def get_pod(
         raise RuntimeError from e
 
 
+class PodStatusMonitor:
+    """Tracks the status of many pods using a single Kubernetes watch.
+
+    Instead of every waiting thread polling the API server for the status of
+    its own pod, the monitor lists all pods matching a label selector once and
+    then watches them for changes in a background thread. Threads waiting for
+    a pod to reach a certain state are woken up whenever one of the watched
+    pods changes. The pods are listed again whenever the watch expires or
+    fails, so missed events are eventually recovered.
+    """
+
+    def __init__(
+        self,
+        kube_client_fn: Callable[[], k8s_client.ApiClient],
+        namespace: str,
+        label_selector: str,
+        watch_timeout: int = 60,
+        retry_delay: float = 5,
+    ) -> None:
+        """Initializes the monitor.
+
+        Args:
+            kube_client_fn: Function that returns a Kubernetes API client. It
+                is called every time the watch is (re)started.
+            namespace: The namespace of the pods.
+            label_selector: Label selector matching all pods to monitor.
+            watch_timeout: Duration in seconds after which the watch is
+                restarted and the pods are listed again.
+            retry_delay: Delay in seconds before restarting a failed watch.
+        """
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self._kube_client_fn = kube_client_fn
+        self._watch_timeout = watch_timeout
+        self._retry_delay = retry_delay
+        self._pods: Dict[str, Optional[k8s_client.V1Pod]] = {}
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._watch: Optional[k8s_watch.Watch] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Starts watching the pods in a background thread."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._watch_pods, name="pod_status_monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops watching the pods."""
+        self._stop_event.set()
+        if self._watch:
+            self._watch.stop()
+        with self._condition:
+            self._condition.notify_all()
+
+    def __enter__(self) -> "PodStatusMonitor":
+        """Starts the monitor when entering the context.
+
+        Returns:
+            The monitor.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stops the monitor when exiting the context.
+
+        Args:
+            *args: The exception information, if any.
+        """
+        self.stop()
+
+    def _update_pod(self, pod: k8s_client.V1Pod, deleted: bool) -> None:
+        """Updates the cached state of a pod.
+
+        Must be called while holding the condition lock.
+
+        Args:
+            pod: The pod.
+            deleted: Whether the pod was deleted.
+        """
+        self._pods[pod.metadata.name] = None if deleted else pod
+
+    def _watch_pods(self) -> None:
+        """Lists and watches the monitored pods until the monitor is stopped."""
+        while not self._stop_event.is_set():
+            try:
+                core_api = k8s_client.CoreV1Api(self._kube_client_fn())
+                pod_list = core_api.list_namespaced_pod(
+                    namespace=self.namespace,
+                    label_selector=self.label_selector,
+                )
+                with self._condition:
+                    listed_pods = {pod.metadata.name for pod in pod_list.items}
+                    for pod_name in self._pods:
+                        if pod_name not in listed_pods:
+                            self._pods[pod_name] = None
+                    for pod in pod_list.items:
+                        self._update_pod(pod, deleted=False)
+                    self._condition.notify_all()
+
+                self._watch = k8s_watch.Watch()
+                for event in self._watch.stream(
+                    core_api.list_namespaced_pod,
+                    namespace=self.namespace,
+                    label_selector=self.label_selector,
+                    resource_version=pod_list.metadata.resource_version,
+                    timeout_seconds=self._watch_timeout,
+                ):
+                    if event["type"] == "ERROR":
+                        # Most likely the resource version expired, so we
+                        # list the pods again.
+                        break
+
+                    with self._condition:
+                        self._update_pod(
+                            event["object"],
+                            deleted=event["type"] == "DELETED",
+                        )
+                        self._condition.notify_all()
+            except Exception as e:
+                if self._stop_event.is_set():
+                    break
+                logger.warning(
+                    f"Error while watching pods: {e}. Retrying in "
+                    f"{self._retry_delay} seconds..."
+                )
+                self._stop_event.wait(self._retry_delay)
+
+    def get_pod(self, pod_name: str) -> Optional[k8s_client.V1Pod]:
+        """Gets the latest known state of a pod.
+
+        Args:
+            pod_name: The name of the pod.
+
+        Returns:
+            The pod, or None if it was not seen (yet) or was deleted.
+        """
+        with self._condition:
+            return self._pods.get(pod_name)
+
+    def wait_for_pod(
+        self,
+        pod_name: str,
+        condition: Callable[[k8s_client.V1Pod], bool],
+        timeout: Optional[float] = None,
+    ) -> Optional[k8s_client.V1Pod]:
+        """Waits until a pod meets a condition or was deleted.
+
+        Args:
+            pod_name: The name of the pod.
+            condition: Function that returns True once the pod reached the
+                desired state.
+            timeout: Maximum time to wait in seconds, or None to wait for an
+                unlimited duration.
+
+        Raises:
+            RuntimeError: If the pod was deleted or the monitor was stopped.
+
+        Returns:
+            The pod if it met the condition, None if the wait timed out.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while not self._stop_event.is_set():
+                if pod_name in self._pods:
+                    pod = self._pods[pod_name]
+                    if pod is None:
+                        raise RuntimeError(
+                            f"Pod `{self.namespace}:{pod_name}` not found."
+                        )
+                    if condition(pod):
+                        return pod
+
+                remaining = (
+                    None if deadline is None else deadline - time.monotonic()
+                )
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+
+        raise RuntimeError("The pod status monitor was stopped.")
+
+
+# Extra seconds of logs to fetch when reading pod logs incrementally, to make
+# sure that no lines are lost due to request latencies.
+POD_LOGS_OVERLAP_SECONDS = 5
+
+
+def _normalize_log_timestamp(timestamp: str) -> str:
+    """Normalizes a Kubernetes log timestamp so it can be compared as string.
+
+    Kubernetes prefixes log lines with RFC3339 timestamps with a variable
+    number of fractional digits, e.g. `2024-01-01T10:00:00.12Z`.
+
+    Args:
+        timestamp: The timestamp to normalize.
+
+    Returns:
+        The timestamp with exactly nine fractional digits and no timezone.
+    """
+    timestamp = timestamp.rstrip("Z")
+    seconds, _, fraction = timestamp.partition(".")
+    return f"{seconds}.{fraction.ljust(9, '0')}"
+
+
+class PodLogsReader:
+    """Reads the logs of a pod incrementally.
+
+    The full logs are only downloaded on the first read. Subsequent reads only
+    request the logs since the previous read (plus a small overlap), and use
+    the timestamps of the log lines to skip lines that were already returned.
+    As every read is a new request, dropped connections are transparently
+    recovered on the next read.
+    """
+
+    def __init__(self, pod_name: str, namespace: str) -> None:
+        """Initializes the reader.
+
+        Args:
+            pod_name: The name of the pod.
+            namespace: The namespace of the pod.
+        """
+        self.pod_name = pod_name
+        self.namespace = namespace
+        self._last_read_time: Optional[float] = None
+        self._last_timestamp: Optional[str] = None
+        self._lines_at_last_timestamp = 0
+
+    def read_new_lines(self, core_api: k8s_client.CoreV1Api) -> List[str]:
+        """Reads the log lines that were not returned by previous reads.
+
+        Args:
+            core_api: Client of Core V1 API of Kubernetes API.
+
+        Returns:
+            The new log lines, without timestamps.
+        """
+        kwargs: Dict[str, Any] = {}
+        read_time = time.monotonic()
+        if self._last_read_time is not None:
+            kwargs["since_seconds"] = (
+                int(read_time - self._last_read_time)
+                + POD_LOGS_OVERLAP_SECONDS
+            )
+
+        response = core_api.read_namespaced_pod_log(
+            name=self.pod_name,
+            namespace=self.namespace,
+            timestamps=True,
+            _preload_content=False,
+            **kwargs,
+        )
+        try:
+            raw_data = response.data
+        finally:
+            response.release_conn()
+        self._last_read_time = read_time
+
+        new_lines = []
+        lines_at_timestamp = 0
+        previous_timestamp = None
+        decoded_log = raw_data.decode("utf-8", errors="replace")
+        for line in decoded_log.splitlines():
+            raw_timestamp, _, message = line.partition(" ")
+            timestamp = _normalize_log_timestamp(raw_timestamp)
+
+            if timestamp == previous_timestamp:
+                lines_at_timestamp += 1
+            else:
+                previous_timestamp = timestamp
+                lines_at_timestamp = 1
+
+            if self._last_timestamp is not None:
+                if timestamp < self._last_timestamp:
+                    continue
+                if (
+                    timestamp == self._last_timestamp
+                    and lines_at_timestamp <= self._lines_at_last_timestamp
+                ):
+                    continue
+
+            new_lines.append(message)
+            if timestamp == self._last_timestamp:
+                self._lines_at_last_timestamp = lines_at_timestamp
+            else:
+                self._last_timestamp = timestamp
+                self._lines_at_last_timestamp = lines_at_timestamp
+
+        return new_lines
+
+
 def wait_pod(
     kube_client_fn: Callable[[], k8s_client.ApiClient],
     pod_name: str,
@@ -221,6 +527,7 @@ def wait_pod(
     timeout_sec: int = 0,
     exponential_backoff: bool = False,
     stream_logs: bool = False,
+    pod_monitor: Optional[PodStatusMonitor] = None,
 ) -> k8s_client.V1Pod:
     """Wait for a pod to meet an exit condition.
 
@@ -242,6 +549,9 @@ def wait_pod(
             Defaults to False.
         stream_logs: Whether to stream the pod logs to
             `zenml.logger.info()`. Defaults to False.
+        pod_monitor: Optional monitor which is watching the pod. If given, the
+            pod status is taken from the monitor instead of being polled from
+            the Kubernetes API.
 
     Raises:
         RuntimeError: when the function times out.
@@ -256,44 +566,45 @@ def wait_pod(
     backoff_interval = 1
     maximum_backoff = 32
 
-    logged_lines = 0
+    logs_reader = PodLogsReader(pod_name=pod_name, namespace=namespace)
 
     while True:
-        kube_client = kube_client_fn()
-        core_api = k8s_client.CoreV1Api(kube_client)
-
-        resp = get_pod(core_api, pod_name, namespace)
-
-        if resp is None:
-            raise RuntimeError(f"Pod `{namespace}:{pod_name}` not found.")
+        if pod_monitor:
+            # Wake up as soon as the pod reaches a final state, or after the
+            # polling interval to stream the latest logs.
+            resp = pod_monitor.wait_for_pod(
+                pod_name=pod_name,
+                condition=lambda pod: pod_failed(pod)
+                or exit_condition_lambda(pod),
+                timeout=backoff_interval,
+            ) or pod_monitor.get_pod(pod_name)
+        else:
+            kube_client = kube_client_fn()
+            core_api = k8s_client.CoreV1Api(kube_client)
+
+            resp = get_pod(core_api, pod_name, namespace)
+
+            if resp is None:
+                raise RuntimeError(f"Pod `{namespace}:{pod_name}` not found.")
 
         # Stream logs to `zenml.logger.info()`.
-        # TODO: can we do this without parsing all logs every time?
-        if stream_logs and pod_is_not_pending(resp):
+        if stream_logs and resp is not None and pod_is_not_pending(resp):
+            if pod_monitor:
+                core_api = k8s_client.CoreV1Api(kube_client_fn())
             try:
-                response = core_api.read_namespaced_pod_log(
-                    name=pod_name,
-                    namespace=namespace,
-                    _preload_content=False,
-                )
-            except ApiException as e:
+                for line in logs_reader.read_new_lines(core_api):
+                    logger.info(line)
+            except (ApiException, HTTPError) as e:
                 logger.error(f"Error reading pod logs: {e}. Retrying...")
-            else:
-                raw_data = response.data
-                decoded_log = raw_data.decode("utf-8", errors="replace")
-                logs = decoded_log.splitlines()
-                if len(logs) > logged_lines:
-                    for line in logs[logged_lines:]:
-                        logger.info(line)
-                    logged_lines = len(logs)
-
-        # Raise an error if the pod failed.
-        if pod_failed(resp):
-            raise RuntimeError(f"Pod `{namespace}:{pod_name}` failed.")
-
-        # Check if pod is in desired state (e.g. finished / running / ...).
-        if exit_condition_lambda(resp):
-            return resp
+
+        if resp is not None:
+            # Raise an error if the pod failed.
+            if pod_failed(resp):
+                raise RuntimeError(f"Pod `{namespace}:{pod_name}` failed.")
+
+            # Check if pod is in desired state (e.g. finished / running / ...).
+            if exit_condition_lambda(resp):
+                return resp
 
         # Check if wait timed out.
         elapse_time = utc_now() - start_time
@@ -303,8 +614,10 @@ def wait_pod(
                 f"{timeout_sec} seconds."
             )
 
-        # Wait (using exponential backoff).
-        time.sleep(backoff_interval)
+        # Wait (using exponential backoff). When using a pod monitor, the
+        # wait already happened while waiting for a status change.
+        if not pod_monitor:
+            time.sleep(backoff_interval)
         if exponential_backoff and backoff_interval < maximum_backoff:
             backoff_interval *= 2
 
@@ -478,6 +791,7 @@ def create_and_wait_for_pod_to_start(
     startup_failure_delay: float,
     startup_failure_backoff: float,
     startup_timeout: float,
+    pod_monitor: Optional[PodStatusMonitor] = None,
 ) -> None:
     """Create a pod and wait for it to reach a desired state.
 
@@ -491,6 +805,9 @@ def create_and_wait_for_pod_to_start(
         startup_failure_delay: The delay between retries for the pod startup.
         startup_failure_backoff: The backoff factor for the pod startup.
         startup_timeout: The maximum time to wait for the pod to start.
+        pod_monitor: Optional monitor which is watching the pod. If given, the
+            pod status is taken from the monitor instead of being polled from
+            the Kubernetes API.
 
     Raises:
         TimeoutError: If the pod is still in a pending state after the maximum
@@ -525,8 +842,47 @@ def create_and_wait_for_pod_to_start(
                 )
                 raise
 
+    def _delete_pending_pod(total_wait: float) -> NoReturn:
+        """Deletes the pending pod after the startup timed out.
+
+        Args:
+            total_wait: The time in seconds that was spent waiting.
+
+        Raises:
+            TimeoutError: Always.
+        """
+        # Have to delete the pending pod so it doesn't start running
+        # later on.
+        try:
+            core_api.delete_namespaced_pod(
+                name=pod_name,
+                namespace=namespace,
+            )
+        except Exception:
+            pass
+        raise TimeoutError(
+            f"The {pod_display_name} is still in a pending state "
+            f"after {total_wait} seconds. Exiting."
+        )
+
     # Wait for pod to start
     logger.info(f"Waiting for {pod_display_name} to start...")
+    if pod_monitor:
+        try:
+            pod = pod_monitor.wait_for_pod(
+                pod_name=pod_name,
+                condition=pod_is_not_pending,
+                timeout=startup_timeout,
+            )
+        except RuntimeError:
+            # The pod doesn't exist anymore, which is handled by the caller
+            # when waiting for the pod to finish.
+            return
+
+        if not pod:
+            _delete_pending_pod(startup_timeout)
+        return
+
     max_wait = startup_timeout
     total_wait: float = 0
     delay = startup_failure_delay
@@ -539,19 +895,7 @@ def create_and_wait_for_pod_to_start(
         if not pod or pod_is_not_pending(pod):
             break
         if total_wait >= max_wait:
-            # Have to delete the pending pod so it doesn't start running
-            # later on.
-            try:
-                core_api.delete_namespaced_pod(
-                    name=pod_name,
-                    namespace=namespace,
-                )
-            except Exception:
-                pass
-            raise TimeoutError(
-                f"The {pod_display_name} is still in a pending state "
-                f"after {total_wait} seconds. Exiting."
-            )
+            _delete_pending_pod(total_wait)
 
         if total_wait + delay > max_wait:
             delay = max_wait - total_wait
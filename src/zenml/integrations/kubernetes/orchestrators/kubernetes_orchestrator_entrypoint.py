@@ -126,6 +126,12 @@ def main() -> None:
         for owner_reference in owner_references:
             owner_reference.controller = False
 
+    pod_monitor = kube_utils.PodStatusMonitor(
+        kube_client_fn=lambda: orchestrator.get_kube_client(incluster=True),
+        namespace=args.kubernetes_namespace,
+        label_selector=f"run={kube_utils.sanitize_label(args.run_name)}",
+    )
+
     def run_step_on_kubernetes(step_name: str) -> None:
         """Run a pipeline step in a separate Kubernetes pod.
 
@@ -219,6 +225,7 @@ def main() -> None:
             startup_failure_delay=settings.pod_failure_retry_delay,
             startup_failure_backoff=settings.pod_failure_backoff,
             startup_timeout=settings.pod_startup_timeout,
+            pod_monitor=pod_monitor,
         )
 
         # Wait for pod to finish.
@@ -232,6 +239,7 @@ def main() -> None:
                 namespace=args.kubernetes_namespace,
                 exit_condition_lambda=kube_utils.pod_is_done,
                 stream_logs=True,
+                pod_monitor=pod_monitor,
             )
 
             logger.info(f"Pod for step `{step_name}` completed.")
@@ -316,13 +324,16 @@ def main() -> None:
         for step_name, step in deployment.step_configurations.items()
     }
     try:
-        ThreadedDagRunner(
-            dag=pipeline_dag,
-            run_fn=run_step_on_kubernetes,
-            finalize_fn=finalize_run,
-            parallel_node_startup_waiting_period=parallel_node_startup_waiting_period,
-            max_parallelism=pipeline_settings.max_parallelism,
-        ).run()
+        # All step pods share the run label, so a single watch is enough to
+        # track the status of all of them.
+        with pod_monitor:
+            ThreadedDagRunner(
+                dag=pipeline_dag,
+                run_fn=run_step_on_kubernetes,
+                finalize_fn=finalize_run,
+                parallel_node_startup_waiting_period=parallel_node_startup_waiting_period,
+                max_parallelism=pipeline_settings.max_parallelism,
+            ).run()
         logger.info("Orchestration pod completed.")
     finally:
         if (
@@ -11,27 +11,55 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
-"""Implementation of the ZenML NumPy materializer."""
-
+"""Implementation of the ZenML NumPy materializer.
+
+Environment Variables:
+    ZENML_NUMPY_SHARD_SIZE: If set, arrays which are larger than this number
+        of bytes are stored as multiple `.npy` shards along their first axis.
+    ZENML_NUMPY_CACHE_DIR: The local directory in which copies of remote
+        arrays are cached when loading them as `np.memmap`. Defaults to a
+        directory inside the global ZenML config directory. Steps running on
+        the same machine share the cached copies.
+    ZENML_NUMPY_CACHE_MAX_SIZE: The maximum size of the cache in bytes. The
+        least recently used arrays are removed from the cache once it grows
+        larger. Defaults to 10 GiB.
+"""
+
+import hashlib
+import json
 import os
+import shutil
 from collections import Counter
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
+    List,
     Optional,
     Tuple,
     Type,
     Union,
 )
+from uuid import uuid4
 
 import numpy as np
 
+from zenml.constants import (
+    ENV_ZENML_NUMPY_CACHE_DIR,
+    ENV_ZENML_NUMPY_CACHE_MAX_SIZE,
+    ENV_ZENML_NUMPY_SHARD_SIZE,
+)
 from zenml.enums import ArtifactType, VisualizationType
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import DType, MetadataType
+from zenml.utils.materializer_utils import (
+    evict_local_cache_files,
+    get_local_cache_directory,
+    touch_local_cache_file,
+)
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
@@ -41,6 +69,10 @@ logger = get_logger(__name__)
 
 NUMPY_FILENAME = "data.npy"
 
+SHARDS_FILENAME = "shards.json"
+SHARD_FILENAME_TEMPLATE = "data_{index:05d}.npy"
+CACHE_DIRECTORY_NAME = "numpy_cache"
+
 DATA_FILENAME = "data.parquet"
 SHAPE_FILENAME = "shape.json"
 DATA_VAR = "data_var"
@@ -88,6 +120,25 @@ def _create_array(
         return np.array(data, dtype=dtype, copy=False)
 
 
+def _memory_map(path: str) -> Optional["np.memmap[Any, Any]"]:
+    """Memory-map a local `.npy` file in read-only mode.
+
+    Args:
+        path: The local path of the `.npy` file.
+
+    Returns:
+        The memory-mapped array, or None if the array contains python objects
+        which can not be memory-mapped.
+    """
+    try:
+        arr = np.load(path, mmap_mode="r", allow_pickle=False)
+    except ValueError as e:
+        logger.debug("Unable to memory-map array at `%s`: %s", path, e)
+        return None
+
+    return arr  # type: ignore[no-any-return]
+
+
 class NumpyMaterializer(BaseMaterializer):
     """Materializer to read data to and from pandas."""
 
@@ -97,10 +148,13 @@ class NumpyMaterializer(BaseMaterializer):
     def load(self, data_type: Type[Any]) -> "Any":
         """Reads a numpy array from a `.npy` file.
 
+        If the requested data type is `np.memmap`, the array is memory-mapped
+        in read-only mode instead of being read into memory. Arrays stored in
+        remote artifact stores are copied to a local cache first.
+
         Args:
             data_type: The type of the data to read.
 
-
         Raises:
             ImportError: If pyarrow is not installed.
 
@@ -108,12 +162,34 @@ class NumpyMaterializer(BaseMaterializer):
             The numpy array.
         """
         numpy_file = os.path.join(self.uri, NUMPY_FILENAME)
+        shards_file = os.path.join(self.uri, SHARDS_FILENAME)
+        memory_map = issubclass(data_type, np.memmap)
 
         if self.artifact_store.exists(numpy_file):
+            if memory_map:
+                if os.path.isfile(numpy_file):
+                    # Local or mounted artifact store, no copy required
+                    local_path = numpy_file
+                else:
+                    local_path = self._cache_locally(
+                        lambda path: self._copy_to_local_file(numpy_file, path)
+                    )
+                if (memory_mapped := _memory_map(local_path)) is not None:
+                    return memory_mapped
+
             with self.artifact_store.open(numpy_file, "rb") as f:
                 arr = np.load(f, allow_pickle=True)
                 # Ensure consistent dtype handling
                 return _ensure_dtype_compatibility(arr)
+        elif self.artifact_store.exists(shards_file):
+            if memory_map:
+                local_path = self._cache_locally(self._merge_shards)
+                if (memory_mapped := _memory_map(local_path)) is not None:
+                    return memory_mapped
+
+            return np.concatenate(
+                [self._load_shard(filename) for filename, _ in self._shards()]
+            )
         elif self.artifact_store.exists(os.path.join(self.uri, DATA_FILENAME)):
             logger.warning(
                 "A legacy artifact was found. "
@@ -159,11 +235,149 @@ class NumpyMaterializer(BaseMaterializer):
         # Ensure consistent dtype handling before saving
         arr = _ensure_dtype_compatibility(arr)
 
+        shard_size = os.environ.get(ENV_ZENML_NUMPY_SHARD_SIZE)
+        if (
+            shard_size
+            and arr.ndim > 0
+            and not arr.dtype.hasobject
+            and arr.nbytes > int(shard_size)
+        ):
+            self._save_shards(arr, shard_size=int(shard_size))
+            return
+
         with self.artifact_store.open(
             os.path.join(self.uri, NUMPY_FILENAME), "wb"
         ) as f:
             np.save(f, arr)
 
+    def _save_shards(self, arr: "NDArray[Any]", shard_size: int) -> None:
+        """Writes a np.ndarray as multiple `.npy` shards.
+
+        Args:
+            arr: The numpy array to write.
+            shard_size: The maximum size of each shard in bytes.
+        """
+        row_size = max(arr.nbytes // len(arr), 1)
+        rows_per_shard = max(shard_size // row_size, 1)
+
+        shards = []
+        for index, start in enumerate(range(0, len(arr), rows_per_shard)):
+            shard = arr[start : start + rows_per_shard]
+            filename = SHARD_FILENAME_TEMPLATE.format(index=index)
+            with self.artifact_store.open(
+                os.path.join(self.uri, filename), "wb"
+            ) as f:
+                np.save(f, shard)
+            shards.append({"filename": filename, "rows": len(shard)})
+
+        with self.artifact_store.open(
+            os.path.join(self.uri, SHARDS_FILENAME), "w"
+        ) as f:
+            json.dump({"shape": list(arr.shape), "shards": shards}, f)
+
+    def _shards(self) -> List[Tuple[str, int]]:
+        """Reads the shard file names and row counts of a sharded array.
+
+        Returns:
+            The file name and number of rows of each shard.
+        """
+        with self.artifact_store.open(
+            os.path.join(self.uri, SHARDS_FILENAME), "r"
+        ) as f:
+            shards = json.load(f)["shards"]
+        return [(shard["filename"], shard["rows"]) for shard in shards]
+
+    def _load_shard(self, filename: str) -> "NDArray[Any]":
+        """Reads a single shard of a sharded array.
+
+        Args:
+            filename: The file name of the shard.
+
+        Returns:
+            The shard.
+        """
+        with self.artifact_store.open(
+            os.path.join(self.uri, filename), "rb"
+        ) as f:
+            return np.load(f, allow_pickle=False)  # type: ignore[no-any-return]
+
+    def _merge_shards(self, path: str) -> None:
+        """Merges the shards of a sharded array into a local `.npy` file.
+
+        Only one shard at a time is held in memory.
+
+        Args:
+            path: The local path of the `.npy` file to create.
+        """
+        shards = self._shards()
+        first_shard = self._load_shard(shards[0][0])
+        total_rows = sum(rows for _, rows in shards)
+
+        merged = np.lib.format.open_memmap(
+            path,
+            mode="w+",
+            dtype=first_shard.dtype,
+            shape=(total_rows, *first_shard.shape[1:]),
+        )
+        start = 0
+        for index, (filename, rows) in enumerate(shards):
+            shard = first_shard if index == 0 else self._load_shard(filename)
+            merged[start : start + rows] = shard
+            start += rows
+        merged.flush()
+        del merged
+
+    def _copy_to_local_file(self, source: str, path: str) -> None:
+        """Copies a file from the artifact store to a local file.
+
+        Args:
+            source: The path of the file in the artifact store.
+            path: The local destination path.
+        """
+        with self.artifact_store.open(source, "rb") as src:
+            with open(path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+
+    def _cache_locally(self, create_file: Callable[[str], None]) -> str:
+        """Gets the path of the locally cached `.npy` file of this artifact.
+
+        Artifacts are immutable, which means the cached file stays valid
+        until it gets removed to keep the cache below its maximum size.
+
+        Args:
+            create_file: Function to create the `.npy` file at the given local
+                path if it is not cached yet.
+
+        Returns:
+            The local path of the cached file.
+        """
+        cache_dir = get_local_cache_directory(
+            name=CACHE_DIRECTORY_NAME, env_var=ENV_ZENML_NUMPY_CACHE_DIR
+        )
+        key = hashlib.md5(  # nosec
+            f"{self.artifact_store.id}:{self.uri}".encode()
+        ).hexdigest()
+        cached_path = os.path.join(cache_dir, key, NUMPY_FILENAME)
+
+        if os.path.exists(cached_path):
+            touch_local_cache_file(cached_path)
+        else:
+            os.makedirs(os.path.dirname(cached_path), exist_ok=True)
+            # Create the file under a unique temporary name so that concurrent
+            # threads or processes never see a partially written file.
+            temp_path = f"{cached_path}.{uuid4().hex}.tmp"
+            try:
+                create_file(temp_path)
+                os.replace(temp_path, cached_path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            evict_local_cache_files(
+                cache_dir, max_size_env_var=ENV_ZENML_NUMPY_CACHE_MAX_SIZE
+            )
+
+        return cached_path
+
     def save_visualizations(
         self, arr: "NDArray[Any]"
     ) -> Dict[str, VisualizationType]:
@@ -0,0 +1,177 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Lazy handle for pandas artifacts.
+
+Annotating a step input with `LazyDataFrame` instead of `pd.DataFrame` gives
+the step a handle to the stored artifact instead of the loaded data:
+
+```python
+from zenml import step
+from zenml.integrations.pandas.lazy_dataframe import LazyDataFrame
+
+@step
+def my_step(data: LazyDataFrame) -> float:
+    return data.read(columns=["price"])["price"].mean()
+```
+
+For artifacts stored as parquet, only the requested columns and row groups
+are read from the artifact store.
+"""
+
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
+
+
+class LazyDataFrame:
+    """Handle to a pandas artifact which only reads data on request."""
+
+    def __init__(
+        self,
+        path: str,
+        artifact_store: "BaseArtifactStore",
+        is_parquet: bool,
+    ) -> None:
+        """Initializes the handle.
+
+        Args:
+            path: The path of the file in which the data is stored.
+            artifact_store: The artifact store in which the data is stored.
+            is_parquet: Whether the data is stored as parquet. Otherwise, the
+                data is stored as CSV, which only supports column projections
+                and consists of a single row group.
+        """
+        self.path = path
+        self.artifact_store = artifact_store
+        self.is_parquet = is_parquet
+
+    def _get_parquet_metadata(self) -> Any:
+        """Reads the parquet metadata from the footer of the file.
+
+        Returns:
+            The parquet file metadata.
+        """
+        import pyarrow.parquet as pq  # type: ignore
+
+        with self.artifact_store.open(self.path, mode="rb") as f:
+            return pq.ParquetFile(f).metadata
+
+    @property
+    def columns(self) -> List[str]:
+        """The names of the data columns.
+
+        Returns:
+            The column names, excluding index columns.
+        """
+        if not self.is_parquet:
+            with self.artifact_store.open(self.path, mode="rb") as f:
+                return list(pd.read_csv(f, index_col=0, nrows=0).columns)
+
+        schema = self._get_parquet_metadata().schema.to_arrow_schema()
+        index_columns = set()
+        if pandas_metadata := schema.pandas_metadata:
+            index_columns = {
+                column
+                for column in pandas_metadata.get("index_columns", [])
+                if isinstance(column, str)
+            }
+        return [name for name in schema.names if name not in index_columns]
+
+    @property
+    def num_rows(self) -> int:
+        """The number of rows.
+
+        Returns:
+            The number of rows.
+        """
+        if not self.is_parquet:
+            return len(self.read(columns=[]))
+
+        return int(self._get_parquet_metadata().num_rows)
+
+    @property
+    def num_row_groups(self) -> int:
+        """The number of row groups which can be read independently.
+
+        Returns:
+            The number of row groups.
+        """
+        if not self.is_parquet:
+            return 1
+
+        return int(self._get_parquet_metadata().num_row_groups)
+
+    def read(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        row_groups: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        """Reads (parts of) the data.
+
+        Args:
+            columns: The columns to read. If not given, all columns are read.
+                The index is always included.
+            row_groups: The indices of the row groups to read. If not given,
+                all row groups are read.
+
+        Returns:
+            The requested data.
+
+        Raises:
+            ValueError: If invalid row groups were requested for data stored
+                as CSV.
+        """
+        if not self.is_parquet:
+            if row_groups is not None and list(row_groups) != [0]:
+                raise ValueError(
+                    "Data stored as CSV consists of a single row group."
+                )
+
+            with self.artifact_store.open(self.path, mode="rb") as f:
+                df = pd.read_csv(f, index_col=0, parse_dates=True)
+            return df if columns is None else df[list(columns)]
+
+        import pyarrow.parquet as pq
+
+        with self.artifact_store.open(self.path, mode="rb") as f:
+            parquet_file = pq.ParquetFile(f)
+            column_list = None if columns is None else list(columns)
+            if row_groups is None:
+                table = parquet_file.read(
+                    columns=column_list, use_pandas_metadata=True
+                )
+            else:
+                table = parquet_file.read_row_groups(
+                    list(row_groups),
+                    columns=column_list,
+                    use_pandas_metadata=True,
+                )
+        return table.to_pandas()
+
+    def iter_row_groups(
+        self, columns: Optional[Sequence[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Iterates over the row groups of the data.
+
+        Args:
+            columns: The columns to read. If not given, all columns are read.
+
+        Yields:
+            The data of each row group.
+        """
+        for row_group in range(self.num_row_groups):
+            yield self.read(columns=columns, row_groups=[row_group])
@@ -23,6 +23,11 @@ Special features:
 Environment Variables:
     ZENML_PANDAS_SAMPLE_ROWS: Controls the number of sample rows to include in
         visualizations. Defaults to 10 if not set.
+    ZENML_PANDAS_PARQUET_COMPRESSION: The compression codec used to store
+        data as parquet (e.g. `zstd`, `lz4`, `snappy`, `gzip` or `none`).
+        Defaults to `zstd` if not set.
+    ZENML_PANDAS_PARQUET_ROW_GROUP_SIZE: The maximum number of rows in each
+        parquet row group. Defaults to the pyarrow default if not set.
 """
 
 import os
@@ -32,14 +37,19 @@ import pandas as pd
 
 from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
 from zenml.enums import ArtifactType, VisualizationType
+from zenml.integrations.pandas.lazy_dataframe import LazyDataFrame
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import DType, MetadataType
 
 logger = get_logger(__name__)
 
+# The file name is kept for all compression codecs so that artifacts remain
+# readable by previous versions of this materializer. Parquet files store the
+# codec in their metadata, which means reading does not depend on it.
 PARQUET_FILENAME = "df.parquet.gzip"
-COMPRESSION_TYPE = "gzip"
+COMPRESSION_TYPE = "zstd"
+FALLBACK_COMPRESSION_TYPE = "gzip"
 
 CSV_FILENAME = "df.csv"
 
@@ -73,12 +83,75 @@ def is_standard_dtype(dtype_str: str) -> bool:
     return any(prefix in dtype_str for prefix in STANDARD_DTYPE_PREFIXES)
 
 
+def _get_parquet_compression() -> Optional[str]:
+    """Get the compression codec to use for parquet files.
+
+    Returns:
+        The compression codec, or None if the data should not be compressed.
+    """
+    import pyarrow  # type: ignore
+
+    compression = os.environ.get(
+        "ZENML_PANDAS_PARQUET_COMPRESSION", COMPRESSION_TYPE
+    ).lower()
+    if compression == "none":
+        return None
+
+    try:
+        is_available = pyarrow.Codec.is_available(compression)
+    except ValueError:
+        logger.warning(
+            "Invalid parquet compression codec `%s`, falling back to `%s`.",
+            compression,
+            FALLBACK_COMPRESSION_TYPE,
+        )
+        return FALLBACK_COMPRESSION_TYPE
+
+    if not is_available:
+        logger.warning(
+            "The compression codec `%s` is not available in your `pyarrow` "
+            "installation, falling back to `%s`.",
+            compression,
+            FALLBACK_COMPRESSION_TYPE,
+        )
+        return FALLBACK_COMPRESSION_TYPE
+
+    return compression
+
+
+def _get_parquet_row_group_size() -> Optional[int]:
+    """Get the maximum number of rows in each parquet row group.
+
+    Returns:
+        The row group size, or None if the pyarrow default should be used.
+    """
+    row_group_size = os.environ.get("ZENML_PANDAS_PARQUET_ROW_GROUP_SIZE")
+    if not row_group_size:
+        return None
+
+    try:
+        value = int(row_group_size)
+    except ValueError:
+        value = 0
+
+    if value <= 0:
+        logger.warning(
+            "Invalid parquet row group size `%s`, falling back to the "
+            "`pyarrow` default.",
+            row_group_size,
+        )
+        return None
+
+    return value
+
+
 class PandasMaterializer(BaseMaterializer):
     """Materializer to read data to and from pandas."""
 
     ASSOCIATED_TYPES: ClassVar[Tuple[Type[Any], ...]] = (
         pd.DataFrame,
         pd.Series,
+        LazyDataFrame,
     )
     ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.DATA
 
@@ -93,7 +166,7 @@ class PandasMaterializer(BaseMaterializer):
         """
         super().__init__(uri, artifact_store)
         try:
-            import pyarrow  # type: ignore # noqa
+            import pyarrow  # noqa
 
             self.pyarrow_exists = True
         except ImportError:
@@ -109,11 +182,15 @@ class PandasMaterializer(BaseMaterializer):
             self.parquet_path = os.path.join(self.uri, PARQUET_FILENAME)
             self.csv_path = os.path.join(self.uri, CSV_FILENAME)
 
-    def load(self, data_type: Type[Any]) -> Union[pd.DataFrame, pd.Series]:
+    def load(
+        self, data_type: Type[Any]
+    ) -> Union[pd.DataFrame, pd.Series, LazyDataFrame]:
         """Reads `pd.DataFrame` or `pd.Series` from a `.parquet` or `.csv` file.
 
         Args:
-            data_type: The type of the data to read.
+            data_type: The type of the data to read. If this is
+                `LazyDataFrame`, a handle is returned which only reads the
+                data on request.
 
         Raises:
             ImportError: If pyarrow or fastparquet is not installed.
@@ -121,8 +198,21 @@ class PandasMaterializer(BaseMaterializer):
             zenml_type_error: If the data type is a custom data type.
 
         Returns:
-            The pandas dataframe or series.
+            The pandas dataframe or series, or a lazy handle to it.
         """
+        if issubclass(data_type, LazyDataFrame):
+            is_parquet = self.artifact_store.exists(self.parquet_path)
+            if is_parquet and not self.pyarrow_exists:
+                raise ImportError(
+                    "Reading `.parquet` files requires `pyarrow`. You can "
+                    "install `pyarrow` by running '`pip install pyarrow`'."
+                )
+            return LazyDataFrame(
+                path=self.parquet_path if is_parquet else self.csv_path,
+                artifact_store=self.artifact_store,
+                is_parquet=is_parquet,
+            )
+
         try:
             # First try normal loading
             if self.artifact_store.exists(self.parquet_path):
@@ -195,24 +285,31 @@ class PandasMaterializer(BaseMaterializer):
 
         return is_dataframe_or_series(df)
 
-    def save(self, df: Union[pd.DataFrame, pd.Series]) -> None:
+    def save(self, df: Union[pd.DataFrame, pd.Series, LazyDataFrame]) -> None:
         """Writes a pandas dataframe or series to the specified filename.
 
         Args:
             df: The pandas dataframe or series to write.
         """
+        if isinstance(df, LazyDataFrame):
+            df = df.read()
+
         if isinstance(df, pd.Series):
             df = df.to_frame(name="series")
 
         if self.pyarrow_exists:
+            compression = _get_parquet_compression()
+            row_group_size = _get_parquet_row_group_size()
             with self.artifact_store.open(self.parquet_path, mode="wb") as f:
-                df.to_parquet(f, compression=COMPRESSION_TYPE)
+                df.to_parquet(
+                    f, compression=compression, row_group_size=row_group_size
+                )
         else:
             with self.artifact_store.open(self.csv_path, mode="wb") as f:
                 df.to_csv(f, index=True)
 
     def save_visualizations(
-        self, df: Union[pd.DataFrame, pd.Series]
+        self, df: Union[pd.DataFrame, pd.Series, LazyDataFrame]
     ) -> Dict[str, VisualizationType]:
         """Save visualizations of the given pandas dataframe or series.
 
@@ -230,6 +327,9 @@ class PandasMaterializer(BaseMaterializer):
         Returns:
             A dictionary of visualization URIs and their types.
         """
+        if isinstance(df, LazyDataFrame):
+            df = df.read()
+
         visualizations = {}
         describe_uri = os.path.join(self.uri, "describe.csv")
         describe_uri = describe_uri.replace("\\", "/")
@@ -258,7 +358,7 @@ class PandasMaterializer(BaseMaterializer):
         return visualizations
 
     def extract_metadata(
-        self, df: Union[pd.DataFrame, pd.Series]
+        self, df: Union[pd.DataFrame, pd.Series, LazyDataFrame]
     ) -> Dict[str, "MetadataType"]:
         """Extract metadata from the given pandas dataframe or series.
 
@@ -268,6 +368,9 @@ class PandasMaterializer(BaseMaterializer):
         Returns:
             The extracted metadata as a dictionary.
         """
+        if isinstance(df, LazyDataFrame):
+            df = df.read()
+
         # Store whether it's a Series for later reference
         is_series = isinstance(df, pd.Series)
 
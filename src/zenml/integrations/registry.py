@@ -13,10 +13,17 @@
 #  permissions and limitations under the License.
 """Implementation of a registry to track ZenML integrations."""
 
+import hashlib
 import importlib
+import json
 import os
+import sys
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
 
+from zenml.constants import (
+    ENV_ZENML_DISABLE_INTEGRATION_MANIFEST,
+    handle_bool_env_var,
+)
 from zenml.exceptions import IntegrationError
 from zenml.logger import get_logger
 
@@ -25,6 +32,44 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+INTEGRATION_MANIFEST_FILENAME = "integration_manifest.json"
+
+
+def _get_environment_fingerprint() -> str:
+    """Computes a fingerprint of the installed python distributions.
+
+    Instead of reading the metadata of all installed distributions, this only
+    lists the metadata directories in all `sys.path` entries. Their names
+    contain the name and version of each distribution, and the modification
+    time of the `sys.path` entries changes whenever a distribution gets
+    installed or removed.
+
+    Returns:
+        The fingerprint of the python environment.
+    """
+    hash_ = hashlib.md5()  # nosec
+    hash_.update(sys.executable.encode())
+    hash_.update(sys.version.encode())
+
+    for path in sys.path:
+        if not path or not os.path.isdir(path):
+            continue
+
+        hash_.update(path.encode())
+        try:
+            hash_.update(str(os.stat(path).st_mtime_ns).encode())
+            entries = sorted(os.listdir(path))
+        except OSError:
+            continue
+
+        for entry in entries:
+            if entry.endswith(
+                (".dist-info", ".egg-info", ".egg-link", ".pth")
+            ):
+                hash_.update(entry.encode())
+
+    return hash_.hexdigest()
+
 
 class IntegrationRegistry(object):
     """Registry to keep track of ZenML Integrations."""
@@ -96,11 +141,95 @@ class IntegrationRegistry(object):
                 logger.exception(f"Failed to import module `{module_path}`.")
                 continue
 
+    def _check_installations(self) -> Dict[str, bool]:
+        """Checks which of the registered integrations are installed.
+
+        Resolving the requirements of all integrations is expensive, which is
+        why the results are stored in an activation manifest in the global
+        config directory. The manifest is only valid as long as the installed
+        python distributions and the integration requirements don't change.
+
+        Returns:
+            A dict mapping integration names to whether they are installed.
+        """
+        from zenml.utils.io_utils import get_global_config_directory
+
+        self._initialize()
+
+        if handle_bool_env_var(ENV_ZENML_DISABLE_INTEGRATION_MANIFEST):
+            return {
+                name: integration.check_installation()
+                for name, integration in self._integrations.items()
+            }
+
+        manifest_path = os.path.join(
+            get_global_config_directory(), INTEGRATION_MANIFEST_FILENAME
+        )
+        fingerprint = _get_environment_fingerprint()
+
+        manifest: Dict[str, Any] = {}
+        try:
+            with open(manifest_path, "r") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        cached_integrations: Dict[str, Any] = {}
+        if (
+            isinstance(manifest, dict)
+            and manifest.get("fingerprint") == fingerprint
+        ):
+            cached_integrations = manifest.get("integrations", {})
+
+        installation_status: Dict[str, bool] = {}
+        integration_manifest: Dict[str, Any] = {}
+        for name, integration in self._integrations.items():
+            requirements = integration.get_requirements()
+            cached = cached_integrations.get(name)
+
+            if (
+                isinstance(cached, dict)
+                and cached.get("requirements") == requirements
+            ):
+                installed = bool(cached.get("installed"))
+            else:
+                installed = integration.check_installation()
+
+            installation_status[name] = installed
+            integration_manifest[name] = {
+                "requirements": requirements,
+                "installed": installed,
+            }
+
+        if integration_manifest != cached_integrations:
+            try:
+                os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+                # Write to a temporary file first so that concurrent
+                # processes never read a partially written manifest.
+                temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+                with open(temp_path, "w") as f:
+                    json.dump(
+                        {
+                            "fingerprint": fingerprint,
+                            "integrations": integration_manifest,
+                        },
+                        f,
+                    )
+                os.replace(temp_path, manifest_path)
+            except OSError as e:
+                logger.debug(
+                    "Failed to write integration manifest to `%s`: %s",
+                    manifest_path,
+                    e,
+                )
+
+        return installation_status
+
     def activate_integrations(self) -> None:
         """Method to activate the integrations with are registered in the registry."""
-        self._initialize()
+        installation_status = self._check_installations()
         for name, integration in self._integrations.items():
-            if integration.check_installation():
+            if installation_status[name]:
                 logger.debug(f"Activating integration `{name}`...")
                 integration.activate()
                 logger.debug(f"Integration `{name}` is activated.")
@@ -227,11 +356,10 @@ class IntegrationRegistry(object):
         Returns:
             List of installed integrations.
         """
-        self._initialize()
         return [
             name
-            for name, integration in integration_registry.integrations.items()
-            if integration.check_installation()
+            for name, installed in self._check_installations().items()
+            if installed
         ]
 
 
@@ -14,8 +14,15 @@
 """Functionality for reading, writing and managing files."""
 
 import os
+import shutil
 from typing import Any, Callable, Iterable, List, Optional, Tuple, Type
 
+from zenml.constants import (
+    DIRECTORY_TRANSFER_CHUNK_SIZE,
+    ENV_ZENML_DIRECTORY_TRANSFER_CHUNK_SIZE,
+    handle_int_env_var,
+)
+
 # this import required for CI to get local filesystem
 from zenml.io import local_filesystem  # noqa
 from zenml.io.filesystem import BaseFilesystem, PathType
@@ -87,11 +94,18 @@ def copy(src: "PathType", dst: "PathType", overwrite: bool = False) -> None:
                 f"Destination file '{convert_to_str(dst)}' already exists "
                 f"and `overwrite` is false."
             )
-        with open(src, mode="rb") as f:
-            contents = f.read()
-
-        with open(dst, mode="wb") as f:
-            f.write(contents)
+        # Stream the file in chunks so that large files don't need to fit
+        # into memory. Remote filesystems upload the chunks in multiple parts.
+        with open(src, mode="rb") as source_file:
+            with open(dst, mode="wb") as destination_file:
+                shutil.copyfileobj(
+                    source_file,
+                    destination_file,
+                    handle_int_env_var(
+                        ENV_ZENML_DIRECTORY_TRANSFER_CHUNK_SIZE,
+                        default=DIRECTORY_TRANSFER_CHUNK_SIZE,
+                    ),
+                )
 
 
 def exists(path: "PathType") -> bool:
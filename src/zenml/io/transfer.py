@@ -0,0 +1,224 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Concurrent transfer of directories between filesystems."""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import (
+    Callable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from zenml.constants import (
+    DIRECTORY_TRANSFER_MAX_WORKERS,
+    ENV_ZENML_DIRECTORY_TRANSFER_MAX_WORKERS,
+    handle_int_env_var,
+)
+from zenml.io import fileio
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TransferProgress(NamedTuple):
+    """Progress of a directory transfer."""
+
+    total_files: int
+    transferred_files: int
+    skipped_files: int
+    transferred_bytes: int
+
+
+def _list_files(
+    source_dir: str, destination_dir: str
+) -> List[Tuple[str, str]]:
+    """Lists all files of a directory and their destination paths.
+
+    Args:
+        source_dir: The directory to list.
+        destination_dir: The directory to which the files will be copied.
+
+    Returns:
+        Tuples of source and destination path for all files in the directory.
+    """
+    files = []
+    for name in fileio.listdir(source_dir):
+        name = fileio.convert_to_str(name)
+        source_path = os.path.join(source_dir, name)
+        destination_path = os.path.join(destination_dir, name)
+        if fileio.isdir(source_path):
+            if source_path == destination_dir:
+                # if the destination is a subdirectory of the source, we skip
+                # copying it to avoid an infinite loop.
+                continue
+            files.extend(_list_files(source_path, destination_path))
+        else:
+            files.append((source_path, destination_path))
+    return files
+
+
+def _is_transferred(source: str, destination: str) -> bool:
+    """Checks whether a file was already completely copied.
+
+    Args:
+        source: The source path of the file.
+        destination: The destination path of the file.
+
+    Returns:
+        Whether the destination file exists and has the size of the source.
+    """
+    if not fileio.exists(destination):
+        return False
+    size = fileio.size(destination)
+    return size is not None and size == fileio.size(source)
+
+
+def copy_files(
+    files: Sequence[Tuple[str, str]],
+    overwrite: bool = False,
+    resume: bool = False,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[TransferProgress], None]] = None,
+) -> None:
+    """Copies multiple files in parallel.
+
+    Files are streamed in chunks between different filesystems. The chunk
+    size can be configured using the `ZENML_DIRECTORY_TRANSFER_CHUNK_SIZE`
+    environment variable. The parent directories of the destination paths
+    need to exist.
+
+    Args:
+        files: Tuples of source and destination path of the files to copy.
+        overwrite: Whether to overwrite existing destination files.
+        resume: Whether to resume a previous, interrupted copy. Files that
+            already exist in the destination with the same size as the source
+            file are skipped, all other files are overwritten.
+        max_workers: The maximum number of files to copy in parallel.
+            Defaults to the value of the
+            `ZENML_DIRECTORY_TRANSFER_MAX_WORKERS` environment variable.
+        progress_callback: Function that is called with the progress of the
+            transfer after each file.
+    """
+    if max_workers is None:
+        max_workers = handle_int_env_var(
+            ENV_ZENML_DIRECTORY_TRANSFER_MAX_WORKERS,
+            default=DIRECTORY_TRANSFER_MAX_WORKERS,
+        )
+
+    lock = threading.Lock()
+    progress = TransferProgress(
+        total_files=len(files),
+        transferred_files=0,
+        skipped_files=0,
+        transferred_bytes=0,
+    )
+
+    def _copy_file(source: str, destination: str) -> None:
+        """Copies a single file and updates the transfer progress.
+
+        Args:
+            source: The source path of the file.
+            destination: The destination path of the file.
+        """
+        nonlocal progress
+
+        if resume and _is_transferred(source, destination):
+            with lock:
+                progress = progress._replace(
+                    skipped_files=progress.skipped_files + 1
+                )
+                if progress_callback:
+                    progress_callback(progress)
+            return
+
+        fileio.copy(source, destination, overwrite=overwrite or resume)
+        size = fileio.size(source) if progress_callback else None
+        with lock:
+            progress = progress._replace(
+                transferred_files=progress.transferred_files + 1,
+                transferred_bytes=progress.transferred_bytes + (size or 0),
+            )
+            if progress_callback:
+                progress_callback(progress)
+
+    if max_workers <= 1 or len(files) <= 1:
+        for source, destination in files:
+            _copy_file(source, destination)
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(files))
+        ) as executor:
+            futures = [
+                executor.submit(_copy_file, source, destination)
+                for source, destination in files
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    logger.debug(
+        "Copied %d files, skipped %d files.",
+        progress.transferred_files,
+        progress.skipped_files,
+    )
+
+
+def copy_directory(
+    source_dir: str,
+    destination_dir: str,
+    overwrite: bool = False,
+    resume: bool = False,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[TransferProgress], None]] = None,
+) -> None:
+    """Copies all files of a directory, transferring multiple files at once.
+
+    Args:
+        source_dir: The directory to copy.
+        destination_dir: The directory to copy to.
+        overwrite: Whether to overwrite existing files in the destination.
+        resume: Whether to resume a previous, interrupted copy. See
+            `copy_files` for details.
+        max_workers: The maximum number of files to copy in parallel.
+        progress_callback: Function that is called with the progress of the
+            transfer after each file.
+    """
+    files = _list_files(source_dir, destination_dir)
+
+    # Create all destination directories upfront instead of checking for
+    # their existence for every single file.
+    directories: Set[str] = {
+        os.path.dirname(destination) for _, destination in files
+    }
+    for directory in sorted(directories):
+        if not fileio.exists(directory):
+            fileio.makedirs(directory)
+
+    copy_files(
+        files,
+        overwrite=overwrite,
+        resume=resume,
+        max_workers=max_workers,
+        progress_callback=progress_callback,
+    )
@@ -20,5 +20,22 @@ STEP_LOGS_STORAGE_INTERVAL_SECONDS: int = 15
 # How many messages to buffer before uploading logs to the artifact store
 STEP_LOGS_STORAGE_MAX_MESSAGES: int = 100
 
+# How many buffers to queue for uploading before the logs are dropped
+STEP_LOGS_STORAGE_MAX_QUEUE_SIZE: int = 100
+
+# How many seconds to wait for space in a full upload queue before the logs are
+# dropped
+STEP_LOGS_STORAGE_MAX_QUEUE_WAIT_SECONDS: float = 1.0
+
+# How many seconds to wait for the queued logs to be uploaded when flushing or
+# closing the logs storage
+STEP_LOGS_STORAGE_MAX_FLUSH_WAIT_SECONDS: float = 60.0
+
 # How often to merge logs into a single file
 STEP_LOGS_STORAGE_MERGE_INTERVAL_SECONDS: int = 10 * 60
+
+# How many bytes of logs to write before updating the logs index
+STEP_LOGS_INDEX_GRANULARITY_BYTES: int = 1024 * 1024
+
+# How many lines of logs to fetch per page
+STEP_LOGS_PAGE_SIZE: int = 1000
@@ -13,14 +13,29 @@
 #  permissions and limitations under the License.
 """ZenML logging handler."""
 
-import logging
+import json
 import os
 import re
 import sys
+import threading
 import time
+from bisect import bisect_left, bisect_right
 from contextvars import ContextVar
+from datetime import datetime
+from queue import Empty, Full, Queue
 from types import TracebackType
-from typing import Any, Callable, List, Optional, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import UUID, uuid4
 
 from zenml import get_step_context
@@ -37,11 +52,16 @@ from zenml.constants import (
 from zenml.exceptions import DoesNotExistException
 from zenml.logger import get_logger
 from zenml.logging import (
+    STEP_LOGS_INDEX_GRANULARITY_BYTES,
+    STEP_LOGS_PAGE_SIZE,
     STEP_LOGS_STORAGE_INTERVAL_SECONDS,
+    STEP_LOGS_STORAGE_MAX_FLUSH_WAIT_SECONDS,
     STEP_LOGS_STORAGE_MAX_MESSAGES,
+    STEP_LOGS_STORAGE_MAX_QUEUE_SIZE,
+    STEP_LOGS_STORAGE_MAX_QUEUE_WAIT_SECONDS,
     STEP_LOGS_STORAGE_MERGE_INTERVAL_SECONDS,
 )
-from zenml.utils.time_utils import utc_now
+from zenml.utils.time_utils import to_utc_timezone, utc_now
 from zenml.zen_stores.base_zen_store import BaseZenStore
 
 # Get the logger
@@ -49,9 +69,30 @@ logger = get_logger(__name__)
 
 redirected: ContextVar[bool] = ContextVar("redirected", default=False)
 
+# The logs storage contexts that are active in the current execution context,
+# ordered from the outermost to the innermost one.
+_active_logs_contexts: ContextVar[Tuple["PipelineLogsStorageContext", ...]] = (
+    ContextVar("active_logs_contexts", default=())
+)
+# The logs storage context stacks of all execution contexts, in the order in
+# which they were entered. Used for output written by threads that do not have
+# a logs storage context of their own (e.g. threads spawned inside a step).
+_entered_logs_contexts: List[Tuple["PipelineLogsStorageContext", ...]] = []
+# The original `write` and `flush` methods of the redirected streams.
+_original_stream_methods: Dict[
+    str, Tuple[Any, Callable[..., Any], Callable[..., Any]]
+] = {}
+_redirect_lock = threading.RLock()
+
 LOGS_EXTENSION = ".log"
+LOGS_INDEX_EXTENSION = ".index"
 PIPELINE_RUN_LOGS_FOLDER = "pipeline_runs"
 
+LOGS_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+_LOGS_TIMESTAMP_PATTERN = re.compile(
+    r"^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) UTC\]"
+)
+
 
 def remove_ansi_escape_codes(text: str) -> str:
     """Auxiliary function to remove ANSI escape codes from a given string.
@@ -66,6 +107,79 @@ def remove_ansi_escape_codes(text: str) -> str:
     return ansi_escape.sub("", text)
 
 
+def _get_active_logs_contexts() -> Tuple["PipelineLogsStorageContext", ...]:
+    """Gets the logs storage contexts that should receive the current output.
+
+    Returns:
+        The logs storage contexts of the current execution context, or the
+        ones that were entered most recently in any execution context if the
+        current one has none.
+    """
+    contexts = _active_logs_contexts.get()
+    if not contexts and _entered_logs_contexts:
+        contexts = _entered_logs_contexts[-1]
+    return contexts
+
+
+def _redirected_write(
+    write: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """Writes to a redirected stream and stores the message in the logs.
+
+    Args:
+        write: The original `write` method of the redirected stream.
+        *args: The positional arguments passed to `write`.
+        **kwargs: The keyword arguments passed to `write`.
+
+    Returns:
+        The output of the original `write` method.
+    """
+    contexts = _get_active_logs_contexts()
+    if (
+        not args
+        or not contexts
+        # Output of the writer threads (e.g. errors or messages logged by the
+        # artifact store implementation) would otherwise keep them busy.
+        or isinstance(threading.current_thread(), _LogsWriter)
+    ):
+        return write(*args, **kwargs)
+
+    # Each context stores the message the way it was passed to it, starting
+    # from the innermost one, and potentially prepends the step name for
+    # the outer contexts and the console output.
+    message = args[0]
+    stored_messages = []
+    for context in reversed(contexts):
+        stored_messages.append((context, message))
+        message = context._prepend_step_name(message)
+
+    output = write(message, *args[1:], **kwargs)
+    for context, stored_message in stored_messages:
+        context.storage.write(stored_message)
+
+    return output
+
+
+def _redirected_flush(
+    flush: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """Flushes a redirected stream and the storage of all active contexts.
+
+    Args:
+        flush: The original `flush` method of the redirected stream.
+        *args: The positional arguments passed to `flush`.
+        **kwargs: The keyword arguments passed to `flush`.
+
+    Returns:
+        The output of the original `flush` method.
+    """
+    output = flush(*args, **kwargs)
+    for context in reversed(_get_active_logs_contexts()):
+        context.storage.save_to_file()
+
+    return output
+
+
 def prepare_logs_uri(
     artifact_store: "BaseArtifactStore",
     step_name: Optional[str] = None,
@@ -93,17 +207,25 @@ def prepare_logs_uri(
 
     # Delete the file if it already exists
     if artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
+        logs_index_uri = get_logs_index_uri(
+            os.path.join(logs_base_uri, log_key)
+        )
         logs_uri_folder = os.path.join(logs_base_uri, log_key)
         if artifact_store.exists(logs_uri_folder):
             logger.warning(
                 f"Logs directory {logs_uri_folder} already exists! Removing old log directory..."
             )
             artifact_store.rmtree(logs_uri_folder)
+        if artifact_store.exists(logs_index_uri):
+            artifact_store.remove(logs_index_uri)
 
         artifact_store.makedirs(logs_uri_folder)
         return logs_uri_folder
     else:
         logs_uri = os.path.join(logs_base_uri, f"{log_key}{LOGS_EXTENSION}")
+        logs_index_uri = get_logs_index_uri(logs_uri)
+        if artifact_store.exists(logs_index_uri):
+            artifact_store.remove(logs_index_uri)
         if artifact_store.exists(logs_uri):
             logger.warning(
                 f"Logs file {logs_uri} already exists! Removing old log file..."
@@ -222,8 +344,374 @@ def fetch_logs(
         artifact_store.cleanup()
 
 
+def get_logs_index_uri(logs_uri: str) -> str:
+    """Gets the URI of the index of a log file or folder.
+
+    The index is a JSON lines file next to the logs. Each line describes a
+    chunk of the logs with the keys `file` (the name of the file inside the
+    logs folder, empty for a single log file), `offset` and `size` (the byte
+    range of the chunk in that file), `lines` (the number of lines of the
+    chunk) and `first` and `last` (the timestamps of its first and last
+    message).
+
+    Args:
+        logs_uri: The URI of the log file or folder.
+
+    Returns:
+        The URI of the index.
+    """
+    return f"{logs_uri.rstrip('/')}{LOGS_INDEX_EXTENSION}"
+
+
+class _LogSegment(NamedTuple):
+    """A byte range of a log file.
+
+    Attributes:
+        uri: The URI of the log file.
+        offset: The offset of the segment in the file.
+        size: The size of the segment in bytes, or None if the segment
+            extends until the end of the file.
+        lines: The number of lines of the segment, if known.
+        last: The timestamp of the last message of the segment, if known.
+    """
+
+    uri: str
+    offset: int
+    size: Optional[int]
+    lines: Optional[int]
+    last: Optional[str]
+
+
+def _read_logs_index(
+    artifact_store: "BaseArtifactStore", logs_uri: str
+) -> List[Dict[str, Any]]:
+    """Reads the index of a log file or folder.
+
+    Args:
+        artifact_store: The artifact store in which the logs are stored.
+        logs_uri: The URI of the log file or folder.
+
+    Returns:
+        The index entries, or an empty list if the logs are not indexed.
+    """
+    try:
+        content = _load_file_from_artifact_store(
+            get_logs_index_uri(logs_uri),
+            artifact_store=artifact_store,
+            mode="rb",
+        ).decode()
+        entries = [json.loads(line) for line in content.splitlines() if line]
+        for entry in entries:
+            for key, type_ in (
+                ("file", str),
+                ("offset", int),
+                ("size", int),
+                ("lines", int),
+                ("last", str),
+            ):
+                if not isinstance(entry.get(key), type_):
+                    raise ValueError(f"Invalid index entry: {entry}")
+    except DoesNotExistException:
+        return []
+    except ValueError as e:
+        logger.debug("Ignoring invalid logs index of `%s`: %s", logs_uri, e)
+        return []
+
+    return entries
+
+
+def _get_log_segments(
+    artifact_store: "BaseArtifactStore", logs_uri: str
+) -> List[_LogSegment]:
+    """Gets the segments of a log file or folder in the order of the logs.
+
+    The indexed segments come first, followed by the parts of the logs that
+    were written after the index was last updated. If the index does not
+    match the logs, all logs are treated as not indexed.
+
+    Args:
+        artifact_store: The artifact store in which the logs are stored.
+        logs_uri: The URI of the log file or folder.
+
+    Returns:
+        The log segments.
+    """
+    entries = _read_logs_index(artifact_store, logs_uri)
+
+    if not artifact_store.isdir(logs_uri):
+        end = 0
+        for entry in entries:
+            if entry["file"] or entry["offset"] != end:
+                entries, end = [], 0
+                break
+            end += entry["size"]
+
+        segments = [
+            _LogSegment(
+                logs_uri,
+                entry["offset"],
+                entry["size"],
+                entry["lines"],
+                entry["last"],
+            )
+            for entry in entries
+        ]
+        segments.append(_LogSegment(logs_uri, end, None, None, None))
+        return segments
+
+    files = sorted(str(file) for file in artifact_store.listdir(logs_uri))
+    indexed_files = {entry["file"] for entry in entries}
+    unindexed_files = [file for file in files if file not in indexed_files]
+    if not indexed_files.issubset(files) or (
+        indexed_files
+        and unindexed_files
+        and min(unindexed_files) < max(indexed_files)
+    ):
+        entries, unindexed_files = [], files
+
+    segments = [
+        _LogSegment(
+            os.path.join(logs_uri, entry["file"]),
+            entry["offset"],
+            entry["size"],
+            entry["lines"],
+            entry["last"],
+        )
+        for entry in entries
+    ]
+    segments.extend(
+        _LogSegment(os.path.join(logs_uri, file), 0, None, None, None)
+        for file in unindexed_files
+    )
+    return segments
+
+
+def _split_lines(text: str) -> List[str]:
+    """Splits text into lines, keeping the line breaks.
+
+    Unlike `str.splitlines`, this only splits at line feeds, which is also how
+    the lines of the index are counted.
+
+    Args:
+        text: The text to split.
+
+    Returns:
+        The lines.
+    """
+    lines = [f"{line}\n" for line in text.split("\n")]
+    lines[-1] = lines[-1][:-1]
+    if not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def fetch_log_lines(
+    zen_store: "BaseZenStore",
+    artifact_store_id: Union[str, UUID],
+    logs_uri: str,
+    tail: Optional[int] = None,
+    since: Optional[datetime] = None,
+    page: Optional[int] = None,
+    size: int = STEP_LOGS_PAGE_SIZE,
+    strip_timestamp: bool = False,
+) -> str:
+    """Fetches a range of log lines from the artifact store.
+
+    For logs that were stored with an index, only the index and the requested
+    byte ranges of the logs are read from the artifact store.
+
+    Args:
+        zen_store: The store in which the artifact is stored.
+        artifact_store_id: The ID of the artifact store.
+        logs_uri: The URI of the log file or folder.
+        tail: If given, fetch the last `tail` lines.
+        since: If given, fetch up to `size` lines, starting with the first
+            message that was logged at or after this time.
+        page: If given, fetch the lines of this page (starting at 1) of
+            `size` lines each. Defaults to the first page if neither `tail`
+            nor `since` is given.
+        size: The page size.
+        strip_timestamp: Whether to strip timestamps in logs or not.
+
+    Returns:
+        The log lines as a string.
+
+    Raises:
+        ValueError: If more than one of `tail`, `since` and `page` is given
+            or if they are out of range.
+    """
+    if sum(option is not None for option in (tail, since, page)) > 1:
+        raise ValueError(
+            "Only one of `tail`, `since` and `page` can be specified."
+        )
+    if (tail is not None and tail < 0) or (page is not None and page < 1):
+        raise ValueError("`tail` must be >= 0 and `page` must be >= 1.")
+
+    artifact_store = _load_artifact_store(artifact_store_id, zen_store)
+    try:
+        segments = _get_log_segments(artifact_store, logs_uri)
+        indexed = [
+            segment for segment in segments if segment.lines is not None
+        ]
+
+        # The parts of the logs that are not indexed are written most
+        # recently and therefore small, so they are always read completely.
+        unindexed_lines: List[str] = []
+        for segment in segments[len(indexed) :]:
+            try:
+                unindexed_lines.extend(
+                    _split_lines(
+                        _load_file_from_artifact_store(
+                            segment.uri,
+                            artifact_store=artifact_store,
+                            mode="rb",
+                            offset=segment.offset,
+                        ).decode()
+                    )
+                )
+            except DoesNotExistException:
+                continue
+
+        starts = [0]
+        for segment in indexed:
+            starts.append(starts[-1] + (segment.lines or 0))
+        indexed_line_count = starts[-1]
+
+        def _read_lines(start: int, stop: int) -> List[str]:
+            lines: List[str] = []
+            first = bisect_right(starts, start) - 1
+            last = bisect_left(starts, min(stop, indexed_line_count))
+            # Adjacent segments of the same file are read at once
+            index = first
+            while index < last:
+                segment = indexed[index]
+                length = segment.size or 0
+                index += 1
+                while (
+                    index < last
+                    and indexed[index].uri == segment.uri
+                    and indexed[index].offset == segment.offset + length
+                ):
+                    length += indexed[index].size or 0
+                    index += 1
+                lines.extend(
+                    _split_lines(
+                        _load_file_from_artifact_store(
+                            segment.uri,
+                            artifact_store=artifact_store,
+                            mode="rb",
+                            offset=segment.offset,
+                            length=length,
+                        ).decode()
+                    )
+                )
+            lines = lines[start - starts[first] : stop - starts[first]]
+            lines.extend(
+                unindexed_lines[
+                    max(start - indexed_line_count, 0) : max(
+                        stop - indexed_line_count, 0
+                    )
+                ]
+            )
+            return lines
+
+        total = indexed_line_count + len(unindexed_lines)
+        if tail is not None:
+            lines = _read_lines(max(total - tail, 0), total)
+        elif since is not None:
+            since_str = to_utc_timezone(since).strftime(LOGS_TIMESTAMP_FORMAT)
+            # The first segment which contains messages logged after `since`
+            first = bisect_left(
+                [segment.last or "" for segment in indexed], since_str
+            )
+            start = starts[first]
+            if first < len(indexed):
+                stop = start + (indexed[first].lines or 0) + size
+            else:
+                stop = total
+            lines = _read_lines(start, stop)
+            for index, line in enumerate(lines):
+                match = _LOGS_TIMESTAMP_PATTERN.match(line)
+                if match and match.group(1) >= since_str:
+                    lines = lines[index : index + size]
+                    break
+            else:
+                lines = []
+        else:
+            start = ((page or 1) - 1) * size
+            lines = _read_lines(start, start + size)
+    finally:
+        artifact_store.cleanup()
+
+    logs = "".join(lines)
+    if strip_timestamp:
+        logs = _strip_timestamp_from_multiline_string(logs)
+    return logs
+
+
+# Items in the queue of a logs writer: a batch of messages to write, an event
+# to set once all previous batches are written, or `None` to stop the writer.
+_QueueItem = Union[List[str], threading.Event, None]
+
+
+class _LogsWriter(threading.Thread):
+    """Background thread which writes the queued logs to the artifact store."""
+
+    def __init__(self, storage: "PipelineLogsStorage") -> None:
+        """Initializes the writer.
+
+        Args:
+            storage: The storage for which to write the logs.
+        """
+        super().__init__(daemon=True, name="zenml-logs-writer")
+        self.storage = storage
+
+    def run(self) -> None:
+        """Write queued batches until the writer is stopped."""
+        running = True
+        while running:
+            items = [self.storage.queue.get()]
+            # Write all batches which are queued at this point at once
+            while True:
+                try:
+                    items.append(self.storage.queue.get_nowait())
+                except Empty:
+                    break
+
+            messages: List[str] = []
+            events: List[threading.Event] = []
+            for item in items:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    events.append(item)
+                else:
+                    messages.extend(item)
+
+            try:
+                self.storage._write_messages(messages)
+                self.storage._merge_log_files_if_needed()
+                if events:
+                    self.storage._write_index()
+            except Exception as e:
+                # Keep the writer running so later logs still get written and
+                # threads waiting for a flush don't block forever.
+                logger.error(f"Error while trying to write logs: {e}")
+                self.storage._invalidate_index()
+            finally:
+                for event in events:
+                    event.set()
+
+
 class PipelineLogsStorage:
-    """Helper class which buffers and stores logs to a given URI."""
+    """Helper class which buffers and stores logs to a given URI.
+
+    Writing to the artifact store happens in a background thread, so the
+    thread that produced the logs never waits for the artifact store. If the
+    artifact store can not keep up, the logs are queued up to a limit, after
+    which the producing threads wait for a short time before the logs are
+    dropped.
+    """
 
     def __init__(
         self,
@@ -232,6 +720,10 @@ class PipelineLogsStorage:
         max_messages: int = STEP_LOGS_STORAGE_MAX_MESSAGES,
         time_interval: int = STEP_LOGS_STORAGE_INTERVAL_SECONDS,
         merge_files_interval: int = STEP_LOGS_STORAGE_MERGE_INTERVAL_SECONDS,
+        max_queue_size: int = STEP_LOGS_STORAGE_MAX_QUEUE_SIZE,
+        max_queue_wait: float = STEP_LOGS_STORAGE_MAX_QUEUE_WAIT_SECONDS,
+        max_flush_wait: float = STEP_LOGS_STORAGE_MAX_FLUSH_WAIT_SECONDS,
+        index_granularity: int = STEP_LOGS_INDEX_GRANULARITY_BYTES,
     ) -> None:
         """Initialization.
 
@@ -243,23 +735,44 @@ class PipelineLogsStorage:
                 automatically.
             merge_files_interval: the amount of seconds before the created files
                 get merged into a single file.
+            max_queue_size: the maximum number of buffers that are queued for
+                writing to the artifact store.
+            max_queue_wait: the amount of seconds to wait for space in a full
+                queue before the buffer gets dropped.
+            max_flush_wait: the amount of seconds to wait for the queued
+                buffers to be written when flushing or closing the storage.
+            index_granularity: the amount of bytes of logs after which the
+                index gets updated.
         """
         # Parameters
         self.logs_uri = logs_uri
         self.max_messages = max_messages
         self.time_interval = time_interval
         self.merge_files_interval = merge_files_interval
+        self.max_queue_wait = max_queue_wait
+        self.max_flush_wait = max_flush_wait
+        self.index_granularity = index_granularity
 
         # State
         self.buffer: List[str] = []
-        self.disabled_buffer: List[str] = []
         self.last_save_time = time.time()
-        self.disabled = False
         self.artifact_store = artifact_store
+        self.dropped_messages = 0
+        self.queue: "Queue[_QueueItem]" = Queue(maxsize=max_queue_size)
+        self._buffer_lock = threading.Lock()
+        self._writer: Optional[_LogsWriter] = None
 
         # Immutable filesystems state
         self.last_merge_time = time.time()
 
+        # Index state. For immutable filesystems, the index is rewritten with
+        # all entries. Otherwise, only the new entries are appended.
+        self.index_uri = get_logs_index_uri(logs_uri)
+        self._index_entries: List[Dict[str, Any]] = []
+        self._index_valid = True
+        self._unindexed_bytes = 0
+        self._log_file_size: Optional[int] = None
+
     def write(self, text: str) -> None:
         """Main write method.
 
@@ -269,14 +782,14 @@ class PipelineLogsStorage:
         if text == "\n":
             return
 
-        if not self.disabled:
-            # Add timestamp to the message when it's received
-            timestamp = utc_now().strftime("%Y-%m-%d %H:%M:%S")
-            formatted_message = (
-                f"[{timestamp} UTC] {remove_ansi_escape_codes(text)}"
-            )
+        # Add timestamp to the message when it's received
+        timestamp = utc_now().strftime("%Y-%m-%d %H:%M:%S")
+        formatted_message = (
+            f"[{timestamp} UTC] {remove_ansi_escape_codes(text)}"
+        )
+        with self._buffer_lock:
             self.buffer.append(formatted_message.rstrip())
-            self.save_to_file()
+        self.save_to_file()
 
     @property
     def _is_write_needed(self) -> bool:
@@ -304,88 +817,225 @@ class PipelineLogsStorage:
     def save_to_file(self, force: bool = False) -> None:
         """Method to save the buffer to the given URI.
 
+        The buffer is handed over to the background writer. If the save is
+        forced, this method waits until all handed over messages are written,
+        for at most `max_flush_wait` seconds.
+
         Args:
             force: whether to force a save even if the write conditions not met.
         """
-        import asyncio
-        import threading
-
-        # Most artifact stores are based on fsspec, which converts between
-        # sync and async operations by using a separate AIO thread.
-        # It may happen that the fsspec call itself will log something,
-        # which will trigger this method, which may then use fsspec again,
-        # causing a "Calling sync() from within a running loop" error, because
-        # the fsspec library does not expect sync calls being made as a result
-        # of a logging call made by itself.
-        # To avoid this, we simply check if we're running in the fsspec AIO
-        # thread and skip the save if that's the case.
-        try:
-            if (
-                asyncio.events.get_running_loop() is not None
-                and threading.current_thread().name == "fsspecIO"
-            ):
+        with self._buffer_lock:
+            if not (self._is_write_needed or force):
                 return
-        except RuntimeError:
-            # No running loop
-            pass
 
-        if not self.disabled and (self._is_write_needed or force):
-            # IMPORTANT: keep this as the first code line in this method! The
-            # code that follows might still emit logging messages, which will
-            # end up triggering this method again, causing an infinite loop.
-            self.disabled = True
+            messages = self.buffer
+            self.buffer = []
+            self.last_save_time = time.time()
+
+        if messages:
+            self._enqueue(messages, block=force)
 
+        if force:
+            flushed = threading.Event()
+            if not (
+                self._enqueue(flushed, block=True)
+                and flushed.wait(timeout=self.max_flush_wait)
+            ):
+                logger.warning(
+                    "Timed out after %s seconds while waiting for the logs "
+                    "to be written to the artifact store.",
+                    self.max_flush_wait,
+                )
+
+    def close(self) -> None:
+        """Writes all remaining messages and stops the background writer."""
+        self.save_to_file(force=True)
+
+        if self._writer:
             try:
-                # The configured logging handler uses a lock to ensure that
-                # logs generated by different threads are not interleaved.
-                # Given that most artifact stores are based on fsspec, which
-                # use a separate thread for async operations, it may happen that
-                # the fsspec library itself will log something, which will end
-                # up in a deadlock.
-                # To avoid this, we temporarily disable the lock in the logging
-                # handler while writing to the file.
-                logging_handler = logging.getLogger().handlers[0]
-                logging_lock = logging_handler.lock
-                logging_handler.lock = None
-
-                if self.buffer:
-                    if self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
-                        _logs_uri = self._get_timestamped_filename()
-                        with self.artifact_store.open(
-                            os.path.join(
-                                self.logs_uri,
-                                _logs_uri,
-                            ),
-                            "w",
-                        ) as file:
-                            for message in self.buffer:
-                                file.write(f"{message}\n")
-                    else:
-                        with self.artifact_store.open(
-                            self.logs_uri, "a"
-                        ) as file:
-                            for message in self.buffer:
-                                file.write(f"{message}\n")
-                        self.artifact_store._remove_previous_file_versions(
-                            self.logs_uri
-                        )
+                self.queue.put(None, timeout=self.max_flush_wait)
+            except Full:
+                # The writer is stuck, it's a daemon thread so we leave it
+                pass
+            else:
+                self._writer.join(timeout=self.max_flush_wait)
+            self._writer = None
 
-            except (OSError, IOError) as e:
-                # This exception can be raised if there are issues with the
-                # underlying system calls, such as reaching the maximum number
-                # of open files, permission issues, file corruption, or other
-                # I/O errors.
-                logger.error(f"Error while trying to write logs: {e}")
-            finally:
-                # Restore the original logging handler lock
-                logging_handler.lock = logging_lock
+    def _enqueue(self, item: _QueueItem, block: bool) -> bool:
+        """Hands an item over to the background writer.
 
-                self.buffer = []
-                self.last_save_time = time.time()
+        Args:
+            item: The item to hand over.
+            block: Whether to wait up to `max_flush_wait` seconds for space in
+                the queue. Otherwise, messages are dropped if the queue is
+                still full after waiting for `max_queue_wait` seconds.
+
+        Returns:
+            Whether the item was handed over.
+        """
+        with self._buffer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = _LogsWriter(storage=self)
+                self._writer.start()
+
+        message_count = 0
+        if isinstance(item, list):
+            message_count = len(item)
+            if self.dropped_messages:
+                timestamp = utc_now().strftime("%Y-%m-%d %H:%M:%S")
+                item = [
+                    f"[{timestamp} UTC] {self.dropped_messages} log messages "
+                    "were dropped because the artifact store could not keep "
+                    "up.",
+                    *item,
+                ]
 
-                self.disabled = False
-        # merge created files on a given interval (defaults to 10 minutes)
-        # only runs on Immutable Filesystems
+        try:
+            self.queue.put(
+                item,
+                timeout=self.max_flush_wait if block else self.max_queue_wait,
+            )
+        except Full:
+            self.dropped_messages += message_count
+            return False
+        else:
+            if message_count:
+                self.dropped_messages = 0
+            return True
+
+    def _write_messages(self, messages: List[str]) -> None:
+        """Writes messages to the artifact store.
+
+        Args:
+            messages: The messages to write.
+        """
+        if not messages:
+            return
+
+        text = "".join(f"{message}\n" for message in messages)
+        try:
+            if self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
+                _logs_uri = self._get_timestamped_filename()
+                with self.artifact_store.open(
+                    os.path.join(
+                        self.logs_uri,
+                        _logs_uri,
+                    ),
+                    "w",
+                ) as file:
+                    file.write(text)
+                self._add_index_entry(_logs_uri, 0, text, messages)
+            else:
+                if self._log_file_size is None:
+                    self._log_file_size = (
+                        int(self.artifact_store.size(self.logs_uri) or 0)
+                        if self.artifact_store.exists(self.logs_uri)
+                        else 0
+                    )
+                with self.artifact_store.open(self.logs_uri, "a") as file:
+                    file.write(text)
+                self.artifact_store._remove_previous_file_versions(
+                    self.logs_uri
+                )
+                self._add_index_entry("", self._log_file_size, text, messages)
+                self._log_file_size += self._index_entries[-1]["size"]
+
+            if self._unindexed_bytes >= self.index_granularity:
+                self._write_index()
+        except (OSError, IOError) as e:
+            # This exception can be raised if there are issues with the
+            # underlying system calls, such as reaching the maximum number
+            # of open files, permission issues, file corruption, or other
+            # I/O errors.
+            logger.error(f"Error while trying to write logs: {e}")
+            # The index can not describe logs which were partially written
+            self._invalidate_index()
+
+    def _add_index_entry(
+        self, file: str, offset: int, text: str, messages: List[str]
+    ) -> None:
+        """Adds an entry for a written chunk of logs to the index.
+
+        Args:
+            file: The name of the file in the logs folder, or an empty string
+                if the logs are stored in a single file.
+            offset: The offset of the chunk in the file.
+            text: The text of the chunk.
+            messages: The messages of the chunk.
+        """
+        size = len(text.encode())
+        lines = text.count("\n")
+        first, last = (
+            match.group(1) if match else ""
+            for match in (
+                _LOGS_TIMESTAMP_PATTERN.match(messages[0]),
+                _LOGS_TIMESTAMP_PATTERN.match(messages[-1]),
+            )
+        )
+        self._unindexed_bytes += size
+
+        entries = self._index_entries
+        if (
+            entries
+            and not self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM
+            and entries[-1]["offset"] + entries[-1]["size"] == offset
+            and entries[-1]["size"] + size <= self.index_granularity
+        ):
+            entries[-1]["size"] += size
+            entries[-1]["lines"] += lines
+            entries[-1]["last"] = last
+        else:
+            entries.append(
+                {
+                    "file": file,
+                    "offset": offset,
+                    "size": size,
+                    "lines": lines,
+                    "first": first,
+                    "last": last,
+                }
+            )
+
+    def _write_index(self) -> None:
+        """Writes the new index entries to the artifact store."""
+        if not self._index_valid or not self._unindexed_bytes:
+            return
+
+        content = "".join(
+            f"{json.dumps(entry)}\n" for entry in self._index_entries
+        )
+        try:
+            if self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
+                with self.artifact_store.open(self.index_uri, "w") as file:
+                    file.write(content)
+            else:
+                with self.artifact_store.open(self.index_uri, "a") as file:
+                    file.write(content)
+                self.artifact_store._remove_previous_file_versions(
+                    self.index_uri
+                )
+                self._index_entries = []
+        except (OSError, IOError) as e:
+            logger.error(f"Error while trying to write logs index: {e}")
+            self._invalidate_index()
+        else:
+            self._unindexed_bytes = 0
+
+    def _invalidate_index(self) -> None:
+        """Removes the index, which means that all logs are read when fetched."""
+        self._index_valid = False
+        self._index_entries = []
+        try:
+            if self.artifact_store.exists(self.index_uri):
+                self.artifact_store.remove(self.index_uri)
+        except (OSError, IOError) as e:
+            logger.error(f"Error while trying to remove logs index: {e}")
+
+    def _merge_log_files_if_needed(self) -> None:
+        """Merges the created files on a given interval.
+
+        Only applies to immutable filesystems.
+        """
         if (
             self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM
             and time.time() - self.last_merge_time > self.merge_files_interval
@@ -418,35 +1068,101 @@ class PipelineLogsStorage:
                 files_.sort()
                 logger.debug("Log files count: %s", len(files_))
 
-                missing_files = set()
+                missing_files: Set[str] = set()
+                # offsets of the merged files in the new file
+                offsets: Dict[str, int] = {}
+                merged_size = 0
                 # dump all logs to a local file first
                 with self.artifact_store.open(
                     os.path.join(self.logs_uri, file_name_), "w"
                 ) as merged_file:
                     for file in files_:
                         try:
-                            merged_file.write(
-                                str(
-                                    _load_file_from_artifact_store(
-                                        os.path.join(self.logs_uri, str(file)),
-                                        artifact_store=self.artifact_store,
-                                        mode="r",
-                                    )
+                            content = str(
+                                _load_file_from_artifact_store(
+                                    os.path.join(self.logs_uri, str(file)),
+                                    artifact_store=self.artifact_store,
+                                    mode="r",
                                 )
                             )
                         except DoesNotExistException:
-                            missing_files.add(file)
+                            missing_files.add(str(file))
+                            continue
+                        merged_file.write(content)
+                        offsets[str(file)] = merged_size
+                        merged_size += len(content.encode())
+
+                # update the index before the merged files are removed
+                self._merge_index_entries(file_name_, offsets, missing_files)
 
                 # clean up left over files
                 for file in files_:
-                    if file not in missing_files:
+                    if str(file) not in missing_files:
                         self.artifact_store.remove(
                             os.path.join(self.logs_uri, str(file))
                         )
 
+    def _merge_index_entries(
+        self,
+        merged_file: str,
+        offsets: Dict[str, int],
+        missing_files: Set[str],
+    ) -> None:
+        """Updates the index after log files were merged.
+
+        Args:
+            merged_file: The name of the file into which the files were
+                merged.
+            offsets: The offsets of the merged files in the new file.
+            missing_files: Files which should have been merged but did not
+                exist anymore.
+        """
+        if not self._index_valid:
+            return
+
+        indexed_files = {entry["file"] for entry in self._index_entries}
+        if not indexed_files.issuperset(offsets):
+            # Some merged files were not written by this storage
+            self._invalidate_index()
+            return
+
+        entries: List[Dict[str, Any]] = []
+        for entry in self._index_entries:
+            if entry["file"] in offsets:
+                entry = {
+                    **entry,
+                    "file": merged_file,
+                    "offset": offsets[entry["file"]] + entry["offset"],
+                }
+            elif entry["file"] in missing_files:
+                continue
+
+            previous = entries[-1] if entries else None
+            if (
+                previous
+                and previous["file"] == entry["file"]
+                and previous["offset"] + previous["size"] == entry["offset"]
+                and previous["size"] + entry["size"] <= self.index_granularity
+            ):
+                previous["size"] += entry["size"]
+                previous["lines"] += entry["lines"]
+                previous["last"] = entry["last"]
+            else:
+                entries.append(entry)
+
+        self._index_entries = entries
+        self._unindexed_bytes = max(self._unindexed_bytes, 1)
+        self._write_index()
+
 
 class PipelineLogsStorageContext:
-    """Context manager which patches stdout and stderr during pipeline run execution."""
+    """Context manager which patches stdout and stderr during pipeline run execution.
+
+    The streams are patched only once per process, no matter how many contexts
+    are active. Each message is stored by the contexts that were entered in the
+    execution context (e.g. thread) that wrote it, which keeps the logs of
+    steps running in parallel separated.
+    """
 
     def __init__(
         self,
@@ -475,19 +1191,16 @@ class PipelineLogsStorageContext:
         Returns:
             self
         """
-        self.stdout_write = getattr(sys.stdout, "write")
-        self.stdout_flush = getattr(sys.stdout, "flush")
-
-        self.stderr_write = getattr(sys.stderr, "write")
-        self.stderr_flush = getattr(sys.stderr, "flush")
-
-        setattr(sys.stdout, "write", self._wrap_write(self.stdout_write))
-        setattr(sys.stdout, "flush", self._wrap_flush(self.stdout_flush))
+        with _redirect_lock:
+            if not _original_stream_methods:
+                for stream_name in ("stdout", "stderr"):
+                    self._wrap_stream(stream_name)
 
-        setattr(sys.stderr, "write", self._wrap_write(self.stderr_write))
-        setattr(sys.stderr, "flush", self._wrap_flush(self.stderr_flush))
+            contexts = _active_logs_contexts.get() + (self,)
+            self._contexts_token = _active_logs_contexts.set(contexts)
+            self._redirected_token = redirected.set(True)
+            _entered_logs_contexts.append(contexts)
 
-        redirected.set(True)
         return self
 
     def __exit__(
@@ -503,84 +1216,82 @@ class PipelineLogsStorageContext:
             exc_val: The instance of the exception
             exc_tb: The traceback of the exception
 
-        Restores the `write` method of both stderr and stdout.
+        Restores the `write` method of both stderr and stdout once no other
+        context is active anymore.
         """
-        self.storage.save_to_file(force=True)
-
-        setattr(sys.stdout, "write", self.stdout_write)
-        setattr(sys.stdout, "flush", self.stdout_flush)
-
-        setattr(sys.stderr, "write", self.stderr_write)
-        setattr(sys.stderr, "flush", self.stderr_flush)
-
-        redirected.set(False)
+        self.storage.close()
+
+        with _redirect_lock:
+            contexts = _active_logs_contexts.get()
+            _entered_logs_contexts.remove(contexts)
+            _active_logs_contexts.reset(self._contexts_token)
+            redirected.reset(self._redirected_token)
+
+            if not _entered_logs_contexts:
+                # Streams are restored in reverse order, as `sys.stdout` and
+                # `sys.stderr` might be the same object which was wrapped
+                # twice.
+                for stream, write, flush in reversed(
+                    list(_original_stream_methods.values())
+                ):
+                    setattr(stream, "write", write)
+                    setattr(stream, "flush", flush)
+                _original_stream_methods.clear()
 
         try:
             self.storage.merge_log_files(merge_all_files=True)
         except (OSError, IOError) as e:
             logger.warning(f"Step logs roll-up failed: {e}")
 
-    def _wrap_write(self, method: Callable[..., Any]) -> Callable[..., Any]:
-        """Wrapper function that utilizes the storage object to store logs.
+    @staticmethod
+    def _wrap_stream(stream_name: str) -> None:
+        """Wraps the `write` and `flush` methods of a system stream.
 
         Args:
-            method: the original write method
-
-        Returns:
-            the wrapped write method.
+            stream_name: The name of the stream in the `sys` module.
         """
+        stream = getattr(sys, stream_name)
+        # The wrappers keep references to the original methods, as threads
+        # might still be writing to the stream while it gets restored.
+        write = getattr(stream, "write")
+        flush = getattr(stream, "flush")
+        _original_stream_methods[stream_name] = (stream, write, flush)
 
         def wrapped_write(*args: Any, **kwargs: Any) -> Any:
-            step_names_disabled = (
-                handle_bool_env_var(
-                    ENV_ZENML_DISABLE_STEP_NAMES_IN_LOGS, default=False
-                )
-                or not self.prepend_step_name
-            )
+            return _redirected_write(write, *args, **kwargs)
 
-            if step_names_disabled:
-                output = method(*args, **kwargs)
-            else:
-                message = args[0]
-                # Try to get step context if not available yet
-                step_context = None
-                try:
-                    step_context = get_step_context()
-                except Exception:
-                    pass
-
-                if step_context and args[0] not in ["\n", ""]:
-                    # For progress bar updates (with \r), inject the step name after the \r
-                    if "\r" in message:
-                        message = message.replace(
-                            "\r", f"\r[{step_context.step_name}] "
-                        )
-                    else:
-                        message = f"[{step_context.step_name}] {message}"
-
-                output = method(message, *args[1:], **kwargs)
-
-            # Save the original message without step name prefix to storage
-            if args:
-                self.storage.write(args[0])
-
-            return output
+        def wrapped_flush(*args: Any, **kwargs: Any) -> Any:
+            return _redirected_flush(flush, *args, **kwargs)
 
-        return wrapped_write
+        setattr(stream, "write", wrapped_write)
+        setattr(stream, "flush", wrapped_flush)
 
-    def _wrap_flush(self, method: Callable[..., Any]) -> Callable[..., Any]:
-        """Wrapper function that flushes the buffer of the storage object.
+    def _prepend_step_name(self, message: str) -> str:
+        """Prepends the name of the running step to a message.
 
         Args:
-            method: the original flush method
+            message: The message.
 
         Returns:
-            the wrapped flush method.
+            The message, prefixed with the step name if enabled and a step is
+            running in the current execution context.
         """
+        step_names_disabled = (
+            handle_bool_env_var(
+                ENV_ZENML_DISABLE_STEP_NAMES_IN_LOGS, default=False
+            )
+            or not self.prepend_step_name
+        )
+        if step_names_disabled or message in ["\n", ""]:
+            return message
 
-        def wrapped_flush(*args: Any, **kwargs: Any) -> Any:
-            output = method(*args, **kwargs)
-            self.storage.save_to_file()
-            return output
-
-        return wrapped_flush
+        # Try to get step context if not available yet
+        try:
+            step_context = get_step_context()
+        except Exception:
+            return message
+
+        # For progress bar updates (with \r), inject the step name after the \r
+        if "\r" in message:
+            return message.replace("\r", f"\r[{step_context.step_name}] ")
+        return f"[{step_context.step_name}] {message}"
@@ -13,7 +13,11 @@
 #  permissions and limitations under the License.
 """Implementation of ZenML's builtin materializer."""
 
+import contextvars
 import os
+import shutil
+import tarfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -26,17 +30,23 @@ from typing import (
     Type,
     Union,
 )
+from uuid import uuid4
 
 from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
 from zenml.constants import (
     ENV_ZENML_MATERIALIZER_ALLOW_NON_ASCII_JSON_DUMPS,
     handle_bool_env_var,
 )
-from zenml.enums import ArtifactType, VisualizationType
+from zenml.enums import (
+    ArtifactType,
+    StackComponentType,
+    VisualizationType,
+)
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.materializers.materializer_registry import materializer_registry
-from zenml.utils import source_utils, yaml_utils
+from zenml.utils import io_utils, source_utils, yaml_utils
+from zenml.utils.time_utils import utc_now
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
@@ -45,6 +55,7 @@ logger = get_logger(__name__)
 DEFAULT_FILENAME = "data.json"
 DEFAULT_BYTES_FILENAME = "data.txt"
 DEFAULT_METADATA_FILENAME = "metadata.json"
+PACKED_ELEMENTS_FILENAME = "elements.tar"
 BASIC_TYPES = (
     bool,
     float,
@@ -284,6 +295,48 @@ def find_materializer_registry_type(type_: Type[Any]) -> Type[Any]:
     )
 
 
+def _get_staging_artifact_store(path: str) -> BaseArtifactStore:
+    """Gets a local artifact store to stage container elements in.
+
+    Args:
+        path: The local directory of the artifact store.
+
+    Returns:
+        The local artifact store.
+    """
+    from zenml.artifact_stores.local_artifact_store import (
+        LocalArtifactStore,
+        LocalArtifactStoreConfig,
+    )
+
+    return LocalArtifactStore(
+        name="staging",
+        id=uuid4(),
+        config=LocalArtifactStoreConfig(path=path),
+        flavor="local",
+        type=StackComponentType.ARTIFACT_STORE,
+        user=None,
+        created=utc_now(),
+        updated=utc_now(),
+    )
+
+
+def _get_directory_size(path: str) -> int:
+    """Gets the total size of all files in a local directory.
+
+    Args:
+        path: The local directory.
+
+    Returns:
+        The total size of all files in bytes.
+    """
+    return sum(
+        os.path.getsize(os.path.join(root, file))
+        for root, _, files in os.walk(path)
+        for file in files
+    )
+
+
 class BuiltInContainerMaterializer(BaseMaterializer):
     """Handle built-in container types (dict, list, set, tuple)."""
 
@@ -293,6 +346,11 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         set,
         tuple,
     )
+    # Elements whose materialized files are at most this size are packed
+    # into a single archive instead of being stored in separate directories.
+    MAX_PACKED_ELEMENT_SIZE: ClassVar[int] = 1024 * 1024  # 1 MiB
+    # Maximum number of threads used to store and load separate elements.
+    MAX_WORKERS: ClassVar[int] = 16
 
     def __init__(
         self, uri: str, artifact_store: Optional[BaseArtifactStore] = None
@@ -306,6 +364,7 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         super().__init__(uri, artifact_store)
         self.data_path = os.path.join(self.uri, DEFAULT_FILENAME)
         self.metadata_path = os.path.join(self.uri, DEFAULT_METADATA_FILENAME)
+        self.packed_path = os.path.join(self.uri, PACKED_ELEMENTS_FILENAME)
 
     def load(self, data_type: Type[Any]) -> Any:
         """Reads a materialized built-in container object.
@@ -318,6 +377,9 @@ class BuiltInContainerMaterializer(BaseMaterializer):
             3. Initialize the materializer with the desired path,
             4. Use `load()` of that materializer to load the element.
 
+        Packed elements are extracted from their archive into a temporary
+        directory first. All elements are loaded in parallel.
+
         Args:
             data_type: The type of the data to read.
 
@@ -327,19 +389,17 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         Raises:
             RuntimeError: If the data was not found.
         """
+        # If the data was serialized as JSON, deserialize it.
+        if self.artifact_store.exists(self.data_path):
+            outputs = yaml_utils.read_json(self.data_path)
+
         # If the data was not serialized, there must be metadata present.
-        if not self.artifact_store.exists(
-            self.data_path
-        ) and not self.artifact_store.exists(self.metadata_path):
+        elif not self.artifact_store.exists(self.metadata_path):
             raise RuntimeError(
                 f"Materialization of type {data_type} failed. Expected either"
                 f"{self.data_path} or {self.metadata_path} to exist."
             )
 
-        # If the data was serialized as JSON, deserialize it.
-        if self.artifact_store.exists(self.data_path):
-            outputs = yaml_utils.read_json(self.data_path)
-
         # Otherwise, use the metadata to reconstruct the data as a list.
         else:
             metadata = yaml_utils.read_json(self.metadata_path)
@@ -360,17 +420,7 @@ class BuiltInContainerMaterializer(BaseMaterializer):
 
             # New format for zenml > 0.37.0
             elif isinstance(metadata, list):
-                for entry in metadata:
-                    path_ = entry["path"]
-                    type_ = source_utils.load(entry["type"])
-                    materializer_class = source_utils.load(
-                        entry["materializer"]
-                    )
-                    materializer = materializer_class(
-                        uri=path_, artifact_store=self.artifact_store
-                    )
-                    element = materializer.load(type_)
-                    outputs.append(element)
+                outputs = self._load_elements(metadata)
 
             else:
                 raise RuntimeError(f"Unknown metadata format: {metadata}.")
@@ -392,7 +442,9 @@ class BuiltInContainerMaterializer(BaseMaterializer):
 
         Otherwise, use the `default_materializer_registry` to find the correct
         materializer for each element and materialize each element into a
-        subdirectory.
+        local staging directory. Elements whose files are small are packed
+        into a single archive, larger ones are uploaded into separate
+        subdirectories in parallel.
 
         Tuples and sets are cast to list before materialization.
 
@@ -421,45 +473,176 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         if isinstance(data, dict):
             data = [list(data.keys()), list(data.values())]
 
-        # non-serializable list: Materialize each element into a subfolder.
-        # Get path, type, and corresponding materializer for each element.
-        metadata: List[Dict[str, str]] = []
-        materializers: List[BaseMaterializer] = []
+        # non-serializable list: Materialize each element into a local
+        # staging directory first. Small elements are then packed into a
+        # single archive, larger ones are uploaded into separate subfolders.
+        metadata: List[Dict[str, Any]] = []
         try:
-            for i, element in enumerate(data):
-                element_path = os.path.join(self.uri, str(i))
-                self.artifact_store.mkdir(element_path)
-                type_ = type(element)
-                materializer_class = materializer_registry[type_]
-                materializer = materializer_class(
-                    uri=element_path, artifact_store=self.artifact_store
-                )
-                materializers.append(materializer)
-                metadata.append(
-                    {
-                        "path": element_path,
-                        "type": source_utils.resolve(type_).import_path,
-                        "materializer": source_utils.resolve(
-                            materializer_class
-                        ).import_path,
-                    }
-                )
+            with self.get_temporary_directory(
+                delete_at_exit=True
+            ) as staging_dir:
+                self._save_elements(data, staging_dir, metadata)
             # Write metadata as JSON.
             yaml_utils.write_json(self.metadata_path, metadata)
-            # Materialize each element.
-            for element, materializer in zip(data, materializers):
-                materializer.validate_save_type_compatibility(type(element))
-                materializer.save(element)
         # If an error occurs, delete all created files.
         except Exception as e:
             # Delete metadata
             if self.artifact_store.exists(self.metadata_path):
                 self.artifact_store.remove(self.metadata_path)
+            if self.artifact_store.exists(self.packed_path):
+                self.artifact_store.remove(self.packed_path)
             # Delete all elements that were already saved.
             for entry in metadata:
-                self.artifact_store.rmtree(entry["path"])
+                if not entry["packed"] and self.artifact_store.exists(
+                    entry["path"]
+                ):
+                    self.artifact_store.rmtree(entry["path"])
             raise e
 
+    def _save_elements(
+        self,
+        data: List[Any],
+        staging_dir: str,
+        metadata: List[Dict[str, Any]],
+    ) -> None:
+        """Materializes the elements of a non-serializable list.
+
+        Args:
+            data: The elements to materialize.
+            staging_dir: Local directory in which the elements are staged.
+            metadata: List to which the metadata of each element is appended.
+        """
+        staging_store = _get_staging_artifact_store(staging_dir)
+        packed_paths: List[str] = []
+        # Resolving sources is slow, so it is only done once per class.
+        import_paths: Dict[Type[Any], str] = {}
+
+        def _resolve(class_: Type[Any]) -> str:
+            if class_ not in import_paths:
+                import_paths[class_] = source_utils.resolve(class_).import_path
+            return import_paths[class_]
+
+        def _upload(staged_path: str, element_path: str) -> None:
+            self.artifact_store.mkdir(element_path)
+            io_utils.copy_dir(staged_path, element_path)
+            shutil.rmtree(staged_path)
+
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            uploads: List[Future[None]] = []
+            for i, element in enumerate(data):
+                staged_path = os.path.join(staging_dir, str(i))
+                os.makedirs(staged_path)
+                type_ = type(element)
+                materializer_class = materializer_registry[type_]
+                materializer = materializer_class(
+                    uri=staged_path, artifact_store=staging_store
+                )
+                materializer.validate_save_type_compatibility(type_)
+                materializer.save(element)
+
+                element_path = os.path.join(self.uri, str(i))
+                packed = (
+                    _get_directory_size(staged_path)
+                    <= self.MAX_PACKED_ELEMENT_SIZE
+                )
+                metadata.append(
+                    {
+                        "path": element_path,
+                        "type": _resolve(type_),
+                        "materializer": _resolve(materializer_class),
+                        "packed": packed,
+                    }
+                )
+                if packed:
+                    packed_paths.append(staged_path)
+                else:
+                    # Large elements are uploaded in the background while the
+                    # next elements are materialized.
+                    uploads.append(
+                        executor.submit(_upload, staged_path, element_path)
+                    )
+
+            for upload in uploads:
+                upload.result()
+
+        if packed_paths:
+            with self.artifact_store.open(self.packed_path, "wb") as f:
+                with tarfile.open(
+                    fileobj=f, mode="w|", format=tarfile.GNU_FORMAT
+                ) as tar:
+                    for staged_path in packed_paths:
+                        tar.add(
+                            staged_path, arcname=os.path.basename(staged_path)
+                        )
+
+    def _load_elements(self, metadata: List[Dict[str, Any]]) -> List[Any]:
+        """Loads the elements of a non-serializable list.
+
+        Args:
+            metadata: The metadata of each element.
+
+        Returns:
+            The loaded elements.
+        """
+        staging_store = None
+        if any(entry.get("packed", False) for entry in metadata):
+            # Some materializers load data lazily, which is why the extracted
+            # files persist until the step execution ends.
+            with self.get_temporary_directory(
+                delete_at_exit=False
+            ) as staging_dir:
+                with self.artifact_store.open(self.packed_path, "rb") as f:
+                    with tarfile.open(fileobj=f, mode="r|") as tar:
+                        for member in tar:
+                            # Only extract regular files and directories with
+                            # safe paths to prevent path traversal attacks
+                            if (
+                                member.isfile() or member.isdir()
+                            ) and io_utils.is_path_within_directory(
+                                member.name, staging_dir
+                            ):
+                                tar.extract(member, path=staging_dir)  # nosec B202 - members are filtered through is_path_within_directory
+            staging_store = _get_staging_artifact_store(staging_dir)
+
+        # Loading sources is slow, so it is only done once per source.
+        sources = {
+            source: source_utils.load(source)
+            for source in {
+                source
+                for entry in metadata
+                for source in (entry["type"], entry["materializer"])
+            }
+        }
+
+        def _load(entry: Dict[str, Any]) -> Any:
+            type_ = sources[entry["type"]]
+            materializer_class = sources[entry["materializer"]]
+            if entry.get("packed", False):
+                assert staging_store is not None
+                materializer = materializer_class(
+                    uri=os.path.join(
+                        staging_store.path, os.path.basename(entry["path"])
+                    ),
+                    artifact_store=staging_store,
+                )
+            else:
+                materializer = materializer_class(
+                    uri=entry["path"], artifact_store=self.artifact_store
+                )
+            return materializer.load(type_)
+
+        if len(metadata) <= 1:
+            return [_load(entry) for entry in metadata]
+
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            # Each element is loaded in a copy of the current context, so that
+            # the element materializers still use e.g. the running step.
+            loads = [
+                executor.submit(contextvars.copy_context().run, _load, entry)
+                for entry in metadata
+            ]
+            return [load.result() for load in loads]
+
     # save dict type objects to JSON file with JSON visualization type
     def save_visualizations(self, data: Any) -> Dict[str, "VisualizationType"]:
         """Save visualizations for the given data.
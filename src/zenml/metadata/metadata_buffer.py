@@ -0,0 +1,162 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Buffer which collects run metadata and stores it in bulk."""
+
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from zenml.constants import (
+    STEP_METADATA_BUFFER_MAX_SIZE,
+    STEP_METADATA_FLUSH_INTERVAL_SECONDS,
+)
+from zenml.enums import MetadataResourceTypes
+from zenml.logger import get_logger
+from zenml.utils.time_utils import increasing_time_ns
+
+if TYPE_CHECKING:
+    from zenml.metadata.metadata_types import MetadataType
+    from zenml.models import RunMetadataResource
+
+logger = get_logger(__name__)
+
+_BufferKey = Tuple[
+    Tuple[Tuple[MetadataResourceTypes, UUID], ...],
+    Optional[UUID],
+    Optional[UUID],
+]
+
+
+class RunMetadataBuffer:
+    """Buffer which collects run metadata and stores it in bulk.
+
+    Every call to `add()` is stored as a separate entry, so logging the same
+    key multiple times stores all values, exactly as if they were stored
+    without the buffer. Each entry also records the time at which it was
+    added, which orders values of the same key that are stored in one flush.
+    The buffer is flushed once it holds `max_size` values
+    or `flush_interval` seconds have passed since the last flush, and when
+    `flush()` is called explicitly.
+    """
+
+    def __init__(
+        self,
+        max_size: int = STEP_METADATA_BUFFER_MAX_SIZE,
+        flush_interval: float = STEP_METADATA_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        """Initializes the buffer.
+
+        Args:
+            max_size: The number of buffered values after which the buffer is
+                flushed.
+            flush_interval: The number of seconds after which the buffer is
+                flushed when new metadata is added.
+        """
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self._entries: List[
+            Tuple[_BufferKey, Dict[str, "MetadataType"], int]
+        ] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+
+    def add(
+        self,
+        metadata: Dict[str, "MetadataType"],
+        resources: List["RunMetadataResource"],
+        stack_component_id: Optional[UUID] = None,
+        publisher_step_id: Optional[UUID] = None,
+    ) -> None:
+        """Adds metadata to the buffer.
+
+        Args:
+            metadata: The metadata to add as a dictionary of key-value pairs.
+            resources: The resources for which the metadata was produced.
+            stack_component_id: The ID of the stack component that produced
+                the metadata.
+            publisher_step_id: The ID of the step execution that publishes
+                this metadata.
+        """
+        key: _BufferKey = (
+            tuple(
+                sorted(
+                    {(resource.type, resource.id) for resource in resources}
+                )
+            ),
+            stack_component_id,
+            publisher_step_id,
+        )
+        # Values are stored with the time at which they were logged, as all
+        # values of a flush get the same creation time.
+        sequence = increasing_time_ns()
+        with self._lock:
+            self._entries.append((key, dict(metadata), sequence))
+            self._size += len(metadata)
+
+            if (
+                self._size >= self.max_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self.flush()
+
+    def flush(self) -> None:
+        """Stores all buffered metadata in a single request."""
+        from zenml.client import Client
+        from zenml.metadata.metadata_types import prepare_run_metadata
+        from zenml.models import RunMetadataRequest, RunMetadataResource
+
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._entries:
+                return
+
+            entries, self._entries, self._size = self._entries, [], 0
+            client = Client()
+            requests = []
+            for (
+                resources,
+                stack_component_id,
+                publisher_step_id,
+            ), metadata, sequence in entries:
+                values, types = prepare_run_metadata(metadata)
+                requests.append(
+                    RunMetadataRequest(
+                        project=client.active_project.id,
+                        resources=[
+                            RunMetadataResource(id=id_, type=type_)
+                            for type_, id_ in resources
+                        ],
+                        stack_component_id=stack_component_id,
+                        publisher_step_id=publisher_step_id,
+                        values=values,
+                        types=types,
+                        sequence=sequence,
+                    )
+                )
+
+            logger.debug(
+                "Storing %d run metadata values.",
+                sum(len(request.values) for request in requests),
+            )
+            client.zen_store.batch_create_run_metadata(requests)
+
+    def __len__(self) -> int:
+        """Returns the number of buffered metadata values.
+
+        Returns:
+            The number of buffered metadata values.
+        """
+        return self._size
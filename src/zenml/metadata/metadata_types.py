@@ -252,3 +252,42 @@ def validate_metadata(
         validated_metadata[key] = value
 
     return validated_metadata
+
+
+def prepare_run_metadata(
+    metadata: Dict[str, MetadataType],
+) -> Tuple[Dict[str, MetadataType], Dict[str, MetadataTypeEnum]]:
+    """Prepare metadata to be stored as run metadata.
+
+    This function excludes and warns about metadata values that are too long
+    or of an unsupported type.
+
+    Args:
+        metadata: The metadata to prepare.
+
+    Returns:
+        The metadata values which can be stored and their types.
+    """
+    values: Dict[str, MetadataType] = {}
+    types: Dict[str, MetadataTypeEnum] = {}
+    for key, value in metadata.items():
+        # Skip metadata that is too large to be stored in the database.
+        if len(json.dumps(value)) > TEXT_FIELD_MAX_LENGTH:
+            logger.warning(
+                f"Metadata value for key '{key}' is too large to be "
+                "stored in the database. Skipping."
+            )
+            continue
+        # Skip metadata that is not of a supported type.
+        try:
+            metadata_type = get_metadata_type(value)
+        except ValueError as e:
+            logger.warning(
+                f"Metadata value for key '{key}' is not of a supported "
+                f"type. Skipping. Full error: {e}"
+            )
+            continue
+        values[key] = value
+        types[key] = metadata_type
+
+    return values, types
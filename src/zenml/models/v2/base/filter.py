@@ -13,6 +13,8 @@
 #  permissions and limitations under the License.
 """Base filter model definitions."""
 
+import base64
+import binascii
 import json
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -549,11 +551,13 @@ class BaseFilter(BaseModel):
         "page",
         "size",
         "logical_operator",
+        "cursor",
+        "include_total",
     ]
     CUSTOM_SORTING_OPTIONS: ClassVar[List[str]] = []
 
     # List of fields that are not even mentioned as options in the CLI.
-    CLI_EXCLUDE_FIELDS: ClassVar[List[str]] = []
+    CLI_EXCLUDE_FIELDS: ClassVar[List[str]] = ["cursor", "include_total"]
 
     # List of fields that are wrapped with `fastapi.Query(default)` in API.
     API_MULTI_INPUT_PARAMS: ClassVar[List[str]] = []
@@ -575,6 +579,17 @@ class BaseFilter(BaseModel):
         le=PAGE_SIZE_MAXIMUM,
         description="Page size",
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor returned as `next_cursor` by the previous page. "
+        "If set, the items following the cursor are returned instead of the "
+        "requested page.",
+    )
+    include_total: bool = Field(
+        default=True,
+        description="Whether to count the total number of items. If "
+        "disabled, the total only includes the items up to the returned page.",
+    )
     id: Optional[Union[UUID, str]] = Field(
         default=None,
         description="Id for this resource",
@@ -890,6 +905,134 @@ class BaseFilter(BaseModel):
         """
         return self.size * (self.page - 1)
 
+    def supports_cursor_pagination(self, table: Type["AnySchema"]) -> bool:
+        """Checks whether the query can be paginated using cursors.
+
+        Cursors can only be used when sorting by a non-nullable column of the
+        table.
+
+        Args:
+            table: The query table.
+
+        Returns:
+            Whether the query can be paginated using cursors.
+        """
+        column, _ = self.sorting_params
+        if column in self.CUSTOM_SORTING_OPTIONS:
+            return False
+
+        table_column = table.__table__.columns.get(column)  # type: ignore[attr-defined]
+        return table_column is not None and not table_column.nullable
+
+    def create_cursor(self, item: "AnySchema", page: int) -> str:
+        """Creates a cursor pointing to the items following an item.
+
+        Args:
+            item: The last item of the current page.
+            page: The index of the page following the item.
+
+        Returns:
+            The cursor.
+        """
+        column, _ = self.sorting_params
+        value = getattr(item, column)
+        value_type = None
+        if isinstance(value, datetime):
+            value, value_type = value.isoformat(), "datetime"
+        elif isinstance(value, UUID):
+            value, value_type = value.hex, "uuid"
+
+        data = {
+            "column": column,
+            "value": value,
+            "type": value_type,
+            "id": item.id.hex,
+            "page": page,
+        }
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+    def _decode_cursor(self) -> Dict[str, Any]:
+        """Decodes the cursor of this filter.
+
+        Returns:
+            The decoded cursor.
+
+        Raises:
+            ValueError: If the cursor is invalid or was created for a
+                different sort column.
+        """
+        assert self.cursor
+        try:
+            data = json.loads(base64.urlsafe_b64decode(self.cursor.encode()))
+            column, value, id_, page = (
+                data["column"],
+                data["value"],
+                UUID(data["id"]),
+                int(data["page"]),
+            )
+            if data["type"] == "datetime":
+                value = datetime.fromisoformat(value)
+            elif data["type"] == "uuid":
+                value = UUID(value)
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise ValueError(f"Invalid pagination cursor `{self.cursor}`.")
+
+        if column != self.sorting_params[0]:
+            raise ValueError(
+                f"The pagination cursor was created for items sorted by "
+                f"`{column}` and can't be used to sort by "
+                f"`{self.sorting_params[0]}`."
+            )
+        return {"value": value, "id": id_, "page": page}
+
+    @property
+    def cursor_page(self) -> int:
+        """The index of the page the cursor points to.
+
+        Returns:
+            The page index.
+        """
+        if not self.cursor:
+            return self.page
+
+        return int(self._decode_cursor()["page"])
+
+    def apply_cursor(
+        self,
+        query: AnyQuery,
+        table: Type["AnySchema"],
+    ) -> AnyQuery:
+        """Restricts a sorted query to the items following the cursor.
+
+        Args:
+            query: The query to which to apply the cursor.
+            table: The query table.
+
+        Returns:
+            The query with the cursor applied.
+        """
+        if not self.cursor:
+            return query
+
+        cursor = self._decode_cursor()
+        column_name, operand = self.sorting_params
+        column = getattr(table, column_name)
+
+        # Items are sorted by the sort column and their ID as a tiebreaker,
+        # see `apply_sorting`.
+        if operand == SorterOps.DESCENDING:
+            beyond_cursor = column < cursor["value"]
+        else:
+            beyond_cursor = column > cursor["value"]
+
+        query = query.where(
+            or_(
+                beyond_cursor,
+                and_(column == cursor["value"], table.id > cursor["id"]),
+            )
+        )
+        return query
+
     def generate_filter(
         self, table: Type["AnySchema"]
     ) -> Union["ColumnElement[bool]"]:
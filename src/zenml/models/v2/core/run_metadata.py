@@ -47,6 +47,12 @@ class RunMetadataRequest(ProjectScopedRequest):
         title="The ID of the step execution that published this metadata.",
         default=None,
     )
+    sequence: Optional[int] = Field(
+        title="The time at which the metadata was logged, in nanoseconds "
+        "since the epoch. Used to order values of the same key which are "
+        "stored at the same time. Set when storing the metadata if not given.",
+        default=None,
+    )
 
     @model_validator(mode="after")
     def validate_values_keys(self) -> "RunMetadataRequest":
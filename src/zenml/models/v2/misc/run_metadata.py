@@ -14,6 +14,7 @@
 """Utility classes for modeling run metadata."""
 
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -32,6 +33,9 @@ class RunMetadataResource(BaseModel):
 class RunMetadataEntry(BaseModel):
     """Utility class to sort/list run metadata entries."""
 
+    key: Optional[str] = Field(
+        default=None, title="The key of the run metadata entry."
+    )
     value: MetadataType = Field(title="The value for the run metadata entry")
     created: datetime = Field(
         title="The timestamp when this resource was created."
@@ -14,7 +14,7 @@
 """Model definitions for ZenML servers."""
 
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
@@ -102,6 +102,12 @@ class ServerModel(BaseModel):
         title="The metadata associated with the server.",
     )
 
+    request_content_encodings: List[str] = Field(
+        [],
+        title="The content encodings supported by the server for request "
+        "bodies.",
+    )
+
     last_user_activity: Optional[datetime] = Field(
         None,
         title="Timestamp of latest user activity traced on the server.",
@@ -14,7 +14,7 @@
 """Utilities for caching."""
 
 import hashlib
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from zenml.client import Client
 from zenml.enums import ExecutionStatus, SorterOps
@@ -136,6 +136,30 @@ def get_cached_step_run(cache_key: str) -> Optional["StepRunResponse"]:
     return None
 
 
+def get_cached_step_runs(
+    cache_keys: List[str],
+) -> Dict[str, "StepRunResponse"]:
+    """Get the existing step runs for multiple cache keys at once.
+
+    Compared to calling `get_cached_step_run` for each cache key, this only
+    requires a single request to the ZenML server.
+
+    Args:
+        cache_keys: The cache keys of the steps.
+
+    Returns:
+        A dictionary mapping cache keys to the existing step run which can be
+        used as cache. Cache keys without such a step run are not included.
+    """
+    if not cache_keys:
+        return {}
+
+    client = Client()
+    return client.zen_store.get_cached_run_steps(
+        project_id=client.active_project.id, cache_keys=cache_keys
+    )
+
+
 def create_cached_step_runs_and_prune_deployment(
     deployment: "PipelineDeploymentResponse",
     pipeline_run: "PipelineRunResponse",
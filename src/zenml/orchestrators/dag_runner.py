@@ -15,9 +15,10 @@
 
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 from zenml.logger import get_logger
 
@@ -65,7 +66,11 @@ class ThreadedDagRunner:
     well as a custom `run_fn` as input, then calls `run_fn(node)` for each
     string node in the DAG.
 
-    Steps that can be executed in parallel will be started in separate threads.
+    Nodes whose upstream nodes have all completed are put in a ready queue.
+    The ready nodes are started by the scheduling loop in the calling thread
+    as soon as a slot is available, and each of them is run in a thread of a
+    worker pool that never exceeds `max_parallelism` threads. Finished nodes
+    wake up the scheduling loop immediately, so no polling is involved.
     """
 
     def __init__(
@@ -107,7 +112,9 @@ class ThreadedDagRunner:
         self.node_states = {
             node: NodeStatus.NOT_STARTED for node in self.nodes
         }
-        self._lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._ready_nodes: Deque[str] = deque()
+        self._running_nodes = 0
 
     def _can_run(self, node: str) -> bool:
         """Determine whether a node is ready to be run.
@@ -131,32 +138,53 @@ class ThreadedDagRunner:
 
         return True
 
-    def _prepare_node_run(self, node: str) -> None:
-        """Prepare a node run.
+    def _enqueue_node(self, node: str) -> None:
+        """Add a node to the ready queue.
+
+        Must be called while holding the condition lock.
 
         Args:
             node: The node.
         """
-        if self.max_parallelism is None:
-            with self._lock:
-                self.node_states[node] = NodeStatus.RUNNING
-        else:
+        self.node_states[node] = NodeStatus.PENDING
+        self._ready_nodes.append(node)
+
+    def _has_free_slot(self) -> bool:
+        """Check whether another node can be started right now.
+
+        Must be called while holding the condition lock.
+
+        Returns:
+            True if fewer than `max_parallelism` nodes are running.
+        """
+        return (
+            self.max_parallelism is None
+            or self._running_nodes < self.max_parallelism
+        )
+
+    def _next_node(self) -> Optional[str]:
+        """Wait until a ready node can be started.
+
+        Returns:
+            The next node to start, or None if all nodes that can run have
+            finished.
+        """
+        with self._condition:
             while True:
-                with self._lock:
-                    logger.debug(f"Checking if {node} can run.")
-                    running_nodes = len(
-                        [
-                            state
-                            for state in self.node_states.values()
-                            if state == NodeStatus.RUNNING
-                        ]
-                    )
-                    if running_nodes < self.max_parallelism:
-                        self.node_states[node] = NodeStatus.RUNNING
-                        break
+                if self._ready_nodes and self._has_free_slot():
+                    node = self._ready_nodes.popleft()
+                    self.node_states[node] = NodeStatus.RUNNING
+                    self._running_nodes += 1
+                    return node
+
+                if not self._ready_nodes and self._running_nodes == 0:
+                    return None
 
-                logger.debug(f"Waiting for {running_nodes} nodes to finish.")
-                time.sleep(10)
+                logger.debug(
+                    "Waiting for one of %d running nodes to finish.",
+                    self._running_nodes,
+                )
+                self._condition.wait()
 
     def _run_node(self, node: str) -> None:
         """Run a single node.
@@ -166,90 +194,70 @@ class ThreadedDagRunner:
         Args:
             node: The node.
         """
-        self._prepare_node_run(node)
-
         try:
             self.run_fn(node)
-            self._finish_node(node)
-        except Exception as e:
-            self._finish_node(node, failed=True)
+        except BaseException as e:
             logger.exception(f"Node `{node}` failed: {e}")
-
-    def _run_node_in_thread(self, node: str) -> threading.Thread:
-        """Run a single node in a separate thread.
-
-        Args:
-            node: The node.
-
-        Returns:
-            The thread in which the node was run.
-        """
-        assert self.node_states[node] == NodeStatus.NOT_STARTED
-        with self._lock:
-            self.node_states[node] = NodeStatus.PENDING
-
-        # Run node in new thread.
-        thread = threading.Thread(target=self._run_node, args=(node,))
-        thread.start()
-        return thread
+            self._finish_node(node, failed=True)
+        else:
+            self._finish_node(node)
 
     def _finish_node(self, node: str, failed: bool = False) -> None:
         """Finish a node run.
 
-        First updates the node status to completed.
-        Then starts all other nodes that can now be run and waits for them.
+        Updates the node status, queues all downstream nodes that can now be
+        run and wakes up the scheduling loop.
 
         Args:
             node: The node.
             failed: Whether the node failed.
         """
-        # Update node status to completed.
-        assert self.node_states[node] == NodeStatus.RUNNING
-        with self._lock:
+        with self._condition:
+            assert self.node_states[node] == NodeStatus.RUNNING
+            self._running_nodes -= 1
+
             if failed:
+                # If the node failed, we don't need to run any downstream
+                # nodes.
                 self.node_states[node] = NodeStatus.FAILED
             else:
                 self.node_states[node] = NodeStatus.COMPLETED
+                for downstream_node in self.reversed_dag[node]:
+                    if self._can_run(downstream_node):
+                        self._enqueue_node(downstream_node)
 
-        if failed:
-            # If the node failed, we don't need to run any downstream nodes.
-            return
-
-        # Run downstream nodes.
-        threads: List[threading.Thread] = []
-        for downstream_node in self.reversed_dag[node]:
-            if self._can_run(downstream_node):
-                if threads and self.parallel_node_startup_waiting_period > 0:
-                    time.sleep(self.parallel_node_startup_waiting_period)
-
-                thread = self._run_node_in_thread(downstream_node)
-                threads.append(thread)
-
-        # Wait for all downstream nodes to complete.
-        for thread in threads:
-            thread.join()
+            self._condition.notify_all()
 
     def run(self) -> None:
         """Call `self.run_fn` on all nodes in `self.dag`.
 
         The order of execution is determined using topological sort.
-        Each node is run in a separate thread to enable parallelism.
+        Each node is run in a worker thread to enable parallelism.
         """
-        # Run all nodes that can be started immediately.
-        # These will, in turn, start other nodes once all of their respective
-        # upstream nodes have completed.
-        threads: List[threading.Thread] = []
-        for node in self.nodes:
-            if self._can_run(node):
-                if threads and self.parallel_node_startup_waiting_period > 0:
-                    time.sleep(self.parallel_node_startup_waiting_period)
-
-                thread = self._run_node_in_thread(node)
-                threads.append(thread)
+        with self._condition:
+            for node in self.nodes:
+                if self._can_run(node):
+                    self._enqueue_node(node)
+
+        max_workers = self.max_parallelism or max(len(self.nodes), 1)
+        last_start_time: Optional[float] = None
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dag_runner"
+        ) as executor:
+            while (next_node := self._next_node()) is not None:
+                if (
+                    last_start_time is not None
+                    and self.parallel_node_startup_waiting_period > 0
+                ):
+                    remaining_delay = (
+                        self.parallel_node_startup_waiting_period
+                        - (time.monotonic() - last_start_time)
+                    )
+                    if remaining_delay > 0:
+                        time.sleep(remaining_delay)
 
-        # Wait till all nodes have completed.
-        for thread in threads:
-            thread.join()
+                last_start_time = time.monotonic()
+                executor.submit(self._run_node, next_node)
 
         # Call the finalize function.
         if self.finalize_fn:
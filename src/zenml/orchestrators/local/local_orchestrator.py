@@ -13,17 +13,22 @@
 #  permissions and limitations under the License.
 """Implementation of the ZenML local orchestrator."""
 
+import contextvars
 import time
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, cast
 from uuid import uuid4
 
+from pydantic import PositiveInt
+
 from zenml.logger import get_logger
 from zenml.orchestrators import BaseOrchestrator
 from zenml.orchestrators.base_orchestrator import (
     BaseOrchestratorConfig,
     BaseOrchestratorFlavor,
 )
+from zenml.orchestrators.dag_runner import ThreadedDagRunner
 from zenml.stack import Stack
+from zenml.steps.step_context import StepContext
 from zenml.utils import string_utils
 
 if TYPE_CHECKING:
@@ -35,12 +40,22 @@ logger = get_logger(__name__)
 class LocalOrchestrator(BaseOrchestrator):
     """Orchestrator responsible for running pipelines locally.
 
-    This orchestrator does not allow for concurrent execution of steps and also
-    does not support running on a schedule.
+    This orchestrator runs steps sequentially by default. If `max_parallelism`
+    is configured to a value greater than one, independent steps are executed
+    concurrently in separate threads. Running on a schedule is not supported.
     """
 
     _orchestrator_run_id: Optional[str] = None
 
+    @property
+    def config(self) -> "LocalOrchestratorConfig":
+        """Returns the `LocalOrchestratorConfig` config.
+
+        Returns:
+            The configuration.
+        """
+        return cast(LocalOrchestratorConfig, self._config)
+
     def prepare_or_run_pipeline(
         self,
         deployment: "PipelineDeploymentResponse",
@@ -48,7 +63,11 @@ class LocalOrchestrator(BaseOrchestrator):
         environment: Dict[str, str],
         placeholder_run: Optional["PipelineRunResponse"] = None,
     ) -> Any:
-        """Iterates through all steps and executes them sequentially.
+        """Iterates through all steps and executes them.
+
+        Steps are executed sequentially, unless `max_parallelism` is greater
+        than one, in which case steps are executed in topological order with
+        all independent steps running concurrently.
 
         Args:
             deployment: The pipeline deployment to prepare or run.
@@ -67,7 +86,6 @@ class LocalOrchestrator(BaseOrchestrator):
         self._orchestrator_run_id = str(uuid4())
         start_time = time.time()
 
-        # Run each step
         for step_name, step in deployment.step_configurations.items():
             if self.requires_resources_in_orchestration_environment(step):
                 logger.warning(
@@ -77,16 +95,64 @@ class LocalOrchestrator(BaseOrchestrator):
                     step_name,
                 )
 
-            self.run_step(
-                step=step,
-            )
+        try:
+            if self.config.max_parallelism > 1:
+                self._run_steps_in_parallel(deployment=deployment)
+            else:
+                # Run each step
+                for step in deployment.step_configurations.values():
+                    self.run_step(
+                        step=step,
+                    )
+        finally:
+            self._orchestrator_run_id = None
 
         run_duration = time.time() - start_time
         logger.info(
             "Pipeline run has finished in `%s`.",
             string_utils.get_human_readable_time(run_duration),
         )
-        self._orchestrator_run_id = None
+
+    def _run_steps_in_parallel(
+        self, deployment: "PipelineDeploymentResponse"
+    ) -> None:
+        """Runs all steps of a deployment using a threaded DAG runner.
+
+        Args:
+            deployment: The pipeline deployment to run.
+
+        Raises:
+            BaseException: The exception of the first step that failed.
+        """
+        # Each step thread runs in a copy of the current context, so that
+        # the pipeline logs are still captured while the step logs and
+        # step context stay isolated per thread. Explicitly clearing the step
+        # context makes sure that no thread falls back to the step context
+        # of another thread.
+        StepContext._clear()
+        parent_context = contextvars.copy_context()
+        step_exceptions: List[BaseException] = []
+
+        def _run_step(step_name: str) -> None:
+            step = deployment.step_configurations[step_name]
+            try:
+                parent_context.copy().run(self.run_step, step=step)
+            except BaseException as e:
+                step_exceptions.append(e)
+                raise
+
+        pipeline_dag = {
+            step_name: step.spec.upstream_steps
+            for step_name, step in deployment.step_configurations.items()
+        }
+        ThreadedDagRunner(
+            dag=pipeline_dag,
+            run_fn=_run_step,
+            max_parallelism=self.config.max_parallelism,
+        ).run()
+
+        if step_exceptions:
+            raise step_exceptions[0]
 
     def get_orchestrator_run_id(self) -> str:
         """Returns the active orchestrator run id.
@@ -105,7 +171,15 @@ class LocalOrchestrator(BaseOrchestrator):
 
 
 class LocalOrchestratorConfig(BaseOrchestratorConfig):
-    """Local orchestrator config."""
+    """Local orchestrator config.
+
+    Attributes:
+        max_parallelism: Maximum number of steps to run in parallel. Steps are
+            run sequentially in the order of the deployment if this is set
+            to `1`.
+    """
+
+    max_parallelism: PositiveInt = 1
 
     @property
     def is_local(self) -> bool:
@@ -84,6 +84,7 @@ class StepRunRequestFactory:
         self,
         request: StepRunRequest,
         step_runs: Optional[Dict[str, "StepRunResponse"]] = None,
+        check_cache: bool = True,
     ) -> None:
         """Populate a step run request with additional information.
 
@@ -92,6 +93,10 @@ class StepRunRequestFactory:
             step_runs: A dictionary of already fetched step runs to use for
                 input resolution. This will be updated in-place with newly
                 fetched step runs.
+            check_cache: Whether to look for an existing step run that can be
+                used as cache for the step. If set to False, the caller is
+                responsible for applying a cached step run using
+                `apply_cached_step_run(...)`.
         """
         step = self.deployment.step_configurations[request.name]
 
@@ -129,6 +134,9 @@ class StepRunRequestFactory:
             CODE_HASH_PARAMETER_NAME
         )
 
+        if not check_cache:
+            return
+
         cache_enabled = utils.is_setting_enabled(
             is_enabled_on_step=step.config.enable_cache,
             is_enabled_on_pipeline=self.deployment.pipeline_configuration.enable_cache,
@@ -138,19 +146,33 @@ class StepRunRequestFactory:
             if cached_step_run := cache_utils.get_cached_step_run(
                 cache_key=cache_key
             ):
-                request.inputs = {
-                    input_name: [artifact.id for artifact in artifacts]
-                    for input_name, artifacts in cached_step_run.inputs.items()
-                }
+                self.apply_cached_step_run(
+                    request=request, cached_step_run=cached_step_run
+                )
+
+    @staticmethod
+    def apply_cached_step_run(
+        request: StepRunRequest, cached_step_run: "StepRunResponse"
+    ) -> None:
+        """Turn a step run request into a request for a cached step run.
+
+        Args:
+            request: The request to update.
+            cached_step_run: The existing step run which is used as cache.
+        """
+        request.inputs = {
+            input_name: [artifact.id for artifact in artifacts]
+            for input_name, artifacts in cached_step_run.inputs.items()
+        }
 
-                request.original_step_run_id = cached_step_run.id
-                request.outputs = {
-                    output_name: [artifact.id for artifact in artifacts]
-                    for output_name, artifacts in cached_step_run.outputs.items()
-                }
+        request.original_step_run_id = cached_step_run.id
+        request.outputs = {
+            output_name: [artifact.id for artifact in artifacts]
+            for output_name, artifacts in cached_step_run.outputs.items()
+        }
 
-                request.status = ExecutionStatus.CACHED
-                request.end_time = request.start_time
+        request.status = ExecutionStatus.CACHED
+        request.end_time = request.start_time
 
     def _get_docstring_and_source_code(
         self, invocation_id: str
@@ -307,7 +329,11 @@ def create_cached_step_runs(
         # them -> no need to check them again
         - visited_invocations
     ):
-        for invocation_id in cache_candidates:
+        # All candidates of the same wave are independent of each other, which
+        # means we can look up and create their cached step runs in batches
+        # instead of sending separate requests for each of them.
+        step_run_requests: List[StepRunRequest] = []
+        for invocation_id in sorted(cache_candidates):
             visited_invocations.add(invocation_id)
 
             try:
@@ -315,7 +341,7 @@ def create_cached_step_runs(
                     invocation_id
                 )
                 request_factory.populate_request(
-                    step_run_request, step_runs=step_runs
+                    step_run_request, step_runs=step_runs, check_cache=False
                 )
             except Exception as e:
                 # We failed to create/populate the step run. This might be due
@@ -328,13 +354,40 @@ def create_cached_step_runs(
                 )
                 continue
 
-            if step_run_request.status != ExecutionStatus.CACHED:
+            step_run_requests.append(step_run_request)
+
+        cached_step_runs = cache_utils.get_cached_step_runs(
+            cache_keys=[
+                request.cache_key
+                for request in step_run_requests
+                if request.cache_key
+            ]
+        )
+
+        cached_step_run_requests = []
+        for step_run_request in step_run_requests:
+            if not step_run_request.cache_key or not (
+                cached_step_run := cached_step_runs.get(
+                    step_run_request.cache_key
+                )
+            ):
                 # If we're not able to cache the step run, the orchestrator
                 # will run the step later which will create the step run
                 # -> We don't need to do anything here
                 continue
 
-            step_run = Client().zen_store.create_run_step(step_run_request)
+            request_factory.apply_cached_step_run(
+                request=step_run_request, cached_step_run=cached_step_run
+            )
+            cached_step_run_requests.append(step_run_request)
+
+        if not cached_step_run_requests:
+            continue
+
+        for step_run in Client().zen_store.batch_create_run_steps(
+            cached_step_run_requests
+        ):
+            invocation_id = step_run.name
 
             # Include the newly created step run in the step runs dictionary to
             # avoid fetching it again later when downstream steps need it for
@@ -28,7 +28,10 @@ from typing import (
 )
 
 from zenml.artifacts.unmaterialized_artifact import UnmaterializedArtifact
-from zenml.artifacts.utils import _store_artifact_data_and_prepare_request
+from zenml.artifacts.utils import (
+    _load_artifact_manifest,
+    _store_artifact_data_and_prepare_request,
+)
 from zenml.client import Client
 from zenml.config.step_configurations import StepConfiguration
 from zenml.config.step_run_info import StepRunInfo
@@ -263,7 +266,18 @@ class StepRunner:
                                 },
                                 model_version=model_version,
                             )
+
+                        step_context.metadata_buffer.flush()
                 finally:
+                    try:
+                        # Store the metadata which is still buffered if the
+                        # step or one of the previous operations failed
+                        step_context.metadata_buffer.flush()
+                    except Exception as e:
+                        logger.error(
+                            "Failed to store the metadata logged by step "
+                            f"`{step_run.name}`: {e}"
+                        )
                     step_context._cleanup_registry.execute_callbacks(
                         raise_on_exception=False
                     )
@@ -462,6 +476,9 @@ class StepRunner:
                 uri=artifact.uri, artifact_store=artifact_store
             )
             materializer.validate_load_type_compatibility(data_type)
+            _load_artifact_manifest(
+                artifact_store=artifact_store, uri=artifact.uri
+            )
             return materializer.load(data_type=data_type)
 
         if artifact.artifact_store_id == self._stack.artifact_store.id:
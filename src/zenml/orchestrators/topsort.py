@@ -110,10 +110,23 @@ def topsorted_layers(
     def get_clean_child_nodes(node: NodeT) -> List[NodeT]:
         return _apply_and_clean(get_child_nodes, "get_child_nodes", node)
 
+    # Count the parents of each node. A node is added to the next layer once
+    # all its parents were visited. If a node is part of a cycle, it will
+    # never be included since it will have at least one unvisited parent node
+    # which is also part of the cycle.
+    nodes_by_id = {get_node_id_fn(node): node for node in nodes}
+    num_unvisited_parents = {
+        node_id: len(get_clean_parent_nodes(node))
+        for node_id, node in nodes_by_id.items()
+    }
+
     # The first layer contains nodes with no incoming edges.
-    layer = [node for node in nodes if not get_clean_parent_nodes(node)]
+    layer = [
+        node
+        for node in nodes
+        if num_unvisited_parents[get_node_id_fn(node)] == 0
+    ]
 
-    visited_node_ids = set()
     layers = []
     while layer:
         layer = sorted(layer, key=get_node_id_fn)
@@ -121,17 +134,11 @@ def topsorted_layers(
 
         next_layer = []
         for node in layer:
-            visited_node_ids.add(get_node_id_fn(node))
             for child_node in get_clean_child_nodes(node):
-                # Include the child node if all its parents are visited. If the child
-                # node is part of a cycle, it will never be included since it will have
-                # at least one unvisited parent node which is also part of the cycle.
-                parent_node_ids = set(
-                    get_node_id_fn(p)
-                    for p in get_clean_parent_nodes(child_node)
-                )
-                if parent_node_ids.issubset(visited_node_ids):
-                    next_layer.append(child_node)
+                child_node_id = get_node_id_fn(child_node)
+                num_unvisited_parents[child_node_id] -= 1
+                if num_unvisited_parents[child_node_id] == 0:
+                    next_layer.append(nodes_by_id[child_node_id])
         layer = next_layer
 
     num_output_nodes = sum(len(layer) for layer in layers)
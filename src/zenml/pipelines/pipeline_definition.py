@@ -169,6 +169,7 @@ class Pipeline:
             substitutions: Extra placeholders to use in the name templates.
         """
         self._invocations: Dict[str, StepInvocation] = {}
+        self._invocation_id_counters: Dict[str, int] = {}
         self._run_args: Dict[str, Any] = {}
 
         self._configuration = PipelineConfiguration(
@@ -471,6 +472,7 @@ class Pipeline:
         # Clear existing parameters and invocations
         self._parameters = {}
         self._invocations = {}
+        self._invocation_id_counters = {}
 
         conflicting_parameters = {}
         parameters_ = (self.configuration.parameters or {}).copy()
@@ -1283,7 +1285,6 @@ To avoid this consider setting pipeline parameters only in one place (config or
         Raises:
             RuntimeError: If no ID suffix is allowed and an invocation for the
                 same ID already exists.
-            RuntimeError: If no unique invocation ID can be found.
 
         Returns:
             The invocation ID.
@@ -1296,12 +1297,16 @@ To avoid this consider setting pipeline parameters only in one place (config or
         if not allow_suffix:
             raise RuntimeError(f"Duplicate step ID `{id_}`")
 
-        for index in range(2, 10000):
+        # Remember the next suffix to try for each ID, so invoking the same
+        # step many times doesn't probe all previously used suffixes again.
+        index = self._invocation_id_counters.get(base_id, 2)
+        id_ = f"{base_id}_{index}"
+        while id_ in self.invocations:
+            index += 1
             id_ = f"{base_id}_{index}"
-            if id_ not in self.invocations:
-                return id_
 
-        raise RuntimeError("Unable to find step ID")
+        self._invocation_id_counters[base_id] = index + 1
+        return id_
 
     def __enter__(self) -> Self:
         """Activate the pipeline context.
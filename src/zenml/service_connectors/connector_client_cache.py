@@ -0,0 +1,352 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Process-wide cache of service connector clients with refresh-ahead."""
+
+import os
+import threading
+import time
+from datetime import timezone
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+)
+
+from zenml.constants import (
+    ENV_ZENML_SERVICE_CONNECTOR_REFRESH_FRACTION,
+    SERVICE_CONNECTOR_REFRESH_FRACTION,
+    SERVICE_CONNECTOR_SKEW_TOLERANCE_SECONDS,
+)
+from zenml.logger import get_logger
+from zenml.utils.singleton import SingletonMetaClass
+
+if TYPE_CHECKING:
+    from zenml.service_connectors.service_connector import ServiceConnector
+
+logger = get_logger(__name__)
+
+ConnectorClientLoader = Callable[[], "ServiceConnector"]
+
+
+class _Refresh:
+    """A refresh of a cache entry which is in progress."""
+
+    def __init__(self) -> None:
+        """Initializes the refresh."""
+        self.done = threading.Event()
+        self.client: Optional["ServiceConnector"] = None
+        self.error: Optional[Exception] = None
+
+
+class _CacheEntry:
+    """A cached connector client."""
+
+    def __init__(
+        self,
+        client: "ServiceConnector",
+        refresh_at: Optional[float],
+        timer: Optional[threading.Timer],
+    ) -> None:
+        """Initializes the cache entry.
+
+        Args:
+            client: The connector client.
+            refresh_at: The time at which the client should be refreshed, or
+                None if the client credentials do not expire.
+            timer: The timer which refreshes the client in the background.
+        """
+        self.client = client
+        self.refresh_at = refresh_at
+        self.timer = timer
+        # Whether the client was used since it was cached
+        self.used = False
+
+
+def get_refresh_fraction() -> float:
+    """Gets the fraction of the credentials lifetime after which to refresh.
+
+    Returns:
+        The configured refresh fraction.
+    """
+    value = os.getenv(ENV_ZENML_SERVICE_CONNECTOR_REFRESH_FRACTION)
+    try:
+        fraction = (
+            float(value) if value else SERVICE_CONNECTOR_REFRESH_FRACTION
+        )
+    except ValueError:
+        logger.warning(
+            "Invalid value `%s` for %s, using the default instead.",
+            value,
+            ENV_ZENML_SERVICE_CONNECTOR_REFRESH_FRACTION,
+        )
+        fraction = SERVICE_CONNECTOR_REFRESH_FRACTION
+
+    return min(max(fraction, 0.0), 1.0)
+
+
+class ServiceConnectorClientCache(metaclass=SingletonMetaClass):
+    """Process-wide cache of service connector clients.
+
+    Clients with expiring credentials are refreshed in the background once a
+    configurable fraction of their lifetime has passed, so that stack
+    components can switch to fresh credentials before the old ones expire
+    instead of fetching new ones while they are being used. Concurrent
+    refreshes of the same client are deduplicated.
+
+    Only clients which were used since they were cached are refreshed in the
+    background. Clients which are no longer used are refreshed the next time
+    they are requested instead.
+
+    Only clients with expiring credentials are cached. Other clients are
+    fetched every time, which makes sure that changes to their connectors are
+    picked up.
+    """
+
+    def __init__(self, refresh_fraction: Optional[float] = None) -> None:
+        """Initializes the cache.
+
+        Args:
+            refresh_fraction: The fraction of the credentials lifetime after
+                which clients are refreshed. Defaults to the value of the
+                `ZENML_SERVICE_CONNECTOR_REFRESH_FRACTION` environment
+                variable.
+        """
+        self.refresh_fraction = (
+            get_refresh_fraction()
+            if refresh_fraction is None
+            else refresh_fraction
+        )
+        self._entries: Dict[Hashable, _CacheEntry] = {}
+        self._refreshes: Dict[Hashable, _Refresh] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, key: Hashable, loader: ConnectorClientLoader
+    ) -> "ServiceConnector":
+        """Gets a valid connector client.
+
+        If no valid client is cached, this waits for a new client to be
+        fetched. If the cached client is due for a refresh, the refresh is
+        started in the background and the cached client is returned.
+
+        Args:
+            key: The cache key of the client.
+            loader: Function which fetches a new client.
+
+        Returns:
+            The connector client.
+
+        Raises:
+            Exception: If no valid client is cached and fetching a new one
+                failed.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and not entry.client.has_expired():
+                entry.used = True
+                if entry.refresh_at is not None and (
+                    time.time() >= entry.refresh_at
+                ):
+                    self._start_background_refresh(key, loader)
+                return entry.client
+
+            refresh, owner = self._refreshes.get(key), False
+            if refresh is None:
+                refresh, owner = self._start_refresh(key), True
+
+        if owner:
+            self._refresh(key, loader, refresh)
+        else:
+            refresh.done.wait()
+
+        if refresh.error:
+            raise refresh.error
+
+        assert refresh.client is not None
+        return refresh.client
+
+    def get_cached(self, key: Hashable) -> Optional["ServiceConnector"]:
+        """Gets the cached connector client without fetching a new one.
+
+        Args:
+            key: The cache key of the client.
+
+        Returns:
+            The cached client, if one exists.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            entry.used = True
+            return entry.client
+
+    def invalidate(self, key: Hashable) -> None:
+        """Removes a client from the cache.
+
+        Args:
+            key: The cache key of the client.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry and entry.timer:
+                entry.timer.cancel()
+
+    def clear(self) -> None:
+        """Removes all clients from the cache."""
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.timer:
+                    entry.timer.cancel()
+            self._entries.clear()
+
+    def _start_refresh(self, key: Hashable) -> _Refresh:
+        """Registers a refresh of a client.
+
+        Must be called while holding the lock.
+
+        Args:
+            key: The cache key of the client.
+
+        Returns:
+            The registered refresh.
+        """
+        refresh = _Refresh()
+        self._refreshes[key] = refresh
+        return refresh
+
+    def _start_background_refresh(
+        self, key: Hashable, loader: ConnectorClientLoader
+    ) -> None:
+        """Refreshes a client in a background thread.
+
+        Must be called while holding the lock. Does nothing if the client is
+        already being refreshed.
+
+        Args:
+            key: The cache key of the client.
+            loader: Function which fetches a new client.
+        """
+        if key in self._refreshes:
+            return
+
+        refresh = self._start_refresh(key)
+        threading.Thread(
+            target=self._refresh,
+            args=(key, loader, refresh),
+            daemon=True,
+            name="zenml-connector-refresh",
+        ).start()
+
+    def _on_timer(self, key: Hashable, loader: ConnectorClientLoader) -> None:
+        """Starts a background refresh when the refresh time was reached.
+
+        Clients which were not used since they were cached are not refreshed,
+        which stops refreshing clients that are no longer used. They are
+        refreshed when they are requested the next time instead.
+
+        Args:
+            key: The cache key of the client.
+            loader: Function which fetches a new client.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+
+            if entry.used:
+                self._start_background_refresh(key, loader)
+            else:
+                logger.debug("Not refreshing unused connector client %s.", key)
+
+    def _refresh(
+        self,
+        key: Hashable,
+        loader: ConnectorClientLoader,
+        refresh: _Refresh,
+    ) -> None:
+        """Fetches a new client and caches it if its credentials expire.
+
+        The client and errors are stored in the refresh instead of being
+        returned or raised.
+
+        Args:
+            key: The cache key of the client.
+            loader: Function which fetches a new client.
+            refresh: The refresh in progress.
+        """
+        try:
+            client = loader()
+            refresh.client = client
+            refresh_at, delay = self._get_refresh_time(client)
+
+            with self._lock:
+                previous = self._entries.pop(key, None)
+                if previous and previous.timer:
+                    previous.timer.cancel()
+
+                if client.expires_at:
+                    timer = None
+                    if delay is not None:
+                        timer = threading.Timer(
+                            delay, self._on_timer, args=(key, loader)
+                        )
+                        timer.daemon = True
+                        timer.start()
+                    self._entries[key] = _CacheEntry(
+                        client=client, refresh_at=refresh_at, timer=timer
+                    )
+        except Exception as e:
+            logger.debug("Failed to refresh connector client %s: %s", key, e)
+            refresh.error = e
+        finally:
+            with self._lock:
+                self._refreshes.pop(key, None)
+            refresh.done.set()
+
+    def _get_refresh_time(
+        self, client: "ServiceConnector"
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """Computes when a client should be refreshed.
+
+        Args:
+            client: The connector client.
+
+        Returns:
+            The time at which the client should be refreshed and the number
+            of seconds until then, or None if the client does not expire or
+            is already expired.
+        """
+        if not client.expires_at:
+            return None, None
+
+        skew = (
+            client.expires_skew_tolerance
+            if client.expires_skew_tolerance is not None
+            else SERVICE_CONNECTOR_SKEW_TOLERANCE_SECONDS
+        )
+        now = time.time()
+        expires_at = (
+            client.expires_at.replace(tzinfo=timezone.utc).timestamp() - skew
+        )
+        if expires_at <= now:
+            # Already considered expired, refreshing ahead is not possible
+            return None, None
+
+        delay = (expires_at - now) * self.refresh_fraction
+        return now + delay, delay
@@ -18,7 +18,17 @@ from abc import ABC
 from collections.abc import Mapping, Sequence
 from datetime import datetime
 from inspect import isclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, model_validator
@@ -34,6 +44,9 @@ from zenml.models import (
     ServiceConnectorRequirements,
     StepRunResponse,
 )
+from zenml.service_connectors.connector_client_cache import (
+    ServiceConnectorClientCache,
+)
 from zenml.utils import (
     pydantic_utils,
     secret_utils,
@@ -547,7 +560,44 @@ class StackComponent:
         if self._connector_instance is None:
             return True
 
-        return self._connector_instance.has_expired()
+        if self._connector_instance.has_expired():
+            return True
+
+        # Report the connector as expired if a refreshed client is available,
+        # which makes the component switch to the new credentials early.
+        key = self._get_connector_cache_key()
+        if key is None:
+            return False
+        cached_client = ServiceConnectorClientCache().get_cached(key)
+        return (
+            cached_client is not None
+            and cached_client is not self._connector_instance
+        )
+
+    def _get_connector_cache_key(self) -> Optional[Tuple[str, str, Any]]:
+        """Gets the key of the connector client in the connector client cache.
+
+        Returns:
+            The cache key, or None if the component does not declare
+            connector requirements.
+        """
+        if self.connector is None or self.connector_requirements is None:
+            return None
+
+        if self.connector_requirements.resource_id_attr is not None:
+            # Check if an attribute is set in the component configuration
+            resource_id = getattr(
+                self.config, self.connector_requirements.resource_id_attr
+            )
+        else:
+            # Otherwise, use the resource ID configured in the component
+            resource_id = self.connector_resource_id
+
+        return (
+            str(self.connector),
+            self.connector_requirements.resource_type,
+            resource_id,
+        )
 
     def get_connector(self) -> Optional["ServiceConnector"]:
         """Returns the connector linked to this stack component.
@@ -565,13 +615,14 @@ class StackComponent:
         if self.connector is None:
             return None
 
-        if self._connector_instance is not None:
-            # If the connector instance is still valid, return it. Otherwise,
-            # we'll try to get a new one.
-            if not self._connector_instance.has_expired():
-                return self._connector_instance
+        if (
+            self._connector_instance is not None
+            and not self.connector_has_expired()
+        ):
+            return self._connector_instance
 
-        if self.connector_requirements is None:
+        key = self._get_connector_cache_key()
+        if key is None:
             raise RuntimeError(
                 f"Unable to get connector for component {self} because this "
                 "component does not declare any connector requirements in its. "
@@ -580,22 +631,20 @@ class StackComponent:
                 "to return a connector requirements specification and try "
                 "again."
             )
+        connector, resource_type, resource_id = key
 
-        if self.connector_requirements.resource_id_attr is not None:
-            # Check if an attribute is set in the component configuration
-            resource_id = getattr(
-                self.config, self.connector_requirements.resource_id_attr
+        def _load_connector_client() -> "ServiceConnector":
+            return Client().get_service_connector_client(
+                name_id_or_prefix=connector,
+                resource_type=resource_type,
+                resource_id=resource_id,
             )
-        else:
-            # Otherwise, use the resource ID configured in the component
-            resource_id = self.connector_resource_id
 
-        client = Client()
+        # The clients are shared between components and refreshed in the
+        # background before their credentials expire.
         try:
-            self._connector_instance = client.get_service_connector_client(
-                name_id_or_prefix=self.connector,
-                resource_type=self.connector_requirements.resource_type,
-                resource_id=resource_id,
+            self._connector_instance = ServiceConnectorClientCache().get(
+                key, loader=_load_connector_client
             )
         except KeyError:
             raise RuntimeError(
@@ -26,8 +26,9 @@ from typing import (
 
 from zenml.exceptions import StepContextError
 from zenml.logger import get_logger
+from zenml.metadata.metadata_buffer import RunMetadataBuffer
 from zenml.utils.callback_registry import CallbackRegistry
-from zenml.utils.singleton import SingletonMetaClass
+from zenml.utils.singleton import ContextSingletonMetaClass
 
 if TYPE_CHECKING:
     from zenml.artifacts.artifact_config import ArtifactConfig
@@ -61,7 +62,7 @@ def get_step_context() -> "StepContext":
     )
 
 
-class StepContext(metaclass=SingletonMetaClass):
+class StepContext(metaclass=ContextSingletonMetaClass):
     """Provides additional context inside a step function.
 
     This singleton class is used to access information about the current run,
@@ -85,6 +86,10 @@ class StepContext(metaclass=SingletonMetaClass):
         # get info about the future output artifacts of this step
         output_artifact_uri = context.get_output_artifact_uri()
 
+        # store the metadata logged so far instead of waiting for the end of
+        # the step
+        context.metadata_buffer.flush()
+
         ...
     ```
     """
@@ -148,6 +153,9 @@ class StepContext(metaclass=SingletonMetaClass):
             for key in output_materializers.keys()
         }
         self._cleanup_registry = CallbackRegistry()
+        # Run metadata logged during the step execution, which is stored in
+        # bulk periodically and when the step finishes
+        self.metadata_buffer = RunMetadataBuffer()
 
     @property
     def pipeline(self) -> "PipelineResponse":
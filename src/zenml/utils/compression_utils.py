@@ -0,0 +1,115 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions to compress HTTP bodies."""
+
+import gzip
+import zlib
+from typing import List, Optional
+
+GZIP_ENCODING = "gzip"
+ZSTD_ENCODING = "zstd"
+
+
+def zstd_available() -> bool:
+    """Checks whether the `zstandard` package is installed.
+
+    Returns:
+        Whether the `zstandard` package is installed.
+    """
+    try:
+        import zstandard  # type: ignore[import-not-found] # noqa: F401
+    except ImportError:
+        return False
+
+    return True
+
+
+def get_supported_content_encodings() -> List[str]:
+    """Gets the supported content encodings in order of preference.
+
+    Returns:
+        The supported content encodings.
+    """
+    if zstd_available():
+        return [ZSTD_ENCODING, GZIP_ENCODING]
+
+    return [GZIP_ENCODING]
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compresses data.
+
+    Args:
+        data: The data to compress.
+        encoding: The content encoding to use.
+
+    Returns:
+        The compressed data.
+
+    Raises:
+        ValueError: If the content encoding is not supported.
+    """
+    if encoding == GZIP_ENCODING:
+        # A low compression level is much faster and compresses JSON almost
+        # as well as the default one.
+        return gzip.compress(data, compresslevel=3)
+    elif encoding == ZSTD_ENCODING and zstd_available():
+        import zstandard
+
+        return bytes(zstandard.ZstdCompressor().compress(data))
+
+    raise ValueError(f"Unsupported content encoding `{encoding}`.")
+
+
+def decompress(
+    data: bytes, encoding: str, max_size: Optional[int] = None
+) -> bytes:
+    """Decompresses data.
+
+    Args:
+        data: The data to decompress.
+        encoding: The content encoding of the data.
+        max_size: The maximum size of the decompressed data.
+
+    Returns:
+        The decompressed data.
+
+    Raises:
+        ValueError: If the content encoding is not supported, the data is
+            invalid or its decompressed size exceeds the maximum size.
+    """
+    limit = max_size + 1 if max_size is not None else -1
+    if encoding == GZIP_ENCODING:
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        try:
+            result = decompressor.decompress(data, max(limit, 0))
+        except zlib.error as e:
+            raise ValueError(f"Invalid gzip data: {e}") from e
+    elif encoding == ZSTD_ENCODING and zstd_available():
+        import zstandard
+
+        try:
+            reader = zstandard.ZstdDecompressor().stream_reader(data)
+            result = reader.read(limit)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Invalid zstd data: {e}") from e
+    else:
+        raise ValueError(f"Unsupported content encoding `{encoding}`.")
+
+    if max_size is not None and len(result) > max_size:
+        raise ValueError(
+            f"The decompressed data exceeds the maximum size of {max_size} "
+            "bytes."
+        )
+    return bytes(result)
@@ -23,16 +23,15 @@ import click
 from zenml.constants import APP_NAME, ENV_ZENML_CONFIG_PATH, REMOTE_FS_PREFIX
 from zenml.io.fileio import (
     convert_to_str,
-    copy,
     exists,
     isdir,
-    listdir,
     makedirs,
     mkdir,
     open,
     rename,
     walk,
 )
+from zenml.io.transfer import copy_directory
 
 if TYPE_CHECKING:
     from zenml.io.filesystem import PathType
@@ -90,38 +89,36 @@ def read_file_contents_as_string(file_path: str) -> str:
     Raises:
         FileNotFoundError: If file does not exist.
     """
-    if not exists(file_path):
-        raise FileNotFoundError(f"{file_path} does not exist!")
-    with open(file_path) as f:
-        return f.read()  # type: ignore[no-any-return]
+    # Opening the file raises an error if it does not exist, which avoids an
+    # additional request for remote files.
+    try:
+        with open(file_path) as f:
+            return f.read()  # type: ignore[no-any-return]
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"{file_path} does not exist!") from e
 
 
 def copy_dir(
-    source_dir: str, destination_dir: str, overwrite: bool = False
+    source_dir: str,
+    destination_dir: str,
+    overwrite: bool = False,
+    resume: bool = False,
 ) -> None:
     """Copies dir from source to destination.
 
+    Multiple files are copied in parallel, see
+    `zenml.io.transfer.copy_directory` for details.
+
     Args:
         source_dir: Path to copy from.
         destination_dir: Path to copy to.
         overwrite: Boolean. If false, function throws an error before overwrite.
+        resume: Whether to skip files that were already copied completely by
+            a previous, interrupted call.
     """
-    for source_file in listdir(source_dir):
-        source_path = os.path.join(source_dir, convert_to_str(source_file))
-        destination_path = os.path.join(
-            destination_dir, convert_to_str(source_file)
-        )
-        if isdir(source_path):
-            if source_path == destination_dir:
-                # if the destination is a subdirectory of the source, we skip
-                # copying it to avoid an infinite loop.
-                continue
-            copy_dir(source_path, destination_path, overwrite)
-        else:
-            create_dir_recursive_if_not_exists(
-                os.path.dirname(destination_path)
-            )
-            copy(str(source_path), str(destination_path), overwrite)
+    copy_directory(
+        source_dir, destination_dir, overwrite=overwrite, resume=resume
+    )
 
 
 def find_files(dir_path: "PathType", pattern: str) -> Iterable[str]:
@@ -13,11 +13,22 @@
 #  permissions and limitations under the License.
 """Util functions for materializers."""
 
-from typing import TYPE_CHECKING, Any, Optional, Sequence, Type
+import os
+import time
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple, Type
+
+from zenml.constants import (
+    MATERIALIZER_CACHE_MAX_SIZE,
+    MATERIALIZER_CACHE_MIN_AGE_SECONDS,
+    handle_int_env_var,
+)
+from zenml.logger import get_logger
 
 if TYPE_CHECKING:
     from zenml.materializers.base_materializer import BaseMaterializer
 
+logger = get_logger(__name__)
+
 
 def select_materializer(
     data_type: Type[Any],
@@ -48,3 +59,77 @@ def select_materializer(
         return fallback
 
     raise RuntimeError(f"No materializer found for type {data_type}.")
+
+
+def get_local_cache_directory(name: str, env_var: str) -> str:
+    """Get the directory of a local materializer cache.
+
+    Args:
+        name: The name of the cache directory inside the global config
+            directory.
+        env_var: Environment variable which can be used to configure a
+            different cache directory.
+
+    Returns:
+        The path of the cache directory.
+    """
+    from zenml.utils.io_utils import get_global_config_directory
+
+    return os.environ.get(env_var) or os.path.join(
+        get_global_config_directory(), name
+    )
+
+
+def touch_local_cache_file(path: str) -> None:
+    """Mark a file in a local materializer cache as recently used.
+
+    Args:
+        path: The path of the cached file.
+    """
+    try:
+        os.utime(path)
+    except OSError:
+        # The file was removed in the meantime
+        pass
+
+
+def evict_local_cache_files(cache_dir: str, max_size_env_var: str) -> None:
+    """Remove the least recently used files of a local materializer cache.
+
+    Files are removed until the size of the cache is below its maximum size.
+    Files which are still being written (`.tmp` suffix) and files which were
+    used within the last `MATERIALIZER_CACHE_MIN_AGE_SECONDS` seconds are
+    never removed, so the files that steps are currently loading stay
+    available.
+
+    Args:
+        cache_dir: The cache directory.
+        max_size_env_var: Environment variable which can be used to configure
+            the maximum size of the cache in bytes.
+    """
+    max_size = handle_int_env_var(
+        max_size_env_var, default=MATERIALIZER_CACHE_MAX_SIZE
+    )
+    total_size = 0
+    files: List[Tuple[float, int, str]] = []
+    for root, _, filenames in os.walk(cache_dir):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            total_size += stat.st_size
+            if not filename.endswith(".tmp"):
+                files.append((stat.st_mtime, stat.st_size, path))
+
+    min_age_time = time.time() - MATERIALIZER_CACHE_MIN_AGE_SECONDS
+    for modification_time, size, path in sorted(files):
+        if total_size <= max_size or modification_time > min_age_time:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_size -= size
+        logger.debug("Removed `%s` from the local cache.", path)
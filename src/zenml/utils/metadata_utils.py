@@ -19,6 +19,7 @@ from uuid import UUID
 from zenml.client import Client
 from zenml.enums import MetadataResourceTypes, ModelStages
 from zenml.logger import get_logger
+from zenml.metadata.metadata_buffer import RunMetadataBuffer
 from zenml.metadata.metadata_types import MetadataType
 from zenml.models import RunMetadataResource
 from zenml.steps.step_context import get_step_context
@@ -128,6 +129,10 @@ def log_metadata(
 ) -> None:
     """Logs metadata for various resource types in a generalized way.
 
+    Metadata which is logged for the current step or its model version from
+    inside a step is buffered in the step context and stored in bulk
+    periodically and when the step finishes.
+
     Args:
         metadata: The metadata to log.
         step_id: The ID of the step.
@@ -152,6 +157,9 @@ def log_metadata(
 
     resources: List[RunMetadataResource] = []
     publisher_step_id = None
+    # Metadata which is logged for the model version or step run of the step
+    # context is buffered and stored in bulk
+    metadata_buffer: Optional[RunMetadataBuffer] = None
 
     # Log metadata to a step by ID
     if step_id is not None:
@@ -230,6 +238,7 @@ def log_metadata(
                 type=MetadataResourceTypes.MODEL_VERSION,
             )
         ]
+        metadata_buffer = step_context.metadata_buffer
 
     # Log metadata to an artifact version by its name and version
     elif artifact_name is not None and artifact_version is not None:
@@ -327,6 +336,7 @@ def log_metadata(
             )
         ]
         publisher_step_id = step_context.step_run.id
+        metadata_buffer = step_context.metadata_buffer
 
     else:
         raise ValueError(
@@ -361,8 +371,15 @@ def log_metadata(
             """
         )
 
-    client.create_run_metadata(
-        metadata=metadata,
-        resources=resources,
-        publisher_step_id=publisher_step_id,
-    )
+    if metadata_buffer is not None:
+        metadata_buffer.add(
+            metadata=metadata,
+            resources=resources,
+            publisher_step_id=publisher_step_id,
+        )
+    else:
+        client.create_run_metadata(
+            metadata=metadata,
+            resources=resources,
+            publisher_step_id=publisher_step_id,
+        )
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Pagination utilities."""
 
+import inspect
 from typing import Any, Callable, List, TypeVar
 
 from zenml.models import BaseIdentifiedResponse, Page
@@ -25,6 +26,9 @@ def depaginate(
 ) -> List[AnyResponse]:
     """Depaginate the results from a client or store method that returns pages.
 
+    If the list method supports it, the pages are fetched using the cursor of
+    the previous page and without counting the total number of items.
+
     Args:
         list_method: The list method to depaginate.
         **kwargs: Arguments for the list method.
@@ -32,10 +36,18 @@ def depaginate(
     Returns:
         A list of the corresponding Response Models.
     """
+    parameters = inspect.signature(list_method).parameters
+    supports_cursor = "cursor" in parameters
+    if "include_total" in parameters:
+        kwargs.setdefault("include_total", False)
+
     page = list_method(**kwargs)
     items = list(page.items)
     while page.index < page.total_pages:
-        kwargs["page"] = page.index + 1
+        if supports_cursor and page.next_cursor:
+            kwargs["cursor"] = page.next_cursor
+        else:
+            kwargs["page"] = page.index + 1
         page = list_method(**kwargs)
         items += list(page.items)
 
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Utility class to turn classes into singleton classes."""
 
+from contextvars import ContextVar
 from typing import Any, Optional, cast
 
 
@@ -87,3 +88,93 @@ class SingletonMetaClass(type):
             `True` if the singleton instance exists, `False` otherwise.
         """
         return cls.__singleton_instance is not None
+
+
+class _Unset:
+    """Marker for a context in which no singleton instance was set."""
+
+
+class ContextSingletonMetaClass(type):
+    """Singleton metaclass with a separate instance per execution context.
+
+    Classes using this metaclass behave like regular singletons, except that
+    the instance is tracked in a `ContextVar`. This allows multiple threads
+    (e.g. steps running in parallel within the same process) to each have
+    their own instance. Contexts which never created or cleared an instance
+    themselves fall back to the instance that was created most recently in
+    any context, which keeps the behavior identical to `SingletonMetaClass`
+    for single-threaded usage and for helper threads spawned by user code.
+    """
+
+    def __init__(cls, *args: Any, **kwargs: Any) -> None:
+        """Initialize a context singleton class.
+
+        Args:
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments.
+        """
+        super().__init__(*args, **kwargs)
+        cls.__singleton_instance: Optional["ContextSingletonMetaClass"] = None
+        cls.__context_instance: ContextVar[Any] = ContextVar(
+            f"{cls.__name__}_singleton_instance", default=_Unset
+        )
+
+    def __call__(
+        cls, *args: Any, **kwargs: Any
+    ) -> "ContextSingletonMetaClass":
+        """Create or return the singleton instance of the current context.
+
+        Args:
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            The singleton instance.
+        """
+        instance = cls._instance()
+        if instance is None:
+            instance = cast(
+                "ContextSingletonMetaClass", super().__call__(*args, **kwargs)
+            )
+            cls._clear(instance)
+
+        return instance
+
+    def _clear(
+        cls, instance: Optional["ContextSingletonMetaClass"] = None
+    ) -> None:
+        """Clear or replace the singleton instance of the current context.
+
+        Args:
+            instance: The new singleton instance.
+        """
+        previous_instance = cls.__context_instance.get()
+        cls.__context_instance.set(instance)
+
+        # Only reset the process-wide fallback if it belongs to this context,
+        # otherwise we would remove the instance of another running context.
+        if (
+            instance is not None
+            or cls.__singleton_instance is previous_instance
+        ):
+            cls.__singleton_instance = instance
+
+    def _instance(cls) -> Optional["ContextSingletonMetaClass"]:
+        """Get the singleton instance of the current context.
+
+        Returns:
+            The singleton instance.
+        """
+        instance = cls.__context_instance.get()
+        if instance is _Unset:
+            return cls.__singleton_instance
+
+        return cast(Optional["ContextSingletonMetaClass"], instance)
+
+    def _exists(cls) -> bool:
+        """Check if the singleton instance exists in the current context.
+
+        Returns:
+            `True` if the singleton instance exists, `False` otherwise.
+        """
+        return cls._instance() is not None
@@ -16,6 +16,7 @@
 import hashlib
 import inspect
 import sys
+import weakref
 from types import (
     CodeType,
     FrameType,
@@ -33,6 +34,12 @@ from typing import (
 
 from zenml.environment import Environment
 
+# Computing the source code of classes requires parsing their whole module,
+# which is why the hashes are cached for as long as the objects exist.
+_HASHED_SOURCE_CODE_CACHE: "weakref.WeakKeyDictionary[Any, str]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def get_source_code(value: Any) -> str:
     """Returns the source code of an object.
@@ -112,10 +119,24 @@ def get_hashed_source_code(value: Any) -> str:
     Raises:
         TypeError: If unable to compute the hash.
     """
+    try:
+        return _HASHED_SOURCE_CODE_CACHE[value]
+    except (KeyError, TypeError):
+        # Not cached yet or the object can't be weakly referenced
+        pass
+
     try:
         source_code = get_source_code(value)
     except TypeError:
         raise TypeError(
             f"Unable to compute the hash of source code of object: {value}."
         )
-    return hashlib.sha256(source_code.encode("utf-8")).hexdigest()
+    hashed_source_code = hashlib.sha256(
+        source_code.encode("utf-8")
+    ).hexdigest()
+
+    try:
+        _HASHED_SOURCE_CODE_CACHE[value] = hashed_source_code
+    except TypeError:
+        pass
+    return hashed_source_code
@@ -19,6 +19,7 @@ import inspect
 import os
 import site
 import sys
+from contextvars import ContextVar
 from distutils.sysconfig import get_python_lib
 from pathlib import Path, PurePath
 from types import BuiltinFunctionType, FunctionType, ModuleType
@@ -69,12 +70,28 @@ BuiltinFunctionTypeSource = Source(
 _CUSTOM_SOURCE_ROOT: Optional[str] = os.getenv(
     ENV_ZENML_CUSTOM_SOURCE_ROOT, None
 )
-
 _SHARED_TEMPDIR: Optional[str] = None
 _resolved_notebook_sources: Dict[str, str] = {}
 _notebook_modules: Dict[str, UUID] = {}
 
 
+class _SourceResolutionCache:
+    """Cache for the source root and resolved modules."""
+
+    def __init__(self) -> None:
+        """Initializes the cache."""
+        self.source_root: Optional[str] = None
+        self.source_types: Dict[str, SourceType] = {}
+        self.module_sources: Dict[str, str] = {}
+
+
+# The cache is stored in a context variable, so that threads resolving sources
+# concurrently (e.g. steps running in parallel) do not share or clear it.
+_source_resolution_cache: ContextVar[Optional[_SourceResolutionCache]] = (
+    ContextVar("source_resolution_cache", default=None)
+)
+
+
 def load(source: Union[Source, str]) -> Any:
     """Load a source or import path.
 
@@ -320,6 +337,20 @@ def get_source_root() -> str:
         logger.debug("Using custom source root: %s", _CUSTOM_SOURCE_ROOT)
         return _CUSTOM_SOURCE_ROOT
 
+    if cache := _source_resolution_cache.get():
+        if cache.source_root is None:
+            cache.source_root = _get_source_root()
+        return cache.source_root
+
+    return _get_source_root()
+
+
+def _get_source_root() -> str:
+    """Get the repository root or the implicit source root.
+
+    Returns:
+        The source root.
+    """
     from zenml.client import Client
 
     repo_root = Client.find_repository()
@@ -417,6 +448,24 @@ def is_distribution_package_file(file_path: str, module_name: str) -> bool:
 def get_source_type(module: ModuleType) -> SourceType:
     """Get the type of a source.
 
+    Args:
+        module: The module for which to get the source type.
+
+    Returns:
+        The source type.
+    """
+    cache = _source_resolution_cache.get()
+    if not cache:
+        return _get_source_type(module=module)
+
+    if module.__name__ not in cache.source_types:
+        cache.source_types[module.__name__] = _get_source_type(module=module)
+    return cache.source_types[module.__name__]
+
+
+def _get_source_type(module: ModuleType) -> SourceType:
+    """Determine the type of a source.
+
     Args:
         module: The module for which to get the source type.
 
@@ -453,6 +502,31 @@ def get_source_type(module: ModuleType) -> SourceType:
     return SourceType.UNKNOWN
 
 
+@contextlib.contextmanager
+def cache_source_resolution() -> Iterator[None]:
+    """Context manager to cache the source root and resolved modules.
+
+    Finding the source root requires searching the current working directory
+    and all its parents for a ZenML repository, and the type and import path
+    of a module depend on the location of its module file. Inside this context
+    manager, these are determined only once and reused by all calls that
+    resolve or load sources, which speeds up handling many sources at once.
+
+    Yields:
+        None
+    """
+    if _source_resolution_cache.get():
+        # Already enabled by an outer context manager
+        yield
+        return
+
+    token = _source_resolution_cache.set(_SourceResolutionCache())
+    try:
+        yield
+    finally:
+        _source_resolution_cache.reset(token)
+
+
 @contextlib.contextmanager
 def prepend_python_path(path: str) -> Iterator[None]:
     """Context manager to temporarily prepend a path to the python path.
@@ -552,6 +626,10 @@ def _resolve_module(module: ModuleType) -> str:
             )
         return module.__name__
 
+    cache = _source_resolution_cache.get()
+    if cache and module.__name__ in cache.module_sources:
+        return cache.module_sources[module.__name__]
+
     module_file = Path(module.__file__).resolve()
     source_root = Path(get_source_root()).resolve()
 
@@ -573,6 +651,9 @@ def _resolve_module(module: ModuleType) -> str:
 
     logger.debug("Resolved module `%s` to `%s`", module, module_source)
 
+    if cache:
+        cache.module_sources[module.__name__] = module_source
+
     return module_source
 
 
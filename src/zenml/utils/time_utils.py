@@ -13,9 +13,14 @@
 #  permissions and limitations under the License.
 """Time utils."""
 
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Union
 
+_last_time_ns = 0
+_time_ns_lock = threading.Lock()
+
 
 def utc_now(tz_aware: Union[bool, datetime] = False) -> datetime:
     """Get the current time in the UTC timezone.
@@ -44,6 +49,23 @@ def utc_now(tz_aware: Union[bool, datetime] = False) -> datetime:
     return now
 
 
+def increasing_time_ns() -> int:
+    """Get the current time in nanoseconds since the epoch.
+
+    In contrast to `time.time_ns()`, successive calls within the same process
+    always return strictly increasing values, which makes the result usable to
+    order events that happen within the resolution of the system clock.
+
+    Returns:
+        The current time in nanoseconds since the epoch.
+    """
+    global _last_time_ns
+
+    with _time_ns_lock:
+        _last_time_ns = max(time.time_ns(), _last_time_ns + 1)
+        return _last_time_ns
+
+
 def utc_now_tz_aware() -> datetime:
     """Get the current timezone-aware UTC time.
 
@@ -82,13 +82,10 @@ def read_yaml(file_path: str) -> Any:
     Raises:
         FileNotFoundError: if file does not exist.
     """
-    if fileio.exists(file_path):
-        contents = io_utils.read_file_contents_as_string(file_path)
-        # TODO: [LOW] consider adding a default empty dict to be returned
-        #   instead of None
-        return yaml.safe_load(contents)
-    else:
-        raise FileNotFoundError(f"{file_path} does not exist.")
+    contents = io_utils.read_file_contents_as_string(file_path)
+    # TODO: [LOW] consider adding a default empty dict to be returned
+    #   instead of None
+    return yaml.safe_load(contents)
 
 
 def is_yaml(file_path: str) -> bool:
@@ -158,11 +155,8 @@ def read_json(file_path: str) -> Any:
     Raises:
         FileNotFoundError: if file does not exist.
     """
-    if fileio.exists(file_path):
-        contents = io_utils.read_file_contents_as_string(file_path)
-        return json.loads(contents)
-    else:
-        raise FileNotFoundError(f"{file_path} does not exist.")
+    contents = io_utils.read_file_contents_as_string(file_path)
+    return json.loads(contents)
 
 
 class UUIDEncoder(json.JSONEncoder):
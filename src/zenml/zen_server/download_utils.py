@@ -15,11 +15,17 @@
 
 import os
 import tarfile
-import tempfile
+import zlib
 from typing import (
     TYPE_CHECKING,
+    Iterator,
+    Optional,
+    Tuple,
 )
 
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
 from zenml.artifacts.utils import _load_artifact_store
 from zenml.exceptions import (
     IllegalOperationError,
@@ -27,11 +33,13 @@ from zenml.exceptions import (
 from zenml.models import (
     ArtifactVersionResponse,
 )
-from zenml.zen_server.utils import server_config, zen_store
+from zenml.zen_server.utils import zen_store
 
 if TYPE_CHECKING:
     from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def verify_artifact_is_downloadable(
     artifact: "ArtifactVersionResponse",
@@ -42,7 +50,6 @@ def verify_artifact_is_downloadable(
         artifact: The artifact to verify.
 
     Raises:
-        IllegalOperationError: If the artifact is too large to be archived.
         KeyError: If the artifact store is not found or the artifact URI does
             not exist.
 
@@ -62,62 +69,264 @@ def verify_artifact_is_downloadable(
     if not artifact_store.exists(artifact.uri):
         raise KeyError(f"The artifact URI '{artifact.uri}' does not exist.")
 
-    size = artifact_store.size(artifact.uri)
-    max_download_size = server_config().file_download_size_limit
+    return artifact_store
 
-    if size and size > max_download_size:
-        raise IllegalOperationError(
-            f"The artifact '{artifact.id}' is too large to be downloaded. "
-            f"The maximum download size allowed by your ZenML server is "
-            f"{max_download_size} bytes."
+
+def _iterate_file(
+    artifact_store: "BaseArtifactStore",
+    path: str,
+    start: int = 0,
+    length: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Iterate over the content of a file in the artifact store in chunks.
+
+    Args:
+        artifact_store: The artifact store in which the file is stored.
+        path: The path of the file.
+        start: The offset at which to start reading.
+        length: The number of bytes to read. If not given, the file is read
+            until the end.
+
+    Yields:
+        The file content in chunks of at most `DOWNLOAD_CHUNK_SIZE` bytes.
+
+    Raises:
+        RuntimeError: If the file is shorter than expected.
+    """
+    with artifact_store.open(path, "rb") as f:
+        if start:
+            f.seek(start)
+
+        remaining = length
+        while remaining is None or remaining > 0:
+            read_size = (
+                DOWNLOAD_CHUNK_SIZE
+                if remaining is None
+                else min(DOWNLOAD_CHUNK_SIZE, remaining)
+            )
+            chunk = f.read(read_size)
+            if not chunk:
+                if remaining is not None:
+                    raise RuntimeError(
+                        f"Unexpected end of file while reading `{path}`."
+                    )
+                break
+
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+
+
+def _iterate_tar_entries(
+    artifact_store: "BaseArtifactStore", uri: str
+) -> Iterator[bytes]:
+    """Iterate over the uncompressed tar archive data of an artifact.
+
+    Args:
+        artifact_store: The artifact store in which the artifact is stored.
+        uri: The URI of the artifact.
+
+    Yields:
+        Chunks of the tar archive.
+    """
+
+    def _header(tarinfo: tarfile.TarInfo) -> bytes:
+        return tarinfo.tobuf(
+            tarfile.DEFAULT_FORMAT, tarfile.ENCODING, "surrogateescape"
         )
 
-    return artifact_store
+    def _file_entry(path: str) -> Iterator[bytes]:
+        tarinfo = tarfile.TarInfo(name=os.path.relpath(path, uri))
+        if size := artifact_store.size(path):
+            tarinfo.size = size
+
+        yield _header(tarinfo)
+        if tarinfo.size:
+            yield from _iterate_file(
+                artifact_store, path=path, length=tarinfo.size
+            )
+            # File contents are padded to a multiple of the block size
+            remainder = tarinfo.size % tarfile.BLOCKSIZE
+            if remainder:
+                yield tarfile.NUL * (tarfile.BLOCKSIZE - remainder)
+
+    if artifact_store.isdir(uri):
+        for dir, _, files in artifact_store.walk(uri):
+            dir = dir.decode() if isinstance(dir, bytes) else dir
+            dir_info = tarfile.TarInfo(name=os.path.relpath(dir, uri))
+            dir_info.type = tarfile.DIRTYPE
+            dir_info.mode = 0o755
+            yield _header(dir_info)
+
+            for file in files:
+                file = file.decode() if isinstance(file, bytes) else file
+                yield from _file_entry(os.path.join(dir, file))
+    else:
+        yield from _file_entry(uri)
+
+    # End of archive marker
+    yield tarfile.NUL * (tarfile.BLOCKSIZE * 2)
+
 
+def _iterate_artifact_archive(
+    artifact_store: "BaseArtifactStore", uri: str
+) -> Iterator[bytes]:
+    """Iterate over a gzipped tar archive of an artifact.
 
-def create_artifact_archive(
+    Args:
+        artifact_store: The artifact store in which the artifact is stored.
+        uri: The URI of the artifact.
+
+    Yields:
+        Chunks of the gzipped tar archive.
+    """
+    # Produce the gzip format instead of a raw zlib stream
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    uncompressed_size = 0
+
+    for data in _iterate_tar_entries(artifact_store=artifact_store, uri=uri):
+        uncompressed_size += len(data)
+        if compressed := compressor.compress(data):
+            yield compressed
+
+    # The archive size is padded to a multiple of the record size
+    remainder = uncompressed_size % tarfile.RECORDSIZE
+    if remainder:
+        yield compressor.compress(
+            tarfile.NUL * (tarfile.RECORDSIZE - remainder)
+        )
+    yield compressor.flush()
+
+
+def stream_artifact_archive(
     artifact: "ArtifactVersionResponse",
-) -> str:
-    """Create an archive of the given artifact.
+) -> Iterator[bytes]:
+    """Stream a gzipped tar archive of the given artifact.
+
+    The archive is created on the fly while it is being sent, which means
+    neither the memory nor the disk usage depends on the artifact size.
 
     Args:
         artifact: The artifact to archive.
 
     Returns:
-        The path to the created archive.
+        An iterator over the chunks of the archive.
     """
+    # Verify eagerly so errors are raised before the response starts
     artifact_store = verify_artifact_is_downloadable(artifact)
+    return _iterate_artifact_archive(
+        artifact_store=artifact_store, uri=artifact.uri
+    )
 
-    def _prepare_tarinfo(path: str) -> tarfile.TarInfo:
-        archive_path = os.path.relpath(path, artifact.uri)
-        tarinfo = tarfile.TarInfo(name=archive_path)
-        if size := artifact_store.size(path):
-            tarinfo.size = size
-        return tarinfo
-
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        with tarfile.open(fileobj=temp_file, mode="w:gz") as tar:
-            if artifact_store.isdir(artifact.uri):
-                for dir, _, files in artifact_store.walk(artifact.uri):
-                    dir = dir.decode() if isinstance(dir, bytes) else dir
-                    dir_info = tarfile.TarInfo(
-                        name=os.path.relpath(dir, artifact.uri)
-                    )
-                    dir_info.type = tarfile.DIRTYPE
-                    dir_info.mode = 0o755
-                    tar.addfile(dir_info)
-
-                    for file in files:
-                        file = (
-                            file.decode() if isinstance(file, bytes) else file
-                        )
-                        path = os.path.join(dir, file)
-                        tarinfo = _prepare_tarinfo(path)
-                        with artifact_store.open(path, "rb") as f:
-                            tar.addfile(tarinfo, fileobj=f)
-            else:
-                tarinfo = _prepare_tarinfo(artifact.uri)
-                with artifact_store.open(artifact.uri, "rb") as f:
-                    tar.addfile(tarinfo, fileobj=f)
-
-        return temp_file.name
+
+def parse_range_header(
+    range_header: str, size: int
+) -> Optional[Tuple[int, int]]:
+    """Parse the value of an HTTP `Range` header.
+
+    Only a single byte range is supported. Headers which are invalid or
+    request multiple ranges are ignored, in which case the full content
+    should be sent.
+
+    Args:
+        range_header: The value of the `Range` header.
+        size: The size of the content in bytes.
+
+    Returns:
+        The first and last (inclusive) byte position of the requested range,
+        or None if the header should be ignored.
+
+    Raises:
+        HTTPException: If the requested range can not be satisfied.
+    """
+    unit, _, ranges = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+
+    first, separator, last = ranges.strip().partition("-")
+    if not separator:
+        return None
+
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            # Suffix range containing the last N bytes
+            start = max(size - int(last), 0)
+            end = size - 1
+    except ValueError:
+        return None
+
+    if start >= size:
+        raise HTTPException(
+            status_code=416, headers={"Content-Range": f"bytes */{size}"}
+        )
+
+    if end < start:
+        return None
+
+    return start, min(end, size - 1)
+
+
+def stream_artifact_file(
+    artifact: "ArtifactVersionResponse", range_header: Optional[str] = None
+) -> StreamingResponse:
+    """Stream the file of a single-file artifact.
+
+    Args:
+        artifact: The artifact to stream.
+        range_header: Optional value of the HTTP `Range` header of the request.
+
+    Returns:
+        The streaming response, which only contains the requested range if
+        a valid `Range` header was passed.
+
+    Raises:
+        IllegalOperationError: If the artifact is a directory.
+    """
+    artifact_store = verify_artifact_is_downloadable(artifact)
+    if artifact_store.isdir(artifact.uri):
+        raise IllegalOperationError(
+            f"The artifact '{artifact.id}' is stored as a directory and can "
+            "only be downloaded as an archive."
+        )
+
+    filename = os.path.basename(artifact.uri)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="{filename}"',
+    }
+    size = artifact_store.size(artifact.uri)
+    if size is None:
+        return StreamingResponse(
+            _iterate_file(artifact_store, path=artifact.uri),
+            media_type="application/octet-stream",
+            headers=headers,
+        )
+
+    byte_range = (
+        parse_range_header(range_header, size) if range_header else None
+    )
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(
+            _iterate_file(artifact_store, path=artifact.uri, length=size),
+            media_type="application/octet-stream",
+            headers=headers,
+        )
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        _iterate_file(
+            artifact_store,
+            path=artifact.uri,
+            start=start,
+            length=end - start + 1,
+        ),
+        status_code=206,
+        media_type="application/octet-stream",
+        headers=headers,
+    )
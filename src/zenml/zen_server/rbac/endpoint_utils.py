@@ -109,12 +109,16 @@ def verify_permissions_and_create_entity(
 def verify_permissions_and_batch_create_entity(
     batch: List[AnyRequest],
     create_method: Callable[[List[AnyRequest]], List[AnyResponse]],
+    surrogate_models: Optional[List[AnyOtherResponse]] = None,
 ) -> List[AnyResponse]:
     """Verify permissions and create a batch of entities if authorized.
 
     Args:
         batch: The batch to create.
         create_method: The method to create the entities.
+        surrogate_models: Optional list of surrogate models to verify
+            UPDATE permissions for instead of verifying CREATE permissions for
+            the request models.
 
     Raises:
         RuntimeError: If the resource type is usage-tracked.
@@ -138,7 +142,12 @@ def verify_permissions_and_batch_create_entity(
             # models.
             request_model.user = auth_context.user.id
 
-    batch_verify_permissions_for_models(models=batch, action=Action.CREATE)
+    if surrogate_models:
+        batch_verify_permissions_for_models(
+            models=surrogate_models, action=Action.UPDATE
+        )
+    else:
+        batch_verify_permissions_for_models(models=batch, action=Action.CREATE)
 
     if resource_types & set(server_config().reportable_resources):
         raise RuntimeError(
@@ -13,13 +13,11 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for artifact versions."""
 
-import os
-from typing import List, Union
+from typing import List, Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
-from fastapi.responses import FileResponse
-from starlette.background import BackgroundTask
+from fastapi import APIRouter, Depends, Header, Security
+from fastapi.responses import StreamingResponse
 
 from zenml.artifacts.utils import (
     load_artifact_visualization,
@@ -48,7 +46,8 @@ from zenml.zen_server.auth import (
     verify_artifact_download_token,
 )
 from zenml.zen_server.download_utils import (
-    create_artifact_archive,
+    stream_artifact_archive,
+    stream_artifact_file,
     verify_artifact_is_downloadable,
 )
 from zenml.zen_server.exceptions import error_response
@@ -336,13 +335,22 @@ def get_artifact_download_token(
 )
 @async_fastapi_endpoint_wrapper
 def download_artifact_data(
-    artifact_version_id: UUID, token: str
-) -> FileResponse:
+    artifact_version_id: UUID,
+    token: str,
+    archive: bool = True,
+    range_header: Optional[str] = Header(None, alias="Range"),
+) -> StreamingResponse:
     """Download the artifact data.
 
     Args:
         artifact_version_id: ID of the artifact version for which to get the data.
         token: The token to authenticate the artifact download.
+        archive: Whether to download the artifact data as a gzipped tar
+            archive. If False, the artifact needs to consist of a single file
+            which will be downloaded directly. In this case, the download
+            supports HTTP range requests.
+        range_header: The HTTP `Range` header of the request. Only used when
+            not downloading an archive.
 
     Returns:
         The artifact data.
@@ -350,11 +358,13 @@ def download_artifact_data(
     verify_artifact_download_token(token, artifact_version_id)
 
     artifact = zen_store().get_artifact_version(artifact_version_id)
-    archive_path = create_artifact_archive(artifact)
 
-    return FileResponse(
-        archive_path,
+    if not archive:
+        return stream_artifact_file(artifact, range_header=range_header)
+
+    filename = f"{artifact.name}-{artifact.version}.tar.gz"
+    return StreamingResponse(
+        stream_artifact_archive(artifact),
         media_type="application/gzip",
-        filename=f"{artifact.name}-{artifact.version}.tar.gz",
-        background=BackgroundTask(os.remove, archive_path),
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -13,14 +13,26 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for run metadata."""
 
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from fastapi import APIRouter, Security
 
-from zenml.constants import API, RUN_METADATA, VERSION_1
+from zenml.constants import (
+    API,
+    BATCH,
+    HISTORY,
+    PAGE_SIZE_DEFAULT,
+    PAGINATION_STARTING_PAGE,
+    RUN_METADATA,
+    VERSION_1,
+)
 from zenml.enums import MetadataResourceTypes
-from zenml.models import RunMetadataRequest
+from zenml.models import (
+    RunMetadataEntry,
+    RunMetadataRequest,
+    RunMetadataResource,
+)
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.rbac.models import Action
@@ -62,36 +74,122 @@ def create_run_metadata(
         run_metadata: The run metadata to create.
         project_name_or_id: Optional name or ID of the project.
         auth_context: Authentication context.
-
-    Raises:
-        RuntimeError: If the resource type is not supported.
     """
     if project_name_or_id:
         project = zen_store().get_project(project_name_or_id)
         run_metadata.project = project.id
 
     run_metadata.user = auth_context.user.id
+    _verify_run_metadata_permissions([run_metadata])
+
+    zen_store().create_run_metadata(run_metadata)
+
+
+@router.post(
+    BATCH,
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@async_fastapi_endpoint_wrapper
+def batch_create_run_metadata(
+    run_metadata: List[RunMetadataRequest],
+    auth_context: AuthContext = Security(authorize),
+) -> None:
+    """Creates a batch of run metadata.
+
+    Args:
+        run_metadata: The run metadata to create.
+        auth_context: Authentication context.
+    """
+    for request in run_metadata:
+        request.user = auth_context.user.id
+    _verify_run_metadata_permissions(run_metadata)
+
+    zen_store().batch_create_run_metadata(run_metadata)
+
+
+@router.get(
+    HISTORY,
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@async_fastapi_endpoint_wrapper
+def get_run_metadata_history(
+    resource_id: UUID,
+    resource_type: MetadataResourceTypes,
+    key: Optional[str] = None,
+    page: int = PAGINATION_STARTING_PAGE,
+    size: int = PAGE_SIZE_DEFAULT,
+    _: AuthContext = Security(authorize),
+) -> List[RunMetadataEntry]:
+    """Gets all run metadata entries of a resource, newest first.
+
+    Args:
+        resource_id: The ID of the resource.
+        resource_type: The type of the resource.
+        key: If given, only get the entries with this key.
+        page: The page of entries to get.
+        size: The number of entries per page.
+
+    Returns:
+        The run metadata entries of the page.
+    """
+    resource = RunMetadataResource(id=resource_id, type=resource_type)
+    verify_permission_for_model(
+        model=_get_resource_model(resource), action=Action.READ
+    )
+
+    return zen_store().get_run_metadata_history(
+        resource=resource, key=key, page=page, size=size
+    )
+
+
+def _get_resource_model(resource: RunMetadataResource) -> Any:
+    """Gets the model of a resource which run metadata is attached to.
+
+    Args:
+        resource: The resource.
+
+    Returns:
+        The model of the resource.
+
+    Raises:
+        RuntimeError: If the resource type is not supported.
+    """
+    if resource.type == MetadataResourceTypes.PIPELINE_RUN:
+        return zen_store().get_run(resource.id)
+    elif resource.type == MetadataResourceTypes.STEP_RUN:
+        return zen_store().get_run_step(resource.id)
+    elif resource.type == MetadataResourceTypes.ARTIFACT_VERSION:
+        return zen_store().get_artifact_version(resource.id)
+    elif resource.type == MetadataResourceTypes.MODEL_VERSION:
+        return zen_store().get_model_version(resource.id)
+    elif resource.type == MetadataResourceTypes.SCHEDULE:
+        return zen_store().get_schedule(resource.id)
+    else:
+        raise RuntimeError(f"Unknown resource type: {resource.type}")
 
-    verify_models: List[Any] = []
-    for resource in run_metadata.resources:
-        if resource.type == MetadataResourceTypes.PIPELINE_RUN:
-            verify_models.append(zen_store().get_run(resource.id))
-        elif resource.type == MetadataResourceTypes.STEP_RUN:
-            verify_models.append(zen_store().get_run_step(resource.id))
-        elif resource.type == MetadataResourceTypes.ARTIFACT_VERSION:
-            verify_models.append(zen_store().get_artifact_version(resource.id))
-        elif resource.type == MetadataResourceTypes.MODEL_VERSION:
-            verify_models.append(zen_store().get_model_version(resource.id))
-        elif resource.type == MetadataResourceTypes.SCHEDULE:
-            verify_models.append(zen_store().get_schedule(resource.id))
-        else:
-            raise RuntimeError(f"Unknown resource type: {resource.type}")
+
+def _verify_run_metadata_permissions(
+    run_metadata: List[RunMetadataRequest],
+) -> None:
+    """Verifies the permissions to create run metadata.
+
+    Every resource which the metadata is attached to is only fetched once.
+
+    Args:
+        run_metadata: The run metadata to create.
+    """
+    verify_models: Dict[Tuple[MetadataResourceTypes, UUID], Any] = {}
+    for request in run_metadata:
+        for resource in request.resources:
+            key = (resource.type, resource.id)
+            if key not in verify_models:
+                verify_models[key] = _get_resource_model(resource)
 
     batch_verify_permissions_for_models(
-        models=verify_models,
+        models=list(verify_models.values()),
         action=Action.UPDATE,
     )
 
-    verify_permission_for_model(model=run_metadata, action=Action.CREATE)
-
-    zen_store().create_run_metadata(run_metadata)
+    batch_verify_permissions_for_models(
+        models=run_metadata, action=Action.CREATE
+    )
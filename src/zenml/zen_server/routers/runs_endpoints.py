@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for pipeline runs."""
 
+from datetime import datetime
 from typing import Any, Dict, Optional, Tuple, Union
 from uuid import UUID
 
@@ -29,7 +30,8 @@ from zenml.constants import (
 )
 from zenml.enums import ExecutionStatus, StackComponentType
 from zenml.logger import get_logger
-from zenml.logging.step_logging import fetch_logs
+from zenml.logging import STEP_LOGS_PAGE_SIZE
+from zenml.logging.step_logging import fetch_log_lines, fetch_logs
 from zenml.models import (
     Page,
     PipelineRunDAG,
@@ -434,14 +436,25 @@ def run_logs(
     run_id: UUID,
     offset: int = 0,
     length: int = 1024 * 1024 * 16,  # Default to 16MiB of data
+    tail: Optional[int] = None,
+    since: Optional[datetime] = None,
+    page: Optional[int] = None,
+    size: int = STEP_LOGS_PAGE_SIZE,
     _: AuthContext = Security(authorize),
 ) -> str:
     """Get pipeline run logs.
 
+    The logs are fetched by line if any of `tail`, `since` or `page` is
+    given, and by byte range otherwise.
+
     Args:
         run_id: ID of the pipeline run.
         offset: The offset from which to start reading.
         length: The amount of bytes that should be read.
+        tail: If given, get the last `tail` lines.
+        since: If given, get up to `size` lines logged at or after this time.
+        page: If given, get the lines of this page.
+        size: The number of lines per page.
 
     Returns:
         The pipeline run logs.
@@ -466,6 +479,16 @@ def run_logs(
     if logs is None:
         raise KeyError("No logs available for this pipeline run")
 
+    if tail is not None or since is not None or page is not None:
+        return fetch_log_lines(
+            zen_store=store,
+            artifact_store_id=logs.artifact_store_id,
+            logs_uri=logs.uri,
+            tail=tail,
+            since=since,
+            page=page,
+            size=size,
+        )
     return fetch_logs(
         zen_store=store,
         artifact_store_id=logs.artifact_store_id,
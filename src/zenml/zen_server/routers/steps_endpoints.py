@@ -13,13 +13,16 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for steps (and artifacts) of pipeline runs."""
 
-from typing import Any, Dict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Security
+from fastapi import APIRouter, Body, Depends, HTTPException, Security
 
 from zenml.constants import (
     API,
+    BATCH,
+    CACHED,
     LOGS,
     STATUS,
     STEP_CONFIGURATION,
@@ -27,7 +30,8 @@ from zenml.constants import (
     VERSION_1,
 )
 from zenml.enums import ExecutionStatus
-from zenml.logging.step_logging import fetch_logs
+from zenml.logging import STEP_LOGS_PAGE_SIZE
+from zenml.logging.step_logging import fetch_log_lines, fetch_logs
 from zenml.models import (
     Page,
     StepRunFilter,
@@ -38,6 +42,7 @@ from zenml.models import (
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.rbac.endpoint_utils import (
+    verify_permissions_and_batch_create_entity,
     verify_permissions_and_create_entity,
 )
 from zenml.zen_server.rbac.models import Action, ResourceType
@@ -132,6 +137,74 @@ def create_run_step(
     )
 
 
+@router.post(
+    BATCH,
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@async_fastapi_endpoint_wrapper
+def batch_create_run_steps(
+    steps: List[StepRunRequest],
+    _: AuthContext = Security(authorize),
+) -> List[StepRunResponse]:
+    """Create a batch of run steps.
+
+    Args:
+        steps: The run steps to create.
+
+    Returns:
+        The created run steps.
+    """
+    pipeline_run_ids = {step.pipeline_run_id for step in steps}
+    pipeline_runs = [
+        zen_store().get_run(pipeline_run_id)
+        for pipeline_run_id in pipeline_run_ids
+    ]
+
+    return verify_permissions_and_batch_create_entity(
+        batch=steps,
+        create_method=zen_store().batch_create_run_steps,
+        surrogate_models=pipeline_runs,
+    )
+
+
+@router.post(
+    CACHED,
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@async_fastapi_endpoint_wrapper
+def get_cached_run_steps(
+    project_id: UUID,
+    cache_keys: List[str] = Body(...),
+    auth_context: AuthContext = Security(authorize),
+) -> Dict[str, StepRunResponse]:
+    """Get the run steps that can be used as cache for the given keys.
+
+    Args:
+        project_id: The ID of the project in which to look for run steps.
+        cache_keys: The cache keys for which to get the run steps.
+        auth_context: Authentication context.
+
+    Returns:
+        A dictionary mapping the cache keys to their cached run step. Cache
+        keys without a cached run step are not included.
+    """
+    allowed_pipeline_run_ids = get_allowed_resource_ids(
+        resource_type=ResourceType.PIPELINE_RUN,
+        project_id=project_id,
+    )
+    cached_step_runs = zen_store().get_cached_run_steps(
+        project_id=project_id,
+        cache_keys=cache_keys,
+        allowed_pipeline_run_ids=allowed_pipeline_run_ids,
+        authenticated_user_id=auth_context.user.id,
+    )
+
+    return {
+        cache_key: dehydrate_response_model(step_run)
+        for cache_key, step_run in cached_step_runs.items()
+    }
+
+
 @router.get(
     "/{step_id}",
     responses={401: error_response, 404: error_response, 422: error_response},
@@ -252,15 +325,26 @@ def get_step_logs(
     offset: int = 0,
     length: int = 1024 * 1024 * 16,  # Default to 16MiB of data
     strip_timestamp: bool = False,
+    tail: Optional[int] = None,
+    since: Optional[datetime] = None,
+    page: Optional[int] = None,
+    size: int = STEP_LOGS_PAGE_SIZE,
     _: AuthContext = Security(authorize),
 ) -> str:
     """Get the logs of a specific step.
 
+    The logs are fetched by line if any of `tail`, `since` or `page` is
+    given, and by byte range otherwise.
+
     Args:
         step_id: ID of the step for which to get the logs.
         offset: The offset from which to start reading.
         length: The amount of bytes that should be read.
         strip_timestamp: Whether to strip the timestamp in logs or not.
+        tail: If given, get the last `tail` lines.
+        since: If given, get up to `size` lines logged at or after this time.
+        page: If given, get the lines of this page.
+        size: The number of lines per page.
 
     Returns:
         The logs of the step.
@@ -278,6 +362,17 @@ def get_step_logs(
         raise HTTPException(
             status_code=404, detail="No logs available for this step"
         )
+    if tail is not None or since is not None or page is not None:
+        return fetch_log_lines(
+            zen_store=store,
+            artifact_store_id=logs.artifact_store_id,
+            logs_uri=logs.uri,
+            tail=tail,
+            since=since,
+            page=page,
+            size=size,
+            strip_timestamp=strip_timestamp,
+        )
     return fetch_logs(
         zen_store=store,
         artifact_store_id=logs.artifact_store_id,
@@ -20,6 +20,7 @@ To run this file locally, execute:
     ```
 """
 
+import hashlib
 import logging
 import os
 import threading
@@ -38,28 +39,35 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.base import (
     BaseHTTPMiddleware,
     RequestResponseEndpoint,
 )
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.responses import (
     FileResponse,
     JSONResponse,
     RedirectResponse,
     Response,
 )
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 import zenml
 from zenml.analytics import source_context
 from zenml.constants import (
     API,
+    DEFAULT_HTTP_COMPRESSION_MIN_SIZE,
     DEFAULT_ZENML_SERVER_REPORT_USER_ACTIVITY_TO_DB_SECONDS,
     HEALTH,
 )
 from zenml.enums import AuthScheme, SourceContextTypes
 from zenml.models import ServerDeploymentType
+from zenml.utils.compression_utils import (
+    decompress,
+    get_supported_content_encodings,
+)
 from zenml.utils.time_utils import utc_now
 from zenml.zen_server.cloud_utils import send_pro_workspace_status_update
 from zenml.zen_server.exceptions import error_detail
@@ -256,6 +264,190 @@ class RestrictFileUploadsMiddleware(BaseHTTPMiddleware):
             )
 
 
+class RequestDecompressionMiddleware:
+    """Decompresses compressed request bodies."""
+
+    def __init__(self, app: ASGIApp, max_bytes: int) -> None:
+        """Decompresses compressed request bodies.
+
+        Args:
+            app: The FastAPI app.
+            max_bytes: The maximum size of the decompressed request body.
+        """
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Decompresses the request body if it is compressed.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = Headers(scope=scope).get("content-encoding", "identity")
+        if encoding == "identity":
+            await self.app(scope, receive, send)
+            return
+
+        response: Optional[Response] = None
+        content_length = Headers(scope=scope).get("content-length")
+        if encoding not in get_supported_content_encodings():
+            response = JSONResponse(
+                status_code=415,
+                content={
+                    "detail": f"Unsupported content encoding `{encoding}`."
+                },
+            )
+        elif content_length and int(content_length) > self.max_bytes:
+            response = Response(status_code=413)  # Request Entity Too Large
+        else:
+            chunks = []
+            size = 0
+            more_body = True
+            while more_body:
+                message = await receive()
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                if size > self.max_bytes:
+                    # Stop reading bodies which exceed the limit even before
+                    # they are decompressed
+                    response = Response(status_code=413)
+                    break
+                chunks.append(chunk)
+                more_body = message.get("more_body", False)
+
+            if response is None:
+                try:
+                    body = decompress(
+                        b"".join(chunks),
+                        encoding=encoding,
+                        max_size=self.max_bytes,
+                    )
+                except ValueError as e:
+                    response = JSONResponse(
+                        status_code=400, content={"detail": str(e)}
+                    )
+
+        if response is not None:
+            await response(scope, receive, send)
+            return
+
+        headers = [
+            (key, value)
+            for key, value in scope["headers"]
+            if key not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(body)).encode()))
+        body_sent = False
+
+        async def receive_decompressed() -> Message:
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(
+            {**scope, "headers": headers}, receive_decompressed, send
+        )
+
+
+class ConditionalGetMiddleware:
+    """Adds ETags to JSON responses and handles conditional GET requests.
+
+    The ETag is computed from the response body. If the client sends a
+    matching `If-None-Match` header, the body is replaced by an empty `304 Not
+    Modified` response, which saves transferring unchanged resources.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Adds ETags to JSON responses.
+
+        Args:
+            app: The FastAPI app.
+        """
+        self.app = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Adds an ETag to the response of GET requests.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match", "")
+        start_message: Optional[Message] = None
+        body_parts: List[bytes] = []
+        passthrough = False
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    message["status"] != 200
+                    or "etag" in headers
+                    or not headers.get("content-type", "").startswith(
+                        "application/json"
+                    )
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            assert start_message is not None
+            body = b"".join(body_parts)
+            # The ETag is weak because the body might be compressed afterwards
+            etag = f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+            headers = MutableHeaders(raw=list(start_message["headers"]))
+            headers["etag"] = etag
+
+            requested_etags = {
+                value.strip().removeprefix("W/")
+                for value in if_none_match.split(",")
+            }
+            if etag.removeprefix("W/") in requested_etags or (
+                "*" in requested_etags
+            ):
+                del headers["content-length"]
+                del headers["content-type"]
+                await send(
+                    {**start_message, "status": 304, "headers": headers.raw}
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send({**start_message, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_etag)
+
+
 ALLOWED_FOR_FILE_UPLOAD: Set[str] = set()
 
 
@@ -502,6 +694,16 @@ app.add_middleware(
 app.add_middleware(
     RestrictFileUploadsMiddleware, allowed_paths=ALLOWED_FOR_FILE_UPLOAD
 )
+# Request bodies are decompressed before their size is checked by the
+# `RequestBodyLimit` middleware.
+app.add_middleware(
+    RequestDecompressionMiddleware,
+    max_bytes=server_config().max_request_body_size_in_bytes,
+)
+app.add_middleware(ConditionalGetMiddleware)
+app.add_middleware(
+    GZipMiddleware, minimum_size=DEFAULT_HTTP_COMPRESSION_MIN_SIZE
+)
 
 
 @app.middleware("http")
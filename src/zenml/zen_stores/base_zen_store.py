@@ -55,6 +55,7 @@ from zenml.models import (
     UserFilter,
     UserResponse,
 )
+from zenml.utils.compression_utils import get_supported_content_encodings
 from zenml.utils.pydantic_utils import before_validator_handler
 from zenml.zen_stores.zen_store_interface import ZenStoreInterface
 
@@ -410,6 +411,7 @@ class BaseZenStore(
             dashboard_url=server_config.dashboard_url or "",
             analytics_enabled=GlobalConfiguration().analytics_opt_in,
             metadata=metadata,
+            request_content_encodings=get_supported_content_encodings(),
         )
 
         # Add ZenML Pro specific store information to the server model, if available.
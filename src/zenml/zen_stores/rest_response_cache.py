@@ -0,0 +1,188 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Cache of REST API responses which are revalidated using ETags."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CachedResponse(NamedTuple):
+    """A cached response body and its ETag."""
+
+    etag: str
+    body: Any
+
+
+class RestResponseCache:
+    """Cache of REST API responses which are revalidated using ETags.
+
+    The most recently used responses are kept in memory. If a directory is
+    configured, responses are additionally stored on disk so that they can be
+    reused by other processes, e.g. consecutive CLI commands. Cached responses
+    are never used without asking the server whether they are still valid,
+    which means they only save the transfer of unchanged response bodies.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        directory: Optional[str] = None,
+        max_files: int = 0,
+    ) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_entries: The maximum number of responses kept in memory.
+            directory: Optional directory in which responses are stored.
+            max_files: The maximum number of responses stored on disk. If
+                there are more files, the least recently written ones are
+                deleted.
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_files = max_files
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_path(self, key: str) -> Optional[str]:
+        """Gets the path of the file in which a response is stored.
+
+        Args:
+            key: The cache key of the response.
+
+        Returns:
+            The file path, or None if responses are not stored on disk.
+        """
+        if not self.directory:
+            return None
+
+        file_name = hashlib.sha256(key.encode()).hexdigest() + ".json"
+        return os.path.join(self.directory, file_name)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Gets a cached response.
+
+        Args:
+            key: The cache key of the response.
+
+        Returns:
+            The cached response, if one exists.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+                return entry
+
+        path = self._get_path(key)
+        if not path or not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            # The key is stored to rule out hash collisions.
+            if data["key"] != key:
+                return None
+            entry = CachedResponse(etag=data["etag"], body=data["body"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Failed to read cached response %s: %s", path, e)
+            return None
+
+        self._set_in_memory(key, entry)
+        return entry
+
+    def set(self, key: str, etag: str, body: Any) -> None:
+        """Caches a response.
+
+        Args:
+            key: The cache key of the response.
+            etag: The ETag of the response.
+            body: The parsed response body.
+        """
+        entry = CachedResponse(etag=etag, body=body)
+        self._set_in_memory(key, entry)
+
+        path = self._get_path(key)
+        if not path or not self.directory:
+            return
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file first so that other processes never
+            # read partially written responses.
+            fd, temp_path = tempfile.mkstemp(dir=self.directory)
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"key": key, "etag": etag, "body": body}, f)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+            self._remove_old_files()
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Failed to store cached response %s: %s", path, e)
+
+    def clear(self) -> None:
+        """Removes all responses from the memory cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def _set_in_memory(self, key: str, entry: CachedResponse) -> None:
+        """Caches a response in memory.
+
+        Args:
+            key: The cache key of the response.
+            entry: The response to cache.
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _remove_old_files(self) -> None:
+        """Removes the least recently written files from the cache directory."""
+        if not self.directory:
+            return
+
+        files = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                files.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                # Another process might have removed the file already.
+                continue
+
+        if len(files) <= self.max_files:
+            return
+
+        files.sort()
+        for _, path in files[: len(files) - self.max_files]:
+            try:
+                os.remove(path)
+            except OSError:
+                # Another process might have removed the file already.
+                pass
@@ -13,8 +13,11 @@
 #  permissions and limitations under the License.
 """REST Zen Store implementation."""
 
+import json
 import os
 import re
+import socket
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -39,11 +42,14 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
     ValidationError,
     field_validator,
     model_validator,
 )
 from requests.adapters import HTTPAdapter, Retry
+from urllib3.connection import HTTPConnection
+from urllib3.util.request import ACCEPT_ENCODING
 
 import zenml
 from zenml.analytics import source_context
@@ -60,17 +66,23 @@ from zenml.constants import (
     ARTIFACT_VISUALIZATIONS,
     ARTIFACTS,
     BATCH,
+    CACHED,
     CODE_REFERENCES,
     CODE_REPOSITORIES,
     CONFIG,
     CURRENT_USER,
     DEACTIVATE,
+    DEFAULT_HTTP_COMPRESSION_MIN_SIZE,
+    DEFAULT_HTTP_KEEPALIVE_IDLE,
+    DEFAULT_HTTP_POOL_CONNECTIONS,
+    DEFAULT_HTTP_POOL_MAXSIZE,
     DEFAULT_HTTP_TIMEOUT,
     DEVICES,
     DISABLE_CLIENT_SERVER_MISMATCH_WARNING,
     ENV_ZENML_DISABLE_CLIENT_SERVER_MISMATCH_WARNING,
     EVENT_SOURCES,
     FLAVORS,
+    HISTORY,
     INFO,
     LOGIN,
     LOGS,
@@ -78,10 +90,14 @@ from zenml.constants import (
     MODEL_VERSION_PIPELINE_RUNS,
     MODEL_VERSIONS,
     MODELS,
+    PAGE_SIZE_DEFAULT,
+    PAGINATION_STARTING_PAGE,
     PIPELINE_BUILDS,
     PIPELINE_DEPLOYMENTS,
     PIPELINES,
     PROJECTS,
+    REST_RESPONSE_CACHE_MAX_FILES,
+    REST_RESPONSE_CACHE_SIZE,
     RUN_METADATA,
     RUN_TEMPLATES,
     RUNS,
@@ -208,7 +224,9 @@ from zenml.models import (
     ProjectRequest,
     ProjectResponse,
     ProjectUpdate,
+    RunMetadataEntry,
     RunMetadataRequest,
+    RunMetadataResource,
     RunTemplateFilter,
     RunTemplateRequest,
     RunTemplateResponse,
@@ -268,18 +286,34 @@ from zenml.models import (
 from zenml.service_connectors.service_connector_registry import (
     service_connector_registry,
 )
+from zenml.utils import io_utils
+from zenml.utils.compression_utils import (
+    compress,
+    get_supported_content_encodings,
+)
 from zenml.utils.networking_utils import (
     replace_localhost_with_internal_hostname,
 )
 from zenml.utils.pydantic_utils import before_validator_handler
 from zenml.zen_server.exceptions import exception_from_response
 from zenml.zen_stores.base_zen_store import BaseZenStore
+from zenml.zen_stores.rest_response_cache import RestResponseCache
 
 logger = get_logger(__name__)
 
 # type alias for possible json payloads (the Anys are recursive Json instances)
 Json = Union[Dict[str, Any], List[Any], str, int, float, bool, None]
 
+# Routes of resources which rarely or never change once they are created.
+# Responses for these resources are cached and revalidated using ETags.
+CACHED_RESOURCE_ROUTES = {
+    CODE_REFERENCES,
+    FLAVORS,
+    PIPELINE_BUILDS,
+    PIPELINE_DEPLOYMENTS,
+    STACK_COMPONENTS,
+}
+
 
 AnyRequest = TypeVar("AnyRequest", bound=BaseRequest)
 AnyResponse = TypeVar("AnyResponse", bound=BaseIdentifiedResponse)  # type: ignore[type-arg]
@@ -301,6 +335,23 @@ class RestZenStoreConfiguration(StoreConfiguration):
             verify the server's TLS certificate, or a string, in which case it
             must be a path to a CA bundle to use or the CA bundle value itself.
         http_timeout: The timeout to use for all requests.
+        http_pool_connections: The number of connection pools to cache.
+        http_pool_maxsize: The maximum number of connections kept open per
+            connection pool. This should be at least the number of threads
+            that share the store, e.g. when running steps in parallel.
+        http_keepalive_idle: The number of seconds after which TCP keep-alive
+            probes are sent on idle connections, which prevents load balancers
+            from dropping pooled connections. Set to 0 to disable TCP
+            keep-alive.
+        http_compression: Whether to compress request bodies, if the server
+            supports it, and to accept compressed responses.
+        http_compression_min_size: The minimum size in bytes of request
+            bodies that are compressed.
+        http_response_cache: Whether to cache responses for resources which
+            rarely change, like deployments, builds and stack components, in
+            memory and in the global config directory. Cached responses are
+            revalidated with the server on every request, so that their
+            bodies are only downloaded again if they changed.
 
     """
 
@@ -310,6 +361,16 @@ class RestZenStoreConfiguration(StoreConfiguration):
         default=True, union_mode="left_to_right"
     )
     http_timeout: int = DEFAULT_HTTP_TIMEOUT
+    http_pool_connections: int = Field(
+        default=DEFAULT_HTTP_POOL_CONNECTIONS, ge=1
+    )
+    http_pool_maxsize: int = Field(default=DEFAULT_HTTP_POOL_MAXSIZE, ge=1)
+    http_keepalive_idle: int = Field(default=DEFAULT_HTTP_KEEPALIVE_IDLE, ge=0)
+    http_compression: bool = True
+    http_compression_min_size: int = Field(
+        default=DEFAULT_HTTP_COMPRESSION_MIN_SIZE, ge=0
+    )
+    http_response_cache: bool = True
 
     @field_validator("url")
     @classmethod
@@ -431,6 +492,65 @@ class RestZenStoreConfiguration(StoreConfiguration):
     )
 
 
+class _KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTP adapter which enables TCP keep-alive on its connections."""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["keepalive_idle"]
+
+    def __init__(self, keepalive_idle: int, **kwargs: Any) -> None:
+        """Initializes the adapter.
+
+        Args:
+            keepalive_idle: The number of seconds after which keep-alive
+                probes are sent on idle connections. Keep-alive is disabled
+                if this is 0.
+            **kwargs: Keyword arguments for the `HTTPAdapter`.
+        """
+        # This needs to be set before calling the parent constructor, which
+        # initializes the pool manager.
+        self.keepalive_idle = keepalive_idle
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Initializes the pool manager with keep-alive socket options.
+
+        Args:
+            *args: Positional arguments for the pool manager.
+            **kwargs: Keyword arguments for the pool manager.
+        """
+        if self.keepalive_idle:
+            socket_options = list(HTTPConnection.default_socket_options)
+            socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            # The names of these options differ between platforms.
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                socket_options.append(
+                    (
+                        socket.IPPROTO_TCP,
+                        socket.TCP_KEEPIDLE,
+                        self.keepalive_idle,
+                    )
+                )
+            elif hasattr(socket, "TCP_KEEPALIVE"):
+                socket_options.append(
+                    (
+                        socket.IPPROTO_TCP,
+                        socket.TCP_KEEPALIVE,
+                        self.keepalive_idle,
+                    )
+                )
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                socket_options.append(
+                    (
+                        socket.IPPROTO_TCP,
+                        socket.TCP_KEEPINTVL,
+                        self.keepalive_idle,
+                    )
+                )
+            kwargs["socket_options"] = socket_options
+
+        super().init_poolmanager(*args, **kwargs)
+
+
 class RestZenStore(BaseZenStore):
     """Store implementation for accessing data from a REST API."""
 
@@ -439,7 +559,11 @@ class RestZenStore(BaseZenStore):
     CONFIG_TYPE: ClassVar[Type[StoreConfiguration]] = RestZenStoreConfiguration
     _api_token: Optional[APIToken] = None
     _session: Optional[requests.Session] = None
+    _session_lock: threading.RLock = PrivateAttr(
+        default_factory=threading.RLock
+    )
     _server_info: Optional[ServerModel] = None
+    _response_cache: Optional[RestResponseCache] = None
 
     # ====================================
     # ZenML Store interface implementation
@@ -2027,6 +2151,51 @@ class RestZenStore(BaseZenStore):
         """
         self.post(RUN_METADATA, body=run_metadata)
 
+    def batch_create_run_metadata(
+        self, run_metadata: List[RunMetadataRequest]
+    ) -> None:
+        """Creates a batch of run metadata.
+
+        Args:
+            run_metadata: The run metadata to create.
+        """
+        self._request(
+            "POST",
+            self.url + API + VERSION_1 + RUN_METADATA + BATCH,
+            json=[request.model_dump(mode="json") for request in run_metadata],
+        )
+
+    def get_run_metadata_history(
+        self,
+        resource: RunMetadataResource,
+        key: Optional[str] = None,
+        page: int = PAGINATION_STARTING_PAGE,
+        size: int = PAGE_SIZE_DEFAULT,
+    ) -> List[RunMetadataEntry]:
+        """Gets all run metadata entries of a resource, newest first.
+
+        Args:
+            resource: The resource for which to get the metadata.
+            key: If given, only get the entries with this key.
+            page: The page of entries to get.
+            size: The number of entries per page.
+
+        Returns:
+            The run metadata entries of the page.
+        """
+        body = self.get(
+            RUN_METADATA + HISTORY,
+            params={
+                "resource_id": str(resource.id),
+                "resource_type": resource.type.value,
+                "key": key,
+                "page": page,
+                "size": size,
+            },
+        )
+        assert isinstance(body, list)
+        return [RunMetadataEntry.model_validate(entry) for entry in body]
+
     # ----------------------------- Schedules -----------------------------
 
     def create_schedule(self, schedule: ScheduleRequest) -> ScheduleResponse:
@@ -3014,6 +3183,49 @@ class RestZenStore(BaseZenStore):
             route=STEPS,
         )
 
+    def batch_create_run_steps(
+        self, step_runs: List[StepRunRequest]
+    ) -> List[StepRunResponse]:
+        """Creates a batch of step runs.
+
+        Args:
+            step_runs: The step runs to create.
+
+        Returns:
+            The created step runs.
+        """
+        return self._batch_create_resources(
+            resources=step_runs,
+            response_model=StepRunResponse,
+            route=STEPS,
+        )
+
+    def get_cached_run_steps(
+        self, project_id: UUID, cache_keys: List[str]
+    ) -> Dict[str, StepRunResponse]:
+        """Get the step runs that can be used as cache for the given keys.
+
+        Args:
+            project_id: The ID of the project in which to look for step runs.
+            cache_keys: The cache keys for which to get the step runs.
+
+        Returns:
+            A dictionary mapping the cache keys to their cached step run. Cache
+            keys without a cached step run are not included.
+        """
+        response = self._request(
+            "POST",
+            self.url + API + VERSION_1 + STEPS + CACHED,
+            json=cache_keys,
+            params={"project_id": str(project_id)},
+        )
+        assert isinstance(response, dict)
+
+        return {
+            cache_key: StepRunResponse.model_validate(model_data)
+            for cache_key, model_data in response.items()
+        }
+
     def get_run_step(
         self, step_run_id: UUID, hydrate: bool = True
     ) -> StepRunResponse:
@@ -4187,6 +4399,29 @@ class RestZenStore(BaseZenStore):
 
         return self._api_token.access_token
 
+    @property
+    def response_cache(self) -> Optional[RestResponseCache]:
+        """The cache of responses for resources which rarely change.
+
+        Returns:
+            The response cache, or None if response caching is disabled.
+        """
+        if not self.config.http_response_cache:
+            return None
+
+        with self._session_lock:
+            if self._response_cache is None:
+                self._response_cache = RestResponseCache(
+                    max_entries=REST_RESPONSE_CACHE_SIZE,
+                    directory=os.path.join(
+                        io_utils.get_global_config_directory(),
+                        "rest_response_cache",
+                    ),
+                    max_files=REST_RESPONSE_CACHE_MAX_FILES,
+                )
+
+        return self._response_cache
+
     @property
     def session(self) -> requests.Session:
         """Initialize and return a requests session.
@@ -4208,59 +4443,87 @@ class RestZenStore(BaseZenStore):
                     return True
                 return super().is_retry(method, status_code, has_retry_after)
 
-        if self._session is None:
-            # We only need to initialize the session once over the lifetime
-            # of the client. We can swap the token out when it expires.
-            if self.config.verify_ssl is False:
-                urllib3.disable_warnings(
-                    urllib3.exceptions.InsecureRequestWarning
-                )
+        with self._session_lock:
+            if self._session is None:
+                # We only need to initialize the session once over the
+                # lifetime of the client. We can swap the token out when it
+                # expires. The session is shared between all threads using
+                # the store, which is why request specific headers are passed
+                # with each request instead of being set on the session.
+                if self.config.verify_ssl is False:
+                    urllib3.disable_warnings(
+                        urllib3.exceptions.InsecureRequestWarning
+                    )
 
-            self._session = requests.Session()
-            # Retries are triggered for idempotent HTTP methods (GET, HEAD, PUT,
-            # OPTIONS and DELETE) on specific HTTP status codes:
-            #
-            #     502: Bad Gateway.
-            #     503: Service Unavailable.
-            #     504: Gateway Timeout.
-            #
-            # This also handles connection level errors, if a connection attempt
-            # fails due to transient issues like:
-            #
-            #     DNS resolution errors.
-            #     Connection timeouts.
-            #     Network disruptions.
-            #
-            # Additional errors retried:
-            #
-            #     Read Timeouts: If the server does not send a response within
-            #     the timeout period.
-            #     Connection Refused: If the server refuses the connection.
-            #
-            retries = AugmentedRetry(
-                connect=5,
-                read=8,
-                redirect=3,
-                status=10,
-                allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS"],
-                status_forcelist=[
-                    408,  # Request Timeout
-                    429,  # Too Many Requests
-                    502,  # Bad Gateway
-                    503,  # Service Unavailable
-                    504,  # Gateway Timeout
-                ],
-                other=3,
-                backoff_factor=1,
-            )
-            self._session.mount("https://", HTTPAdapter(max_retries=retries))
-            self._session.mount("http://", HTTPAdapter(max_retries=retries))
-            self._session.verify = self.config.verify_ssl
-            # Use a custom user agent to identify the ZenML client in the server
-            # logs.
-            self._session.headers.update(
-                {"User-Agent": "zenml/" + zenml.__version__}
-            )
+                session = requests.Session()
+                # Retries are triggered for idempotent HTTP methods (GET,
+                # HEAD, PUT, OPTIONS and DELETE) on specific HTTP status
+                # codes:
+                #
+                #     502: Bad Gateway.
+                #     503: Service Unavailable.
+                #     504: Gateway Timeout.
+                #
+                # This also handles connection level errors, if a connection
+                # attempt fails due to transient issues like:
+                #
+                #     DNS resolution errors.
+                #     Connection timeouts.
+                #     Network disruptions.
+                #
+                # Additional errors retried:
+                #
+                #     Read Timeouts: If the server does not send a response
+                #     within the timeout period.
+                #     Connection Refused: If the server refuses the
+                #     connection.
+                #
+                retries = AugmentedRetry(
+                    connect=5,
+                    read=8,
+                    redirect=3,
+                    status=10,
+                    allowed_methods=[
+                        "HEAD",
+                        "GET",
+                        "PUT",
+                        "DELETE",
+                        "OPTIONS",
+                    ],
+                    status_forcelist=[
+                        408,  # Request Timeout
+                        429,  # Too Many Requests
+                        502,  # Bad Gateway
+                        503,  # Service Unavailable
+                        504,  # Gateway Timeout
+                    ],
+                    other=3,
+                    backoff_factor=1,
+                )
+                for prefix in ("https://", "http://"):
+                    session.mount(
+                        prefix,
+                        _KeepAliveHTTPAdapter(
+                            keepalive_idle=self.config.http_keepalive_idle,
+                            pool_connections=self.config.http_pool_connections,
+                            pool_maxsize=self.config.http_pool_maxsize,
+                            max_retries=retries,
+                        ),
+                    )
+                session.verify = self.config.verify_ssl
+                # Use a custom user agent to identify the ZenML client in the
+                # server logs.
+                session.headers.update(
+                    {
+                        "User-Agent": "zenml/" + zenml.__version__,
+                        # This includes all encodings which can be decoded
+                        # with the installed packages.
+                        "Accept-Encoding": ACCEPT_ENCODING
+                        if self.config.http_compression
+                        else "identity",
+                    }
+                )
+                self._session = session
 
         # Note that we return an unauthenticated session here. An API token
         # is only fetched and set in the authorization header when and if it is
@@ -4316,9 +4579,10 @@ class RestZenStore(BaseZenStore):
         new_api_token = self.get_or_generate_api_token()
 
         # Set or refresh the authentication token
-        self.session.headers.update(
-            {"Authorization": "Bearer " + new_api_token}
-        )
+        with self._session_lock:
+            self.session.headers.update(
+                {"Authorization": "Bearer " + new_api_token}
+            )
         logger.debug(f"Authenticated to {self.url}")
 
     @staticmethod
@@ -4362,12 +4626,48 @@ class RestZenStore(BaseZenStore):
                 f"{response.status_code} with body:\n{response.text}"
             )
 
+    def _compress_json_body(
+        self, headers: Dict[str, str], kwargs: Dict[str, Any]
+    ) -> None:
+        """Compresses the JSON body of a request if the server supports it.
+
+        Args:
+            headers: The request headers, which are updated in place.
+            kwargs: The keyword arguments of the request, which are updated in
+                place.
+        """
+        # The server info is not fetched here as this would require another
+        # request. It is always available once the store is initialized.
+        if not self.config.http_compression or self._server_info is None:
+            return
+
+        encoding = next(
+            (
+                encoding
+                for encoding in get_supported_content_encodings()
+                if encoding in self._server_info.request_content_encodings
+            ),
+            None,
+        )
+        if encoding is None:
+            return
+
+        body = json.dumps(kwargs["json"], allow_nan=False).encode()
+        if len(body) < self.config.http_compression_min_size:
+            return
+
+        kwargs.pop("json")
+        kwargs["data"] = compress(body, encoding=encoding)
+        headers["Content-Type"] = "application/json"
+        headers["Content-Encoding"] = encoding
+
     def _request(
         self,
         method: str,
         url: str,
         params: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
+        cache: bool = False,
         **kwargs: Any,
     ) -> Json:
         """Make a request to the REST API.
@@ -4377,6 +4677,8 @@ class RestZenStore(BaseZenStore):
             url: The URL to request.
             params: The query parameters to pass to the endpoint.
             timeout: The request timeout in seconds.
+            cache: Whether to cache the response and revalidate the cached
+                response using its ETag.
             kwargs: Additional keyword arguments to pass to the request.
 
         Returns:
@@ -4386,12 +4688,26 @@ class RestZenStore(BaseZenStore):
             CredentialsNotValid: if the request fails due to invalid
                 client credentials.
         """
-        self.session.headers.update(
-            {source_context.name: source_context.get().value}
-        )
-        # Add a request ID to the request headers
+        # Request specific headers are passed with the request instead of
+        # being set on the session, which is shared between threads.
         request_id = str(uuid4())[:8]
-        self.session.headers.update({"X-Request-ID": request_id})
+        headers = {
+            source_context.name: source_context.get().value,
+            "X-Request-ID": request_id,
+            **kwargs.pop("headers", {}),
+        }
+        if kwargs.get("json") is not None:
+            self._compress_json_body(headers=headers, kwargs=kwargs)
+
+        response_cache = self.response_cache if cache else None
+        cache_key = ""
+        cached_response = None
+        if response_cache:
+            cache_key = f"{url}?{json.dumps(params or {}, sort_keys=True, default=str)}"
+            cached_response = response_cache.get(cache_key)
+            if cached_response:
+                headers["If-None-Match"] = cached_response.etag
+
         path = url.removeprefix(self.url)
         start_time = time.time()
         logger.debug(
@@ -4415,16 +4731,24 @@ class RestZenStore(BaseZenStore):
         re_authenticated = False
         while True:
             try:
-                return self._handle_response(
-                    self.session.request(
-                        method,
-                        url,
-                        params=params if params else {},
-                        verify=self.config.verify_ssl,
-                        timeout=timeout or self.config.http_timeout,
-                        **kwargs,
-                    )
+                response = self.session.request(
+                    method,
+                    url,
+                    params=params if params else {},
+                    verify=self.config.verify_ssl,
+                    timeout=timeout or self.config.http_timeout,
+                    headers=headers,
+                    **kwargs,
                 )
+                if cached_response and response.status_code == 304:
+                    # The cached response is still valid
+                    cached_body: Json = cached_response.body
+                    return cached_body
+
+                payload = self._handle_response(response)
+                if response_cache and (etag := response.headers.get("ETag")):
+                    response_cache.set(cache_key, etag=etag, body=payload)
+                return payload
             except CredentialsNotValid as e:
                 # NOTE: CredentialsNotValid is raised only when the server
                 # explicitly indicates that the credentials are not valid and
@@ -4501,6 +4825,7 @@ class RestZenStore(BaseZenStore):
         path: str,
         params: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
+        cache: bool = False,
         **kwargs: Any,
     ) -> Json:
         """Make a GET request to the given endpoint path.
@@ -4509,6 +4834,8 @@ class RestZenStore(BaseZenStore):
             path: The path to the endpoint.
             params: The query parameters to pass to the endpoint.
             timeout: The request timeout in seconds.
+            cache: Whether to cache the response and revalidate the cached
+                response using its ETag.
             kwargs: Additional keyword arguments to pass to the request.
 
         Returns:
@@ -4519,6 +4846,7 @@ class RestZenStore(BaseZenStore):
             self.url + API + VERSION_1 + path,
             params=params,
             timeout=timeout,
+            cache=cache,
             **kwargs,
         )
 
@@ -4737,7 +5065,11 @@ class RestZenStore(BaseZenStore):
         Returns:
             The retrieved resource.
         """
-        body = self.get(f"{route}/{str(resource_id)}", params=params)
+        body = self.get(
+            f"{route}/{str(resource_id)}",
+            params=params,
+            cache=route in CACHED_RESOURCE_ROUTES,
+        )
         return response_model.model_validate(body)
 
     def _list_paginated_resources(
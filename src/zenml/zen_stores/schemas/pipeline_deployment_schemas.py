@@ -14,7 +14,9 @@
 """SQLModel implementation of pipeline deployment tables."""
 
 import json
-from typing import TYPE_CHECKING, Any, List, Optional, Sequence
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import TEXT, Column, String
@@ -26,7 +28,11 @@ from sqlmodel import Field, Relationship
 from zenml.config.pipeline_configurations import PipelineConfiguration
 from zenml.config.pipeline_spec import PipelineSpec
 from zenml.config.step_configurations import Step
-from zenml.constants import MEDIUMTEXT_MAX_LENGTH, TEXT_FIELD_MAX_LENGTH
+from zenml.constants import (
+    DEPLOYMENT_CONFIGURATION_CACHE_SIZE,
+    MEDIUMTEXT_MAX_LENGTH,
+    TEXT_FIELD_MAX_LENGTH,
+)
 from zenml.logger import get_logger
 from zenml.models import (
     PipelineDeploymentRequest,
@@ -55,6 +61,31 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+class _ParsedDeployment:
+    """Parsed configurations of a deployment."""
+
+    def __init__(
+        self,
+        pipeline_configuration: PipelineConfiguration,
+        step_configurations: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Initializes the parsed deployment.
+
+        Args:
+            pipeline_configuration: The pipeline configuration.
+            step_configurations: The unparsed step configurations.
+        """
+        self.pipeline_configuration = pipeline_configuration
+        self.step_configurations = step_configurations
+        self.steps: Optional[Dict[str, Step]] = None
+
+
+# Deployments are immutable, which means their parsed configurations can be
+# cached by ID and shared between all schemas of the same deployment.
+_parsed_deployments: "OrderedDict[UUID, _ParsedDeployment]" = OrderedDict()
+_parsed_deployments_lock = threading.Lock()
+
+
 class PipelineDeploymentSchema(BaseSchema, table=True):
     """SQL Model for pipeline deployments."""
 
@@ -77,6 +108,7 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
             nullable=False,
         )
     )
+    step_count: Optional[int] = Field(nullable=True, default=None)
     client_environment: str = Field(sa_column=Column(TEXT, nullable=False))
     run_name_template: str = Field(nullable=False)
     client_version: str = Field(nullable=True)
@@ -271,8 +303,89 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
             if request.pipeline_spec
             else None,
             code_path=request.code_path,
+            step_count=len(request.step_configurations),
+        )
+
+    def _get_parsed_deployment(self) -> _ParsedDeployment:
+        """Gets the parsed configurations of the deployment.
+
+        Returns:
+            The parsed configurations.
+        """
+        with _parsed_deployments_lock:
+            parsed = _parsed_deployments.get(self.id)
+            if parsed:
+                _parsed_deployments.move_to_end(self.id)
+                return parsed
+
+        parsed = _ParsedDeployment(
+            pipeline_configuration=PipelineConfiguration.model_validate_json(
+                self.pipeline_configuration
+            ),
+            step_configurations=json.loads(self.step_configurations),
+        )
+        with _parsed_deployments_lock:
+            _parsed_deployments[self.id] = parsed
+            while (
+                len(_parsed_deployments) > DEPLOYMENT_CONFIGURATION_CACHE_SIZE
+            ):
+                _parsed_deployments.popitem(last=False)
+        return parsed
+
+    def get_pipeline_configuration(self) -> PipelineConfiguration:
+        """Gets the pipeline configuration of the deployment.
+
+        The returned configuration is shared between callers apart from its
+        substitutions, which can be finalized in place. All other attributes
+        must not be modified.
+
+        Returns:
+            The pipeline configuration.
+        """
+        configuration = self._get_parsed_deployment().pipeline_configuration
+        return configuration.model_copy(
+            update={"substitutions": dict(configuration.substitutions)}
         )
 
+    def get_step_configurations(self) -> Dict[str, Dict[str, Any]]:
+        """Gets the unparsed step configurations of the deployment.
+
+        Returns:
+            The step configurations, which must not be modified.
+        """
+        return self._get_parsed_deployment().step_configurations
+
+    def get_step_count(self) -> int:
+        """Gets the number of steps of the deployment.
+
+        Returns:
+            The number of steps.
+        """
+        if self.step_count is not None:
+            return self.step_count
+
+        return len(self.get_step_configurations())
+
+    def get_steps(self) -> Dict[str, Step]:
+        """Gets the steps of the deployment.
+
+        The step configurations are merged with the pipeline configuration
+        without finalizing its substitutions. The returned steps are shared
+        between callers and must not be modified.
+
+        Returns:
+            The steps of the deployment.
+        """
+        parsed = self._get_parsed_deployment()
+        if parsed.steps is None:
+            parsed.steps = {
+                invocation_id: Step.from_dict(
+                    dict(step), parsed.pipeline_configuration
+                )
+                for invocation_id, step in parsed.step_configurations.items()
+            }
+        return parsed.steps
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -300,19 +413,20 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
         )
         metadata = None
         if include_metadata:
-            pipeline_configuration = PipelineConfiguration.model_validate_json(
-                self.pipeline_configuration
-            )
-            step_configurations = json.loads(self.step_configurations)
-            for invocation_id, step in step_configurations.items():
-                step_configurations[invocation_id] = Step.from_dict(
-                    step, pipeline_configuration
-                )
-
             client_environment = json.loads(self.client_environment)
             if not include_python_packages:
                 client_environment.pop("python_packages", None)
 
+            pipeline_configuration = self.get_pipeline_configuration()
+            step_configurations = {
+                invocation_id: Step.from_dict(
+                    dict(step), pipeline_configuration
+                )
+                for invocation_id, step in (
+                    self.get_step_configurations().items()
+                )
+            }
+
             metadata = PipelineDeploymentResponseMetadata(
                 run_name_template=self.run_name_template,
                 pipeline_configuration=pipeline_configuration,
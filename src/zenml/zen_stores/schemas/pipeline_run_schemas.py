@@ -20,7 +20,7 @@ from uuid import UUID
 
 from pydantic import ConfigDict
 from sqlalchemy import UniqueConstraint
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, object_session
 from sqlalchemy.sql.base import ExecutableOption
 from sqlmodel import TEXT, Column, Field, Relationship
 
@@ -32,6 +32,7 @@ from zenml.enums import (
     TaggableResourceTypes,
 )
 from zenml.logger import get_logger
+from zenml.metadata.metadata_types import MetadataType
 from zenml.models import (
     PipelineRunRequest,
     PipelineRunResponse,
@@ -57,6 +58,7 @@ from zenml.zen_stores.schemas.trigger_schemas import TriggerExecutionSchema
 from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.utils import (
     RunMetadataInterface,
+    get_latest_run_metadata,
     jl_arg,
 )
 
@@ -364,6 +366,47 @@ class PipelineRunSchema(NamedSchema, RunMetadataInterface, table=True):
 
         return metadata_collection
 
+    def fetch_metadata(
+        self, include_full_metadata: bool = False, **kwargs: Any
+    ) -> Dict[str, MetadataType]:
+        """Fetches the latest metadata entries related to the pipeline run.
+
+        Args:
+            include_full_metadata: Whether the full metadata will be included.
+            **kwargs: Keyword arguments.
+
+        Returns:
+            A dictionary, where the key is the key of the metadata entry
+                and the values represent the latest entry with this key.
+        """
+        session = object_session(self)
+        if session is None:
+            return super().fetch_metadata(
+                include_full_metadata=include_full_metadata, **kwargs
+            )
+
+        metadata = super().fetch_metadata(**kwargs)
+
+        if include_full_metadata:
+            # Fetch the latest metadata of all steps of this run at once
+            step_names = {s.id: s.name for s in self.step_runs}
+            step_metadata = get_latest_run_metadata(
+                session=session,
+                resource_type=MetadataResourceTypes.STEP_RUN,
+                resource_ids=list(step_names),
+            )
+            for step_id, values in step_metadata.items():
+                for k, v in values.items():
+                    metadata[f"{step_names[step_id]}::{k}"] = v
+
+            # Fetch the metadata related to the schedule of this run
+            if self.deployment is not None:
+                if schedule := self.deployment.schedule:
+                    for k, v in schedule.fetch_metadata().items():
+                        metadata[f"schedule:{k}"] = v
+
+        return metadata
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -389,19 +432,36 @@ class PipelineRunSchema(NamedSchema, RunMetadataInterface, table=True):
             RuntimeError: if the model creation fails.
         """
         if self.deployment is not None:
-            deployment = self.deployment.to_model(
-                include_metadata=True,
-                include_python_packages=include_python_packages,
-            )
-
-            config = deployment.pipeline_configuration
-            client_environment = deployment.client_environment
+            config = self.deployment.get_pipeline_configuration()
+            client_environment = json.loads(self.deployment.client_environment)
+            if not include_python_packages:
+                client_environment.pop("python_packages", None)
 
-            stack = deployment.stack
-            pipeline = deployment.pipeline
-            build = deployment.build
-            schedule = deployment.schedule
-            code_reference = deployment.code_reference
+            stack = (
+                self.deployment.stack.to_model()
+                if self.deployment.stack
+                else None
+            )
+            pipeline = (
+                self.deployment.pipeline.to_model()
+                if self.deployment.pipeline
+                else None
+            )
+            build = (
+                self.deployment.build.to_model()
+                if self.deployment.build
+                else None
+            )
+            schedule = (
+                self.deployment.schedule.to_model()
+                if self.deployment.schedule
+                else None
+            )
+            code_reference = (
+                self.deployment.code_reference.to_model()
+                if self.deployment.code_reference
+                else None
+            )
 
         elif self.pipeline_configuration is not None:
             config = PipelineConfiguration.model_validate_json(
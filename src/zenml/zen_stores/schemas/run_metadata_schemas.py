@@ -16,7 +16,7 @@
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import TEXT, VARCHAR, Column
+from sqlalchemy import BIGINT, TEXT, VARCHAR, Column
 from sqlmodel import Field, Relationship, SQLModel
 
 from zenml.zen_stores.schemas.base_schemas import BaseSchema
@@ -34,6 +34,16 @@ class RunMetadataSchema(BaseSchema, table=True):
     """SQL Model for run metadata."""
 
     __tablename__ = "run_metadata"
+    __table_args__ = (
+        # Used to find the entries of a key, ordered by creation time, when
+        # fetching the latest value or the history of a key. The resources
+        # which the entries belong to are filtered using the index of the
+        # `run_metadata_resource` table.
+        build_index(
+            table_name=__tablename__,
+            column_names=["key", "created"],
+        ),
+    )
 
     stack_component_id: Optional[UUID] = build_foreign_key_field(
         source=__tablename__,
@@ -70,6 +80,12 @@ class RunMetadataSchema(BaseSchema, table=True):
     key: str
     value: str = Field(sa_column=Column(TEXT, nullable=False))
     type: str
+    # The time at which the value was logged, in nanoseconds since the epoch.
+    # Values which are stored in bulk share the same creation time, so this is
+    # used to order the values of a key which were created at the same time.
+    sequence: Optional[int] = Field(
+        default=None, sa_column=Column(BIGINT, nullable=True)
+    )
 
     publisher_step_id: Optional[UUID] = build_foreign_key_field(
         source=__tablename__,
@@ -13,7 +13,6 @@
 #  permissions and limitations under the License.
 """SQLModel implementation of step run tables."""
 
-import json
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 from uuid import UUID
@@ -25,7 +24,6 @@ from sqlalchemy.orm import joinedload
 from sqlalchemy.sql.base import ExecutableOption
 from sqlmodel import Field, Relationship, SQLModel
 
-from zenml.config.pipeline_configurations import PipelineConfiguration
 from zenml.config.step_configurations import Step
 from zenml.constants import MEDIUMTEXT_MAX_LENGTH
 from zenml.enums import (
@@ -290,21 +288,17 @@ class StepRunSchema(NamedSchema, RunMetadataInterface, table=True):
         """
         step = None
         if self.deployment is not None:
-            step_configurations = json.loads(
-                self.deployment.step_configurations
-            )
+            step_configurations = self.deployment.get_step_configurations()
             if self.name in step_configurations:
                 pipeline_configuration = (
-                    PipelineConfiguration.model_validate_json(
-                        self.deployment.pipeline_configuration
-                    )
+                    self.deployment.get_pipeline_configuration()
                 )
                 pipeline_configuration.finalize_substitutions(
                     start_time=self.pipeline_run.start_time,
                     inplace=True,
                 )
                 step = Step.from_dict(
-                    step_configurations[self.name],
+                    dict(step_configurations[self.name]),
                     pipeline_configuration=pipeline_configuration,
                 )
         if not step and self.step_configuration:
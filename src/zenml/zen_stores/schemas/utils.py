@@ -15,11 +15,14 @@
 
 import json
 import math
-from typing import Any, Dict, List, Type, TypeVar, cast
+from typing import Any, Dict, List, Sequence, Type, TypeVar, cast
+from uuid import UUID
 
-from sqlalchemy.orm import InstrumentedAttribute
-from sqlmodel import Relationship
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import InstrumentedAttribute, Session, object_session
+from sqlmodel import Relationship, col, select
 
+from zenml.enums import MetadataResourceTypes
 from zenml.metadata.metadata_types import MetadataType
 from zenml.models import BaseResponse, Page, RunMetadataEntry
 from zenml.zen_stores.schemas.base_schemas import BaseSchema
@@ -109,6 +112,7 @@ class RunMetadataInterface:
                 metadata_collection[rm.key] = []
             metadata_collection[rm.key].append(
                 RunMetadataEntry(
+                    key=rm.key,
                     value=json.loads(rm.value),
                     created=rm.created,
                 )
@@ -126,6 +130,15 @@ class RunMetadataInterface:
             A dictionary, where the key is the key of the metadata entry
                 and the values represent the latest entry with this key.
         """
+        if session := object_session(self):
+            assert isinstance(self, BaseSchema)
+            resource_type = MetadataResourceTypes(str(self.__tablename__))
+            return get_latest_run_metadata(
+                session=session,
+                resource_type=resource_type,
+                resource_ids=[self.id],
+            ).get(self.id, {})
+
         metadata_collection = self.fetch_metadata_collection(**kwargs)
         return {
             k: sorted(v, key=lambda x: x.created, reverse=True)[0].value
@@ -133,6 +146,122 @@ class RunMetadataInterface:
         }
 
 
+def get_latest_run_metadata(
+    session: Session,
+    resource_type: MetadataResourceTypes,
+    resource_ids: Sequence[UUID],
+) -> Dict[UUID, Dict[str, MetadataType]]:
+    """Fetches the latest run metadata entry per key for resources.
+
+    Only the latest entry of each key is loaded from the database, instead of
+    the full metadata history of the resources.
+
+    Args:
+        session: The DB session to use for queries.
+        resource_type: The type of the resources.
+        resource_ids: The IDs of the resources.
+
+    Returns:
+        The latest metadata of each resource which has metadata.
+    """
+    from zenml.zen_stores.schemas.run_metadata_schemas import (
+        RunMetadataResourceSchema,
+        RunMetadataSchema,
+    )
+
+    if not resource_ids:
+        return {}
+
+    resource_filter = and_(
+        col(RunMetadataResourceSchema.resource_type) == resource_type.value,
+        col(RunMetadataResourceSchema.resource_id).in_(resource_ids),
+    )
+    latest_created = (
+        select(
+            col(RunMetadataResourceSchema.resource_id).label("resource_id"),
+            col(RunMetadataSchema.key).label("key"),
+            func.max(RunMetadataSchema.created).label("created"),
+        )
+        .join(
+            RunMetadataSchema,
+            col(RunMetadataSchema.id)
+            == col(RunMetadataResourceSchema.run_metadata_id),
+        )
+        .where(resource_filter)
+        .group_by(
+            col(RunMetadataResourceSchema.resource_id),
+            col(RunMetadataSchema.key),
+        )
+        .subquery()
+    )
+    # Entries which are stored in bulk share the same creation time, in which
+    # case the one that was logged last is the latest.
+    latest = (
+        select(
+            latest_created.c.resource_id,
+            latest_created.c.key,
+            latest_created.c.created,
+            func.max(RunMetadataSchema.sequence).label("sequence"),
+        )
+        .join(
+            RunMetadataResourceSchema,
+            col(RunMetadataResourceSchema.resource_id)
+            == latest_created.c.resource_id,
+        )
+        .join(
+            RunMetadataSchema,
+            and_(
+                col(RunMetadataSchema.id)
+                == col(RunMetadataResourceSchema.run_metadata_id),
+                col(RunMetadataSchema.key) == latest_created.c.key,
+                col(RunMetadataSchema.created) == latest_created.c.created,
+            ),
+        )
+        .where(resource_filter)
+        .group_by(
+            latest_created.c.resource_id,
+            latest_created.c.key,
+            latest_created.c.created,
+        )
+        .subquery()
+    )
+    query = (
+        select(
+            RunMetadataResourceSchema.resource_id,
+            RunMetadataSchema.key,
+            RunMetadataSchema.value,
+        )
+        .join(
+            RunMetadataSchema,
+            col(RunMetadataSchema.id)
+            == col(RunMetadataResourceSchema.run_metadata_id),
+        )
+        .join(
+            latest,
+            and_(
+                latest.c.resource_id
+                == col(RunMetadataResourceSchema.resource_id),
+                latest.c.key == col(RunMetadataSchema.key),
+                latest.c.created == col(RunMetadataSchema.created),
+                or_(
+                    latest.c.sequence.is_(None),
+                    latest.c.sequence == col(RunMetadataSchema.sequence),
+                ),
+            ),
+        )
+        .where(resource_filter)
+        # Entries stored before the sequence was recorded don't have one. If
+        # they share the same creation time, the one with the largest ID is
+        # used, which is the same one the metadata history lists first.
+        .order_by(col(RunMetadataSchema.id))
+    )
+
+    metadata: Dict[UUID, Dict[str, MetadataType]] = {}
+    for resource_id, key, value in session.execute(query).all():
+        metadata.setdefault(resource_id, {})[key] = json.loads(value)
+    return metadata
+
+
 def get_resource_type_name(schema_class: Type[BaseSchema]) -> str:
     """Get the name of a resource from a schema class.
 
@@ -14,13 +14,17 @@
 """Base Secrets Store implementation."""
 
 from abc import ABC
+from functools import wraps
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
     Optional,
     Type,
+    TypeVar,
+    cast,
 )
 from uuid import UUID
 
@@ -31,6 +35,10 @@ from zenml.enums import SecretsStoreType
 from zenml.logger import get_logger
 from zenml.utils import source_utils
 from zenml.utils.pydantic_utils import before_validator_handler
+from zenml.zen_stores.secrets_stores.secrets_cache import (
+    BaseSecretsCache,
+    InMemorySecretsCache,
+)
 from zenml.zen_stores.secrets_stores.secrets_store_interface import (
     SecretsStoreInterface,
 )
@@ -44,17 +52,83 @@ ZENML_SECRET_LABEL = "zenml"
 ZENML_SECRET_ID_LABEL = "zenml_secret_id"
 ZENML_SECRET_NAME_LABEL = "zenml_secret_name"
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _cached_get_secret_values(method: F) -> F:
+    """Wraps the `get_secret_values` method of a secrets store with a cache.
+
+    Args:
+        method: The method to wrap.
+
+    Returns:
+        The wrapped method.
+    """
+
+    @wraps(method)
+    def wrapper(
+        self: "BaseSecretsStore", secret_id: UUID, *args: Any, **kwargs: Any
+    ) -> Dict[str, str]:
+        # Only the outermost wrapper uses the cache if a subclass overrides
+        # the method of another subclass.
+        cache = self.cache
+        if (
+            cache is None
+            or getattr(type(self), method.__name__) is not wrapper
+        ):
+            return cast(
+                Dict[str, str], method(self, secret_id, *args, **kwargs)
+            )
+
+        values = cache.get(secret_id)
+        if values is None:
+            generation = cache.generation
+            values = method(self, secret_id, *args, **kwargs)
+            cache.set(secret_id, values, generation=generation)
+        return values
+
+    return cast(F, wrapper)
+
+
+def _invalidating(method: F) -> F:
+    """Wraps a method of a secrets store which modifies secret values.
+
+    Args:
+        method: The method to wrap.
+
+    Returns:
+        The wrapped method, which removes the secret values from the cache.
+    """
+
+    @wraps(method)
+    def wrapper(
+        self: "BaseSecretsStore", secret_id: UUID, *args: Any, **kwargs: Any
+    ) -> Any:
+        try:
+            return method(self, secret_id, *args, **kwargs)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(secret_id)
+
+    return cast(F, wrapper)
+
 
 class BaseSecretsStore(BaseModel, SecretsStoreInterface, ABC):
     """Base class for accessing and persisting ZenML secret values.
 
+    Secret values fetched by subclasses are cached according to the store
+    configuration. The cache is invalidated whenever the values of a secret
+    are stored, updated or deleted through the same secrets store.
+
     Attributes:
         config: The configuration of the secret store.
         _zen_store: The ZenML store that owns this secrets store.
+        _cache: The cache for secret values.
     """
 
     config: SecretsStoreConfiguration
     _zen_store: Optional["BaseZenStore"] = None
+    _cache: Optional[BaseSecretsCache] = None
 
     TYPE: ClassVar[SecretsStoreType]
     CONFIG_TYPE: ClassVar[Type[SecretsStoreConfiguration]]
@@ -153,6 +227,7 @@ class BaseSecretsStore(BaseModel, SecretsStoreInterface, ABC):
         """
         super().__init__(**kwargs)
         self._zen_store = zen_store
+        self._cache = self._create_cache()
 
         try:
             self._initialize()
@@ -161,6 +236,57 @@ class BaseSecretsStore(BaseModel, SecretsStoreInterface, ABC):
                 f"Error initializing {self.type.value} secrets store: {str(e)}"
             ) from e
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Wraps the secret values methods of subclasses with the cache.
+
+        Args:
+            **kwargs: Keyword arguments passed to the parent class.
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+
+        if "get_secret_values" in cls.__dict__:
+            cls.get_secret_values = _cached_get_secret_values(  # type: ignore[method-assign]
+                cls.__dict__["get_secret_values"]
+            )
+        for name in (
+            "store_secret_values",
+            "update_secret_values",
+            "delete_secret_values",
+        ):
+            if name in cls.__dict__:
+                setattr(cls, name, _invalidating(cls.__dict__[name]))
+
+    def _create_cache(self) -> Optional[BaseSecretsCache]:
+        """Creates the cache for secret values.
+
+        Returns:
+            The cache, or None if caching is disabled.
+
+        Raises:
+            ValueError: If the configured cache class cannot be imported or is
+                not a subclass of `BaseSecretsCache`.
+        """
+        if self.config.cache_ttl <= 0 or self.config.cache_max_size <= 0:
+            return None
+
+        cache_class: Type[BaseSecretsCache] = InMemorySecretsCache
+        if self.config.cache_class_path:
+            try:
+                cache_class = source_utils.load_and_validate_class(
+                    self.config.cache_class_path,
+                    expected_class=BaseSecretsCache,
+                )
+            except (ImportError, AttributeError) as e:
+                raise ValueError(
+                    f"Could not import class "
+                    f"`{self.config.cache_class_path}`: {str(e)}"
+                ) from e
+
+        return cache_class(
+            max_size=self.config.cache_max_size, ttl=self.config.cache_ttl
+        )
+
     @staticmethod
     def _load_custom_store_class(
         store_config: SecretsStoreConfiguration,
@@ -281,6 +407,15 @@ class BaseSecretsStore(BaseModel, SecretsStoreInterface, ABC):
         """
         return self.TYPE
 
+    @property
+    def cache(self) -> Optional[BaseSecretsCache]:
+        """The cache for secret values.
+
+        Returns:
+            The cache, or None if caching is disabled.
+        """
+        return self._cache
+
     @property
     def zen_store(self) -> "BaseZenStore":
         """The ZenML store that owns this secrets store.
@@ -0,0 +1,208 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Caches for secret values."""
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+
+class BaseSecretsCache(ABC):
+    """Base class for caches of secret values.
+
+    A secrets store uses a cache to avoid fetching the values of the same
+    secret from the back-end over and over again. Custom cache implementations
+    must inherit from this class and can be configured through the
+    `cache_class_path` secrets store configuration attribute. The storage
+    methods of subclasses are always called while holding a lock.
+
+    Attributes:
+        max_size: The maximum number of secrets to cache.
+        ttl: The number of seconds after which cached values expire.
+        hits: The number of lookups that were served from the cache.
+        misses: The number of lookups that were not served from the cache.
+        generation: Counter which is incremented whenever values are
+            invalidated.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_size: The maximum number of secrets to cache.
+            ttl: The number of seconds after which cached values expire.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._lock = Lock()
+
+    def get(self, secret_id: UUID) -> Optional[Dict[str, str]]:
+        """Gets the cached values of a secret and counts the lookup.
+
+        Args:
+            secret_id: The ID of the secret.
+
+        Returns:
+            A copy of the cached values, or None if no valid values are
+            cached for the secret.
+        """
+        with self._lock:
+            values = self._get(secret_id)
+            if values is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return dict(values)
+
+    def set(
+        self,
+        secret_id: UUID,
+        values: Dict[str, str],
+        generation: Optional[int] = None,
+    ) -> None:
+        """Caches the values of a secret.
+
+        Args:
+            secret_id: The ID of the secret.
+            values: The secret values.
+            generation: The generation of the cache at the time the values
+                were fetched. If values were invalidated since then, the
+                fetched values might be outdated and are not cached.
+        """
+        with self._lock:
+            if generation is None or generation == self.generation:
+                self._set(secret_id, dict(values))
+
+    def invalidate(self, secret_id: UUID) -> None:
+        """Removes the values of a secret from the cache.
+
+        Args:
+            secret_id: The ID of the secret.
+        """
+        with self._lock:
+            self.generation += 1
+            self._remove(secret_id)
+
+    def clear(self) -> None:
+        """Removes all values from the cache."""
+        with self._lock:
+            self.generation += 1
+            self._clear()
+
+    @abstractmethod
+    def _get(self, secret_id: UUID) -> Optional[Dict[str, str]]:
+        """Gets the cached values of a secret.
+
+        Args:
+            secret_id: The ID of the secret.
+
+        Returns:
+            The cached values, or None if no valid values are cached for the
+            secret.
+        """
+
+    @abstractmethod
+    def _set(self, secret_id: UUID, values: Dict[str, str]) -> None:
+        """Caches the values of a secret.
+
+        Args:
+            secret_id: The ID of the secret.
+            values: The secret values.
+        """
+
+    @abstractmethod
+    def _remove(self, secret_id: UUID) -> None:
+        """Removes the values of a secret from the cache.
+
+        Args:
+            secret_id: The ID of the secret.
+        """
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Removes all values from the cache."""
+
+
+class InMemorySecretsCache(BaseSecretsCache):
+    """In-memory cache which evicts the least recently used entries.
+
+    The cache is local to the process, which means that changes made through
+    another ZenML server replica are only picked up after the cached values
+    expired.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_size: The maximum number of secrets to cache.
+            ttl: The number of seconds after which cached values expire.
+        """
+        super().__init__(max_size=max_size, ttl=ttl)
+        self._entries: "OrderedDict[UUID, Tuple[float, Dict[str, str]]]" = (
+            OrderedDict()
+        )
+
+    def _get(self, secret_id: UUID) -> Optional[Dict[str, str]]:
+        """Gets the cached values of a secret.
+
+        Args:
+            secret_id: The ID of the secret.
+
+        Returns:
+            The cached values, or None if no valid values are cached for the
+            secret.
+        """
+        entry = self._entries.get(secret_id)
+        if entry is None:
+            return None
+
+        expiry, values = entry
+        if time.monotonic() >= expiry:
+            del self._entries[secret_id]
+            return None
+
+        self._entries.move_to_end(secret_id)
+        return values
+
+    def _set(self, secret_id: UUID, values: Dict[str, str]) -> None:
+        """Caches the values of a secret.
+
+        Args:
+            secret_id: The ID of the secret.
+            values: The secret values.
+        """
+        self._entries[secret_id] = (time.monotonic() + self.ttl, values)
+        self._entries.move_to_end(secret_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _remove(self, secret_id: UUID) -> None:
+        """Removes the values of a secret from the cache.
+
+        Args:
+            secret_id: The ID of the secret.
+        """
+        self._entries.pop(secret_id, None)
+
+    def _clear(self) -> None:
+        """Removes all values from the cache."""
+        self._entries.clear()
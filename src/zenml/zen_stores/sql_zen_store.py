@@ -98,12 +98,11 @@ from zenml.analytics.utils import (
     track_handler,
 )
 from zenml.config.global_config import GlobalConfiguration
-from zenml.config.pipeline_configurations import PipelineConfiguration
 from zenml.config.pipeline_run_configuration import PipelineRunConfiguration
 from zenml.config.secrets_store_config import SecretsStoreConfiguration
 from zenml.config.server_config import ServerConfiguration
 from zenml.config.source import Source
-from zenml.config.step_configurations import Step, StepConfiguration, StepSpec
+from zenml.config.step_configurations import StepConfiguration, StepSpec
 from zenml.config.store_config import StoreConfiguration
 from zenml.constants import (
     DEFAULT_PASSWORD,
@@ -115,6 +114,8 @@ from zenml.constants import (
     ENV_ZENML_SERVER,
     FINISHED_ONBOARDING_SURVEY_KEY,
     MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION,
+    PAGE_SIZE_DEFAULT,
+    PAGINATION_STARTING_PAGE,
     SQL_STORE_BACKUP_DIRECTORY_NAME,
     TEXT_FIELD_MAX_LENGTH,
     handle_bool_env_var,
@@ -238,6 +239,7 @@ from zenml.models import (
     ProjectScopedFilter,
     ProjectScopedRequest,
     ProjectUpdate,
+    RunMetadataEntry,
     RunMetadataRequest,
     RunMetadataResource,
     RunTemplateFilter,
@@ -318,7 +320,7 @@ from zenml.utils.string_utils import (
     random_str,
     validate_name,
 )
-from zenml.utils.time_utils import utc_now
+from zenml.utils.time_utils import increasing_time_ns, utc_now
 from zenml.zen_stores import template_utils
 from zenml.zen_stores.base_zen_store import (
     BaseZenStore,
@@ -1074,19 +1076,32 @@ class SqlZenStore(BaseZenStore):
             The Domain Model representation of the DB resource
 
         Raises:
-            ValueError: if the filtered page number is out of bounds.
+            ValueError: if the filtered page number is out of bounds or the
+                query can't be paginated using a cursor.
             RuntimeError: if the schema does not have a `to_model` method.
         """
         query = filter_model.apply_filter(query=query, table=table)
         query = filter_model.apply_sorting(query=query, table=table)
         query = query.distinct()
 
+        supports_cursor = (
+            custom_fetch is None
+            and filter_model.supports_cursor_pagination(table=table)
+        )
+        if filter_model.cursor and not supports_cursor:
+            raise ValueError(
+                "Pagination cursors are not supported when sorting by "
+                f"`{filter_model.sort_by}`."
+            )
+        index = filter_model.cursor_page
+
         # Get the total amount of items in the database for a given query
         custom_fetch_result: Optional[Sequence[Any]] = None
+        total: Optional[int] = None
         if custom_fetch:
             custom_fetch_result = custom_fetch(session, query, filter_model)
             total = len(custom_fetch_result)
-        else:
+        elif filter_model.include_total:
             result = session.scalar(
                 select(func.count()).select_from(
                     query.options(noload("*")).subquery()
@@ -1099,18 +1114,19 @@ class SqlZenStore(BaseZenStore):
                 total = 0
 
         # Get the total amount of pages in the database for a given query
-        if total == 0:
-            total_pages = 1
-        else:
-            total_pages = math.ceil(total / filter_model.size)
+        if total is not None:
+            if total == 0:
+                total_pages = 1
+            else:
+                total_pages = math.ceil(total / filter_model.size)
 
-        if filter_model.page > total_pages:
-            raise ValueError(
-                f"Invalid page {filter_model.page}. The requested page size is "
-                f"{filter_model.size} and there are a total of {total} items "
-                f"for this query. The maximum page value therefore is "
-                f"{total_pages}."
-            )
+            if index > total_pages:
+                raise ValueError(
+                    f"Invalid page {index}. The requested page size is "
+                    f"{filter_model.size} and there are a total of {total} "
+                    f"items for this query. The maximum page value therefore "
+                    f"is {total_pages}."
+                )
 
         query_options = table.get_query_options(
             include_metadata=hydrate, include_resources=True
@@ -1123,15 +1139,40 @@ class SqlZenStore(BaseZenStore):
         if custom_fetch:
             assert custom_fetch_result is not None
             item_schemas = custom_fetch_result
+            has_next_page = filter_model.offset + filter_model.size < len(
+                item_schemas
+            )
             # select the items in the current page
             item_schemas = item_schemas[
                 filter_model.offset : filter_model.offset + filter_model.size
             ]
         else:
-            query_result = session.exec(
-                query.limit(filter_model.size).offset(filter_model.offset)
-            )
+            if filter_model.cursor:
+                query = filter_model.apply_cursor(query=query, table=table)
+            else:
+                query = query.offset(filter_model.offset)
+
+            # Fetch one additional item to find out whether there is a next
+            # page without counting all items.
+            query_result = session.exec(query.limit(filter_model.size + 1))
             item_schemas = query_result.all()
+            has_next_page = len(item_schemas) > filter_model.size
+            item_schemas = item_schemas[: filter_model.size]
+
+        if total is None:
+            if index > 1 and not item_schemas and not filter_model.cursor:
+                raise ValueError(
+                    f"Invalid page {index}. There are no items for this "
+                    "query on this page."
+                )
+            total = (index - 1) * filter_model.size + len(item_schemas)
+            total_pages = index + 1 if has_next_page else index
+
+        next_cursor = None
+        if supports_cursor and has_next_page:
+            next_cursor = filter_model.create_cursor(
+                item_schemas[-1], page=index + 1
+            )
 
         # Convert this page of items from schemas to models.
         items: List[AnyResponse] = []
@@ -1157,8 +1198,9 @@ class SqlZenStore(BaseZenStore):
             total=total,
             total_pages=total_pages,
             items=items,
-            index=filter_model.page,
+            index=index,
             max_size=filter_model.size,
+            next_cursor=next_cursor,
         )
 
     # ====================================
@@ -5106,31 +5148,31 @@ class SqlZenStore(BaseZenStore):
             deployment = run.deployment
             step_runs = {step.name: step for step in run.step_runs}
 
-            pipeline_configuration = PipelineConfiguration.model_validate_json(
-                deployment.pipeline_configuration
-            )
-            pipeline_configuration.finalize_substitutions(
-                start_time=run.start_time, inplace=True
-            )
-
-            steps = {
-                step_name: Step.from_dict(
-                    config_dict, pipeline_configuration=pipeline_configuration
+            # The steps are shared with other callers and their substitutions
+            # are not finalized, which is why the date and time of this run
+            # are added to a copy of them when formatting output names.
+            steps = deployment.get_steps()
+            run_substitutions = (
+                deployment.get_pipeline_configuration().finalize_substitutions(
+                    start_time=run.start_time, inplace=True
                 )
-                for step_name, config_dict in json.loads(
-                    deployment.step_configurations
-                ).items()
-            }
+            )
             regular_output_artifact_nodes: Dict[
                 str, Dict[str, PipelineRunDAG.Node]
             ] = defaultdict(dict)
 
+            def _get_step_substitutions(step_name: str) -> Dict[str, str]:
+                substitutions = dict(steps[step_name].config.substitutions)
+                substitutions.setdefault("date", run_substitutions["date"])
+                substitutions.setdefault("time", run_substitutions["time"])
+                return substitutions
+
             def _get_regular_output_artifact_node(
                 step_name: str, output_name: str
             ) -> PipelineRunDAG.Node:
                 substituted_output_name = format_name_template(
                     output_name,
-                    substitutions=steps[step_name].config.substitutions,
+                    substitutions=_get_step_substitutions(step_name),
                 )
                 return regular_output_artifact_nodes[step_name][
                     substituted_output_name
@@ -5257,7 +5299,7 @@ class SqlZenStore(BaseZenStore):
                         # outputs from the config instead.
                         substituted_output_name = format_name_template(
                             output_name,
-                            substitutions=step.config.substitutions,
+                            substitutions=_get_step_substitutions(step_name),
                         )
                         if (
                             substituted_output_name
@@ -5367,7 +5409,7 @@ class SqlZenStore(BaseZenStore):
                     for output_name in step.config.outputs.keys():
                         substituted_output_name = format_name_template(
                             output_name,
-                            substitutions=step.config.substitutions,
+                            substitutions=_get_step_substitutions(step_name),
                         )
                         artifact_node = helper.add_artifact_node(
                             node_id=helper.get_artifact_node_id(
@@ -5877,75 +5919,170 @@ class SqlZenStore(BaseZenStore):
 
         Args:
             run_metadata: The run metadata to create.
+        """
+        self.batch_create_run_metadata([run_metadata])
 
-        Returns:
-            The created run metadata.
+    def batch_create_run_metadata(
+        self, run_metadata: List[RunMetadataRequest]
+    ) -> None:
+        """Creates a batch of run metadata.
+
+        All run metadata is created in a single transaction and every
+        referenced resource is only validated once.
+
+        Args:
+            run_metadata: The run metadata to create.
 
         Raises:
             RuntimeError: If the resource type is not supported.
         """
-        with Session(self.engine) as session:
-            self._set_request_user_id(
-                request_model=run_metadata, session=session
-            )
-
-            self._get_reference_schema_by_id(
-                resource=run_metadata,
-                reference_schema=StackComponentSchema,
-                reference_id=run_metadata.stack_component_id,
-                session=session,
-            )
-
-            for resource in run_metadata.resources:
-                reference_schema: Type[BaseSchema]
-                if resource.type == MetadataResourceTypes.PIPELINE_RUN:
-                    reference_schema = PipelineRunSchema
-                elif resource.type == MetadataResourceTypes.STEP_RUN:
-                    reference_schema = StepRunSchema
-                elif resource.type == MetadataResourceTypes.ARTIFACT_VERSION:
-                    reference_schema = ArtifactVersionSchema
-                elif resource.type == MetadataResourceTypes.MODEL_VERSION:
-                    reference_schema = ModelVersionSchema
-                elif resource.type == MetadataResourceTypes.SCHEDULE:
-                    reference_schema = ScheduleSchema
-                else:
-                    raise RuntimeError(
-                        f"Unknown resource type: {resource.type}"
-                    )
+        if not run_metadata:
+            return
 
+        with Session(self.engine) as session:
+            user_id = self._get_active_user(session).id
+            # Resources which were already validated, in combination with the
+            # project of the metadata which references them
+            validated_references: Set[Tuple[Any, UUID, Optional[UUID]]] = set()
+
+            def _validate_reference(
+                request: RunMetadataRequest,
+                reference_schema: Type[BaseSchema],
+                reference_id: Optional[UUID],
+            ) -> None:
+                if reference_id is None:
+                    return
+                key = (reference_schema, reference_id, request.project)
+                if key in validated_references:
+                    return
                 self._get_reference_schema_by_id(
-                    resource=run_metadata,
+                    resource=request,
                     reference_schema=reference_schema,
-                    reference_id=resource.id,
+                    reference_id=reference_id,
                     session=session,
                 )
+                validated_references.add(key)
+
+            for request in run_metadata:
+                request.user = user_id
+
+                _validate_reference(
+                    request, StackComponentSchema, request.stack_component_id
+                )
+
+                for resource in request.resources:
+                    reference_schema: Type[BaseSchema]
+                    if resource.type == MetadataResourceTypes.PIPELINE_RUN:
+                        reference_schema = PipelineRunSchema
+                    elif resource.type == MetadataResourceTypes.STEP_RUN:
+                        reference_schema = StepRunSchema
+                    elif (
+                        resource.type == MetadataResourceTypes.ARTIFACT_VERSION
+                    ):
+                        reference_schema = ArtifactVersionSchema
+                    elif resource.type == MetadataResourceTypes.MODEL_VERSION:
+                        reference_schema = ModelVersionSchema
+                    elif resource.type == MetadataResourceTypes.SCHEDULE:
+                        reference_schema = ScheduleSchema
+                    else:
+                        raise RuntimeError(
+                            f"Unknown resource type: {resource.type}"
+                        )
 
-            if run_metadata.resources:
-                for key, value in run_metadata.values.items():
-                    type_ = run_metadata.types[key]
+                    _validate_reference(request, reference_schema, resource.id)
 
+                if not request.resources:
+                    continue
+
+                # Orders values of the same key which get the same creation
+                # time, as they are stored in the same batch or second.
+                sequence = request.sequence
+                if sequence is None:
+                    sequence = increasing_time_ns()
+
+                for key, value in request.values.items():
                     run_metadata_schema = RunMetadataSchema(
-                        project_id=run_metadata.project,
-                        user_id=run_metadata.user,
-                        stack_component_id=run_metadata.stack_component_id,
+                        project_id=request.project,
+                        user_id=request.user,
+                        stack_component_id=request.stack_component_id,
                         key=key,
                         value=json.dumps(value),
-                        type=type_,
-                        publisher_step_id=run_metadata.publisher_step_id,
+                        type=request.types[key],
+                        publisher_step_id=request.publisher_step_id,
+                        sequence=sequence,
                     )
-
                     session.add(run_metadata_schema)
-                    session.commit()
 
-                    for resource in run_metadata.resources:
-                        rm_resource_link = RunMetadataResourceSchema(
-                            resource_id=resource.id,
-                            resource_type=resource.type.value,
-                            run_metadata_id=run_metadata_schema.id,
+                    for resource in request.resources:
+                        session.add(
+                            RunMetadataResourceSchema(
+                                resource_id=resource.id,
+                                resource_type=resource.type.value,
+                                run_metadata_id=run_metadata_schema.id,
+                            )
                         )
-                        session.add(rm_resource_link)
-                        session.commit()
-        return None
+
+            session.commit()
+
+    def get_run_metadata_history(
+        self,
+        resource: RunMetadataResource,
+        key: Optional[str] = None,
+        page: int = PAGINATION_STARTING_PAGE,
+        size: int = PAGE_SIZE_DEFAULT,
+    ) -> List[RunMetadataEntry]:
+        """Gets all run metadata entries of a resource, newest first.
+
+        Args:
+            resource: The resource for which to get the metadata.
+            key: If given, only get the entries with this key.
+            page: The page of entries to get.
+            size: The number of entries per page.
+
+        Returns:
+            The run metadata entries of the page.
+
+        Raises:
+            ValueError: If the page or size are invalid.
+        """
+        if page < 1 or size < 1:
+            raise ValueError("Page and size must be positive.")
+
+        query = (
+            select(RunMetadataSchema)
+            .join(
+                RunMetadataResourceSchema,
+                col(RunMetadataResourceSchema.run_metadata_id)
+                == col(RunMetadataSchema.id),
+            )
+            .where(
+                col(RunMetadataResourceSchema.resource_id) == resource.id,
+                col(RunMetadataResourceSchema.resource_type)
+                == resource.type.value,
+            )
+        )
+        if key is not None:
+            query = query.where(col(RunMetadataSchema.key) == key)
+
+        with Session(self.engine) as session:
+            entries = session.exec(
+                query.order_by(
+                    desc(RunMetadataSchema.created),
+                    desc(RunMetadataSchema.sequence),
+                    desc(RunMetadataSchema.id),
+                )
+                .offset((page - 1) * size)
+                .limit(size)
+            ).all()
+
+            return [
+                RunMetadataEntry(
+                    key=entry.key,
+                    value=json.loads(entry.value),
+                    created=entry.created,
+                )
+                for entry in entries
+            ]
 
     # ----------------------------- Schedules -----------------------------
 
@@ -8424,184 +8561,349 @@ class SqlZenStore(BaseZenStore):
 
         Returns:
             The created step run.
+        """
+        with Session(self.engine) as session:
+            step_schema = self._create_run_step_schema(
+                step_run=step_run, session=session
+            )
+
+            if step_run.status != ExecutionStatus.RUNNING:
+                self._update_pipeline_run_status(
+                    pipeline_run_id=step_run.pipeline_run_id, session=session
+                )
+
+            session.commit()
+            session.refresh(step_schema)
+
+            self._link_run_step_to_model_version(
+                step_schema=step_schema, session=session
+            )
+
+            return step_schema.to_model(
+                include_metadata=True, include_resources=True
+            )
+
+    def batch_create_run_steps(
+        self, step_runs: List[StepRunRequest]
+    ) -> List[StepRunResponse]:
+        """Creates a batch of step runs.
+
+        All step runs are created in a single transaction, which means either
+        all or none of them get created.
+
+        Args:
+            step_runs: The step runs to create.
+
+        Returns:
+            The created step runs.
+        """
+        with Session(self.engine) as session:
+            step_schemas = [
+                self._create_run_step_schema(
+                    step_run=step_run, session=session
+                )
+                for step_run in step_runs
+            ]
+            session.commit()
+
+            pipeline_run_ids = {
+                step_run.pipeline_run_id
+                for step_run in step_runs
+                if step_run.status != ExecutionStatus.RUNNING
+            }
+            for pipeline_run_id in pipeline_run_ids:
+                self._update_pipeline_run_status(
+                    pipeline_run_id=pipeline_run_id, session=session
+                )
+
+            for step_schema in step_schemas:
+                session.refresh(step_schema)
+                self._link_run_step_to_model_version(
+                    step_schema=step_schema, session=session
+                )
+
+            return [
+                step_schema.to_model(
+                    include_metadata=True, include_resources=True
+                )
+                for step_schema in step_schemas
+            ]
+
+    def _create_run_step_schema(
+        self, step_run: StepRunRequest, session: Session
+    ) -> StepRunSchema:
+        """Creates a step run without committing it.
+
+        Args:
+            step_run: The step run to create.
+            session: The database session to use.
+
+        Returns:
+            The schema of the created step run.
 
         Raises:
             EntityExistsError: if the step run already exists.
         """
-        with Session(self.engine) as session:
-            self._set_request_user_id(request_model=step_run, session=session)
+        self._set_request_user_id(request_model=step_run, session=session)
 
-            # Check if the pipeline run exists
-            run = self._get_reference_schema_by_id(
-                resource=step_run,
-                reference_schema=PipelineRunSchema,
-                reference_id=step_run.pipeline_run_id,
-                session=session,
+        # Check if the pipeline run exists
+        run = self._get_reference_schema_by_id(
+            resource=step_run,
+            reference_schema=PipelineRunSchema,
+            reference_id=step_run.pipeline_run_id,
+            session=session,
+        )
+
+        self._get_reference_schema_by_id(
+            resource=step_run,
+            reference_schema=StepRunSchema,
+            reference_id=step_run.original_step_run_id,
+            session=session,
+            reference_type="original step run",
+        )
+
+        step_schema = StepRunSchema.from_request(
+            step_run, deployment_id=run.deployment_id
+        )
+        session.add(step_schema)
+        try:
+            session.flush()
+        except IntegrityError:
+            # We have to rollback the failed session first in order
+            # to continue using it
+            session.rollback()
+            raise EntityExistsError(
+                f"Unable to create step `{step_run.name}`: A step with "
+                f"this name already exists in the pipeline run with ID "
+                f"'{step_run.pipeline_run_id}'."
             )
 
+        # Add logs entry for the step if exists
+        if step_run.logs is not None:
             self._get_reference_schema_by_id(
                 resource=step_run,
-                reference_schema=StepRunSchema,
-                reference_id=step_run.original_step_run_id,
+                reference_schema=StackComponentSchema,
+                reference_id=step_run.logs.artifact_store_id,
                 session=session,
-                reference_type="original step run",
+                reference_type="logs artifact store",
             )
 
-            step_schema = StepRunSchema.from_request(
-                step_run, deployment_id=run.deployment_id
+            log_entry = LogsSchema(
+                uri=step_run.logs.uri,
+                step_run_id=step_schema.id,
+                artifact_store_id=step_run.logs.artifact_store_id,
             )
-            session.add(step_schema)
-            try:
-                session.commit()
-            except IntegrityError:
-                # We have to rollback the failed session first in order
-                # to continue using it
-                session.rollback()
-                raise EntityExistsError(
-                    f"Unable to create step `{step_run.name}`: A step with "
-                    f"this name already exists in the pipeline run with ID "
-                    f"'{step_run.pipeline_run_id}'."
-                )
+            session.add(log_entry)
 
-            # Add logs entry for the step if exists
-            if step_run.logs is not None:
-                self._get_reference_schema_by_id(
-                    resource=step_run,
-                    reference_schema=StackComponentSchema,
-                    reference_id=step_run.logs.artifact_store_id,
-                    session=session,
-                    reference_type="logs artifact store",
+        # If cached, attach metadata of the original step
+        if (
+            step_run.status == ExecutionStatus.CACHED
+            and step_run.original_step_run_id is not None
+        ):
+            original_metadata_links = session.exec(
+                select(RunMetadataResourceSchema)
+                .where(
+                    RunMetadataResourceSchema.run_metadata_id
+                    == RunMetadataSchema.id
                 )
-
-                log_entry = LogsSchema(
-                    uri=step_run.logs.uri,
-                    step_run_id=step_schema.id,
-                    artifact_store_id=step_run.logs.artifact_store_id,
+                .where(
+                    RunMetadataResourceSchema.resource_id
+                    == step_run.original_step_run_id
                 )
-                session.add(log_entry)
-
-            # If cached, attach metadata of the original step
-            if (
-                step_run.status == ExecutionStatus.CACHED
-                and step_run.original_step_run_id is not None
-            ):
-                original_metadata_links = session.exec(
-                    select(RunMetadataResourceSchema)
-                    .where(
-                        RunMetadataResourceSchema.run_metadata_id
-                        == RunMetadataSchema.id
-                    )
-                    .where(
-                        RunMetadataResourceSchema.resource_id
-                        == step_run.original_step_run_id
-                    )
-                    .where(
-                        RunMetadataResourceSchema.resource_type
-                        == MetadataResourceTypes.STEP_RUN
-                    )
-                    .where(
-                        RunMetadataSchema.publisher_step_id
-                        == step_run.original_step_run_id
-                    )
-                ).all()
-
-                # Create new links in a batch
-                new_links = [
-                    RunMetadataResourceSchema(
-                        resource_id=step_schema.id,
-                        resource_type=link.resource_type,
-                        run_metadata_id=link.run_metadata_id,
-                    )
-                    for link in original_metadata_links
-                ]
-                # Add all new links in a single operation
-                session.add_all(new_links)
-                # Commit the changes
-                session.commit()
-                session.refresh(step_schema)
+                .where(
+                    RunMetadataResourceSchema.resource_type
+                    == MetadataResourceTypes.STEP_RUN
+                )
+                .where(
+                    RunMetadataSchema.publisher_step_id
+                    == step_run.original_step_run_id
+                )
+            ).all()
 
-            # Save parent step IDs into the database.
-            for parent_step_id in step_run.parent_step_ids:
-                self._set_run_step_parent_step(
-                    child_step_run=step_schema,
-                    parent_id=parent_step_id,
-                    session=session,
+            # Create new links in a batch
+            new_links = [
+                RunMetadataResourceSchema(
+                    resource_id=step_schema.id,
+                    resource_type=link.resource_type,
+                    run_metadata_id=link.run_metadata_id,
                 )
+                for link in original_metadata_links
+            ]
+            # Add all new links in a single operation
+            session.add_all(new_links)
 
-            session.commit()
-            session.refresh(step_schema)
+        # Save parent step IDs into the database.
+        for parent_step_id in step_run.parent_step_ids:
+            self._set_run_step_parent_step(
+                child_step_run=step_schema,
+                parent_id=parent_step_id,
+                session=session,
+            )
 
-            step_model = step_schema.to_model(include_metadata=True)
+        session.flush()
+        session.refresh(step_schema)
 
-            # Save input artifact IDs into the database.
-            for input_name, artifact_version_ids in step_run.inputs.items():
-                for artifact_version_id in artifact_version_ids:
-                    if step_run.original_step_run_id:
-                        # This is a cached step run, for which the input
-                        # artifacts might include manually loaded artifacts
-                        # which can not be inferred from the step config. In
-                        # this case, we check the input type of the artifact
-                        # for the original step run.
-                        input_type = self._get_step_run_input_type_from_cached_step_run(
+        step_model = step_schema.to_model(include_metadata=True)
+
+        # Save input artifact IDs into the database.
+        for input_name, artifact_version_ids in step_run.inputs.items():
+            for artifact_version_id in artifact_version_ids:
+                if step_run.original_step_run_id:
+                    # This is a cached step run, for which the input
+                    # artifacts might include manually loaded artifacts
+                    # which can not be inferred from the step config. In
+                    # this case, we check the input type of the artifact
+                    # for the original step run.
+                    input_type = (
+                        self._get_step_run_input_type_from_cached_step_run(
                             input_name=input_name,
                             artifact_version_id=artifact_version_id,
                             cached_step_run_id=step_run.original_step_run_id,
                             session=session,
                         )
-                    else:
-                        # This is a non-cached step run, which means all input
-                        # artifacts we receive at creation time are inputs that
-                        # are defined in the step config.
-                        input_type = self._get_step_run_input_type_from_config(
-                            input_name=input_name,
-                            step_config=step_model.config,
-                            step_spec=step_model.spec,
-                        )
-                    self._set_run_step_input_artifact(
-                        step_run=step_schema,
-                        artifact_version_id=artifact_version_id,
-                        name=input_name,
-                        input_type=input_type,
-                        session=session,
                     )
-
-            # Save output artifact IDs into the database.
-            for name, artifact_version_ids in step_run.outputs.items():
-                for artifact_version_id in artifact_version_ids:
-                    self._set_run_step_output_artifact(
-                        step_run=step_schema,
-                        artifact_version_id=artifact_version_id,
-                        name=name,
-                        session=session,
+                else:
+                    # This is a non-cached step run, which means all input
+                    # artifacts we receive at creation time are inputs that
+                    # are defined in the step config.
+                    input_type = self._get_step_run_input_type_from_config(
+                        input_name=input_name,
+                        step_config=step_model.config,
+                        step_spec=step_model.spec,
                     )
+                self._set_run_step_input_artifact(
+                    step_run=step_schema,
+                    artifact_version_id=artifact_version_id,
+                    name=input_name,
+                    input_type=input_type,
+                    session=session,
+                )
 
-            if step_run.status != ExecutionStatus.RUNNING:
-                self._update_pipeline_run_status(
-                    pipeline_run_id=step_run.pipeline_run_id, session=session
+        # Save output artifact IDs into the database.
+        for name, artifact_version_ids in step_run.outputs.items():
+            for artifact_version_id in artifact_version_ids:
+                self._set_run_step_output_artifact(
+                    step_run=step_schema,
+                    artifact_version_id=artifact_version_id,
+                    name=name,
+                    session=session,
                 )
 
+        session.flush()
+        return step_schema
+
+    def _link_run_step_to_model_version(
+        self, step_schema: StepRunSchema, session: Session
+    ) -> None:
+        """Links a created step run and its pipeline run to a model version.
+
+        Args:
+            step_schema: The schema of the created step run.
+            session: The database session to use.
+        """
+        if model_version_id := self._get_or_create_model_version_for_run(
+            step_schema
+        ):
+            step_schema.model_version_id = model_version_id
+            session.add(step_schema)
             session.commit()
+
+            self.create_model_version_pipeline_run_link(
+                ModelVersionPipelineRunRequest(
+                    model_version=model_version_id,
+                    pipeline_run=step_schema.pipeline_run_id,
+                )
+            )
             session.refresh(step_schema)
 
-            if model_version_id := self._get_or_create_model_version_for_run(
-                step_schema
-            ):
-                step_schema.model_version_id = model_version_id
-                session.add(step_schema)
-                session.commit()
+    def get_cached_run_steps(
+        self,
+        project_id: UUID,
+        cache_keys: List[str],
+        allowed_pipeline_run_ids: Optional[Set[UUID]] = None,
+        authenticated_user_id: Optional[UUID] = None,
+    ) -> Dict[str, StepRunResponse]:
+        """Get the step runs that can be used as cache for the given keys.
 
-                self.create_model_version_pipeline_run_link(
-                    ModelVersionPipelineRunRequest(
-                        model_version=model_version_id,
-                        pipeline_run=step_schema.pipeline_run_id,
-                    )
-                )
-                session.refresh(step_schema)
+        For each cache key, this is the most recently created step run in the
+        project that has the cache key and was successfully executed.
 
-            return step_schema.to_model(
-                include_metadata=True, include_resources=True
+        Args:
+            project_id: The ID of the project in which to look for step runs.
+            cache_keys: The cache keys for which to get the step runs.
+            allowed_pipeline_run_ids: Optional IDs of the pipeline runs to
+                which the step runs are limited. Step runs that are owned by
+                the authenticated user or by no user are always included.
+            authenticated_user_id: ID of the authenticated user.
+
+        Returns:
+            A dictionary mapping the cache keys to their cached step run. Cache
+            keys without a cached step run are not included.
+        """
+        if not cache_keys:
+            return {}
+
+        completed_step_runs_filter = and_(
+            col(StepRunSchema.project_id) == project_id,
+            col(StepRunSchema.cache_key).in_(set(cache_keys)),
+            col(StepRunSchema.status) == ExecutionStatus.COMPLETED.value,
+        )
+        if allowed_pipeline_run_ids is not None:
+            # Same as the RBAC filter applied when listing step runs
+            completed_step_runs_filter = and_(
+                completed_step_runs_filter,
+                or_(
+                    col(StepRunSchema.pipeline_run_id).in_(
+                        allowed_pipeline_run_ids
+                    ),
+                    col(StepRunSchema.user_id).is_(None),
+                    col(StepRunSchema.user_id) == authenticated_user_id,
+                ),
             )
 
+        latest_step_runs = (
+            select(
+                StepRunSchema.cache_key,
+                func.max(StepRunSchema.created).label("created"),
+            )
+            .where(completed_step_runs_filter)
+            .group_by(col(StepRunSchema.cache_key))
+            .subquery()
+        )
+        query = (
+            select(StepRunSchema)
+            .join(
+                latest_step_runs,
+                and_(
+                    col(StepRunSchema.cache_key)
+                    == latest_step_runs.c.cache_key,
+                    col(StepRunSchema.created) == latest_step_runs.c.created,
+                ),
+            )
+            .where(completed_step_runs_filter)
+            .order_by(col(StepRunSchema.id))
+            .options(
+                *StepRunSchema.get_query_options(
+                    include_metadata=False, include_resources=True
+                )
+            )
+        )
+
+        cached_step_runs: Dict[str, StepRunResponse] = {}
+        with Session(self.engine) as session:
+            for step_run in session.exec(query).unique().all():
+                assert step_run.cache_key
+                # Multiple step runs with the same cache key might have been
+                # created at the exact same time. All of them can be used as
+                # cache, so we use the one with the smallest ID to always
+                # return the same one.
+                if step_run.cache_key not in cached_step_runs:
+                    cached_step_runs[step_run.cache_key] = step_run.to_model(
+                        include_metadata=False, include_resources=True
+                    )
+
+        return cached_step_runs
+
     def get_run_step(
         self, step_run_id: UUID, hydrate: bool = True
     ) -> StepRunResponse:
@@ -8941,9 +9243,7 @@ class SqlZenStore(BaseZenStore):
 
         # Deployment always exists for pipeline runs of newer versions
         assert pipeline_run.deployment
-        num_steps = len(
-            json.loads(pipeline_run.deployment.step_configurations)
-        )
+        num_steps = pipeline_run.deployment.get_step_count()
         new_status = get_pipeline_run_status(
             step_statuses=[
                 ExecutionStatus(status) for status in step_run_statuses
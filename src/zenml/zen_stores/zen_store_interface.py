@@ -15,10 +15,11 @@
 
 import datetime
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from zenml.config.pipeline_run_configuration import PipelineRunConfiguration
+from zenml.constants import PAGE_SIZE_DEFAULT, PAGINATION_STARTING_PAGE
 from zenml.enums import StackDeploymentProvider
 from zenml.models import (
     ActionFilter,
@@ -94,7 +95,9 @@ from zenml.models import (
     ProjectRequest,
     ProjectResponse,
     ProjectUpdate,
+    RunMetadataEntry,
     RunMetadataRequest,
+    RunMetadataResource,
     RunTemplateFilter,
     RunTemplateRequest,
     RunTemplateResponse,
@@ -1629,6 +1632,36 @@ class ZenStoreInterface(ABC):
             None
         """
 
+    @abstractmethod
+    def batch_create_run_metadata(
+        self, run_metadata: List[RunMetadataRequest]
+    ) -> None:
+        """Creates a batch of run metadata.
+
+        Args:
+            run_metadata: The run metadata to create.
+        """
+
+    @abstractmethod
+    def get_run_metadata_history(
+        self,
+        resource: RunMetadataResource,
+        key: Optional[str] = None,
+        page: int = PAGINATION_STARTING_PAGE,
+        size: int = PAGE_SIZE_DEFAULT,
+    ) -> List[RunMetadataEntry]:
+        """Gets all run metadata entries of a resource, newest first.
+
+        Args:
+            resource: The resource for which to get the metadata.
+            key: If given, only get the entries with this key.
+            page: The page of entries to get.
+            size: The number of entries per page.
+
+        Returns:
+            The run metadata entries of the page.
+        """
+
     # -------------------- Schedules --------------------
 
     @abstractmethod
@@ -2331,6 +2364,37 @@ class ZenStoreInterface(ABC):
             KeyError: if the pipeline run doesn't exist.
         """
 
+    @abstractmethod
+    def batch_create_run_steps(
+        self, step_runs: List[StepRunRequest]
+    ) -> List[StepRunResponse]:
+        """Creates a batch of step runs.
+
+        Args:
+            step_runs: The step runs to create.
+
+        Returns:
+            The created step runs.
+        """
+
+    @abstractmethod
+    def get_cached_run_steps(
+        self, project_id: UUID, cache_keys: List[str]
+    ) -> Dict[str, StepRunResponse]:
+        """Get the step runs that can be used as cache for the given keys.
+
+        For each cache key, this is the most recently created step run in the
+        project that has the cache key and was successfully executed.
+
+        Args:
+            project_id: The ID of the project in which to look for step runs.
+            cache_keys: The cache keys for which to get the step runs.
+
+        Returns:
+            A dictionary mapping the cache keys to their cached step run. Cache
+            keys without a cached step run are not included.
+        """
+
     @abstractmethod
     def get_run_step(
         self, step_run_id: UUID, hydrate: bool = True
@@ -104,3 +104,43 @@ def test_environment_variable_can_be_used_to_disable_clientside_caching(
         full_cached_pipeline()
 
     mock_prepare_or_run_pipeline.assert_called()
+
+
+def test_cached_steps_are_looked_up_and_created_in_batches(
+    clean_client, mocker
+):
+    """Tests that the cached steps of each wave of independent steps are
+    looked up and created with a single store call each.
+    """
+    step_with_cache_enabled = noop.with_options(enable_cache=True)
+
+    @pipeline
+    def full_cached_pipeline():
+        step_with_cache_enabled(id="step_1")
+        step_with_cache_enabled(id="step_2")
+        step_with_cache_enabled(id="step_3")
+        step_with_cache_enabled(id="step_4", after=["step_1", "step_2"])
+
+    full_cached_pipeline()
+
+    zen_store_class = type(clean_client.zen_store)
+    get_cached_run_steps = mocker.spy(zen_store_class, "get_cached_run_steps")
+    batch_create_run_steps = mocker.spy(
+        zen_store_class, "batch_create_run_steps"
+    )
+    create_run_step = mocker.spy(zen_store_class, "create_run_step")
+
+    run = full_cached_pipeline()
+
+    assert get_cached_run_steps.call_count == 2
+    assert batch_create_run_steps.call_count == 2
+    create_run_step.assert_not_called()
+
+    first_wave, second_wave = batch_create_run_steps.call_args_list
+    assert {request.name for request in first_wave.args[1]} == {
+        "step_1",
+        "step_2",
+        "step_3",
+    }
+    assert [request.name for request in second_wave.args[1]] == ["step_4"]
+    assert all(step_run.status == "cached" for step_run in run.steps.values())
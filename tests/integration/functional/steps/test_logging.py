@@ -1,13 +1,25 @@
 import os
+import sys
+import threading
 import time
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from zenml import pipeline, step
 from zenml.artifacts.utils import _load_file_from_artifact_store
 from zenml.client import Client
 from zenml.logger import get_logger
-from zenml.logging.step_logging import fetch_logs
+from zenml.logging.step_logging import (
+    PipelineLogsStorage,
+    PipelineLogsStorageContext,
+    fetch_log_lines,
+    fetch_logs,
+    get_logs_index_uri,
+    prepare_logs_uri,
+)
 
 logger = get_logger(__name__)
 
@@ -220,3 +232,234 @@ def test_that_fetch_logs_works_with_legacy(clean_client: Client):
     assert data_.count("1") == 3
     assert data_.count("2") == 3
     assert data_.count("3") == 3
+
+
+def test_that_logs_of_parallel_threads_are_isolated(clean_client: Client):
+    """Each thread with its own logs context only stores its own output."""
+    artifact_store = clean_client.active_stack.artifact_store
+    barrier = threading.Barrier(2, timeout=10)
+    logs_uris = {}
+
+    def _write_logs(name: str) -> None:
+        logs_uri = prepare_logs_uri(artifact_store, step_name=name)
+        logs_uris[name] = logs_uri
+        with PipelineLogsStorageContext(
+            logs_uri=logs_uri, artifact_store=artifact_store
+        ):
+            # Make sure both contexts are active at the same time
+            barrier.wait()
+            for i in range(3):
+                print(f"{name} - {i}")
+            barrier.wait()
+
+    threads = [
+        threading.Thread(target=_write_logs, args=(name,))
+        for name in ("thread_1", "thread_2")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for name, other_name in (
+        ("thread_1", "thread_2"),
+        ("thread_2", "thread_1"),
+    ):
+        logs = fetch_logs(
+            clean_client.zen_store, artifact_store.id, logs_uris[name]
+        )
+        assert all(f"{name} - {i}" in logs for i in range(3))
+        assert other_name not in logs
+
+
+def test_that_wrapped_streams_can_be_used_after_restoring(
+    clean_client: Client,
+):
+    """Threads still inside a wrapped stream method don't fail on exit."""
+    artifact_store = clean_client.active_stack.artifact_store
+    logs_uri = prepare_logs_uri(artifact_store, step_name="restored_step")
+    with PipelineLogsStorageContext(
+        logs_uri=logs_uri, artifact_store=artifact_store
+    ):
+        wrapped_write = sys.stdout.write
+        wrapped_flush = sys.stdout.flush
+
+    assert sys.stdout.write is not wrapped_write
+    wrapped_write("written after restoring\n")
+    wrapped_flush()
+
+
+def test_that_slow_artifact_stores_do_not_block_logging(
+    clean_client: Client,
+):
+    """Logs are written in the background and dropped if the queue is full."""
+    artifact_store = clean_client.active_stack.artifact_store
+    logs_uri = prepare_logs_uri(artifact_store, step_name="slow_step")
+    storage = PipelineLogsStorage(
+        logs_uri=logs_uri,
+        artifact_store=artifact_store,
+        max_messages=1,
+        max_queue_size=1,
+        max_queue_wait=0.01,
+    )
+    write_started = threading.Event()
+    unblock_write = threading.Event()
+    original_write_messages = storage._write_messages
+
+    def _slow_write_messages(messages):
+        write_started.set()
+        unblock_write.wait(timeout=10)
+        original_write_messages(messages)
+
+    with patch.object(storage, "_write_messages", _slow_write_messages):
+        storage.write("message 0")
+        assert write_started.wait(timeout=10)
+
+        start = time.time()
+        for i in range(1, 5):
+            storage.write(f"message {i}")
+        assert time.time() - start < 1
+
+        unblock_write.set()
+        # The final flush waits for space in the queue instead of dropping
+        storage.max_messages = 100
+        storage.write("message 5")
+        storage.close()
+
+    logs = fetch_logs(clean_client.zen_store, artifact_store.id, logs_uri)
+    assert "message 0" in logs
+    assert "message 1" in logs
+    assert "3 log messages were dropped" in logs
+    assert "message 5" in logs
+
+
+def test_that_failing_writes_do_not_stop_the_logs_writer(
+    clean_client: Client,
+):
+    """Errors while writing logs don't block flushing or closing."""
+    artifact_store = clean_client.active_stack.artifact_store
+    logs_uri = prepare_logs_uri(artifact_store, step_name="failing_step")
+    storage = PipelineLogsStorage(
+        logs_uri=logs_uri, artifact_store=artifact_store, max_flush_wait=10
+    )
+    original_write_messages = storage._write_messages
+    failed = []
+
+    def _failing_write_messages(messages):
+        if not failed:
+            failed.append(messages)
+            raise ValueError("Failed to write logs.")
+        original_write_messages(messages)
+
+    with patch.object(storage, "_write_messages", _failing_write_messages):
+        storage.write("message 0")
+        storage.save_to_file(force=True)
+        assert failed
+
+        storage.write("message 1")
+        start = time.time()
+        storage.close()
+        assert time.time() - start < 10
+
+    logs = fetch_logs(clean_client.zen_store, artifact_store.id, logs_uri)
+    assert "message 1" in logs
+
+
+def test_that_dead_logs_writers_are_restarted(clean_client: Client):
+    """A new writer is started if the previous one died."""
+    artifact_store = clean_client.active_stack.artifact_store
+    logs_uri = prepare_logs_uri(artifact_store, step_name="restarted_step")
+    storage = PipelineLogsStorage(
+        logs_uri=logs_uri, artifact_store=artifact_store, max_flush_wait=10
+    )
+    storage.save_to_file(force=True)
+    dead_writer = storage._writer
+    storage.queue.put(None)
+    dead_writer.join(timeout=10)
+
+    storage.write("message 0")
+    storage.save_to_file(force=True)
+    assert storage._writer is not dead_writer
+    storage.close()
+
+    logs = fetch_logs(clean_client.zen_store, artifact_store.id, logs_uri)
+    assert "message 0" in logs
+
+
+@pytest.mark.parametrize("immutable_filesystem", [False, True])
+def test_that_fetch_log_lines_uses_the_index(
+    clean_client: Client, immutable_filesystem: bool
+):
+    """Line ranges are fetched from indexed and not yet indexed logs."""
+    artifact_store = clean_client.active_stack.artifact_store
+    zen_store = clean_client.zen_store
+
+    with patch(
+        "zenml.artifact_stores.base_artifact_store.BaseArtifactStoreConfig.IS_IMMUTABLE_FILESYSTEM",
+        immutable_filesystem,
+    ):
+        logs_uri = prepare_logs_uri(artifact_store, step_name="indexed_step")
+        storage = PipelineLogsStorage(
+            logs_uri=logs_uri,
+            artifact_store=artifact_store,
+            max_messages=3,
+            index_granularity=200,
+        )
+        with patch(
+            "zenml.logging.step_logging.utc_now",
+            side_effect=[
+                datetime(2025, 1, 1, 0, 0, i // 10) for i in range(50)
+            ],
+        ):
+            for i in range(49):
+                storage.write(f"line {i}")
+                if i % 10 == 9:
+                    # Creates multiple chunks and index entries
+                    storage.save_to_file(force=True)
+            storage.write("line 49\ncontinued")
+        storage.save_to_file(force=True)
+        storage.merge_log_files(merge_all_files=True)
+
+        assert artifact_store.exists(get_logs_index_uri(logs_uri))
+
+        # Logs written after the last index update are read as well
+        storage.write("line 50")
+        storage.save_to_file(force=True)
+
+        lines = fetch_log_lines(
+            zen_store,
+            artifact_store.id,
+            logs_uri,
+            tail=3,
+            strip_timestamp=True,
+        )
+        assert lines == "line 49\ncontinued\nline 50\n"
+
+        lines = fetch_log_lines(
+            zen_store, artifact_store.id, logs_uri, page=2, size=5
+        ).splitlines()
+        assert [line.split("] ")[1] for line in lines] == [
+            f"line {i}" for i in range(5, 10)
+        ]
+
+        lines = fetch_log_lines(
+            zen_store,
+            artifact_store.id,
+            logs_uri,
+            since=datetime(2025, 1, 1, 0, 0, 3),
+            size=2,
+            strip_timestamp=True,
+        )
+        assert lines == "line 30\nline 31\n"
+
+        # Without an index, all logs are read
+        storage.close()
+        artifact_store.remove(get_logs_index_uri(logs_uri))
+        lines = fetch_log_lines(
+            zen_store,
+            artifact_store.id,
+            logs_uri,
+            tail=3,
+            strip_timestamp=True,
+        )
+        assert lines == "line 49\ncontinued\nline 50\n"
@@ -16,8 +16,13 @@
 from typing import Annotated, Tuple
 
 import pytest
+from sqlalchemy import update
+from sqlmodel import col
 
 from zenml import Model, log_metadata, pipeline, step
+from zenml.enums import MetadataResourceTypes
+from zenml.zen_stores.schemas import RunMetadataSchema
+from zenml.zen_stores.sql_zen_store import Session, SqlZenStore
 
 
 @step
@@ -188,3 +193,74 @@ def test_metadata_utils(clean_client):
 
     with pytest.raises(ValueError):
         log_metadata(metadata={"auto_artifact_1": True}, infer_artifact=True)
+
+
+@step
+def step_logging_metrics() -> None:
+    """Step that logs metadata for every epoch of a training loop."""
+    for epoch in range(100):
+        log_metadata(metadata={"loss": 1 / (epoch + 1), "epoch": epoch})
+
+
+@pipeline
+def pipeline_logging_metrics():
+    """Pipeline definition to test the metadata buffering."""
+    step_logging_metrics()
+
+
+def test_metadata_is_stored_in_bulk(clean_client, mocker):
+    """Tests that metadata logged inside a step is stored in bulk."""
+    spy = mocker.spy(type(clean_client.zen_store), "batch_create_run_metadata")
+
+    run = pipeline_logging_metrics()
+
+    metric_calls = [
+        call
+        for call in spy.call_args_list
+        if any("loss" in request.values for request in call.args[1])
+    ]
+    assert len(metric_calls) == 1
+    requests = metric_calls[0].args[1]
+    assert [request.values["epoch"] for request in requests] == list(
+        range(100)
+    )
+    # The values are ordered by the time they were logged
+    sequences = [request.sequence for request in requests]
+    assert sequences == sorted(set(sequences))
+
+    step_run = clean_client.get_run_step(run.steps["step_logging_metrics"].id)
+    assert step_run.run_metadata["epoch"] == 99
+    assert step_run.run_metadata["loss"] == 0.01
+
+    # Batching stores every logged value
+    history = clean_client.get_run_metadata_history(
+        resource_id=step_run.id,
+        resource_type=MetadataResourceTypes.STEP_RUN,
+        key="epoch",
+        size=1000,
+    )
+    assert [entry.value for entry in history] == list(reversed(range(100)))
+
+    zen_store = clean_client.zen_store
+    if isinstance(zen_store, SqlZenStore):
+        # Databases like MySQL store the creation time with second precision,
+        # so all values of a batch might have the exact same creation time.
+        with Session(zen_store.engine) as session:
+            session.execute(
+                update(RunMetadataSchema)
+                .where(col(RunMetadataSchema.key).in_(["epoch", "loss"]))
+                .values(created=history[0].created)
+            )
+            session.commit()
+
+        history = clean_client.get_run_metadata_history(
+            resource_id=step_run.id,
+            resource_type=MetadataResourceTypes.STEP_RUN,
+            key="epoch",
+            size=1000,
+        )
+        assert [entry.value for entry in history] == list(reversed(range(100)))
+
+        step_run = clean_client.get_run_step(step_run.id)
+        assert step_run.run_metadata["epoch"] == 99
+        assert step_run.run_metadata["loss"] == 0.01
@@ -29,6 +29,7 @@ from zenml.enums import SecretsStoreType, StoreType
 from zenml.exceptions import EntityExistsError, IllegalOperationError
 from zenml.models import SecretFilter, SecretUpdate
 from zenml.utils.string_utils import random_str
+from zenml.zen_stores.sql_zen_store import SqlZenStore
 
 
 def _get_secrets_store_type() -> SecretsStoreType:
@@ -62,6 +63,33 @@ def test_get_secret_returns_values():
         assert saved_secret.secret_values == values
 
 
+def test_secret_values_are_cached():
+    """Tests that secret values are cached until they are modified."""
+    store = Client().zen_store
+    if not isinstance(store, SqlZenStore) or store.secrets_store is None:
+        pytest.skip("Test only applies to SQL ZenML stores.")
+
+    cache = store.secrets_store.cache
+    assert cache is not None
+
+    with SecretContext(values={"aria": "space cat"}) as secret:
+        cache.invalidate(secret.id)
+        hits = cache.hits
+        store.get_secret(secret_id=secret.id)
+        assert store.get_secret(secret_id=secret.id).secret_values == {
+            "aria": "space cat"
+        }
+        assert cache.hits == hits + 1
+
+        store.update_secret(
+            secret_id=secret.id,
+            secret_update=SecretUpdate(values=dict(aria="space dog")),
+        )
+        assert store.get_secret(secret_id=secret.id).secret_values == {
+            "aria": "space dog"
+        }
+
+
 def test_list_secret_excludes_values():
     """Tests that `list_secret` does not return secret values."""
     client = Client()
@@ -27,6 +27,7 @@ from uuid import UUID, uuid4
 import pytest
 from pydantic import SecretStr, ValidationError
 from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
 
 from tests.integration.functional.utils import sample_name
 from tests.integration.functional.zen_stores.utils import (
@@ -132,8 +133,15 @@ from zenml.models.v2.core.step_run import StepRunRequest
 from zenml.models.v2.core.user import UserFilter
 from zenml.utils import code_repository_utils, source_utils
 from zenml.utils.enum_utils import StrEnum
+from zenml.utils.pagination_utils import depaginate
 from zenml.zen_stores.rest_zen_store import RestZenStore
-from zenml.zen_stores.sql_zen_store import SqlZenStore
+from zenml.zen_stores.schemas import (
+    PipelineDeploymentSchema,
+    RunMetadataResourceSchema,
+    RunMetadataSchema,
+    StepRunSchema,
+)
+from zenml.zen_stores.sql_zen_store import Session, SqlZenStore
 
 DEFAULT_NAME = "default"
 
@@ -5572,6 +5580,111 @@ class TestRunMetadata:
         client.zen_store.delete_stack_component(sc.id)
 
 
+def test_run_metadata_latest_values_and_history():
+    """Tests fetching the latest run metadata values and their history."""
+    client = Client()
+    run_context = PipelineRunContext(1)
+    with run_context:
+        run = run_context.runs[-1]
+        step_run = run_context.steps[-1]
+        step_resource = RunMetadataResource(
+            id=step_run.id, type=MetadataResourceTypes.STEP_RUN
+        )
+        for value in range(5):
+            client.zen_store.create_run_metadata(
+                RunMetadataRequest(
+                    project=client.active_project.id,
+                    resources=[step_resource],
+                    values={"loss": value, f"key_{value}": value},
+                    types={
+                        "loss": MetadataTypeEnum.INT,
+                        f"key_{value}": MetadataTypeEnum.INT,
+                    },
+                )
+            )
+
+        step_metadata = client.zen_store.get_run_step(step_run.id).run_metadata
+        assert step_metadata["loss"] == 4
+        assert {key for key in step_metadata if key.startswith("key_")} == {
+            f"key_{value}" for value in range(5)
+        }
+
+        run_metadata = client.zen_store.get_run(
+            run.id, include_full_metadata=True
+        ).run_metadata
+        assert run_metadata[f"{step_run.name}::loss"] == 4
+
+        history = client.get_run_metadata_history(
+            resource_id=step_run.id,
+            resource_type=MetadataResourceTypes.STEP_RUN,
+            key="loss",
+            size=3,
+        )
+        assert [entry.value for entry in history] == [4, 3, 2]
+        assert all(entry.key == "loss" for entry in history)
+
+        history = client.get_run_metadata_history(
+            resource_id=step_run.id,
+            resource_type=MetadataResourceTypes.STEP_RUN,
+            key="loss",
+            page=2,
+            size=3,
+        )
+        assert [entry.value for entry in history] == [1, 0]
+
+        history = client.get_run_metadata_history(
+            resource_id=step_run.id,
+            resource_type=MetadataResourceTypes.STEP_RUN,
+        )
+        assert len(history) == 10
+
+        zen_store = client.zen_store
+        if isinstance(zen_store, SqlZenStore):
+            # Entries with the same creation time are ordered by their
+            # sequence, and by their ID if they don't have one
+            loss_entries_query = (
+                select(RunMetadataSchema)
+                .join(
+                    RunMetadataResourceSchema,
+                    RunMetadataResourceSchema.run_metadata_id
+                    == RunMetadataSchema.id,
+                )
+                .where(
+                    RunMetadataResourceSchema.resource_id == step_run.id,
+                    RunMetadataSchema.key == "loss",
+                )
+            )
+            with Session(zen_store.engine) as session:
+                entries = session.exec(loss_entries_query).all()
+                for entry in entries:
+                    entry.created = entries[0].created
+                    session.add(entry)
+                session.commit()
+
+            step_metadata = zen_store.get_run_step(step_run.id).run_metadata
+            assert step_metadata["loss"] == 4
+
+            with Session(zen_store.engine) as session:
+                entries = session.exec(loss_entries_query).all()
+                for entry in entries:
+                    entry.sequence = None
+                    session.add(entry)
+                session.commit()
+                latest_entry = max(entries, key=lambda entry: entry.id)
+                expected_value = json.loads(latest_entry.value)
+
+            step_metadata = zen_store.get_run_step(step_run.id).run_metadata
+            assert step_metadata["loss"] == expected_value
+
+            history = client.get_run_metadata_history(
+                resource_id=step_run.id,
+                resource_type=MetadataResourceTypes.STEP_RUN,
+                key="loss",
+                size=1,
+            )
+            assert history[0].value == expected_value
+
+
 @pytest.mark.parametrize(
     "step_status, expected_run_status",
     [
@@ -5593,6 +5706,256 @@ def test_updating_the_pipeline_run_status(step_status, expected_run_status):
         assert run_status == expected_run_status
 
 
+def _create_run_with_steps(step_names: List[str]) -> PipelineRunResponse:
+    """Creates a pipeline run for a deployment with the given steps."""
+    client = Client()
+    deployment = client.zen_store.create_deployment(
+        PipelineDeploymentRequest(
+            project=client.active_project.id,
+            run_name_template=sample_name("foo"),
+            pipeline_configuration=PipelineConfiguration(
+                name=sample_name("foo")
+            ),
+            stack=client.active_stack.id,
+            client_version="0.1.0",
+            server_version="0.1.0",
+            step_configurations={
+                step_name: Step(
+                    spec=StepSpec(
+                        source=Source(
+                            module="acme.foo",
+                            type=SourceType.INTERNAL,
+                        ),
+                        upstream_steps=[],
+                    ),
+                    config=StepConfiguration(name=step_name),
+                )
+                for step_name in step_names
+            },
+        )
+    )
+    run, _ = client.zen_store.get_or_create_run(
+        PipelineRunRequest(
+            project=client.active_project.id,
+            id=uuid4(),
+            name=sample_name("foo"),
+            deployment=deployment.id,
+            status=ExecutionStatus.RUNNING,
+        )
+    )
+    return run
+
+
+def _step_run_request(
+    run: PipelineRunResponse,
+    name: str,
+    cache_key: str,
+    status: ExecutionStatus = ExecutionStatus.COMPLETED,
+) -> StepRunRequest:
+    """Creates a step run request for a pipeline run."""
+    return StepRunRequest(
+        project=run.project_id,
+        name=name,
+        status=status,
+        pipeline_run_id=run.id,
+        deployment=run.deployment_id,
+        cache_key=cache_key,
+    )
+
+
+def test_get_cached_run_steps_returns_latest_completed_step_runs():
+    """Tests getting the latest completed step run per cache key."""
+    client = Client()
+    zen_store = client.zen_store
+    if not isinstance(zen_store, SqlZenStore):
+        pytest.skip("Test only applies to the SQL ZenStore.")
+
+    runs = [_create_run_with_steps(["a", "b"]) for _ in range(4)]
+    try:
+        old_step_run = zen_store.create_run_step(
+            _step_run_request(runs[0], "a", cache_key="key_a")
+        )
+        latest_step_run = zen_store.create_run_step(
+            _step_run_request(runs[1], "a", cache_key="key_a")
+        )
+        # Newer step runs which did not complete can not be used as cache
+        zen_store.create_run_step(
+            _step_run_request(
+                runs[2], "a", cache_key="key_a", status=ExecutionStatus.FAILED
+            )
+        )
+        zen_store.create_run_step(
+            _step_run_request(
+                runs[3], "a", cache_key="key_a", status=ExecutionStatus.RUNNING
+            )
+        )
+        zen_store.create_run_step(
+            _step_run_request(
+                runs[0], "b", cache_key="key_b", status=ExecutionStatus.FAILED
+            )
+        )
+        tied_step_runs = [
+            zen_store.create_run_step(
+                _step_run_request(run, "b", cache_key="key_c")
+            )
+            for run in runs[1:3]
+        ]
+        with Session(zen_store.engine) as session:
+            for step_run in tied_step_runs:
+                step_run_schema = session.get(StepRunSchema, step_run.id)
+                step_run_schema.created = tied_step_runs[0].created
+                session.add(step_run_schema)
+            session.commit()
+
+        cached_step_runs = zen_store.get_cached_run_steps(
+            project_id=client.active_project.id,
+            cache_keys=["key_a", "key_b", "key_c", "key_d"],
+        )
+        assert set(cached_step_runs) == {"key_a", "key_c"}
+        assert cached_step_runs["key_a"].id == latest_step_run.id
+        assert cached_step_runs["key_c"].id == min(
+            step_run.id for step_run in tied_step_runs
+        )
+
+        # Step runs of pipeline runs which are not accessible are ignored
+        # before selecting the latest one
+        cached_step_runs = zen_store.get_cached_run_steps(
+            project_id=client.active_project.id,
+            cache_keys=["key_a", "key_c"],
+            allowed_pipeline_run_ids={runs[0].id, runs[2].id},
+            authenticated_user_id=uuid4(),
+        )
+        assert set(cached_step_runs) == {"key_a", "key_c"}
+        assert cached_step_runs["key_a"].id == old_step_run.id
+        assert cached_step_runs["key_c"].id == tied_step_runs[1].id
+
+        # Step runs owned by the authenticated user are always accessible
+        cached_step_runs = zen_store.get_cached_run_steps(
+            project_id=client.active_project.id,
+            cache_keys=["key_a"],
+            allowed_pipeline_run_ids=set(),
+            authenticated_user_id=client.active_user.id,
+        )
+        assert cached_step_runs["key_a"].id == latest_step_run.id
+    finally:
+        for run in runs:
+            client.delete_pipeline_run(run.id)
+
+
+def test_batch_creating_run_steps():
+    """Tests that a batch of step runs is created in a single transaction."""
+    client = Client()
+    zen_store = client.zen_store
+
+    run = _create_run_with_steps(["a", "b", "c"])
+    try:
+        with pytest.raises(EntityExistsError):
+            zen_store.batch_create_run_steps(
+                [
+                    _step_run_request(run, "a", cache_key="key_a"),
+                    _step_run_request(run, "a", cache_key="key_a"),
+                ]
+            )
+        assert not client.list_run_steps(pipeline_run_id=run.id).items
+
+        step_runs = zen_store.batch_create_run_steps(
+            [
+                _step_run_request(run, "a", cache_key="key_a"),
+                _step_run_request(run, "b", cache_key="key_b"),
+            ]
+        )
+        assert [step_run.name for step_run in step_runs] == ["a", "b"]
+        assert {
+            step_run.name
+            for step_run in client.list_run_steps(pipeline_run_id=run.id)
+        } == {"a", "b"}
+        assert client.get_pipeline_run(run.id).status == (
+            ExecutionStatus.RUNNING
+        )
+
+        zen_store.batch_create_run_steps(
+            [_step_run_request(run, "c", cache_key="key_c")]
+        )
+        assert client.get_pipeline_run(run.id).status == (
+            ExecutionStatus.COMPLETED
+        )
+    finally:
+        client.delete_pipeline_run(run.id)
+
+
+def test_deployment_configurations_are_parsed_once():
+    """Tests that parsed deployment configurations are cached."""
+    zen_store = Client().zen_store
+    if not isinstance(zen_store, SqlZenStore):
+        pytest.skip("Test only applies to the SQL ZenStore.")
+
+    run_context = PipelineRunContext(1)
+    with run_context:
+        run = run_context.runs[-1]
+
+        with Session(zen_store.engine) as session:
+            deployment = session.get(
+                PipelineDeploymentSchema, run.deployment_id
+            )
+            assert deployment.step_count == len(
+                json.loads(deployment.step_configurations)
+            )
+            assert deployment.get_steps() is deployment.get_steps()
+
+            # Run-specific substitutions must not leak into the cache
+            configuration = deployment.get_pipeline_configuration()
+            configuration.finalize_substitutions(inplace=True)
+            assert (
+                "date"
+                not in deployment.get_pipeline_configuration().substitutions
+            )
+
+        run = zen_store.get_run(run.id)
+        assert run.config.substitutions["date"] == run.start_time.strftime(
+            "%Y_%m_%d"
+        )
+        for step_run in run.steps.values():
+            assert (
+                step_run.config.substitutions["time"]
+                == run.config.substitutions["time"]
+            )
+
+        dag = zen_store.get_pipeline_run_dag(run.id)
+        assert {node.name for node in dag.nodes if node.type == "step"} == set(
+            run.steps
+        )
+
+
+@pytest.mark.parametrize("sort_by", ["created", "desc:name"])
+def test_cursor_pagination(sort_by):
+    """Tests paginating step runs using cursors."""
+    client = Client()
+    run_context = PipelineRunContext(2)
+    with run_context:
+        run_ids = json.dumps([str(run.id) for run in run_context.runs])
+        filters = {"sort_by": sort_by, "pipeline_run_id": f"oneof:{run_ids}"}
+        expected_ids = [
+            step_run.id for step_run in client.list_run_steps(**filters)
+        ]
+        assert len(expected_ids) == len(run_context.steps) > 2
+
+        page = client.list_run_steps(size=1, include_total=False, **filters)
+        assert page.total_pages == 2
+        ids = [step_run.id for step_run in page]
+        while page.next_cursor:
+            page = client.list_run_steps(
+                size=1, cursor=page.next_cursor, **filters
+            )
+            assert page.total == len(expected_ids)
+            ids += [step_run.id for step_run in page]
+
+        assert page.index == len(expected_ids)
+        assert ids == expected_ids
+
+        step_runs = depaginate(client.list_run_steps, size=1, **filters)
+        assert [step_run.id for step_run in step_runs] == expected_ids
+
+
 @step
 def produce_artifact() -> int:
     """Produces an artifact and tags it."""
@@ -11,15 +11,25 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import os
+from tempfile import TemporaryDirectory
 
 import pandas as pd
+import pytest
 from datasets import Dataset
 
 from tests.unit.test_general import _test_materializer
+from zenml.client import Client
+from zenml.integrations.huggingface.materializers import (
+    huggingface_datasets_materializer,
+)
 from zenml.integrations.huggingface.materializers.huggingface_datasets_materializer import (
+    DEFAULT_DATASET_DIR,
+    SHARDS_FILENAME,
     HFDatasetMaterializer,
     extract_repo_name,
 )
+from zenml.utils import materializer_utils
 
 
 def test_huggingface_datasets_materializer(clean_client):
@@ -38,6 +48,117 @@ def test_huggingface_datasets_materializer(clean_client):
     assert [1, 2, 3] in data.values()
 
 
+def test_huggingface_datasets_materializer_shard_cache(
+    clean_client, mocker, tmp_path
+):
+    """Tests that datasets in remote artifact stores are cached locally."""
+    mocker.patch.dict(
+        os.environ, {"ZENML_HF_DATASETS_CACHE_DIR": str(tmp_path)}
+    )
+    dataset = Dataset.from_pandas(pd.DataFrame({"a": [1, 2, 3]}))
+
+    artifact_store_uri = Client().active_stack.artifact_store.path
+    with TemporaryDirectory(dir=artifact_store_uri) as artifact_uri:
+        # Local artifact stores are written to and read from directly
+        materializer = HFDatasetMaterializer(uri=artifact_uri)
+        materializer.save(dataset)
+        assert os.path.isdir(os.path.join(artifact_uri, DEFAULT_DATASET_DIR))
+        assert not os.path.exists(os.path.join(artifact_uri, SHARDS_FILENAME))
+        assert materializer.load(Dataset)["a"] == [1, 2, 3]
+
+    mocker.patch.object(
+        huggingface_datasets_materializer.io_utils,
+        "is_remote",
+        return_value=True,
+    )
+    copy_files = mocker.spy(huggingface_datasets_materializer, "copy_files")
+    with TemporaryDirectory(dir=artifact_store_uri) as artifact_uri:
+        materializer = HFDatasetMaterializer(uri=artifact_uri)
+        materializer.save(dataset)
+        assert os.path.exists(os.path.join(artifact_uri, SHARDS_FILENAME))
+        # Saved datasets are only cached if enabled
+        assert not any(files for _, _, files in os.walk(tmp_path))
+
+        assert materializer.load(Dataset)["a"] == [1, 2, 3]
+        assert len(copy_files.call_args.args[0]) > 0
+
+        # The downloaded files are cached
+        assert materializer.load(Dataset)["a"] == [1, 2, 3]
+        assert copy_files.call_args.args[0] == []
+
+    mocker.patch.dict(os.environ, {"ZENML_HF_DATASETS_CACHE_ON_SAVE": "true"})
+    with TemporaryDirectory(dir=artifact_store_uri) as artifact_uri:
+        materializer = HFDatasetMaterializer(uri=artifact_uri)
+        materializer.save(Dataset.from_pandas(pd.DataFrame({"b": [4, 5]})))
+
+        # The files were moved to the cache when saving the dataset, so
+        # nothing needs to be downloaded
+        assert materializer.load(Dataset)["b"] == [4, 5]
+        assert copy_files.call_args.args[0] == []
+
+
+def test_huggingface_datasets_materializer_evicts_after_linking(
+    clean_client, mocker, tmp_path
+):
+    """Tests that evicting cache files doesn't break the loaded dataset."""
+    mocker.patch.dict(
+        os.environ,
+        {
+            "ZENML_HF_DATASETS_CACHE_DIR": str(tmp_path),
+            "ZENML_HF_DATASETS_CACHE_MAX_SIZE": "0",
+        },
+    )
+    mocker.patch.object(
+        materializer_utils, "MATERIALIZER_CACHE_MIN_AGE_SECONDS", -1
+    )
+    mocker.patch.object(
+        huggingface_datasets_materializer.io_utils,
+        "is_remote",
+        return_value=True,
+    )
+    dataset = Dataset.from_pandas(pd.DataFrame({"a": [1, 2, 3]}))
+
+    artifact_store_uri = Client().active_stack.artifact_store.path
+    with TemporaryDirectory(dir=artifact_store_uri) as artifact_uri:
+        materializer = HFDatasetMaterializer(uri=artifact_uri)
+        materializer.save(dataset)
+
+        # All downloaded files exceed the cache size and get evicted
+        assert materializer.load(Dataset)["a"] == [1, 2, 3]
+        assert not any(files for _, _, files in os.walk(tmp_path))
+
+
+def test_huggingface_datasets_materializer_verifies_downloads(
+    clean_client, mocker, tmp_path
+):
+    """Tests that downloaded files which don't match their hash are rejected."""
+    mocker.patch.dict(
+        os.environ, {"ZENML_HF_DATASETS_CACHE_DIR": str(tmp_path)}
+    )
+    mocker.patch.object(
+        huggingface_datasets_materializer.io_utils,
+        "is_remote",
+        return_value=True,
+    )
+    dataset = Dataset.from_pandas(pd.DataFrame({"a": [1, 2, 3]}))
+
+    artifact_store_uri = Client().active_stack.artifact_store.path
+    with TemporaryDirectory(dir=artifact_store_uri) as artifact_uri:
+        materializer = HFDatasetMaterializer(uri=artifact_uri)
+        materializer.save(dataset)
+
+        for root, _, files in os.walk(
+            os.path.join(artifact_uri, DEFAULT_DATASET_DIR)
+        ):
+            for file in files:
+                with open(os.path.join(root, file), "ab") as f:
+                    f.write(b"corrupted")
+
+        with pytest.raises(RuntimeError):
+            materializer.load(Dataset)
+        assert not any(files for _, _, files in os.walk(tmp_path))
+
+
 def test_extract_repo_name():
     """Tests whether the extract_repo_name function works correctly."""
     # Test valid URL
@@ -0,0 +1,155 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Unit tests for kube_utils.py."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes.client import (
+    V1ListMeta,
+    V1ObjectMeta,
+    V1Pod,
+    V1PodList,
+    V1PodStatus,
+)
+
+from zenml.integrations.kubernetes.orchestrators import kube_utils
+from zenml.integrations.kubernetes.orchestrators.kube_utils import (
+    PodLogsReader,
+    PodStatusMonitor,
+)
+
+
+def _mock_core_api(*logs: str) -> MagicMock:
+    """Creates a mock core API which returns the given logs in order."""
+    core_api = MagicMock()
+    responses = []
+    for log in logs:
+        response = MagicMock()
+        response.data = log.encode()
+        responses.append(response)
+    core_api.read_namespaced_pod_log.side_effect = responses
+    return core_api
+
+
+def test_pod_logs_reader_only_returns_new_lines():
+    """Tests that overlapping log reads don't return lines twice."""
+    core_api = _mock_core_api(
+        "2024-01-01T10:00:00.1Z first\n2024-01-01T10:00:00.12Z second\n",
+        "2024-01-01T10:00:00.12Z second\n2024-01-01T10:00:01Z third\n",
+        "2024-01-01T10:00:01Z third\n",
+    )
+    reader = PodLogsReader(pod_name="pod", namespace="ns")
+
+    assert reader.read_new_lines(core_api) == ["first", "second"]
+    assert reader.read_new_lines(core_api) == ["third"]
+    assert reader.read_new_lines(core_api) == []
+
+    first_call, second_call, _ = (
+        core_api.read_namespaced_pod_log.call_args_list
+    )
+    assert "since_seconds" not in first_call.kwargs
+    assert second_call.kwargs["since_seconds"] > 0
+
+
+def test_pod_logs_reader_keeps_lines_with_identical_timestamps():
+    """Tests that new lines with the same timestamp as the last line are
+    returned."""
+    core_api = _mock_core_api(
+        "2024-01-01T10:00:00Z a\n",
+        "2024-01-01T10:00:00Z a\n2024-01-01T10:00:00Z b\n",
+    )
+    reader = PodLogsReader(pod_name="pod", namespace="ns")
+
+    assert reader.read_new_lines(core_api) == ["a"]
+    assert reader.read_new_lines(core_api) == ["b"]
+
+
+def _pod(name: str, phase: str) -> V1Pod:
+    """Creates a pod with the given phase."""
+    return V1Pod(
+        metadata=V1ObjectMeta(name=name), status=V1PodStatus(phase=phase)
+    )
+
+
+def _start_monitor(mocker, pods, events) -> PodStatusMonitor:
+    """Starts a pod monitor with a mocked Kubernetes API."""
+    core_api = MagicMock()
+    core_api.list_namespaced_pod.return_value = V1PodList(
+        items=pods, metadata=V1ListMeta(resource_version="1")
+    )
+    mocker.patch.object(
+        kube_utils.k8s_client, "CoreV1Api", return_value=core_api
+    )
+
+    release_events = threading.Event()
+
+    def _stream(*args, **kwargs):
+        release_events.wait(timeout=10)
+        yield from events
+        # Block like an open watch until the monitor is stopped
+        monitor._stop_event.wait(timeout=10)
+
+    watch = MagicMock()
+    watch.stream.side_effect = _stream
+    mocker.patch.object(kube_utils.k8s_watch, "Watch", return_value=watch)
+
+    monitor = PodStatusMonitor(
+        kube_client_fn=MagicMock(), namespace="ns", label_selector="run=run"
+    )
+    monitor.start()
+    release_events.set()
+    return monitor
+
+
+def test_pod_status_monitor_dispatches_status_changes(mocker):
+    """Tests that waiting threads are woken up by watch events."""
+    monitor = _start_monitor(
+        mocker,
+        pods=[_pod("step-1", "Pending")],
+        events=[
+            {"type": "MODIFIED", "object": _pod("step-1", "Running")},
+            {"type": "ADDED", "object": _pod("step-2", "Succeeded")},
+        ],
+    )
+    with monitor:
+        pod = monitor.wait_for_pod(
+            "step-1", kube_utils.pod_is_not_pending, timeout=10
+        )
+        assert pod.status.phase == "Running"
+
+        pod = monitor.wait_for_pod(
+            "step-2", kube_utils.pod_is_done, timeout=10
+        )
+        assert pod.status.phase == "Succeeded"
+
+        assert (
+            monitor.wait_for_pod("step-1", kube_utils.pod_is_done, timeout=0.1)
+            is None
+        )
+
+
+def test_pod_status_monitor_raises_for_deleted_pods(mocker):
+    """Tests that waiting for a deleted pod fails."""
+    monitor = _start_monitor(
+        mocker,
+        pods=[_pod("step-1", "Pending")],
+        events=[{"type": "DELETED", "object": _pod("step-1", "Pending")}],
+    )
+    with monitor:
+        with pytest.raises(RuntimeError, match="not found"):
+            monitor.wait_for_pod(
+                "step-1", kube_utils.pod_is_not_pending, timeout=10
+            )
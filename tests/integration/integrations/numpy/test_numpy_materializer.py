@@ -12,10 +12,16 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import os
+from tempfile import TemporaryDirectory
+
 import numpy as np
 
 from tests.unit.test_general import _test_materializer
+from zenml.client import Client
 from zenml.integrations.numpy.materializers.numpy_materializer import (
+    NUMPY_FILENAME,
+    SHARDS_FILENAME,
     NumpyMaterializer,
 )
 from zenml.metadata.metadata_types import (
@@ -228,3 +234,35 @@ def test_integer_type_handling():
 
         # Verify values are preserved accurately
         assert np.array_equal(result, test_array)
+
+
+def test_numpy_materializer_memory_mapping(clean_client, mocker, tmp_path):
+    """Test loading regular and sharded arrays as memory-mapped arrays."""
+    mocker.patch.dict(os.environ, {"ZENML_NUMPY_CACHE_DIR": str(tmp_path)})
+    array = np.arange(100, dtype=np.float64).reshape(25, 4)
+
+    artifact_store_uri = Client().active_stack.artifact_store.path
+    with TemporaryDirectory(dir=artifact_store_uri) as artifact_uri:
+        materializer = NumpyMaterializer(uri=artifact_uri)
+        materializer.save(array)
+        assert os.path.exists(os.path.join(artifact_uri, NUMPY_FILENAME))
+
+        result = materializer.load(np.memmap)
+        assert isinstance(result, np.memmap)
+        assert not result.flags.writeable
+        assert np.array_equal(result, array)
+
+    mocker.patch.dict(os.environ, {"ZENML_NUMPY_SHARD_SIZE": "256"})
+    with TemporaryDirectory(dir=artifact_store_uri) as artifact_uri:
+        materializer = NumpyMaterializer(uri=artifact_uri)
+        materializer.save(array)
+        assert os.path.exists(os.path.join(artifact_uri, SHARDS_FILENAME))
+        assert not os.path.exists(os.path.join(artifact_uri, NUMPY_FILENAME))
+
+        result = materializer.load(np.ndarray)
+        assert not isinstance(result, np.memmap)
+        assert np.array_equal(result, array)
+
+        result = materializer.load(np.memmap)
+        assert isinstance(result, np.memmap)
+        assert np.array_equal(result, array)
@@ -13,11 +13,17 @@
 #  permissions and limitations under the License.
 
 import datetime
+import os
+from tempfile import TemporaryDirectory
 
 import pandas
+import pyarrow.parquet as pq
 
 from tests.unit.test_general import _test_materializer
+from zenml.client import Client
+from zenml.integrations.pandas.lazy_dataframe import LazyDataFrame
 from zenml.integrations.pandas.materializers.pandas_materializer import (
+    PARQUET_FILENAME,
     PandasMaterializer,
 )
 
@@ -102,3 +108,66 @@ def test_pandas_materializer_with_index():
         assert_visualization_exists=True,
     )
     assert df_datetime_indexed.equals(result)
+
+
+def test_pandas_materializer_lazy_loading(clean_client, mocker):
+    """Test loading column and row group projections of a dataframe."""
+    mocker.patch.dict(
+        os.environ,
+        {
+            "ZENML_PANDAS_PARQUET_COMPRESSION": "lz4",
+            "ZENML_PANDAS_PARQUET_ROW_GROUP_SIZE": "10",
+        },
+    )
+    df = pandas.DataFrame(
+        {"A": range(25), "B": [str(i) for i in range(25)]},
+        index=[f"row_{i}" for i in range(25)],
+    )
+
+    artifact_store_uri = Client().active_stack.artifact_store.path
+    with TemporaryDirectory(dir=artifact_store_uri) as artifact_uri:
+        materializer = PandasMaterializer(uri=artifact_uri)
+        materializer.save(df)
+
+        metadata = pq.ParquetFile(
+            os.path.join(artifact_uri, PARQUET_FILENAME)
+        ).metadata
+        assert metadata.row_group(0).column(0).compression == "LZ4"
+
+        lazy_df = materializer.load(LazyDataFrame)
+        assert isinstance(lazy_df, LazyDataFrame)
+        assert lazy_df.columns == ["A", "B"]
+        assert lazy_df.num_rows == 25
+        assert lazy_df.num_row_groups == 3
+
+        assert lazy_df.read().equals(df)
+        assert lazy_df.read(columns=["A"]).equals(df[["A"]])
+        assert lazy_df.read(columns=["B"], row_groups=[1]).equals(
+            df[["B"]].iloc[10:20]
+        )
+        assert pandas.concat(lazy_df.iter_row_groups()).equals(df)
+
+
+def test_pandas_materializer_invalid_parquet_settings(clean_client, mocker):
+    """Test that invalid parquet settings fall back to the defaults."""
+    mocker.patch.dict(
+        os.environ,
+        {
+            "ZENML_PANDAS_PARQUET_COMPRESSION": "not_a_codec",
+            "ZENML_PANDAS_PARQUET_ROW_GROUP_SIZE": "not_a_number",
+        },
+    )
+    df = pandas.DataFrame({"A": range(25)})
+
+    artifact_store_uri = Client().active_stack.artifact_store.path
+    with TemporaryDirectory(dir=artifact_store_uri) as artifact_uri:
+        materializer = PandasMaterializer(uri=artifact_uri)
+        materializer.save(df)
+
+        metadata = pq.ParquetFile(
+            os.path.join(artifact_uri, PARQUET_FILENAME)
+        ).metadata
+        assert metadata.row_group(0).column(0).compression == "GZIP"
+        assert metadata.num_row_groups == 1
+
+        assert materializer.load(pandas.DataFrame).equals(df)
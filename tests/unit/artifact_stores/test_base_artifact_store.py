@@ -11,9 +11,15 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import os
+from datetime import datetime
+from uuid import uuid4
+
 import pytest
 
+from zenml.artifact_stores import LocalArtifactStore, LocalArtifactStoreConfig
 from zenml.artifact_stores.base_artifact_store import BaseArtifactStoreConfig
+from zenml.enums import StackComponentType
 from zenml.exceptions import ArtifactStoreInterfaceError
 
 
@@ -44,3 +50,38 @@ class TestBaseArtifactStoreConfig:
     def test_invalid_path(self, path):
         with pytest.raises(ArtifactStoreInterfaceError):
             self.AriaArtifactStoreConfig(path=path)
+
+
+def test_stat_cache(tmp_path):
+    """Tests that existence checks are cached until the path is modified."""
+    artifact_store = LocalArtifactStore(
+        name="",
+        id=uuid4(),
+        config=LocalArtifactStoreConfig(path=str(tmp_path)),
+        flavor="default",
+        type=StackComponentType.ARTIFACT_STORE,
+        user=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+    file_path = os.path.join(str(tmp_path), "file")
+
+    # Paths that don't exist are not cached
+    assert not artifact_store.exists(file_path)
+    open(file_path, "w").close()
+    assert artifact_store.exists(file_path)
+
+    # Paths that exist are cached until they are modified
+    os.remove(file_path)
+    assert artifact_store.exists(file_path)
+    with artifact_store.open(file_path, "w") as f:
+        f.write("")
+    artifact_store.remove(file_path)
+    assert not artifact_store.exists(file_path)
+
+    # Directory listings are used to answer checks for paths inside them
+    artifact_store._cache_listing(str(tmp_path), [file_path])
+    assert artifact_store.exists(file_path)
+    assert not artifact_store.exists(os.path.join(str(tmp_path), "other"))
+    artifact_store.makedirs(os.path.join(str(tmp_path), "other"))
+    assert artifact_store.exists(os.path.join(str(tmp_path), "other"))
@@ -20,7 +20,9 @@ from pydantic import BaseModel
 
 from zenml.artifacts.utils import (
     _load_artifact_from_uri,
+    _load_artifact_manifest,
     _strip_timestamp_from_multiline_string,
+    _write_artifact_manifest,
     load_artifact_from_response,
     load_model_from_metadata,
     save_model_metadata,
@@ -225,3 +227,23 @@ def test__load_artifact(builtin_type_file_uri):
 def test__strip_timestamp_from_multiline_string(raw: str, expected: str):
     """Test the _strip_timestamp_from_multiline_string function to properly strip the logs."""
     assert _strip_timestamp_from_multiline_string(raw) == expected
+
+
+def test_artifact_manifest(clean_client: "Client"):
+    """Tests that artifact manifests answer existence checks."""
+    artifact_store = clean_client.active_stack.artifact_store
+    uri = tempfile.mkdtemp(dir=artifact_store.path)
+    os.makedirs(os.path.join(uri, "subdir"))
+    open(os.path.join(uri, "subdir", "file"), "w").close()
+
+    _write_artifact_manifest(artifact_store=artifact_store, uri=uri)
+    _load_artifact_manifest(artifact_store=artifact_store, uri=uri)
+
+    # Files created without the artifact store are not picked up, as the
+    # manifest contains all files of the artifact
+    open(os.path.join(uri, "other"), "w").close()
+    assert not artifact_store.exists(os.path.join(uri, "other"))
+    assert artifact_store.exists(os.path.join(uri, "subdir", "file"))
+    assert artifact_store.exists(os.path.join(uri, "subdir"))
+
+    shutil.rmtree(uri)
@@ -0,0 +1,73 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from unittest.mock import MagicMock
+
+from zenml.integrations.registry import IntegrationRegistry
+
+
+def _create_registry(requirements):
+    """Creates a registry with a single fake integration."""
+    integration = MagicMock()
+    integration.get_requirements.return_value = requirements
+    integration.check_installation.return_value = True
+
+    registry = IntegrationRegistry()
+    registry._initialized = True
+    registry.register_integration("fake", integration)
+    return registry, integration
+
+
+def test_integration_manifest_skips_installation_checks(
+    mocker, tmp_path
+) -> None:
+    """Tests that the installation status is cached in a manifest."""
+    mocker.patch.dict("os.environ", {"ZENML_CONFIG_PATH": str(tmp_path)})
+
+    registry, integration = _create_registry(["fake-package>=1.0"])
+    registry.activate_integrations()
+    integration.check_installation.assert_called_once()
+    integration.activate.assert_called_once()
+
+    # The manifest is reused by other processes with the same environment
+    registry, integration = _create_registry(["fake-package>=1.0"])
+    registry.activate_integrations()
+    integration.check_installation.assert_not_called()
+    integration.activate.assert_called_once()
+    assert registry.get_installed_integrations() == ["fake"]
+
+    # Changed integration requirements invalidate the cached status
+    registry, integration = _create_registry(["fake-package>=2.0"])
+    registry.activate_integrations()
+    integration.check_installation.assert_called_once()
+
+
+def test_integration_manifest_is_invalidated_by_environment_changes(
+    mocker, tmp_path
+) -> None:
+    """Tests that the manifest is not used if the environment changed."""
+    mocker.patch.dict("os.environ", {"ZENML_CONFIG_PATH": str(tmp_path)})
+    mock_fingerprint = mocker.patch(
+        "zenml.integrations.registry._get_environment_fingerprint",
+        return_value="fingerprint",
+    )
+
+    registry, integration = _create_registry(["fake-package"])
+    registry.activate_integrations()
+    integration.check_installation.assert_called_once()
+
+    mock_fingerprint.return_value = "new_fingerprint"
+    registry, integration = _create_registry(["fake-package"])
+    registry.activate_integrations()
+    integration.check_installation.assert_called_once()
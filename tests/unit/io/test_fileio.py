@@ -247,3 +247,22 @@ def test_walk_returns_an_iterator(tmp_path) -> None:
 def test_walk_function_returns_a_generator_object(tmp_path):
     """Check walk function returns a generator object."""
     assert isinstance(fileio.walk(str(tmp_path)), GeneratorType)
+
+
+def test_copy_between_filesystems_streams_in_chunks(tmp_path, mocker):
+    """Tests that copying between filesystems streams files in chunks."""
+    copyfileobj = mocker.patch("shutil.copyfileobj")
+    mocker.patch.dict(
+        os.environ, {"ZENML_DIRECTORY_TRANSFER_CHUNK_SIZE": "1024"}
+    )
+    mocker.patch.object(
+        fileio, "_get_filesystem", side_effect=lambda path: object()
+    )
+    mocker.patch.object(fileio, "exists", return_value=False)
+    source = tmp_path / "source.txt"
+    source.write_text("content")
+    mocker.patch.object(fileio, "open", side_effect=open)
+
+    fileio.copy(str(source), str(tmp_path / "destination.txt"))
+
+    assert copyfileobj.call_args.args[2] == 1024
@@ -0,0 +1,88 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+
+import pytest
+
+from zenml.io.transfer import copy_directory
+
+
+def _create_files(directory, num_files):
+    """Creates files with different contents in nested directories."""
+    for i in range(num_files):
+        path = os.path.join(directory, f"dir_{i % 3}", f"file_{i}.txt")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write("x" * i)
+
+
+def test_copy_directory_copies_files_in_parallel(tmp_path):
+    """Tests that copying a directory copies all files."""
+    source_dir = str(tmp_path / "source")
+    destination_dir = str(tmp_path / "destination")
+    _create_files(source_dir, 20)
+
+    progress = []
+    copy_directory(
+        source_dir,
+        destination_dir,
+        max_workers=4,
+        progress_callback=progress.append,
+    )
+
+    for i in range(20):
+        path = os.path.join(destination_dir, f"dir_{i % 3}", f"file_{i}.txt")
+        with open(path) as f:
+            assert f.read() == "x" * i
+
+    assert len(progress) == 20
+    assert progress[-1].total_files == 20
+    assert progress[-1].transferred_files == 20
+    assert progress[-1].transferred_bytes == sum(range(20))
+
+
+def test_copy_directory_raises_if_file_exists(tmp_path):
+    """Tests that existing files are not overwritten by default."""
+    source_dir = str(tmp_path / "source")
+    destination_dir = str(tmp_path / "destination")
+    _create_files(source_dir, 10)
+    _create_files(destination_dir, 1)
+
+    with pytest.raises(FileExistsError):
+        copy_directory(source_dir, destination_dir, max_workers=4)
+
+
+def test_copy_directory_resumes_previous_copy(tmp_path):
+    """Tests that resuming a copy skips files that were copied completely."""
+    source_dir = str(tmp_path / "source")
+    destination_dir = str(tmp_path / "destination")
+    _create_files(source_dir, 10)
+    _create_files(destination_dir, 5)
+    # Simulate a partially copied file
+    with open(os.path.join(destination_dir, "dir_1", "file_4.txt"), "w") as f:
+        f.write("x")
+
+    progress = []
+    copy_directory(
+        source_dir,
+        destination_dir,
+        resume=True,
+        progress_callback=progress.append,
+    )
+
+    assert progress[-1].skipped_files == 4
+    assert progress[-1].transferred_files == 6
+    with open(os.path.join(destination_dir, "dir_1", "file_4.txt")) as f:
+        assert f.read() == "x" * 4
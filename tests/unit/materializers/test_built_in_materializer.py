@@ -12,6 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 import os
+from contextvars import ContextVar
 from tempfile import TemporaryDirectory
 from typing import Optional, Type
 
@@ -230,3 +231,92 @@ def test_container_materializer_for_custom_types(
         assert result[0].myname == "aria"
         assert result[1].myname == "axl"
         assert result == example
+
+
+_load_context: ContextVar[Optional[str]] = ContextVar(
+    "_load_context", default=None
+)
+
+
+class ContextType:
+    """Custom type which stores the context it was loaded in."""
+
+    context: Optional[str] = None
+
+
+class ContextTypeMaterializer(BaseMaterializer):
+    """Mock materializer which records the context of the load call."""
+
+    ASSOCIATED_TYPES = (ContextType,)
+
+    def save(self, data: ContextType) -> None:
+        """Save the data (not)."""
+        pass
+
+    def load(self, data_type: Type[ContextType]) -> ContextType:
+        """Load the data in the current context."""
+        data = data_type()
+        data.context = _load_context.get()
+        return data
+
+
+def test_container_materializer_loads_elements_in_current_context(
+    clean_client: "Client",
+):
+    """Test that elements loaded in parallel use the caller's context."""
+    example = [ContextType() for _ in range(10)]
+    with TemporaryDirectory(
+        dir=clean_client.active_stack.artifact_store.path
+    ) as artifact_uri:
+        materializer = BuiltInContainerMaterializer(uri=artifact_uri)
+        materializer.save(example)
+
+        token = _load_context.set("step_context")
+        try:
+            result = materializer.load(list)
+        finally:
+            _load_context.reset(token)
+
+    assert [element.context for element in result] == ["step_context"] * 10
+
+
+def test_container_materializer_packs_small_elements(
+    mocker, clean_client: "Client"
+):
+    """Test that small elements are packed and large ones stored separately."""
+    from zenml.utils import yaml_utils
+
+    mocker.patch.object(
+        BuiltInContainerMaterializer, "MAX_PACKED_ELEMENT_SIZE", 10
+    )
+    example = [b"small", b"large" * 10, b"tiny"]
+    with TemporaryDirectory(
+        dir=clean_client.active_stack.artifact_store.path
+    ) as artifact_uri:
+        materializer = BuiltInContainerMaterializer(uri=artifact_uri)
+        materializer.save(example)
+
+        assert sorted(os.listdir(artifact_uri)) == [
+            "1",
+            "elements.tar",
+            "metadata.json",
+        ]
+        assert materializer.load(list) == example
+
+    # Elements stored in the format without packing can still be loaded
+    mocker.patch.object(
+        BuiltInContainerMaterializer, "MAX_PACKED_ELEMENT_SIZE", -1
+    )
+    with TemporaryDirectory(
+        dir=clean_client.active_stack.artifact_store.path
+    ) as artifact_uri:
+        materializer = BuiltInContainerMaterializer(uri=artifact_uri)
+        materializer.save(example)
+        assert "elements.tar" not in os.listdir(artifact_uri)
+
+        metadata_path = os.path.join(artifact_uri, "metadata.json")
+        metadata = yaml_utils.read_json(metadata_path)
+        for entry in metadata:
+            entry.pop("packed")
+        yaml_utils.write_json(metadata_path, metadata)
+        assert materializer.load(list) == example
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 import uuid
 from datetime import datetime
+from types import SimpleNamespace
 from typing import Any, List, Optional, Type, Union
 from uuid import UUID
 
@@ -260,3 +261,29 @@ def test_string_filter_model():
         filter_value="a_random_string",
         ignore_operators=[GenericFilterOps.ONEOF],
     )
+
+
+def test_filter_model_cursor_round_trip():
+    """Test that a cursor points to the page following the item."""
+    item = SimpleNamespace(id=uuid.uuid4(), created=datetime(2025, 1, 2))
+    cursor = BaseFilter().create_cursor(item, page=3)
+
+    filter_model = BaseFilter(cursor=cursor)
+    assert filter_model.cursor_page == 3
+    assert filter_model._decode_cursor() == {
+        "value": item.created,
+        "id": item.id,
+        "page": 3,
+    }
+
+
+def test_filter_model_cursor_for_other_sort_column_fails():
+    """Test that cursors can only be used for the column they were created for."""
+    item = SimpleNamespace(id=uuid.uuid4(), created=datetime(2025, 1, 2))
+    cursor = BaseFilter().create_cursor(item, page=2)
+
+    with pytest.raises(ValueError):
+        _ = BaseFilter(cursor=cursor, sort_by="updated").cursor_page
+
+    with pytest.raises(ValueError):
+        _ = BaseFilter(cursor="not-a-cursor").cursor_page
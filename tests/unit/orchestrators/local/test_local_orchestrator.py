@@ -11,9 +11,20 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Dict, List
+from uuid import uuid4
 
+import pytest
+
+from zenml.config.step_configurations import Step
 from zenml.enums import StackComponentType
-from zenml.orchestrators import LocalOrchestratorFlavor
+from zenml.orchestrators import LocalOrchestrator, LocalOrchestratorFlavor
+from zenml.orchestrators.local.local_orchestrator import (
+    LocalOrchestratorConfig,
+)
 
 
 def test_local_orchestrator_flavor_attributes():
@@ -23,3 +34,85 @@ def test_local_orchestrator_flavor_attributes():
     flavor = LocalOrchestratorFlavor()
     assert flavor.type == StackComponentType.ORCHESTRATOR
     assert flavor.name == "local"
+
+
+def _create_local_orchestrator(max_parallelism: int) -> LocalOrchestrator:
+    """Creates a local orchestrator with the given parallelism."""
+    return LocalOrchestrator(
+        name="",
+        id=uuid4(),
+        config=LocalOrchestratorConfig(max_parallelism=max_parallelism),
+        flavor="local",
+        type=StackComponentType.ORCHESTRATOR,
+        user=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+
+
+def _create_deployment(dag: Dict[str, List[str]]) -> SimpleNamespace:
+    """Creates a fake deployment with steps for the given DAG."""
+    step_configurations = {
+        step_name: Step.model_validate(
+            {
+                "spec": {
+                    "source": "module.step_class",
+                    "upstream_steps": upstream_steps,
+                    "inputs": {},
+                },
+                "config": {"name": step_name},
+            }
+        )
+        for step_name, upstream_steps in dag.items()
+    }
+    return SimpleNamespace(
+        schedule=None, step_configurations=step_configurations
+    )
+
+
+def test_local_orchestrator_runs_independent_steps_in_parallel(mocker):
+    """Tests that independent steps run concurrently if parallelism is
+    enabled."""
+    orchestrator = _create_local_orchestrator(max_parallelism=2)
+    deployment = _create_deployment(
+        {"source": [], "left": ["source"], "right": ["source"]}
+    )
+    barrier = threading.Barrier(2, timeout=10)
+    executed_steps = []
+
+    def _run_step(step):
+        if step.config.name != "source":
+            # Both downstream steps need to be running at the same time for
+            # the barrier to be passed.
+            barrier.wait()
+        executed_steps.append(step.config.name)
+
+    mocker.patch.object(orchestrator, "run_step", side_effect=_run_step)
+    orchestrator.prepare_or_run_pipeline(
+        deployment=deployment, stack=None, environment={}
+    )
+
+    assert executed_steps[0] == "source"
+    assert set(executed_steps) == {"source", "left", "right"}
+
+
+def test_local_orchestrator_parallel_step_failure(mocker):
+    """Tests that a failing step fails the run and skips downstream steps."""
+    orchestrator = _create_local_orchestrator(max_parallelism=4)
+    deployment = _create_deployment(
+        {"failing": [], "downstream": ["failing"], "independent": []}
+    )
+    executed_steps = []
+
+    def _run_step(step):
+        if step.config.name == "failing":
+            raise RuntimeError("Step failed.")
+        executed_steps.append(step.config.name)
+
+    mocker.patch.object(orchestrator, "run_step", side_effect=_run_step)
+    with pytest.raises(RuntimeError, match="Step failed."):
+        orchestrator.prepare_or_run_pipeline(
+            deployment=deployment, stack=None, environment={}
+        )
+
+    assert executed_steps == ["independent"]
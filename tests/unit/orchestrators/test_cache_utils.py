@@ -300,3 +300,8 @@ def test_fetching_cached_step_run_uses_latest_candidate(
 
     cached_step = cache_utils.get_cached_step_run(cache_key="cache_key")
     assert cached_step == response_2
+
+    cached_steps = cache_utils.get_cached_step_runs(
+        cache_keys=["cache_key", "other_cache_key"]
+    )
+    assert cached_steps == {"cache_key": response_2}
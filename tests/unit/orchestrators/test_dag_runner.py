@@ -12,10 +12,16 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import threading
+import time
 from contextlib import ExitStack as does_not_raise
 from typing import Dict, List
 
-from zenml.orchestrators.dag_runner import ThreadedDagRunner, reverse_dag
+from zenml.orchestrators.dag_runner import (
+    NodeStatus,
+    ThreadedDagRunner,
+    reverse_dag,
+)
 
 
 def test_reverse_dag():
@@ -74,3 +80,93 @@ def test_dag_runner_multi_path():  # 3->(2, 5)->1
 def test_dag_runner_cyclic():
     """Test that nothing happens for cyclic graphs, and no error is raised."""
     _test_runner({"1": ["2"], "2": ["1"]}, correct_results=[0])
+
+
+def test_dag_runner_respects_max_parallelism():
+    """Test that no more than `max_parallelism` nodes run at the same time."""
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def run_fn(node: str) -> None:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    dag = {str(i): [] for i in range(20)}
+    runner = ThreadedDagRunner(dag, run_fn, max_parallelism=3)
+    runner.run()
+
+    assert max_running <= 3
+    assert all(
+        state == NodeStatus.COMPLETED for state in runner.node_states.values()
+    )
+
+
+def test_dag_runner_starts_ready_node_when_slot_frees_up():
+    """Test that a freed slot immediately starts the next ready node."""
+    dag = {"1": [], "2": [], "3": []}
+    release_first_node = threading.Event()
+
+    def run_fn(node: str) -> None:
+        if node == "1":
+            release_first_node.wait(timeout=10)
+        elif node == "3":
+            # Node 3 can only start once node 2 freed its slot, and unblocks
+            # node 1 so the run can finish.
+            release_first_node.set()
+
+    start_time = time.monotonic()
+    runner = ThreadedDagRunner(dag, run_fn, max_parallelism=2)
+    runner.run()
+
+    assert time.monotonic() - start_time < 5
+    assert all(
+        state == NodeStatus.COMPLETED for state in runner.node_states.values()
+    )
+
+
+def test_dag_runner_skips_downstream_nodes_of_failed_nodes():
+    """Test that downstream nodes of a failed node are not run."""
+    executed_nodes = []
+
+    def run_fn(node: str) -> None:
+        if node == "1":
+            raise RuntimeError("Node failed.")
+        executed_nodes.append(node)
+
+    dag = {"1": [], "2": ["1"], "3": ["2"], "4": []}
+    runner = ThreadedDagRunner(dag, run_fn, max_parallelism=1)
+    runner.run()
+
+    assert executed_nodes == ["4"]
+    assert runner.node_states == {
+        "1": NodeStatus.FAILED,
+        "2": NodeStatus.NOT_STARTED,
+        "3": NodeStatus.NOT_STARTED,
+        "4": NodeStatus.COMPLETED,
+    }
+
+
+def test_dag_runner_large_dag_uses_bounded_threads():
+    """Test that large DAGs only use `max_parallelism` worker threads."""
+    thread_names = set()
+    lock = threading.Lock()
+
+    def run_fn(node: str) -> None:
+        with lock:
+            thread_names.add(threading.current_thread().name)
+
+    # A wide fan-out followed by a fan-in
+    dag = {"source": []}
+    dag.update({str(i): ["source"] for i in range(1000)})
+    dag["sink"] = [str(i) for i in range(1000)]
+    runner = ThreadedDagRunner(dag, run_fn, max_parallelism=4)
+    runner.run()
+
+    assert len(thread_names) <= 4
+    assert runner.node_states["sink"] == NodeStatus.COMPLETED
@@ -371,6 +371,32 @@ def test_unique_identifier_considers_spec(empty_step):
     assert id_ != new_id
 
 
+def test_invocation_ids_of_repeated_step_invocations(empty_step):
+    """Tests the invocation IDs of a step that is invoked multiple times."""
+
+    name = empty_step.name
+
+    @pipeline
+    def pipeline_instance():
+        empty_step(id=f"{name}_3")
+        for _ in range(4):
+            empty_step()
+
+    pipeline_instance.prepare()
+    assert list(pipeline_instance.invocations) == [
+        f"{name}_3",
+        name,
+        f"{name}_2",
+        f"{name}_4",
+        f"{name}_5",
+    ]
+
+    # Preparing the pipeline again starts counting from the beginning
+    pipeline_instance.prepare()
+    assert len(pipeline_instance.invocations) == 5
+    assert f"{name}_2" in pipeline_instance.invocations
+
+
 def test_unique_identifier_considers_step_source_code(
     one_step_pipeline, empty_step, mocker
 ):
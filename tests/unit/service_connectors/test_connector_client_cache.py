@@ -0,0 +1,162 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import pytest
+
+from zenml.service_connectors.connector_client_cache import (
+    ServiceConnectorClientCache,
+    get_refresh_fraction,
+)
+
+
+class FakeClient:
+    """Fake connector client with expiring credentials."""
+
+    def __init__(self, lifetime: Optional[float]) -> None:
+        self.expires_at = (
+            datetime.now(timezone.utc).replace(tzinfo=None)
+            + timedelta(seconds=lifetime)
+            if lifetime is not None
+            else None
+        )
+        self.expires_skew_tolerance = 0
+
+    def has_expired(self) -> bool:
+        if not self.expires_at:
+            return False
+        return self.expires_at <= datetime.now(timezone.utc).replace(
+            tzinfo=None
+        )
+
+
+@pytest.fixture
+def cache():
+    """Fresh connector client cache."""
+    ServiceConnectorClientCache._clear()
+    cache = ServiceConnectorClientCache(refresh_fraction=0.5)
+    yield cache
+    cache.clear()
+    ServiceConnectorClientCache._clear()
+
+
+def test_client_is_refreshed_in_the_background(cache):
+    """Tests that clients are refreshed before their credentials expire."""
+    clients = []
+
+    def loader():
+        clients.append(FakeClient(lifetime=2))
+        return clients[-1]
+
+    start = time.time()
+    first = cache.get("key", loader)
+    assert cache.get("key", loader) is first
+    assert len(clients) == 1
+
+    while len(clients) < 2 and time.time() - start < 5:
+        time.sleep(0.05)
+
+    # The client was refreshed before its credentials expired
+    assert len(clients) == 2
+    assert time.time() - start < 2
+    time.sleep(0.1)
+    assert cache.get_cached("key") is clients[1]
+
+
+def test_unused_clients_are_refreshed_when_requested(cache):
+    """Tests that clients are not refreshed in the background if unused."""
+    clients = []
+
+    def loader():
+        clients.append(FakeClient(lifetime=1))
+        return clients[-1]
+
+    first = cache.get("key", loader)
+    time.sleep(0.8)
+    assert len(clients) == 1
+
+    # The refresh time has passed, so the client is refreshed once requested
+    assert cache.get("key", loader) is first
+    start = time.time()
+    while len(clients) < 2 and time.time() - start < 5:
+        time.sleep(0.05)
+    assert len(clients) == 2
+
+
+def test_clients_without_expiration_are_not_cached(cache):
+    """Tests that clients which never expire are fetched every time."""
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return FakeClient(lifetime=None)
+
+    cache.get("key", loader)
+    cache.get("key", loader)
+
+    assert len(calls) == 2
+    assert cache.get_cached("key") is None
+
+
+def test_concurrent_refreshes_are_deduplicated(cache):
+    """Tests that concurrent requests for a client only fetch it once."""
+    calls = []
+    release = threading.Event()
+
+    def loader():
+        calls.append(1)
+        release.wait(5)
+        return FakeClient(lifetime=3600)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get("k", loader)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len({id(client) for client in results}) == 1
+
+
+def test_refresh_errors_are_raised(cache):
+    """Tests that errors while fetching a client are raised to the caller."""
+
+    def loader():
+        raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError):
+        cache.get("key", loader)
+
+    assert cache.get_cached("key") is None
+
+
+def test_invalid_refresh_fraction_falls_back_to_default(monkeypatch):
+    """Tests parsing the refresh fraction environment variable."""
+    monkeypatch.setenv("ZENML_SERVICE_CONNECTOR_REFRESH_FRACTION", "0.2")
+    assert get_refresh_fraction() == 0.2
+
+    monkeypatch.setenv("ZENML_SERVICE_CONNECTOR_REFRESH_FRACTION", "5")
+    assert get_refresh_fraction() == 1.0
+
+    monkeypatch.setenv("ZENML_SERVICE_CONNECTOR_REFRESH_FRACTION", "abc")
+    assert get_refresh_fraction() == 0.75
@@ -14,12 +14,14 @@
 from types import TracebackType
 from typing import Any, Dict, Optional, Tuple, Type
 from unittest.mock import patch
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from pytest_mock import MockFixture
 
+from zenml.analytics import source_context
+from zenml.analytics.client import Client as AnalyticsClient
 from zenml.analytics.enums import AnalyticsEvent
-from zenml.enums import StackComponentType, StoreType
+from zenml.enums import SourceContextTypes, StackComponentType, StoreType
 
 
 def event_check(
@@ -177,3 +179,54 @@ def test_analytics_event(
 
     # Test pipeline run
     one_step_pipeline(empty_step).with_options(unlisted=True)()
+
+
+def test_analytics_client_sends_messages_in_background_batches(
+    mocker: MockFixture,
+) -> None:
+    """Tests that the analytics client batches messages per source context."""
+    mock_post = mocker.patch("zenml.analytics.request.post")
+    client = AnalyticsClient(upload_interval=0.1)
+
+    user_id = uuid4()
+    for _ in range(3):
+        success, _ = client.track(
+            user_id=user_id, event=AnalyticsEvent.RUN_PIPELINE, properties={}
+        )
+        assert success
+
+    token = source_context.set(SourceContextTypes.API)
+    try:
+        client.track(
+            user_id=user_id, event=AnalyticsEvent.RUN_PIPELINE, properties={}
+        )
+    finally:
+        source_context.reset(token)
+
+    client.join()
+
+    sent_batches = {
+        call.kwargs["source"]: call.kwargs["batch"]
+        for call in mock_post.call_args_list
+    }
+    assert len(sent_batches[SourceContextTypes.PYTHON]) == 3
+    assert len(sent_batches[SourceContextTypes.API]) == 1
+
+
+def test_analytics_client_drops_messages_if_queue_is_full(
+    mocker: MockFixture,
+) -> None:
+    """Tests that the analytics client never blocks on a full queue."""
+    mocker.patch.object(AnalyticsClient, "_ensure_consumer")
+    client = AnalyticsClient(max_queue_size=1)
+
+    user_id = uuid4()
+    success, _ = client.track(
+        user_id=user_id, event=AnalyticsEvent.RUN_PIPELINE, properties={}
+    )
+    assert success
+
+    success, _ = client.track(
+        user_id=user_id, event=AnalyticsEvent.RUN_PIPELINE, properties={}
+    )
+    assert not success
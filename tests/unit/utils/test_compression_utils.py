@@ -0,0 +1,48 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import gzip
+
+import pytest
+
+from zenml.utils import compression_utils
+
+
+def test_gzip_compression_roundtrip():
+    """Tests that gzip compressed data can be decompressed."""
+    data = b'{"key": "value"}' * 100
+    compressed = compression_utils.compress(data, encoding="gzip")
+
+    assert len(compressed) < len(data)
+    assert gzip.decompress(compressed) == data
+    assert compression_utils.decompress(compressed, encoding="gzip") == data
+
+
+def test_decompression_fails_for_invalid_data():
+    """Tests that decompressing invalid or oversized data fails."""
+    with pytest.raises(ValueError):
+        compression_utils.decompress(b"not gzip", encoding="gzip")
+
+    with pytest.raises(ValueError):
+        compression_utils.decompress(b"data", encoding="unknown")
+
+    compressed = compression_utils.compress(b"a" * 1000, encoding="gzip")
+    with pytest.raises(ValueError):
+        compression_utils.decompress(compressed, encoding="gzip", max_size=999)
+    assert (
+        compression_utils.decompress(
+            compressed, encoding="gzip", max_size=1000
+        )
+        == b"a" * 1000
+    )
@@ -0,0 +1,41 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+import time
+
+from zenml.utils import materializer_utils
+
+
+def test_evicting_local_cache_files(tmp_path, mocker):
+    """Tests that the least recently used cache files are removed first."""
+    mocker.patch.dict(os.environ, {"ZENML_TEST_CACHE_MAX_SIZE": "250"})
+    old_time = time.time() - 3600
+    for index, name in enumerate(["a", "b", "c"]):
+        path = tmp_path / name / "data"
+        path.parent.mkdir()
+        path.write_bytes(b"0" * 100)
+        os.utime(path, (old_time + index, old_time + index))
+
+    # Used recently, so it's kept even though it's the oldest file
+    materializer_utils.touch_local_cache_file(str(tmp_path / "a" / "data"))
+    (tmp_path / "d.tmp").write_bytes(b"0" * 100)
+
+    materializer_utils.evict_local_cache_files(
+        str(tmp_path), max_size_env_var="ZENML_TEST_CACHE_MAX_SIZE"
+    )
+
+    assert (tmp_path / "a" / "data").exists()
+    assert not (tmp_path / "b" / "data").exists()
+    assert not (tmp_path / "c" / "data").exists()
+    assert (tmp_path / "d.tmp").exists()
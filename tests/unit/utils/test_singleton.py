@@ -12,7 +12,12 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
-from zenml.utils.singleton import SingletonMetaClass
+import threading
+
+from zenml.utils.singleton import (
+    ContextSingletonMetaClass,
+    SingletonMetaClass,
+)
 
 
 class SingletonClass(metaclass=SingletonMetaClass):
@@ -66,3 +71,50 @@ def test_singleton_metaclass_can_be_used_for_multiple_classes():
     assert SingletonClass() is not SecondSingletonClass()
     assert type(SingletonClass()) is SingletonClass
     assert type(SecondSingletonClass()) is SecondSingletonClass
+
+
+class ContextSingletonClass(metaclass=ContextSingletonMetaClass):
+    pass
+
+
+def test_context_singleton_instances_are_separated_per_thread():
+    """Tests that threads which create their own instance of a class with
+    metaclass `ContextSingletonMetaClass` don't share it."""
+    ContextSingletonClass._clear()
+    main_instance = ContextSingletonClass()
+    thread_instances = []
+
+    def _create_instance():
+        ContextSingletonClass._clear()
+        instance = ContextSingletonClass()
+        assert ContextSingletonClass() is instance
+        thread_instances.append(instance)
+        ContextSingletonClass._clear()
+
+    thread = threading.Thread(target=_create_instance)
+    thread.start()
+    thread.join()
+
+    assert len(thread_instances) == 1
+    assert thread_instances[0] is not main_instance
+    assert ContextSingletonClass() is main_instance
+    ContextSingletonClass._clear()
+
+
+def test_context_singleton_falls_back_to_latest_instance():
+    """Tests that threads without an instance of their own use the latest
+    created instance."""
+    ContextSingletonClass._clear()
+    instance = ContextSingletonClass()
+    thread_instances = []
+
+    thread = threading.Thread(
+        target=lambda: thread_instances.append(ContextSingletonClass())
+    )
+    thread.start()
+    thread.join()
+
+    assert thread_instances == [instance]
+
+    ContextSingletonClass._clear()
+    assert not ContextSingletonClass._exists()
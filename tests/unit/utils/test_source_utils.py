@@ -16,6 +16,7 @@ import os
 import pathlib
 import subprocess
 import sys
+import threading
 from contextlib import ExitStack as does_not_raise
 from types import BuiltinFunctionType, FunctionType
 from uuid import uuid4
@@ -292,6 +293,63 @@ def test_setting_a_custom_source_root():
     assert source_utils.get_source_root() == initial_source_root
 
 
+def test_caching_source_resolution(mocker):
+    """Tests caching the source root while resolving sources."""
+    mock_get_source_root = mocker.patch.object(
+        source_utils,
+        "_get_source_root",
+        return_value=CURRENT_MODULE_PARENT_DIR,
+    )
+
+    with source_utils.cache_source_resolution():
+        with source_utils.cache_source_resolution():
+            source_utils.resolve(source_utils)
+        source_utils.resolve(source_utils)
+        assert source_utils.get_source_root() == CURRENT_MODULE_PARENT_DIR
+    assert mock_get_source_root.call_count == 1
+
+    source_utils.get_source_root()
+    source_utils.get_source_root()
+    assert mock_get_source_root.call_count == 3
+
+
+def test_caching_source_resolution_is_isolated_per_thread(mocker):
+    """Tests that the source resolution cache is not shared by threads."""
+    mock_get_source_root = mocker.patch.object(
+        source_utils,
+        "_get_source_root",
+        return_value=CURRENT_MODULE_PARENT_DIR,
+    )
+    entered = threading.Event()
+    exited = threading.Event()
+
+    def _cache_in_thread() -> None:
+        with source_utils.cache_source_resolution():
+            source_utils.get_source_root()
+            entered.set()
+            exited.wait(timeout=10)
+
+    thread = threading.Thread(target=_cache_in_thread)
+    thread.start()
+    try:
+        assert entered.wait(timeout=10)
+        # Caching is only enabled in the other thread
+        source_utils.get_source_root()
+        source_utils.get_source_root()
+        assert mock_get_source_root.call_count == 3
+
+        with source_utils.cache_source_resolution():
+            source_utils.get_source_root()
+            exited.set()
+            thread.join(timeout=10)
+            # Exiting the context in the other thread keeps this cache
+            source_utils.get_source_root()
+        assert mock_get_source_root.call_count == 4
+    finally:
+        exited.set()
+        thread.join(timeout=10)
+
+
 def test_validating_source_classes(mocker):
     """Tests validating the class of a source."""
     mocker.patch.object(
@@ -0,0 +1,69 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import io
+import os
+import tarfile
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+from zenml.zen_server import download_utils
+from zenml.zen_server.download_utils import parse_range_header
+
+
+def test_streamed_artifact_archive_contains_all_files(clean_client, mocker):
+    """Tests that the streamed archive contains the full artifact."""
+    mocker.patch.object(download_utils, "DOWNLOAD_CHUNK_SIZE", 100)
+    artifact_store = clean_client.active_stack.artifact_store
+
+    uri = Path(artifact_store.path) / "artifact"
+    (uri / "nested").mkdir(parents=True)
+    files = {
+        "empty.txt": b"",
+        "small.txt": b"small",
+        os.path.join("nested", "large.bin"): os.urandom(1234),
+    }
+    for path, content in files.items():
+        (uri / path).write_bytes(content)
+
+    data = b"".join(
+        download_utils._iterate_artifact_archive(
+            artifact_store=artifact_store, uri=str(uri)
+        )
+    )
+
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
+        for path, content in files.items():
+            assert tar.extractfile(path).read() == content
+        assert tar.getmember("nested").isdir()
+
+
+def test_parsing_range_headers():
+    """Tests parsing the HTTP range header."""
+    assert parse_range_header("bytes=0-9", size=100) == (0, 9)
+    assert parse_range_header("bytes=10-", size=100) == (10, 99)
+    assert parse_range_header("bytes=-10", size=100) == (90, 99)
+    assert parse_range_header("bytes=90-200", size=100) == (90, 99)
+
+    # Invalid or multiple ranges are ignored
+    assert parse_range_header("bytes=a-b", size=100) is None
+    assert parse_range_header("bytes=5-1", size=100) is None
+    assert parse_range_header("bytes=0-1,5-6", size=100) is None
+    assert parse_range_header("items=0-1", size=100) is None
+
+    with pytest.raises(HTTPException) as e:
+        parse_range_header("bytes=100-", size=100)
+    assert e.value.status_code == 416
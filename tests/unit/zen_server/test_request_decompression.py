@@ -0,0 +1,95 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import asyncio
+import gzip
+from typing import Any, Dict, List, Optional, Tuple
+
+from zenml.zen_server.zen_server_api import RequestDecompressionMiddleware
+
+
+def _send_request(
+    chunks: List[bytes], max_bytes: int, content_length: Optional[int]
+) -> Tuple[int, bytes]:
+    """Sends a gzip encoded request through the middleware.
+
+    Returns:
+        The response status code and the body received by the app.
+    """
+    received = {"body": b""}
+
+    async def app(scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        message = await receive()
+        received["body"] = message["body"]
+        await send({"type": "http.response.start", "status": 200})
+        await send({"type": "http.response.body", "body": b""})
+
+    messages = [
+        {
+            "type": "http.request",
+            "body": chunk,
+            "more_body": index < len(chunks) - 1,
+        }
+        for index, chunk in enumerate(chunks)
+    ]
+
+    async def receive() -> Dict[str, Any]:
+        return messages.pop(0)
+
+    statuses = []
+
+    async def send(message: Dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    headers = [(b"content-encoding", b"gzip")]
+    if content_length is not None:
+        headers.append((b"content-length", str(content_length).encode()))
+    scope = {"type": "http", "method": "POST", "headers": headers}
+
+    middleware = RequestDecompressionMiddleware(app, max_bytes=max_bytes)
+    asyncio.run(middleware(scope, receive, send))
+    return statuses[0], received["body"]
+
+
+def test_compressed_request_bodies_are_decompressed():
+    """Tests that compressed request bodies are decompressed."""
+    body = gzip.compress(b"a" * 500)
+
+    status, received_body = _send_request(
+        [body[:10], body[10:]], max_bytes=1000, content_length=len(body)
+    )
+    assert status == 200
+    assert received_body == b"a" * 500
+
+
+def test_oversized_compressed_request_bodies_are_rejected():
+    """Tests that too large request bodies are rejected."""
+    body = gzip.compress(bytes(range(256)) * 10)
+    assert len(body) > 100
+
+    # Rejected based on the content length
+    status, _ = _send_request([body], max_bytes=100, content_length=len(body))
+    assert status == 413
+
+    # Rejected while reading a body without content length
+    status, _ = _send_request(
+        [body[:50], body[50:]], max_bytes=100, content_length=None
+    )
+    assert status == 413
+
+    # Rejected if the decompressed body exceeds the limit
+    body = gzip.compress(b"a" * 1000)
+    status, _ = _send_request([body], max_bytes=100, content_length=len(body))
+    assert status == 400
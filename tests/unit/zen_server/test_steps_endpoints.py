@@ -0,0 +1,101 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import asyncio
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from zenml.zen_server.auth import AuthContext
+from zenml.zen_server.rbac.models import ResourceType
+from zenml.zen_server.routers import steps_endpoints
+
+
+def _auth_context() -> AuthContext:
+    """Creates an authentication context for a random user."""
+    auth_context = MagicMock(spec=AuthContext)
+    auth_context.user = MagicMock(id=uuid4())
+    return auth_context
+
+
+def test_get_cached_run_steps_filters_by_allowed_pipeline_runs(mocker):
+    """Tests that the cached step runs are limited to accessible runs."""
+    project_id = uuid4()
+    allowed_pipeline_run_ids = {uuid4()}
+    step_run = MagicMock()
+    auth_context = _auth_context()
+
+    get_allowed_resource_ids = mocker.patch.object(
+        steps_endpoints,
+        "get_allowed_resource_ids",
+        return_value=allowed_pipeline_run_ids,
+    )
+    zen_store = mocker.patch.object(steps_endpoints, "zen_store").return_value
+    zen_store.get_cached_run_steps.return_value = {"cache_key": step_run}
+    mocker.patch.object(
+        steps_endpoints,
+        "dehydrate_response_model",
+        side_effect=lambda model: model,
+    )
+
+    cached_step_runs = asyncio.run(
+        steps_endpoints.get_cached_run_steps(
+            project_id=project_id,
+            cache_keys=["cache_key", "other_cache_key"],
+            auth_context=auth_context,
+        )
+    )
+
+    assert cached_step_runs == {"cache_key": step_run}
+    get_allowed_resource_ids.assert_called_once_with(
+        resource_type=ResourceType.PIPELINE_RUN, project_id=project_id
+    )
+    zen_store.get_cached_run_steps.assert_called_once_with(
+        project_id=project_id,
+        cache_keys=["cache_key", "other_cache_key"],
+        allowed_pipeline_run_ids=allowed_pipeline_run_ids,
+        authenticated_user_id=auth_context.user.id,
+    )
+
+
+def test_batch_create_run_steps_verifies_pipeline_run_permissions(mocker):
+    """Tests that batch creating step runs checks each pipeline run once."""
+    pipeline_run_ids = [uuid4(), uuid4()]
+    steps = [
+        MagicMock(pipeline_run_id=pipeline_run_id)
+        for pipeline_run_id in pipeline_run_ids + pipeline_run_ids
+    ]
+    pipeline_runs = {
+        pipeline_run_id: MagicMock() for pipeline_run_id in pipeline_run_ids
+    }
+
+    zen_store = mocker.patch.object(steps_endpoints, "zen_store").return_value
+    zen_store.get_run.side_effect = pipeline_runs.__getitem__
+    verify_permissions_and_batch_create_entity = mocker.patch.object(
+        steps_endpoints,
+        "verify_permissions_and_batch_create_entity",
+        return_value=["created"],
+    )
+
+    created_step_runs = asyncio.run(
+        steps_endpoints.batch_create_run_steps(steps=steps, _=_auth_context())
+    )
+
+    assert created_step_runs == ["created"]
+    assert zen_store.get_run.call_count == 2
+    _, call_kwargs = verify_permissions_and_batch_create_entity.call_args
+    assert call_kwargs["batch"] == steps
+    assert call_kwargs["create_method"] == zen_store.batch_create_run_steps
+    assert sorted(call_kwargs["surrogate_models"], key=id) == sorted(
+        pipeline_runs.values(), key=id
+    )
@@ -0,0 +1,61 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from uuid import uuid4
+
+from zenml.zen_stores.secrets_stores.secrets_cache import InMemorySecretsCache
+
+
+def test_secrets_cache_expiry_and_eviction(mocker):
+    """Tests that cached values expire and that the cache is size-bounded."""
+    now = 1000.0
+    mocker.patch(
+        "zenml.zen_stores.secrets_stores.secrets_cache.time.monotonic",
+        side_effect=lambda: now,
+    )
+    cache = InMemorySecretsCache(max_size=2, ttl=10)
+    first_id, second_id, third_id = uuid4(), uuid4(), uuid4()
+
+    cache.set(first_id, {"key": "first"})
+    cache.set(second_id, {"key": "second"})
+    assert cache.get(first_id) == {"key": "first"}
+
+    # The least recently used secret gets evicted
+    cache.set(third_id, {"key": "third"})
+    assert cache.get(second_id) is None
+    assert cache.get(first_id) == {"key": "first"}
+
+    now += 10
+    assert cache.get(first_id) is None
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_secrets_cache_ignores_values_fetched_before_invalidation():
+    """Tests that outdated values are not cached after an invalidation."""
+    cache = InMemorySecretsCache(max_size=10, ttl=10)
+    secret_id = uuid4()
+
+    generation = cache.generation
+    cache.invalidate(secret_id)
+    cache.set(secret_id, {"key": "outdated"}, generation=generation)
+    assert cache.get(secret_id) is None
+
+    values = {"key": "value"}
+    cache.set(secret_id, values, generation=cache.generation)
+    cached_values = cache.get(secret_id)
+    assert cached_values == values
+
+    # Modifying the returned values does not modify the cache
+    cached_values["key"] = "modified"
+    assert cache.get(secret_id) == values
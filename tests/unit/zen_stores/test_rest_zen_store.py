@@ -0,0 +1,135 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import gzip
+import json
+from types import SimpleNamespace
+from uuid import uuid4
+
+from zenml.constants import PIPELINE_DEPLOYMENTS, STACKS
+from zenml.zen_stores.rest_response_cache import RestResponseCache
+from zenml.zen_stores.rest_zen_store import (
+    RestZenStore,
+    RestZenStoreConfiguration,
+)
+
+
+def _create_store(mocker, **config_kwargs) -> RestZenStore:
+    """Creates a REST store without connecting to a server."""
+    mocker.patch.object(RestZenStore, "_initialize")
+    store = RestZenStore(
+        config=RestZenStoreConfiguration(
+            url="http://localhost:8080", **config_kwargs
+        ),
+        skip_default_registrations=True,
+    )
+    mocker.patch.object(store, "_handle_response", return_value={})
+    return store
+
+
+def _mock_response(status_code: int, body=None, etag=None):
+    """Creates a mock response which is handled as if it came from a server."""
+    return SimpleNamespace(
+        status_code=status_code,
+        headers={"ETag": etag} if etag else {},
+        json=lambda: body,
+    )
+
+
+def test_request_headers_are_not_shared_between_requests(mocker):
+    """Tests that request specific headers are not set on the session."""
+    store = _create_store(mocker)
+    request = mocker.patch.object(store.session, "request")
+
+    store._request("GET", store.url + "/a")
+    store._request("GET", store.url + "/b")
+
+    first_headers = request.call_args_list[0].kwargs["headers"]
+    second_headers = request.call_args_list[1].kwargs["headers"]
+    assert first_headers["X-Request-ID"] != second_headers["X-Request-ID"]
+    assert "X-Request-ID" not in store.session.headers
+
+
+def test_request_bodies_are_compressed(mocker):
+    """Tests that large request bodies are compressed if supported."""
+    store = _create_store(mocker, http_compression_min_size=100)
+    request = mocker.patch.object(store.session, "request")
+    body = {"values": list(range(100))}
+
+    # Bodies are not compressed if the server does not support it
+    store._server_info = SimpleNamespace(request_content_encodings=[])
+    store._request("POST", store.url + "/a", json=body)
+    assert request.call_args.kwargs["json"] == body
+    assert "Content-Encoding" not in request.call_args.kwargs["headers"]
+
+    store._server_info = SimpleNamespace(request_content_encodings=["gzip"])
+    store._request("POST", store.url + "/a", json=body)
+    assert "json" not in request.call_args.kwargs
+    assert request.call_args.kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(request.call_args.kwargs["data"])) == (
+        body
+    )
+
+    # Small bodies are not compressed
+    store._request("POST", store.url + "/a", json={"a": 1})
+    assert request.call_args.kwargs["json"] == {"a": 1}
+
+
+def test_responses_of_cached_routes_are_revalidated(mocker, tmp_path):
+    """Tests that cached responses are only used if the server allows it."""
+    store = _create_store(mocker)
+    mocker.patch.object(
+        store,
+        "_handle_response",
+        side_effect=lambda response: response.json(),
+    )
+    request = mocker.patch.object(store.session, "request")
+    store._response_cache = RestResponseCache(
+        max_entries=10, directory=str(tmp_path), max_files=10
+    )
+    route = f"{PIPELINE_DEPLOYMENTS}/{uuid4()}"
+
+    request.return_value = _mock_response(200, {"id": 1}, etag='W/"1"')
+    assert store.get(route, cache=True) == {"id": 1}
+    assert "If-None-Match" not in request.call_args.kwargs["headers"]
+
+    request.return_value = _mock_response(304)
+    assert store.get(route, cache=True) == {"id": 1}
+    assert request.call_args.kwargs["headers"]["If-None-Match"] == 'W/"1"'
+
+    # Other processes use the cached response stored on disk
+    store._response_cache.clear()
+    assert store.get(route, cache=True) == {"id": 1}
+
+    request.return_value = _mock_response(200, {"id": 2}, etag='W/"2"')
+    assert store.get(route, cache=True) == {"id": 2}
+    assert store._response_cache.get(
+        store.url + "/api/v1" + route + "?{}"
+    ) == ('W/"2"', {"id": 2})
+
+    # Responses are not cached unless requested
+    store.get(STACKS, cache=False)
+    assert "If-None-Match" not in request.call_args.kwargs["headers"]
+
+
+def test_response_cache_removes_old_files(tmp_path):
+    """Tests that the response cache limits the number of stored files."""
+    cache = RestResponseCache(
+        max_entries=1, directory=str(tmp_path), max_files=2
+    )
+    for i in range(4):
+        cache.set(f"key_{i}", etag=str(i), body=i)
+
+    assert len(list(tmp_path.iterdir())) == 2
+    assert cache.get("key_3") == ("3", 3)